@@ -0,0 +1,110 @@
+"""
+Combat resolution benchmark.
+
+Scatters combatants over a map and resolves random attacks of every attack
+type through the spatial-hash CombatResolver, then runs the same melee
+attacks with a linear scan over all combatants for comparison.
+
+Usage:
+    python benchmark_combat.py [--combatants 500] [--attacks 20000]
+"""
+
+import argparse
+import random
+import time
+
+from rpg_modules.core.combat import AttackType, CombatResolver
+from rpg_modules.core.constants import TILE_SIZE
+
+
+class Dummy:
+    """Minimal combatant that never dies."""
+    __slots__ = ('x', 'y', 'health')
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+        self.health = 10 ** 9
+
+
+def make_combatants(count, map_tiles, rng):
+    size = map_tiles * TILE_SIZE
+    return [Dummy(rng.uniform(0, size), rng.uniform(0, size)) for _ in range(count)]
+
+
+def make_attacks(count, map_tiles, rng):
+    size = map_tiles * TILE_SIZE
+    directions = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+    return [((rng.uniform(0, size), rng.uniform(0, size)), rng.choice(directions))
+            for _ in range(count)]
+
+
+def bench_resolver(combatants, attacks, attack_type, attack_range):
+    resolver = CombatResolver()
+    resolver.rebuild(combatants)
+    start = time.perf_counter()
+    for origin, direction in attacks:
+        resolver.resolve_attack(attack_type, origin, direction, attack_range, 1)
+    elapsed = time.perf_counter() - start
+    return resolver.hits_resolved, elapsed
+
+
+def bench_linear_melee(combatants, attacks, attack_range):
+    """The old approach: check every combatant for every attack."""
+    range_sq = attack_range * attack_range
+    hits = 0
+    start = time.perf_counter()
+    for (ox, oy), (fx, fy) in attacks:
+        best, best_sq = None, None
+        for target in combatants:
+            dx, dy = target.x - ox, target.y - oy
+            dist_sq = dx * dx + dy * dy
+            if dist_sq > range_sq:
+                continue
+            dot = dx * fx + dy * fy
+            if dot < 0 or dot * dot < 0.25 * dist_sq:
+                continue
+            if best is None or dist_sq < best_sq:
+                best, best_sq = target, dist_sq
+        if best is not None:
+            best.health -= 1
+            hits += 1
+    return hits, time.perf_counter() - start
+
+
+def report(label, attacks, hits, elapsed):
+    print(f"{label:<22} {attacks / elapsed:>12,.0f} attacks/s {hits / elapsed:>12,.0f} hits/s "
+          f"({hits} hits in {elapsed * 1000:.1f} ms)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark combat hit resolution")
+    parser.add_argument("--combatants", type=int, default=500)
+    parser.add_argument("--attacks", type=int, default=20000)
+    parser.add_argument("--map-tiles", type=int, default=60, help="Map side in tiles")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    combatants = make_combatants(args.combatants, args.map_tiles, rng)
+    attacks = make_attacks(args.attacks, args.map_tiles, rng)
+    base_range = 1.5 * TILE_SIZE
+
+    print(f"{args.combatants} combatants on {args.map_tiles}x{args.map_tiles} tiles, "
+          f"{args.attacks} attacks per run")
+    ranges = {
+        AttackType.REGULAR: base_range,
+        AttackType.HEAVY: base_range * 0.8,
+        AttackType.MAGIC: base_range * 1.5,
+        AttackType.QUICK: base_range
+    }
+    for attack_type, attack_range in ranges.items():
+        hits, elapsed = bench_resolver(combatants, attacks, attack_type, attack_range)
+        report(attack_type.name.lower(), len(attacks), hits, elapsed)
+
+    hits, elapsed = bench_linear_melee(combatants, attacks, base_range)
+    report("regular (linear scan)", len(attacks), hits, elapsed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Pathfinding benchmark: A* against Jump Point Search.
+
+Generates overworld maps and finds paths between random walkable tiles with
+both engines (wall penalty disabled, as JPS requires). Reports node
+expansions and wall time, and checks that both engines find paths of the
+same length.
+
+Usage:
+    python benchmark_pathfinding.py [--sizes 200 500] [--pairs 50]
+"""
+
+import argparse
+import random
+import time
+
+from rpg_modules.core.map import Map
+from rpg_modules.core.pathfinding import DIAGONAL_COST, astar_search, jump_point_search
+
+
+def path_cost(tiles):
+    """Length of a tile path, counting diagonal steps as DIAGONAL_COST."""
+    cost = 0.0
+    for (x0, y0), (x1, y1) in zip(tiles, tiles[1:]):
+        cost += DIAGONAL_COST if x0 != x1 and y0 != y1 else 1.0
+    return cost
+
+
+def run_engine(search, game_map, pairs, max_steps):
+    """Run one engine over all pairs; returns (results, expansions, seconds)."""
+    results, expanded = [], 0
+    start = time.perf_counter()
+    for a, b in pairs:
+        stats = {}
+        results.append(search(game_map, a, b, max_steps=max_steps, stats=stats))
+        expanded += stats.get("expanded", 0)
+    return results, expanded, time.perf_counter() - start
+
+
+def bench_map(size, pair_count, seed):
+    start = time.perf_counter()
+    game_map = Map(size, size, seed)
+    print(f"\n{size}x{size} map generated in {time.perf_counter() - start:.1f} s")
+
+    rng = random.Random(seed)
+    index = game_map.get_walkable_index()
+    pairs = [(index.sample(rng), index.sample(rng)) for _ in range(pair_count)]
+    max_steps = size * size
+
+    astar, astar_expanded, astar_time = run_engine(
+        lambda m, a, b, **kw: astar_search(m, a, b, wall_clearance=0, **kw), game_map, pairs, max_steps)
+    jps, jps_expanded, jps_time = run_engine(jump_point_search, game_map, pairs, max_steps)
+
+    mismatches = 0
+    for a_path, j_path in zip(astar, jps):
+        if (a_path is None) != (j_path is None) or \
+                (a_path and abs(path_cost(a_path) - path_cost(j_path)) > 1e-6):
+            mismatches += 1
+    found = sum(1 for path in astar if path)
+
+    print(f"{'engine':<8} {'expanded':>12} {'per path':>10} {'time':>10} {'per path':>10}")
+    for name, expanded, elapsed in (("A*", astar_expanded, astar_time), ("JPS", jps_expanded, jps_time)):
+        print(f"{name:<8} {expanded:>12,} {expanded / pair_count:>10,.0f} "
+              f"{elapsed:>9.2f}s {elapsed / pair_count * 1000:>8.1f}ms")
+    print(f"{found}/{pair_count} pairs connected, {mismatches} path length mismatches, "
+          f"speedup {astar_time / jps_time:.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark A* against Jump Point Search")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[200, 500], help="Map sides in tiles")
+    parser.add_argument("--pairs", type=int, default=50, help="Random start/goal pairs per map")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        bench_map(size, args.pairs, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Player stat aggregation benchmark.
+
+Computes player attack damage and damage taken through the cached
+StatEngine, then the same numbers the old way, walking the equipment on
+every call, and reports damage computations per second. A third run swaps
+the weapon every --swap-every computations to include the cost of
+recompiling the stats.
+
+Usage:
+    python benchmark_stats.py [--computations 200000] [--swap-every 100]
+"""
+
+import argparse
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from rpg_modules.entities.player import Player
+from rpg_modules.items.armor import Armor
+from rpg_modules.items.hands import Hands
+from rpg_modules.items.weapon import Weapon
+
+
+def equip_player(player):
+    equipment = player.equipment
+    equipment.equip_item(Weapon("Sword", 10, "Common", "Iron"))
+    for armor_type, defense in (("Head", 2), ("Chest", 5), ("Legs", 4), ("Feet", 2)):
+        equipment.equip_item(Armor(armor_type, defense, "Common", "Leather"))
+    equipment.equip_item(Hands(3, 1, "Common", "Leather"))
+
+
+def legacy_attack_damage(player):
+    """The old Player.get_attack_damage for a regular attack: walk the equipment every call."""
+    base_damage = player.attack
+    weapon = player.equipment.get_equipped_item('weapon') if hasattr(player.equipment, 'get_equipped_item') else None
+    if weapon and hasattr(weapon, 'attack_power'):
+        base_damage += weapon.attack_power
+    return max(1, int(base_damage * 1.0 * random.uniform(0.9, 1.1)))
+
+
+def legacy_damage_taken(player, damage):
+    """Damage reduction with the armor summed on every call, as the equipment UI did."""
+    defense = player.defense
+    for slot in ('head', 'chest', 'legs', 'feet', 'hands'):
+        item = player.equipment.get_equipped_item(slot)
+        if item and hasattr(item, 'defense'):
+            defense += item.defense
+    return max(1, damage - defense // 2)
+
+
+def bench_engine(player, computations, swap_every=0):
+    weapons = [Weapon("Sword", 10, "Common", "Iron"), Weapon("Axe", 12, "Common", "Iron")]
+    stats = player.stats
+    start = time.perf_counter()
+    for i in range(computations):
+        if swap_every and i % swap_every == 0:
+            player.equipment.equip_item(weapons[(i // swap_every) % 2])
+        player.get_attack_damage()
+        max(1, 20 - stats.defense // 2)
+    return time.perf_counter() - start
+
+
+def bench_legacy(player, computations):
+    start = time.perf_counter()
+    for _ in range(computations):
+        legacy_attack_damage(player)
+        legacy_damage_taken(player, 20)
+    return time.perf_counter() - start
+
+
+def report(label, computations, elapsed):
+    print(f"{label:<28} {computations / elapsed:>12,.0f} computations/s ({elapsed * 1000:.1f} ms)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark player stat aggregation")
+    parser.add_argument("--computations", type=int, default=200000)
+    parser.add_argument("--swap-every", type=int, default=100,
+                        help="Equip a different weapon every N computations in the churn run")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    pygame.init()
+    player = Player(0, 0)
+    equip_player(player)
+
+    print(f"{args.computations} attack + damage-taken computations per run, fully equipped player")
+    report("stat engine", args.computations, bench_engine(player, args.computations))
+    compiles = player.stats.compile_count
+    elapsed = bench_engine(player, args.computations, args.swap_every)
+    report(f"stat engine (swap every {args.swap_every})", args.computations, elapsed)
+    print(f"{'':<28} {player.stats.compile_count - compiles} recompiles")
+    report("walk equipment per call", args.computations, bench_legacy(player, args.computations))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,58 @@
 import os
+from collections import Counter
 from flask import Flask, request, jsonify, session, redirect, url_for
 from flask_cors import CORS
 from flask_login import LoginManager, login_user, logout_user, login_required, current_user
 from authlib.integrations.flask_client import OAuth
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event, func, inspect, select, text, update
+from sqlalchemy.orm import joinedload
 from datetime import datetime, timedelta
-from models import db, User, Marker
+from models import db, User, Marker, MarkerCount, Revision
 from dotenv import load_dotenv
 
 load_dotenv()
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.getenv('FLASK_SECRET_KEY')
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///deep_desert.db'
+app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL', 'sqlite:///deep_desert.db')
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+
+# Database tuning, overridable from the environment
+SQLITE_WAL = os.getenv('SQLITE_WAL', '1') == '1'
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', '5000'))
+database_uri = app.config['SQLALCHEMY_DATABASE_URI']
+engine_options = {'pool_pre_ping': True}
+if database_uri not in ('sqlite://', 'sqlite:///:memory:'):
+    # In-memory SQLite uses a single-connection pool without these settings
+    engine_options.update({
+        'pool_size': int(os.getenv('DB_POOL_SIZE', '5')),
+        'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', '10')),
+        'pool_timeout': int(os.getenv('DB_POOL_TIMEOUT', '30')),
+        'pool_recycle': 3600
+    })
+if database_uri.startswith('sqlite'):
+    # Pooled connections are handed between threads; SQLite waits this long
+    # for a lock before giving up
+    engine_options['connect_args'] = {'timeout': SQLITE_BUSY_TIMEOUT_MS / 1000, 'check_same_thread': False}
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options
 CORS(app, supports_credentials=True)
 db.init_app(app)
 
+def configure_sqlite_connection(dbapi_connection, connection_record):
+    """Per-connection SQLite settings: WAL lets readers run alongside the writer."""
+    cursor = dbapi_connection.cursor()
+    if SQLITE_WAL:
+        cursor.execute('PRAGMA journal_mode=WAL')
+        # With WAL, NORMAL only syncs at checkpoints and cannot corrupt the database
+        cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute(f'PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}')
+    cursor.close()
+
+with app.app_context():
+    if db.engine.dialect.name == 'sqlite':
+        event.listen(db.engine, 'connect', configure_sqlite_connection)
+
 login_manager = LoginManager()
 login_manager.init_app(app)
 
@@ -39,9 +75,82 @@ google = oauth.register(
 def load_user(user_id):
     return User.query.get(int(user_id))
 
-@app.before_first_request
+# Marker pages: default and maximum number of markers per response
+MARKER_PAGE_SIZE = 500
+MAX_MARKER_PAGE_SIZE = 2000
+
+# Most markers one bulk upsert may create or edit
+MAX_BULK_MARKERS = 1000
+
 def create_tables():
+    """Create the tables and bring an existing database up to the current schema."""
     db.create_all()
+    # create_all skips existing tables, so add columns and indexes introduced later
+    columns = {column['name'] for column in inspect(db.engine).get_columns('marker')}
+    with db.engine.begin() as connection:
+        if 'updated_at' not in columns:
+            connection.execute(text('ALTER TABLE marker ADD COLUMN updated_at DATETIME'))
+            connection.execute(text('UPDATE marker SET updated_at = created_at'))
+        if 'revision' not in columns:
+            connection.execute(text('ALTER TABLE marker ADD COLUMN revision INTEGER NOT NULL DEFAULT 0'))
+            connection.execute(text('UPDATE marker SET revision = id'))
+        if 'deleted' not in columns:
+            connection.execute(text('ALTER TABLE marker ADD COLUMN deleted BOOLEAN NOT NULL DEFAULT 0'))
+    for index in Marker.__table__.indexes:
+        index.create(db.engine, checkfirst=True)
+    if db.session.get(Revision, 1) is None:
+        latest = db.session.query(func.max(Marker.revision)).scalar() or 0
+        db.session.add(Revision(id=1, value=latest))
+        db.session.commit()
+    if MarkerCount.query.first() is None:
+        rebuild_marker_counts()
+        db.session.commit()
+
+def rebuild_marker_counts():
+    """Recount the live markers per cell and type from scratch."""
+    MarkerCount.query.delete()
+    rows = (db.session.query(Marker.cell, Marker.marker_type, func.count(Marker.id))
+            .filter(Marker.deleted.is_(False))
+            .group_by(Marker.cell, Marker.marker_type))
+    db.session.add_all(MarkerCount(cell=cell, marker_type=marker_type, count=count)
+                       for cell, marker_type, count in rows)
+
+def apply_count_changes(changes):
+    """
+    Apply per (cell, marker_type) count changes to the summary table.
+
+    Call inside the transaction that changes the markers, after
+    next_revisions has taken the write lock.
+    """
+    for (cell, marker_type), delta in changes.items():
+        if not delta:
+            continue
+        row = db.session.get(MarkerCount, (cell, marker_type))
+        if row is None:
+            row = MarkerCount(cell=cell, marker_type=marker_type, count=0)
+            db.session.add(row)
+        row.count += delta
+        if row.count <= 0:
+            db.session.delete(row)
+
+def next_revisions(count=1):
+    """
+    Reserve consecutive revisions in the current transaction.
+
+    The counter row is updated before it is read, so the write lock is held
+    until commit and revisions become visible in increasing order.
+
+    Returns:
+        The first reserved revision
+    """
+    db.session.execute(update(Revision).where(Revision.id == 1).values(value=Revision.value + count))
+    return db.session.execute(select(Revision.value).where(Revision.id == 1)).scalar_one() - count + 1
+
+@app.cli.command('migrate')
+def migrate_command():
+    """Create or upgrade the database schema (flask --app app migrate)."""
+    create_tables()
+    print('Database schema is up to date')
 
 @app.route('/api/login')
 def login():
@@ -83,19 +192,190 @@ def get_user():
         })
     return jsonify({'user': None})
 
+def serialize_marker(m):
+    return {
+        'id': m.id,
+        'cell': m.cell,
+        'marker_type': m.marker_type,
+        'note': m.note,
+        'created_at': m.created_at.isoformat(),
+        'updated_at': m.updated_at.isoformat() if m.updated_at else None,
+        'revision': m.revision,
+        'user': m.user.username if m.user else None
+    }
+
 @app.route('/api/markers', methods=['GET'])
 def get_markers():
-    markers = Marker.query.all()
-    return jsonify([
-        {
-            'id': m.id,
-            'cell': m.cell,
-            'marker_type': m.marker_type,
-            'note': m.note,
-            'created_at': m.created_at.isoformat(),
-            'user': m.user.username if m.user else None
-        } for m in markers
-    ])
+    """
+    List markers one page at a time, oldest first.
+
+    Query parameters:
+        cell, marker_type: Only return markers with this value
+        cursor: Return markers after this one (the previous page's next_cursor)
+        limit: Page size (default MARKER_PAGE_SIZE, at most MAX_MARKER_PAGE_SIZE)
+
+    Responses carry an ETag; clients sending it back in If-None-Match get a
+    304 while the page is unchanged.
+    """
+    cursor = request.args.get('cursor', type=int)
+    limit = request.args.get('limit', MARKER_PAGE_SIZE, type=int)
+    limit = max(1, min(limit, MAX_MARKER_PAGE_SIZE))
+
+    # Usernames are loaded in the same query instead of one query per marker
+    query = Marker.query.options(joinedload(Marker.user)).filter(Marker.deleted.is_(False))
+    for field in ('cell', 'marker_type'):
+        value = request.args.get(field)
+        if value:
+            query = query.filter(getattr(Marker, field) == value)
+    if cursor is not None:
+        query = query.filter(Marker.id > cursor)
+    # Fetch one extra row to know whether there is a next page
+    markers = query.order_by(Marker.id).limit(limit + 1).all()
+
+    has_more = len(markers) > limit
+    markers = markers[:limit]
+    response = jsonify({
+        'markers': [serialize_marker(m) for m in markers],
+        'next_cursor': markers[-1].id if has_more else None
+    })
+    response.add_etag()
+    return response.make_conditional(request)
+
+@app.route('/api/markers/changes', methods=['GET'])
+def get_marker_changes():
+    """
+    List markers changed after a revision, in revision order.
+
+    Query parameters:
+        since: Last revision the client has seen (the previous response's
+            cursor; 0 for a full sync)
+        limit: Page size (default MARKER_PAGE_SIZE, at most MAX_MARKER_PAGE_SIZE)
+
+    Deleted markers come back as tombstones: {'id', 'revision', 'deleted': true}.
+    Clients keep requesting with the returned cursor while has_more is true.
+    """
+    since = request.args.get('since', 0, type=int)
+    limit = request.args.get('limit', MARKER_PAGE_SIZE, type=int)
+    limit = max(1, min(limit, MAX_MARKER_PAGE_SIZE))
+
+    markers = (Marker.query.options(joinedload(Marker.user))
+               .filter(Marker.revision > since)
+               .order_by(Marker.revision)
+               .limit(limit + 1).all())
+    has_more = len(markers) > limit
+    markers = markers[:limit]
+    return jsonify({
+        'changes': [{'id': m.id, 'revision': m.revision, 'deleted': True} if m.deleted else serialize_marker(m)
+                    for m in markers],
+        'cursor': markers[-1].revision if markers else since,
+        'has_more': has_more
+    })
+
+# Last summary built by this process: (revision it was built at, response body)
+_summary_cache = {'revision': None, 'body': None}
+
+@app.route('/api/markers/summary', methods=['GET'])
+def get_marker_summary():
+    """
+    Count live markers per cell and type, for zoomed-out map views.
+
+    Returns {'revision', 'marker_types': [...], 'cells': {cell: [count per
+    marker type]}}. The summary is read from the MarkerCount table and kept
+    in memory until the marker revision changes; the revision doubles as
+    ETag, so unchanged summaries are answered with a 304.
+    """
+    revision = db.session.get(Revision, 1).value
+    etag = f'summary-{revision}'
+    if request.if_none_match.contains(etag):
+        return '', 304, {'ETag': f'"{etag}"'}
+
+    if _summary_cache['revision'] != revision:
+        rows = MarkerCount.query.order_by(MarkerCount.cell, MarkerCount.marker_type).all()
+        marker_types = sorted({row.marker_type for row in rows})
+        type_index = {marker_type: i for i, marker_type in enumerate(marker_types)}
+        cells = {}
+        for row in rows:
+            counts = cells.setdefault(row.cell, [0] * len(marker_types))
+            counts[type_index[row.marker_type]] = row.count
+        _summary_cache['body'] = {'revision': revision, 'marker_types': marker_types, 'cells': cells}
+        _summary_cache['revision'] = revision
+
+    response = jsonify(_summary_cache['body'])
+    response.set_etag(etag)
+    return response
+
+def validate_bulk_markers(items):
+    """
+    Check the shape of bulk upsert entries before anything is written.
+
+    Every entry must be an object; an id, if given, must be an integer.
+    New markers need a cell and a marker_type, and edits that set either
+    must not set it to null or an empty string.
+
+    Returns:
+        An error message, or None if every entry is valid
+    """
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            return f'Marker {index} is not an object'
+        marker_id = item.get('id')
+        if marker_id is not None and (not isinstance(marker_id, int) or isinstance(marker_id, bool)):
+            return f'Marker {index} has an invalid id'
+        for field in ('cell', 'marker_type'):
+            if marker_id is None or field in item:
+                value = item.get(field)
+                if not isinstance(value, str) or not value:
+                    return f'Marker {index} needs a non-empty {field}'
+    return None
+
+@app.route('/api/markers/bulk', methods=['POST'])
+@login_required
+def bulk_upsert_markers():
+    """
+    Create and edit many markers in one transaction.
+
+    Body: {'markers': [{'id', 'cell', 'marker_type', 'note'}, ...]}. Entries
+    with an id edit that marker (which must belong to the user), the others
+    create markers. Either every entry is applied or none is.
+    """
+    items = (request.json or {}).get('markers')
+    if not isinstance(items, list) or len(items) > MAX_BULK_MARKERS:
+        return jsonify({'success': False, 'error': f'Expected a list of at most {MAX_BULK_MARKERS} markers'}), 400
+
+    error = validate_bulk_markers(items)
+    if error:
+        return jsonify({'success': False, 'error': error}), 400
+
+    ids = [item['id'] for item in items if item.get('id') is not None]
+    existing = {m.id: m for m in Marker.query.filter(Marker.id.in_(ids))} if ids else {}
+    for item in items:
+        marker_id = item.get('id')
+        if marker_id is not None:
+            marker = existing.get(marker_id)
+            if not marker or marker.deleted or marker.user_id != current_user.id:
+                return jsonify({'success': False, 'error': f'Marker {marker_id} not found or unauthorized'}), 403
+    if not items:
+        return jsonify({'success': True, 'marker_ids': []})
+
+    first_revision = next_revisions(len(items))
+    markers = []
+    counts = Counter()
+    for revision, item in enumerate(items, first_revision):
+        marker = existing.get(item.get('id'))
+        if marker is None:
+            marker = Marker(user_id=current_user.id)
+            db.session.add(marker)
+        else:
+            counts[(marker.cell, marker.marker_type)] -= 1
+        marker.cell = item.get('cell', marker.cell)
+        marker.marker_type = item.get('marker_type', marker.marker_type)
+        marker.note = item.get('note', marker.note)
+        marker.revision = revision
+        counts[(marker.cell, marker.marker_type)] += 1
+        markers.append(marker)
+    apply_count_changes(counts)
+    db.session.commit()
+    return jsonify({'success': True, 'marker_ids': [m.id for m in markers], 'revision': revision})
 
 @app.route('/api/markers', methods=['POST'])
 @login_required
@@ -104,8 +384,10 @@ def add_marker():
     cell = data.get('cell')
     marker_type = data.get('marker_type')
     note = data.get('note')
-    marker = Marker(cell=cell, marker_type=marker_type, note=note, user_id=current_user.id)
+    marker = Marker(cell=cell, marker_type=marker_type, note=note, user_id=current_user.id,
+                    revision=next_revisions())
     db.session.add(marker)
+    apply_count_changes({(cell, marker_type): 1})
     db.session.commit()
     return jsonify({'success': True, 'marker_id': marker.id})
 
@@ -113,11 +395,16 @@ def add_marker():
 @login_required
 def edit_marker(marker_id):
     marker = Marker.query.get(marker_id)
-    if marker and marker.user_id == current_user.id:
+    if marker and not marker.deleted and marker.user_id == current_user.id:
         data = request.json
+        revision = next_revisions()
+        counts = Counter({(marker.cell, marker.marker_type): -1})
         marker.cell = data.get('cell', marker.cell)
         marker.marker_type = data.get('marker_type', marker.marker_type)
         marker.note = data.get('note', marker.note)
+        marker.revision = revision
+        counts[(marker.cell, marker.marker_type)] += 1
+        apply_count_changes(counts)
         db.session.commit()
         return jsonify({'success': True})
     return jsonify({'success': False, 'error': 'Not found or unauthorized'}), 403
@@ -126,8 +413,11 @@ def edit_marker(marker_id):
 @login_required
 def delete_marker(marker_id):
     marker = Marker.query.get(marker_id)
-    if marker and marker.user_id == current_user.id:
-        db.session.delete(marker)
+    if marker and not marker.deleted and marker.user_id == current_user.id:
+        # Keep a tombstone so the change feed reports the delete
+        marker.deleted = True
+        marker.revision = next_revisions()
+        apply_count_changes({(marker.cell, marker.marker_type): -1})
         db.session.commit()
         return jsonify({'success': True})
     return jsonify({'success': False, 'error': 'Not found or unauthorized'}), 403
@@ -135,9 +425,23 @@ def delete_marker(marker_id):
 @app.route('/api/reset', methods=['POST'])
 def reset_markers():
     # TODO: Add admin check if needed
-    Marker.query.delete()
+    live = Marker.query.filter(Marker.deleted.is_(False))
+    first_id, last_id = live.with_entities(func.min(Marker.id), func.max(Marker.id)).one()
+    if first_id is not None:
+        # Tombstone everything; ids are unique, so offsetting them gives
+        # every marker its own revision
+        first_revision = next_revisions(last_id - first_id + 1)
+        live.update({
+            Marker.deleted: True,
+            Marker.revision: Marker.id + (first_revision - first_id),
+            Marker.updated_at: datetime.utcnow()
+        }, synchronize_session=False)
+        MarkerCount.query.delete()
     db.session.commit()
     return jsonify({'success': True})
 
 if __name__ == '__main__':
+    # Development server; production runs wsgi.py under gunicorn
+    with app.app_context():
+        create_tables()
     app.run(debug=True) 
\ No newline at end of file
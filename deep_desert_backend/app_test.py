@@ -0,0 +1,97 @@
+"""
+Test module for the marker API.
+This file tests that POST /api/markers/bulk rejects malformed entries before writing anything.
+"""
+
+import os
+import unittest
+
+os.environ['DATABASE_URL'] = 'sqlite://'
+os.environ.setdefault('FLASK_SECRET_KEY', 'test')
+
+from app import app, create_tables  # noqa: E402
+from models import db, User, Marker, Revision  # noqa: E402
+
+
+class TestBulkUpsertMarkers(unittest.TestCase):
+    """Test cases for the bulk upsert endpoint."""
+
+    def setUp(self):
+        self.context = app.app_context()
+        self.context.push()
+        db.drop_all()
+        create_tables()
+        user = User(google_id='user-1', username='Sandwalker')
+        db.session.add(user)
+        db.session.commit()
+        self.marker_id = self.create_marker(user.id)
+
+        self.client = app.test_client()
+        with self.client.session_transaction() as session:
+            session['_user_id'] = str(user.id)
+            session['_fresh'] = True
+
+    def tearDown(self):
+        db.session.remove()
+        self.context.pop()
+
+    def create_marker(self, user_id):
+        marker = Marker(cell='A1', marker_type='base', user_id=user_id, revision=1)
+        db.session.add(marker)
+        db.session.commit()
+        return marker.id
+
+    def revision(self):
+        db.session.expire_all()
+        return db.session.get(Revision, 1).value
+
+    def post(self, markers):
+        return self.client.post('/api/markers/bulk', json={'markers': markers})
+
+    def assert_rejected(self, markers):
+        revision = self.revision()
+        response = self.post(markers)
+        self.assertEqual(response.status_code, 400, response.get_json())
+        self.assertFalse(response.get_json()['success'])
+        self.assertEqual(self.revision(), revision)
+
+    def test_creates_and_edits(self):
+        response = self.post([
+            {'cell': 'B2', 'marker_type': 'spice'},
+            {'id': self.marker_id, 'note': 'moved'}
+        ])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.get_json()['marker_ids']), 2)
+        self.assertEqual(db.session.get(Marker, self.marker_id).note, 'moved')
+
+    def test_rejects_non_object_entries(self):
+        self.assert_rejected([{'cell': 'B2', 'marker_type': 'spice'}, 'B2'])
+        self.assert_rejected([None])
+        self.assert_rejected([[self.marker_id]])
+
+    def test_rejects_non_integer_ids(self):
+        self.assert_rejected([{'id': str(self.marker_id), 'note': 'x'}])
+        self.assert_rejected([{'id': 1.5, 'note': 'x'}])
+        self.assert_rejected([{'id': True, 'note': 'x'}])
+        self.assert_rejected([{'id': {'$gt': 0}, 'note': 'x'}])
+
+    def test_rejects_new_markers_without_cell_or_type(self):
+        self.assert_rejected([{'marker_type': 'spice'}])
+        self.assert_rejected([{'cell': '', 'marker_type': 'spice'}])
+        self.assert_rejected([{'cell': 'B2', 'marker_type': None}])
+        self.assert_rejected([{'cell': 7, 'marker_type': 'spice'}])
+
+    def test_rejects_edits_clearing_cell_or_type(self):
+        self.assert_rejected([{'id': self.marker_id, 'cell': None}])
+        self.assert_rejected([{'id': self.marker_id, 'marker_type': ''}])
+        marker = db.session.get(Marker, self.marker_id)
+        self.assertEqual((marker.cell, marker.marker_type), ('A1', 'base'))
+
+    def test_rejected_batch_writes_nothing(self):
+        count = Marker.query.count()
+        self.assert_rejected([{'cell': 'B2', 'marker_type': 'spice'}, {'id': self.marker_id, 'cell': None}])
+        self.assertEqual(Marker.query.count(), count)
+
+
+if __name__ == '__main__':
+    unittest.main()
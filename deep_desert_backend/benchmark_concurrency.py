@@ -0,0 +1,211 @@
+"""
+Concurrent read/write throughput benchmark for the marker backend.
+
+Starts the app under gunicorn (or a threaded development server where
+gunicorn is unavailable) on a throwaway SQLite database, then runs client
+threads that mix marker reads (filtered pages, summary, change feed) with
+writes (new and edited markers) for a fixed time. Google OAuth is replaced
+by a stub login route that exists only in this benchmark's app.
+
+By default the run is repeated with the WAL journal and with SQLite's
+default rollback journal to compare them.
+
+Usage:
+    python benchmark_concurrency.py [--clients 16] [--seconds 10] [--write-ratio 0.2]
+"""
+
+import argparse
+import os
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import requests
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+MARKER_TYPES = ['base', 'resource', 'lab', 'spice', 'wreck']
+CELLS = [f'{row}{col}' for row in 'ABCDEFGHI' for col in range(1, 10)]
+
+
+def stub_app():
+    """The marker app plus a /api/stub-login/<user_id> route standing in for OAuth."""
+    from flask import jsonify
+    from flask_login import login_user
+    from app import app, create_tables
+    from models import db, User
+
+    @app.route('/api/stub-login/<int:user_id>')
+    def stub_login(user_id):
+        user = db.session.get(User, user_id)
+        if user is None:
+            user = User(id=user_id, google_id=f'stub-{user_id}', username=f'Stub {user_id}')
+            db.session.add(user)
+            db.session.commit()
+        login_user(user)
+        return jsonify({'id': user.id})
+
+    with app.app_context():
+        create_tables()
+        db.engine.dispose()
+    return app
+
+
+def seed_database(database_url, markers, seed):
+    """Fill the database before the server starts."""
+    os.environ['DATABASE_URL'] = database_url
+    from app import app, create_tables
+    from models import db, User, Marker
+
+    rng = random.Random(seed)
+    with app.app_context():
+        db.create_all()
+        db.session.execute(User.__table__.insert(), [
+            {'id': i, 'google_id': f'stub-{i}', 'username': f'Stub {i}'} for i in range(1, 101)])
+        db.session.execute(Marker.__table__.insert(), [{
+            'cell': rng.choice(CELLS),
+            'marker_type': rng.choice(MARKER_TYPES),
+            'note': f'seed {i}',
+            'revision': i + 1,
+            'user_id': rng.randint(1, 100)
+        } for i in range(markers)])
+        db.session.commit()
+        # Starts the revision counter after the seeded markers and counts them
+        create_tables()
+        db.engine.dispose()
+
+
+def start_server(server, port, env):
+    if server == 'gunicorn':
+        command = [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py',
+                   'benchmark_concurrency:stub_app()']
+    else:
+        command = [sys.executable, '-c',
+                   'from benchmark_concurrency import stub_app; '
+                   f'stub_app().run(port={port}, threaded=True)']
+    process = subprocess.Popen(command, cwd=HERE, env=env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    base_url = f'http://127.0.0.1:{port}'
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            requests.get(base_url + '/api/user', timeout=1)
+            return process, base_url
+        except requests.ConnectionError:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError('Server did not start')
+
+
+class Client(threading.Thread):
+    """One user mixing reads and writes until the deadline."""
+
+    def __init__(self, base_url, user_id, write_ratio, deadline, seed):
+        super().__init__(daemon=True)
+        self.base_url = base_url
+        self.user_id = user_id
+        self.write_ratio = write_ratio
+        self.deadline = deadline
+        self.rng = random.Random(seed)
+        self.latencies = {'read': [], 'write': []}
+        self.errors = 0
+
+    def run(self):
+        session = requests.Session()
+        session.get(f'{self.base_url}/api/stub-login/{self.user_id}')
+        own_markers = []
+        revision = 0
+        while time.time() < self.deadline:
+            kind = 'write' if self.rng.random() < self.write_ratio else 'read'
+            start = time.perf_counter()
+            try:
+                if kind == 'write' and own_markers and self.rng.random() < 0.5:
+                    response = session.put(f'{self.base_url}/api/markers/{self.rng.choice(own_markers)}',
+                                           json={'note': f'edited {time.time()}'})
+                elif kind == 'write':
+                    response = session.post(f'{self.base_url}/api/markers', json={
+                        'cell': self.rng.choice(CELLS), 'marker_type': self.rng.choice(MARKER_TYPES)})
+                    if response.ok:
+                        own_markers.append(response.json()['marker_id'])
+                else:
+                    choice = self.rng.random()
+                    if choice < 0.6:
+                        cell = self.rng.choice(CELLS)
+                        response = session.get(f'{self.base_url}/api/markers?cell={cell}&limit=100')
+                    elif choice < 0.8:
+                        response = session.get(f'{self.base_url}/api/markers/summary')
+                    else:
+                        response = session.get(f'{self.base_url}/api/markers/changes?since={revision}&limit=100')
+                        if response.ok:
+                            revision = response.json()['cursor']
+                if not response.ok:
+                    self.errors += 1
+                    continue
+            except requests.RequestException:
+                self.errors += 1
+                continue
+            self.latencies[kind].append(time.perf_counter() - start)
+
+
+def run(args, journal):
+    directory = tempfile.mkdtemp()
+    database = os.path.join(directory, 'bench.db')
+    database_url = 'sqlite:///' + database
+    env = dict(os.environ, DATABASE_URL=database_url, SQLITE_WAL='1' if journal == 'wal' else '0',
+               FLASK_SECRET_KEY='benchmark', BIND=f'127.0.0.1:{args.port}',
+               WEB_CONCURRENCY=str(args.workers), WEB_THREADS=str(args.threads), ACCESS_LOG='/dev/null')
+    # Seed in a child process so this process never imports the app with other settings
+    subprocess.run([sys.executable, '-c', 'from benchmark_concurrency import seed_database; '
+                    f'seed_database({database_url!r}, {args.markers}, {args.seed})'],
+                   cwd=HERE, env=env, check=True, stdout=subprocess.DEVNULL)
+
+    process, base_url = start_server(args.server, args.port, env)
+    try:
+        deadline = time.time() + args.seconds
+        clients = [Client(base_url, i + 1, args.write_ratio, deadline, args.seed + i) for i in range(args.clients)]
+        for client in clients:
+            client.start()
+        for client in clients:
+            client.join()
+    finally:
+        process.terminate()
+        process.wait()
+        shutil.rmtree(directory, ignore_errors=True)
+
+    print(f'\n{journal} journal, {args.server}, {args.clients} clients, {args.seconds} s')
+    for kind in ('read', 'write'):
+        latencies = sorted(t * 1000 for client in clients for t in client.latencies[kind])
+        if not latencies:
+            print(f'  {kind:<6} no requests completed')
+            continue
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        print(f'  {kind:<6} {len(latencies) / args.seconds:>8.1f} req/s  '
+              f'median {statistics.median(latencies):>7.1f} ms  p95 {p95:>7.1f} ms')
+    print(f'  errors {sum(client.errors for client in clients)}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark concurrent marker reads and writes')
+    parser.add_argument('--clients', type=int, default=16)
+    parser.add_argument('--seconds', type=float, default=10)
+    parser.add_argument('--write-ratio', type=float, default=0.2)
+    parser.add_argument('--markers', type=int, default=20000, help='Markers seeded before the run')
+    parser.add_argument('--journal', choices=['wal', 'rollback', 'both'], default='both')
+    parser.add_argument('--server', choices=['gunicorn', 'threaded'],
+                        default='gunicorn' if os.name == 'posix' else 'threaded')
+    parser.add_argument('--workers', type=int, default=4, help='Gunicorn worker processes')
+    parser.add_argument('--threads', type=int, default=4, help='Threads per gunicorn worker')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    for journal in (['wal', 'rollback'] if args.journal == 'both' else [args.journal]):
+        run(args, journal)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,12 @@
+"""Gunicorn settings for the marker backend (see wsgi.py)."""
+
+import multiprocessing
+import os
+
+bind = os.getenv('BIND', f"0.0.0.0:{os.getenv('PORT', '8000')}")
+workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+# Threads per worker; keep DB_POOL_SIZE + DB_MAX_OVERFLOW at least this high
+threads = int(os.getenv('WEB_THREADS', '4'))
+preload_app = True
+timeout = 30
+accesslog = os.getenv('ACCESS_LOG', '-')
@@ -0,0 +1,180 @@
+"""
+Load test for the marker API against a local SQLite database.
+
+Fills a throwaway database with markers, then measures GET /api/markers:
+walking every page, filtered pages, ETag revalidation (304s), incremental
+syncs through the change feed, the per-cell summary and the number of SQL
+statements per request.
+The old unpaginated endpoint is timed for comparison.
+
+Usage:
+    python load_test.py [--markers 100000] [--users 200] [--requests 200]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+DB_PATH = os.path.join(tempfile.gettempdir(), 'deep_desert_load_test.db')
+os.environ['DATABASE_URL'] = 'sqlite:///' + DB_PATH
+os.environ.setdefault('FLASK_SECRET_KEY', 'load-test')
+
+from sqlalchemy import event  # noqa: E402
+
+from app import app, create_tables  # noqa: E402
+from models import db, User, Marker  # noqa: E402
+
+MARKER_TYPES = ['base', 'resource', 'lab', 'spice', 'wreck']
+CELLS = [f'{row}{col}' for row in 'ABCDEFGHI' for col in range(1, 10)]
+
+
+def populate(marker_count, user_count, seed):
+    rng = random.Random(seed)
+    db.drop_all()
+    db.create_all()
+    db.session.execute(User.__table__.insert(), [
+        {'google_id': f'user-{i}', 'username': f'Sandwalker {i}', 'email': f'user{i}@example.com'}
+        for i in range(1, user_count + 1)
+    ])
+    start = datetime.utcnow() - timedelta(days=30)
+    rows = [{
+        'cell': rng.choice(CELLS),
+        'marker_type': rng.choice(MARKER_TYPES),
+        'note': f'note {i}',
+        'created_at': start + timedelta(seconds=i * 20),
+        'revision': i + 1,
+        'user_id': rng.randint(1, user_count)
+    } for i in range(marker_count)]
+    for offset in range(0, len(rows), 10000):
+        db.session.execute(Marker.__table__.insert(), rows[offset:offset + 10000])
+    db.session.commit()
+    # Starts the revision counter after the inserted markers and counts them
+    create_tables()
+
+
+class QueryCounter:
+    """Counts SQL statements sent to the database."""
+
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine, 'before_cursor_execute', self._on_execute)
+
+    def _on_execute(self, *args):
+        self.count += 1
+
+
+def timed(client, url, headers=None):
+    start = time.perf_counter()
+    response = client.get(url, headers=headers)
+    return response, time.perf_counter() - start
+
+
+def report(label, times, queries=None, extra=''):
+    times_ms = sorted(t * 1000 for t in times)
+    p95 = times_ms[min(len(times_ms) - 1, int(len(times_ms) * 0.95))]
+    line = (f'{label:<28} {len(times_ms):>6} req  median {statistics.median(times_ms):>8.2f} ms  '
+            f'p95 {p95:>8.2f} ms')
+    if queries is not None:
+        line += f'  {queries / len(times_ms):>6.1f} queries/req'
+    print(line + extra)
+
+
+def legacy_get_markers():
+    """The endpoint before pagination: whole table, one User load per marker."""
+    markers = Marker.query.all()
+    return [
+        {
+            'id': m.id,
+            'cell': m.cell,
+            'marker_type': m.marker_type,
+            'note': m.note,
+            'created_at': m.created_at.isoformat(),
+            'user': m.user.username if m.user else None
+        } for m in markers
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test the marker API')
+    parser.add_argument('--markers', type=int, default=100000)
+    parser.add_argument('--users', type=int, default=200)
+    parser.add_argument('--requests', type=int, default=200, help='Requests per filtered scenario')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    with app.app_context():
+        start = time.perf_counter()
+        populate(args.markers, args.users, args.seed)
+        print(f'Inserted {args.markers:,} markers into {DB_PATH} in {time.perf_counter() - start:.1f} s\n')
+        counter = QueryCounter(db.engine)
+        client = app.test_client()
+
+        # Walk every page like a client doing a full sync
+        times, cursor, total = [], None, 0
+        counter.count = 0
+        while True:
+            response, elapsed = timed(client, '/api/markers' + (f'?cursor={cursor}' if cursor else ''))
+            times.append(elapsed)
+            page = response.get_json()
+            total += len(page['markers'])
+            cursor = page['next_cursor']
+            if cursor is None:
+                break
+        report('full sync, page by page', times, counter.count,
+               f'  {total:,} markers in {sum(times):.2f} s')
+
+        # Filtered first pages
+        for label, make_url in (
+                ('filter by cell', lambda: f'/api/markers?cell={rng.choice(CELLS)}'),
+                ('filter by marker_type', lambda: f'/api/markers?marker_type={rng.choice(MARKER_TYPES)}'),
+                ('filter by cell and type', lambda: f'/api/markers?cell={rng.choice(CELLS)}'
+                                                    f'&marker_type={rng.choice(MARKER_TYPES)}')):
+            counter.count = 0
+            times = [timed(client, make_url())[1] for _ in range(args.requests)]
+            report(label, times, counter.count)
+
+        # Polling with If-None-Match
+        url = f'/api/markers?cell={CELLS[0]}'
+        etag = client.get(url).headers['ETag']
+        statuses, times = [], []
+        for _ in range(args.requests):
+            response, elapsed = timed(client, url, {'If-None-Match': etag})
+            statuses.append(response.status_code)
+            times.append(elapsed)
+        report('poll with If-None-Match', times,
+               extra=f'  {statuses.count(304)}/{len(statuses)} answered 304')
+
+        # Incremental sync of the newest 1% of changes
+        since = args.markers - args.markers // 100
+        counter.count = 0
+        times = [timed(client, f'/api/markers/changes?since={since}')[1] for _ in range(args.requests)]
+        report('changes since (last 1%)', times, counter.count)
+
+        # Zoomed-out map summary
+        counter.count = 0
+        times = []
+        for _ in range(args.requests):
+            response, elapsed = timed(client, '/api/markers/summary')
+            times.append(elapsed)
+        report('summary per cell and type', times, counter.count, f'  {len(response.data):,} bytes')
+
+        # The old endpoint, for comparison
+        counter.count = 0
+        times = []
+        for _ in range(3):
+            db.session.expire_all()
+            start = time.perf_counter()
+            legacy_get_markers()
+            times.append(time.perf_counter() - start)
+        report('old endpoint (whole table)', times, counter.count)
+
+    os.remove(DB_PATH)
+
+
+if __name__ == '__main__':
+    main()
@@ -14,8 +14,22 @@ class User(UserMixin, db.Model):
 
 class Marker(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    cell = db.Column(db.String(3), nullable=False)  # e.g. 'A1'
-    marker_type = db.Column(db.String(32), nullable=False)  # base, resource, lab, spice, wreck
+    cell = db.Column(db.String(3), nullable=False, index=True)  # e.g. 'A1'
+    marker_type = db.Column(db.String(32), nullable=False, index=True)  # base, resource, lab, spice, wreck
     note = db.Column(db.String(256))
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False) 
\ No newline at end of file
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    revision = db.Column(db.Integer, nullable=False, default=0, index=True)  # Set from Revision on every change
+    deleted = db.Column(db.Boolean, nullable=False, default=False)  # Tombstone, kept so clients learn about deletes
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+
+class Revision(db.Model):
+    """Single-row counter handing out increasing marker revisions."""
+    id = db.Column(db.Integer, primary_key=True)
+    value = db.Column(db.Integer, nullable=False, default=0) 
+
+class MarkerCount(db.Model):
+    """Live markers per cell and type, kept up to date by every marker write."""
+    cell = db.Column(db.String(3), primary_key=True)
+    marker_type = db.Column(db.String(32), primary_key=True)
+    count = db.Column(db.Integer, nullable=False, default=0)
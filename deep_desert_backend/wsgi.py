@@ -0,0 +1,18 @@
+"""
+Production entry point for the marker backend.
+
+    flask --app app migrate
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+Importing this module also applies schema migrations. gunicorn.conf.py
+preloads the app, so that happens once in the master process before the
+workers are forked.
+"""
+
+from app import app, create_tables
+from models import db
+
+with app.app_context():
+    create_tables()
+    # Workers must not share the master's pooled connections
+    db.engine.dispose()
@@ -18,6 +18,7 @@ from rpg_modules.quests import QuestGenerator, QuestType, QuestLog
 from rpg_modules.core.map import Map
 from rpg_modules.core.camera import Camera
 from rpg_modules.core.assets import load_assets as load_core_assets
+from rpg_modules.core.sound_synth import create_synth_sound
 from rpg_modules.core.constants import (
     SCREEN_WIDTH, SCREEN_HEIGHT, TILE_SIZE, FPS,
     WHITE, BLACK, RED, GREEN, BLUE, GRAY,
@@ -25,7 +26,6 @@ from rpg_modules.core.constants import (
 )
 from rpg_modules.core.map import TileType
 import traceback
-import numpy as np
 import types
 
 # Player stats
@@ -151,135 +151,11 @@ def load_sounds():
     return sounds
 
 def _create_simple_sound(sound_type):
-    """Create an 8-bit style sound effect using numpy."""
-    # Basic sound parameters
-    sample_rate = 22050  # Hz
-    amplitude = 127  # For 8-bit audio (0-255 with 128 as center)
-    
-    # Configure sound parameters based on sound type
-    if sound_type == 'player_attack':
-        # Quick sword swing sound - descending pitch
-        duration = 0.2  # seconds
-        base_freq = 800  # Hz
-        
-        # Time array
-        t = np.linspace(0, duration, int(duration * sample_rate), endpoint=False)
-        
-        # Frequency decreases over time
-        freq = base_freq * (1 - t*2)
-        
-        # Amplitude decreases over time (fade out)
-        amp = amplitude * (1 - t)
-        
-        # Generate samples
-        samples = 128 + amp * np.sin(2 * np.pi * freq * t)
-            
-    elif sound_type == 'monster_attack':
-        # Low growl sound
-        duration = 0.3  # seconds
-        
-        # Time array
-        t = np.linspace(0, duration, int(duration * sample_rate), endpoint=False)
-        
-        # Low frequency with vibrato
-        freq = 200 + 20 * np.sin(30 * t)
-        
-        # Add some noise
-        noise = 10 * (2 * np.random.random(len(t)) - 1)
-        
-        # Generate base samples
-        samples = 128 + amplitude * 0.8 * np.sin(2 * np.pi * freq * t)
-        
-        # Add noise
-        samples = samples + noise
-        
-        # Apply volume envelope - rise and fall
-        envelope = (1 - np.abs(2 * t/duration - 1))
-        samples = 128 + (samples-128) * envelope
-            
-    elif sound_type == 'player_hit':
-        # Impact sound - thud
-        duration = 0.2  # seconds
-        
-        # Time array
-        t = np.linspace(0, duration, int(duration * sample_rate), endpoint=False)
-        
-        # Sharp attack, quick decay
-        envelope = np.exp(-t * 20)
-        freq = 300 + 50 * np.exp(-t * 30)
-        
-        # Generate samples
-        samples = 128 + amplitude * envelope * np.sin(2 * np.pi * freq * t)
-            
-    elif sound_type == 'monster_hit':
-        # Monster getting hit - higher pitched impact
-        duration = 0.15  # seconds
-        
-        # Time array
-        t = np.linspace(0, duration, int(duration * sample_rate), endpoint=False)
-        
-        # Metallic frequency with quick decay
-        freq = 500 * (1 - t*0.5)
-        envelope = np.exp(-t * 25)
-        
-        # Add some noise for impact
-        noise = 15 * np.random.random(len(t)) * envelope
-        
-        # Generate samples
-        samples = 128 + amplitude * envelope * np.sin(2 * np.pi * freq * t) + noise
-            
-    elif sound_type == 'level_up':
-        # Level up - 3 ascending notes
-        duration = 0.5  # seconds
-        note_duration = duration / 3
-        frequencies = [440, 550, 660]  # A4, C#5, E5 (A major triad)
-        
-        all_samples = []
-        
-        for note_idx, freq in enumerate(frequencies):
-            # Time array for this note
-            t = np.linspace(0, note_duration, int(note_duration * sample_rate), endpoint=False)
-            
-            # Each note fades in and out
-            if note_idx < 2:
-                envelope = np.sin(np.pi * t / note_duration)
-            else:
-                # Last note has longer release
-                envelope = np.sin(np.pi * t / note_duration * 0.5)
-            
-            # Generate note samples
-            note_samples = 128 + amplitude * envelope * np.sin(2 * np.pi * freq * t)
-            all_samples.append(note_samples)
-        
-        # Combine all notes
-        samples = np.concatenate(all_samples)
-    else:
-        # Default beep
-        duration = 0.2  # seconds
-        base_freq = 440  # Hz
-        
-        # Time array
-        t = np.linspace(0, duration, int(duration * sample_rate), endpoint=False)
-        
-        # Generate samples
-        samples = 128 + amplitude * np.sin(2 * np.pi * base_freq * t)
-    
-    # Ensure samples are in 8-bit range (0-255)
-    samples = np.clip(samples, 0, 255).astype(np.uint8)
-    
-    try:
-        # Create sound from numpy array
-        sound = pygame.mixer.Sound(buffer=samples)
-        # Set appropriate volume
-        sound.set_volume(0.7)
-        print(f"Created 8-bit style sound for: {sound_type}")
-        return sound
-    except Exception as e:
-        print(f"Error creating sound: {e}")
-        # Return an empty sound in case of error
-        empty_sound = pygame.mixer.Sound(buffer=bytearray(1000))
-        empty_sound.set_volume(0.1)
-        return empty_sound
+    """Create an 8-bit style sound effect, reusing the cached WAV from earlier runs."""
+    sound = create_synth_sound(sound_type)
+    # Set appropriate volume
+    sound.set_volume(0.7)
+    return sound
 
 # Game states
 class GameState:
@@ -324,7 +200,7 @@ class GameState:
         player_pos = self.map.find_empty_tile()
         self.player = Player(player_pos[0], player_pos[1], self.assets)
         self.player.inventory = Inventory(40)  # Player can carry 40 items
-        self.player.equipment = EquipmentManager()
+        self.player.equipment = Equipment()
         
         # Initialize player stats
         self.player.health = PLAYER_HP
@@ -368,7 +244,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -424,7 +300,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -480,7 +356,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -536,7 +412,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -592,7 +468,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -648,7 +524,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -704,7 +580,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -760,7 +636,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -816,7 +692,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -872,7 +748,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -928,7 +804,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -984,7 +860,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -1040,7 +916,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -1096,7 +972,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -1152,7 +1028,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -1208,7 +1084,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -1264,7 +1140,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -1320,7 +1196,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -1376,7 +1252,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -1432,7 +1308,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -1488,7 +1364,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -1544,7 +1420,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -1600,7 +1476,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -1656,7 +1532,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -1712,7 +1588,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -1768,7 +1644,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -1824,7 +1700,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -1880,7 +1756,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -1936,7 +1812,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -1992,7 +1868,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -2048,7 +1924,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -2104,7 +1980,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -2160,7 +2036,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -2216,7 +2092,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -2272,7 +2148,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -2328,7 +2204,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -2384,7 +2260,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -2440,7 +2316,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -2496,7 +2372,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -2552,7 +2428,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -2608,7 +2484,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -2664,7 +2540,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -2720,7 +2596,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -2776,7 +2652,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -2832,7 +2708,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -2888,7 +2764,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -2944,7 +2820,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -3000,7 +2876,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -3056,7 +2932,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -3112,7 +2988,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -3168,7 +3044,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -3224,7 +3100,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -3280,7 +3156,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -3336,7 +3212,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -3392,7 +3268,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -3448,7 +3324,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -3504,7 +3380,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -3560,7 +3436,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -3616,7 +3492,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -3672,7 +3548,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -3728,7 +3604,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -3784,7 +3660,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -3840,7 +3716,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -3896,7 +3772,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -3952,7 +3828,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -4008,7 +3884,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -4064,7 +3940,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -4120,7 +3996,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -4176,7 +4052,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -4232,7 +4108,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -4288,7 +4164,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -4344,7 +4220,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -4400,7 +4276,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -4456,7 +4332,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -4512,7 +4388,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -4568,7 +4444,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -4624,7 +4500,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -4680,7 +4556,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -4736,7 +4612,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -4792,7 +4668,7 @@ class GameState:
         self.death_location_expiry = 500  # Frames before a death location expires
         
         # Initialize UI references
-        self.inventory_ui.inventory = self.player.inventory.items
+        self.inventory_ui.bind_inventory(self.player.inventory)
         self.equipment_ui.equipment = self.player.equipment.slots
         
         # Initialize UI state
@@ -4874,81 +4750,6 @@ class GameState:
             traceback.print_exc()
             return False
 
-class EquipmentManager:
-    """Class to manage equipped items."""
-    def __init__(self):
-        self.slots = {
-            'head': None,
-            'chest': None,
-            'legs': None,
-            'feet': None,
-            'hands': None,
-            'weapon': None
-        }
-        
-    def get_equipped_item(self, slot: str) -> Optional[Item]:
-        """Get the item equipped in the given slot."""
-        return self.slots.get(slot)
-        
-    def equip_item(self, item: Item) -> bool:
-        """
-        Equip an item in its appropriate slot.
-        Returns True if successful, False if no appropriate slot.
-        """
-        slot = None
-        if hasattr(item, 'weapon_type'):
-            slot = 'weapon'
-            print(f"DEBUG: Equipment.equip_item - item is a weapon of type {item.weapon_type}")
-        elif hasattr(item, 'is_hands'):
-            slot = 'hands'
-            print(f"DEBUG: Equipment.equip_item - item is hands armor")
-        elif hasattr(item, 'armor_type'):
-            slot = item.armor_type.lower()
-            print(f"DEBUG: Equipment.equip_item - item is armor of type {item.armor_type}")
-        else:
-            print(f"DEBUG: Equipment.equip_item - could not determine slot for item: {item.display_name if hasattr(item, 'display_name') else item}")
-            
-        if slot and slot in self.slots:
-            self.slots[slot] = item
-            print(f"DEBUG: Equipment.equip_item - successfully equipped item in slot '{slot}'")
-            return True
-        return False
-        
-    def unequip_item(self, slot: str) -> Optional[Item]:
-        """Unequip and return the item in the given slot."""
-        if slot in self.slots:
-            item = self.slots[slot]
-            self.slots[slot] = None
-            return item
-        return None
-
-class Inventory:
-    """Class to manage the player's inventory."""
-    def __init__(self, capacity: int = 40):  # Changed from 32 to 40 to match 5x8 grid
-        self.items = [None] * capacity
-        
-    def add_item(self, item: Item) -> bool:
-        """Add an item to the first empty slot. Returns True if successful."""
-        for i in range(len(self.items)):
-            if self.items[i] is None:
-                self.items[i] = item
-                return True
-        return False
-            
-    def remove_item(self, item: Item) -> bool:
-        """Remove the first occurrence of an item. Returns True if successful."""
-        for i in range(len(self.items)):
-            if self.items[i] is item:
-                self.items[i] = None
-                return True
-        return False
-
-    def get_item_at(self, index: int) -> Optional[Item]:
-        """Get the item at the given index."""
-        if 0 <= index < len(self.items):
-            return self.items[index]
-        return None
-
 class Wall(pygame.sprite.Sprite):
     def __init__(self, x: int, y: int):
         super().__init__()
@@ -0,0 +1,403 @@
+"""
+Asset pipeline for phaser_starter.
+
+Rebuilds a directory of assets in parallel across a process pool:
+
+- .jpg/.jpeg images have their checkerboard background removed and are
+  saved as .png next to where the source would go (what convert_assets.py
+  used to do one file at a time).
+- Every other file is copied unchanged when the output is a different
+  directory, so the output is a complete asset tree.
+
+Background removal works on whole-image masks: every pixel close to one of
+the checkerboard colors is marked, the mask is split into 4-connected
+components, and the components touching a background-like corner are made
+transparent. This matches the old per-pixel flood fill from the corners.
+
+Each source file's SHA-256 is recorded in a manifest (asset-manifest.json in
+the output directory) together with its outputs. Files whose content and
+settings did not change since the last run are skipped.
+
+Usage:
+    python asset_pipeline.py build [--src assets] [--out assets] [--jobs N] [--force]
+    python asset_pipeline.py remove-bg image.jpg [more.jpg ...]
+    python asset_pipeline.py directions assets/monster_echo_mite_base.png --name monster_echo_mite
+    python asset_pipeline.py stills assets/animations/monster-echo-mite-attack-{direction}.png \
+        --target assets/animations/monster_echo_mite_{direction}.png
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+try:
+    from scipy import ndimage
+except ImportError:  # Labelling falls back to the run-based version below
+    ndimage = None
+
+HERE = Path(__file__).resolve().parent
+MANIFEST_NAME = "asset-manifest.json"
+# Bump when the processing changes so every asset is rebuilt once
+PIPELINE_VERSION = 1
+
+CONVERT_SUFFIXES = {".jpg", ".jpeg"}
+# Standard checkerboard colors (approximate for JPG)
+CHECKERBOARD_COLORS = ((255, 255, 255), (204, 204, 204), (192, 192, 192))
+DEFAULT_TOLERANCE = 60
+DIRECTION_ROTATIONS = {"south": 0, "north": 180, "east": 90, "west": -90}
+
+
+# ---------------------------------------------------------------------------
+# Background removal
+# ---------------------------------------------------------------------------
+
+def checkerboard_mask(rgb, tolerance=DEFAULT_TOLERANCE):
+    """Boolean mask of pixels within ``tolerance`` of a checkerboard color on every channel."""
+    rgb = rgb.astype(np.int16)
+    mask = np.zeros(rgb.shape[:2], dtype=bool)
+    for color in CHECKERBOARD_COLORS:
+        mask |= (np.abs(rgb - np.array(color, dtype=np.int16)) < tolerance).all(axis=2)
+    return mask
+
+
+def is_background_corner(color, tolerance=DEFAULT_TOLERANCE):
+    """Whether a flood fill may start at a corner of this color."""
+    r, g, b = (int(c) for c in color[:3])
+    if any(abs(r - cr) < tolerance and abs(g - cg) < tolerance and abs(b - cb) < tolerance
+           for cr, cg, cb in CHECKERBOARD_COLORS):
+        return True
+    # Fallbacks: very bright (near white) or gray (r ~ g ~ b)
+    if r > 240 and g > 240 and b > 240:
+        return True
+    return abs(r - g) < 10 and abs(g - b) < 10
+
+
+def label_components(mask):
+    """
+    Label the 4-connected components of a boolean mask.
+
+    Returns:
+        (labels, count): an int array with 0 for background and 1..count for
+        the components
+    """
+    if ndimage is not None:
+        return ndimage.label(mask)
+    return _label_runs(mask)
+
+
+def _label_runs(mask):
+    """Connected-component labelling over horizontal runs with a union-find."""
+    height, width = mask.shape
+    padded = np.zeros((height, width + 2), dtype=np.int8)
+    padded[:, 1:-1] = mask
+    edges = np.diff(padded, axis=1)
+    # Runs per row: [start, end) column ranges, in row-major order
+    run_rows, run_starts = np.nonzero(edges == 1)
+    _, run_ends = np.nonzero(edges == -1)
+    run_count = len(run_rows)
+    labels = np.zeros(mask.shape, dtype=np.int32)
+    if run_count == 0:
+        return labels, 0
+
+    parent = list(range(run_count))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    row_first = np.searchsorted(run_rows, np.arange(height + 1))
+    for row in range(1, height):
+        above = range(row_first[row - 1], row_first[row])
+        below = range(row_first[row], row_first[row + 1])
+        if not above or not below:
+            continue
+        i, j = above.start, below.start
+        # Walk both sorted run lists; runs overlap when each starts before the other ends
+        while i < above.stop and j < below.stop:
+            if run_starts[i] < run_ends[j] and run_starts[j] < run_ends[i]:
+                root_i, root_j = find(i), find(j)
+                if root_i != root_j:
+                    parent[max(root_i, root_j)] = min(root_i, root_j)
+            if run_ends[i] < run_ends[j]:
+                i += 1
+            else:
+                j += 1
+
+    roots = np.array([find(i) for i in range(run_count)])
+    unique_roots, run_labels = np.unique(roots, return_inverse=True)
+    for run, (row, start, end) in enumerate(zip(run_rows, run_starts, run_ends)):
+        labels[row, start:end] = run_labels[run] + 1
+    return labels, len(unique_roots)
+
+
+def remove_background(img, tolerance=DEFAULT_TOLERANCE):
+    """
+    Make the checkerboard background connected to the image corners transparent.
+
+    Args:
+        img: Source image (any mode)
+        tolerance: Per-channel distance to a checkerboard color still counted as background
+
+    Returns:
+        (rgba_image, cleared_pixel_count)
+    """
+    rgba = np.array(img.convert("RGBA"))
+    height, width = rgba.shape[:2]
+    mask = checkerboard_mask(rgba[:, :, :3], tolerance)
+    seeds = [(y, x) for y, x in ((0, 0), (0, width - 1), (height - 1, 0), (height - 1, width - 1))
+             if is_background_corner(rgba[y, x], tolerance)]
+    if not seeds:
+        return Image.fromarray(rgba, "RGBA"), 0
+
+    # A corner that only passed a fallback still starts the fill
+    for y, x in seeds:
+        mask[y, x] = True
+    labels, count = label_components(mask)
+    fill = np.zeros(count + 1, dtype=bool)
+    fill[[labels[y, x] for y, x in seeds]] = True
+    background = fill[labels]
+    rgba[background] = 0
+    return Image.fromarray(rgba, "RGBA"), int(background.sum())
+
+
+# ---------------------------------------------------------------------------
+# Single-image operations
+# ---------------------------------------------------------------------------
+
+def make_directional_sprites(img, size=32):
+    """South-facing sprite resized to ``size`` and rotated into the four directions."""
+    img = img.resize((size, size), Image.Resampling.NEAREST)
+    return {direction: img.rotate(angle) if angle else img
+            for direction, angle in DIRECTION_ROTATIONS.items()}
+
+
+def extract_still(img, width=64, height=64):
+    """First frame of a sprite sheet."""
+    return img.crop((0, 0, width, height))
+
+
+# ---------------------------------------------------------------------------
+# Directory build
+# ---------------------------------------------------------------------------
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def plan_outputs(relative, converts):
+    """Output paths (relative to the output directory) for a source file."""
+    if converts:
+        return [relative.with_suffix(".png")]
+    return [relative]
+
+
+def build_asset(task):
+    """
+    Process one source file (runs in a worker process).
+
+    Args:
+        task: (src_dir, out_dir, relative path, settings, previous manifest entry or None)
+
+    Returns:
+        (relative path as posix string, manifest entry, status) where status
+        is "converted", "copied", "kept" (in place), "skipped" or an error message
+    """
+    src_dir, out_dir, relative, settings, previous = task
+    src_dir, out_dir, relative = Path(src_dir), Path(out_dir), Path(relative)
+    source = src_dir / relative
+    converts = source.suffix.lower() in CONVERT_SUFFIXES
+    in_place = src_dir == out_dir
+    outputs = plan_outputs(relative, converts)
+
+    digest = file_hash(source)
+    if (previous and previous.get("sha256") == digest and previous.get("settings") == settings
+            and all((out_dir / output).exists() for output in outputs)):
+        return relative.as_posix(), previous, "skipped"
+
+    entry = {"sha256": digest, "bytes": source.stat().st_size, "settings": settings,
+             "outputs": [output.as_posix() for output in outputs]}
+    try:
+        target = out_dir / outputs[0]
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if converts:
+            with Image.open(source) as img:
+                result, cleared = remove_background(img, settings["tolerance"])
+            result.save(target, "PNG")
+            entry.update(size=list(result.size), cleared=cleared)
+            status = "converted"
+        elif not in_place:
+            shutil.copy2(source, target)
+            status = "copied"
+        else:
+            status = "kept"
+    except Exception as e:
+        return relative.as_posix(), None, f"error: {e}"
+    return relative.as_posix(), entry, status
+
+
+def load_manifest(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("version") != PIPELINE_VERSION:
+        return {}
+    return manifest.get("assets", {})
+
+
+def collect_sources(src_dir, out_dir):
+    """Source files under ``src_dir`` in a stable order, excluding pipeline output."""
+    in_place = src_dir == out_dir
+    sources = []
+    for path in sorted(src_dir.rglob("*")):
+        if not path.is_file() or path.name == MANIFEST_NAME:
+            continue
+        if not in_place and out_dir in path.parents:
+            continue
+        sources.append(path.relative_to(src_dir))
+    # A .png next to a .jpg of the same name is that image converted earlier; it is rebuilt, not copied
+    produced = {relative.with_suffix(".png") for relative in sources
+                if relative.suffix.lower() in CONVERT_SUFFIXES}
+    return [relative for relative in sources if relative not in produced]
+
+
+def build(src_dir, out_dir=None, jobs=None, force=False, tolerance=DEFAULT_TOLERANCE, verbose=True):
+    """
+    Rebuild an asset directory.
+
+    Args:
+        src_dir: Directory of source assets
+        out_dir: Output directory (defaults to ``src_dir``: convert in place)
+        jobs: Worker processes (defaults to the CPU count)
+        force: Rebuild everything, ignoring the manifest
+        tolerance: Background color tolerance
+
+    Returns:
+        Counts of files per status
+    """
+    src_dir = Path(src_dir).resolve()
+    out_dir = Path(out_dir).resolve() if out_dir else src_dir
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = out_dir / MANIFEST_NAME
+    previous = {} if force else load_manifest(manifest_path)
+    settings = {"tolerance": tolerance}
+
+    start = time.perf_counter()
+    sources = collect_sources(src_dir, out_dir)
+    tasks = [(str(src_dir), str(out_dir), relative.as_posix(), settings,
+              previous.get(relative.as_posix())) for relative in sources]
+
+    assets, counts = {}, {"converted": 0, "copied": 0, "kept": 0, "skipped": 0, "failed": 0}
+    jobs = jobs or os.cpu_count() or 1
+    if jobs > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(build_asset, tasks, chunksize=max(1, len(tasks) // (jobs * 4))))
+    else:
+        results = [build_asset(task) for task in tasks]
+
+    for relative, entry, status in results:
+        if entry is None:
+            counts["failed"] += 1
+            print(f"❌ {relative}: {status}")
+            continue
+        assets[relative] = entry
+        counts[status] += 1
+        if verbose and status == "converted":
+            print(f"✅ Converted {relative} -> {entry['outputs'][0]} (cleared {entry['cleared']} pixels)")
+
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump({"version": PIPELINE_VERSION, "source": os.path.relpath(src_dir, out_dir),
+                   "assets": assets}, f, indent=2, sort_keys=True)
+
+    print(f"🎉 {len(sources)} files in {time.perf_counter() - start:.2f} s: "
+          f"{counts['converted']} converted, {counts['copied'] + counts['kept']} copied or kept, "
+          f"{counts['skipped']} unchanged, {counts['failed']} failed")
+    return counts
+
+
+# ---------------------------------------------------------------------------
+# Command line
+# ---------------------------------------------------------------------------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="phaser_starter asset pipeline")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = commands.add_parser("build", help="Rebuild an asset directory")
+    build_parser.add_argument("--src", default=str(HERE / "assets"), help="Source directory")
+    build_parser.add_argument("--out", default=None, help="Output directory (default: convert in place)")
+    build_parser.add_argument("--jobs", type=int, default=None, help="Worker processes")
+    build_parser.add_argument("--force", action="store_true", help="Ignore the manifest")
+    build_parser.add_argument("--tolerance", type=int, default=DEFAULT_TOLERANCE)
+
+    remove_parser = commands.add_parser("remove-bg", help="Remove the background of single images")
+    remove_parser.add_argument("images", nargs="+")
+    remove_parser.add_argument("--tolerance", type=int, default=DEFAULT_TOLERANCE)
+
+    directions_parser = commands.add_parser("directions", help="Rotate a south-facing sprite into four directions")
+    directions_parser.add_argument("image")
+    directions_parser.add_argument("--name", required=True, help="Output name prefix, e.g. monster_echo_mite")
+    directions_parser.add_argument("--out", default=str(HERE / "assets" / "animations"))
+    directions_parser.add_argument("--size", type=int, default=32)
+
+    stills_parser = commands.add_parser("stills", help="Cut the first frame out of per-direction sheets")
+    stills_parser.add_argument("source", help="Sheet path with a {direction} placeholder")
+    stills_parser.add_argument("--target", required=True, help="Still path with a {direction} placeholder")
+    stills_parser.add_argument("--frame", type=int, nargs=2, default=(64, 64), metavar=("WIDTH", "HEIGHT"))
+
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        counts = build(args.src, args.out, args.jobs, args.force, args.tolerance)
+        return 1 if counts["failed"] else 0
+
+    if args.command == "remove-bg":
+        for image in args.images:
+            path = Path(image)
+            with Image.open(path) as img:
+                result, cleared = remove_background(img, args.tolerance)
+            output = path.with_suffix(".png")
+            result.save(output, "PNG")
+            print(f"✅ Converted {path.name} -> {output.name} (cleared {cleared} pixels)")
+        return 0
+
+    if args.command == "directions":
+        out_dir = Path(args.out)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        with Image.open(args.image) as img:
+            for direction, sprite in make_directional_sprites(img, args.size).items():
+                sprite.save(out_dir / f"{args.name}_{direction}.png")
+        print("Successfully generated directional sprites.")
+        return 0
+
+    if args.command == "stills":
+        for direction in DIRECTION_ROTATIONS:
+            source = Path(args.source.format(direction=direction))
+            target = Path(args.target.format(direction=direction))
+            if not source.exists():
+                print(f"Skipping {direction}: Source not found at {source}")
+                continue
+            with Image.open(source) as img:
+                extract_still(img, *args.frame).save(target)
+            print(f"✅ Generated {target.name} from {source.name}")
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -798,6 +798,12 @@ function preload() {
                 this.load.audio(assetKey, path);
             }
         }
+        // Load Texture Atlases (packed by sprite_packer.py; frames are named `${set}/${index}`)
+        if (data.atlases) {
+            for (const [assetKey, atlas] of Object.entries(data.atlases)) {
+                this.load.atlas(assetKey, atlas.textureURL, atlas.atlasURL);
+            }
+        }
     });
     this.load.json('assets', 'assets.json');
 
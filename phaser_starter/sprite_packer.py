@@ -0,0 +1,296 @@
+"""
+Sprite-sheet packer for monster and NPC frame sets.
+
+Slices sprite sheets into frames, trims each frame's transparent border,
+drops duplicate frames and packs the rest into one power-of-two atlas.
+Directional variants can be generated from a single south-facing image on
+the way (see ``asset_pipeline.make_directional_sprites``).
+
+The frame map is written in the JSON Hash atlas format, so the game can load
+it with ``this.load.atlas(key, png, json)`` (list it under ``atlases`` in
+assets.json, or pass ``--register assets.json``) and the pygame game with
+``rpg_modules.core.asset_loader.load_packed_atlas``. Frames are named
+``<set>/<index>``, where a set is named after its sheet (e.g.
+``monster_goblin_walk_south``) or the NPC's ``spriteKey``. The extra
+``animations`` section lists the frames of each set in order.
+
+This is build tooling only: no atlas is checked in or registered yet. NPCs
+are still loaded with ``load.spritesheet`` and animated by frame number, and
+monsters are drawn procedurally in both games. Using an atlas means
+switching those sprites and their animations to the atlas key and frame
+names.
+
+Usage:
+    python sprite_packer.py monsters "assets/animations/monster_*.png"
+    python sprite_packer.py echo_mite --directional monster_echo_mite=assets/monster_echo_mite_base.png
+    python sprite_packer.py npcs --npc-json npc.json --register assets.json
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+from PIL import Image
+
+from asset_pipeline import make_directional_sprites
+
+HERE = Path(__file__).resolve().parent
+DEFAULT_MAX_SIZE = 2048
+
+
+class FrameSet:
+    """Frames of one animation (or one still), in playback order."""
+
+    def __init__(self, name, frames):
+        self.name = name
+        self.frames = frames
+
+    @classmethod
+    def from_sheet(cls, name, path, frame_width=None, frame_height=None):
+        """
+        Slice a horizontal (or grid) sprite sheet into frames.
+
+        Frames are square with the sheet's height as their side unless a size is given.
+        """
+        with Image.open(path) as sheet:
+            sheet = sheet.convert("RGBA")
+        frame_height = frame_height or sheet.height
+        frame_width = frame_width or frame_height
+        frames = [sheet.crop((x, y, x + frame_width, y + frame_height))
+                  for y in range(0, sheet.height - frame_height + 1, frame_height)
+                  for x in range(0, sheet.width - frame_width + 1, frame_width)]
+        return cls(name, frames)
+
+
+def collect_sheets(patterns):
+    """Frame sets for every sheet matching the glob patterns, named after the file."""
+    paths = sorted({path for pattern in patterns for path in glob.glob(pattern)})
+    return [FrameSet.from_sheet(Path(path).stem, path) for path in paths]
+
+
+def collect_npcs(npc_json):
+    """Frame sets for the NPC sprite sheets listed in npc.json, named by spriteKey."""
+    base = Path(npc_json).parent
+    with open(npc_json, "r", encoding="utf-8") as f:
+        npcs = json.load(f)
+    sets = []
+    for npc in npcs:
+        path = base / npc.get("spritePath", "")
+        if not npc.get("spriteKey") or not path.is_file():
+            continue
+        sets.append(FrameSet.from_sheet(npc["spriteKey"], path,
+                                        npc.get("frameWidth", 64), npc.get("frameHeight", 64)))
+    return sets
+
+
+def collect_directional(specs, size):
+    """Four one-frame sets (``<name>_south`` ...) per ``name=source`` spec."""
+    sets = []
+    for spec in specs:
+        name, _, source = spec.partition("=")
+        with Image.open(source) as img:
+            sprites = make_directional_sprites(img.convert("RGBA"), size)
+        sets.extend(FrameSet(f"{name}_{direction}", [sprite]) for direction, sprite in sprites.items())
+    return sets
+
+
+def trim(frame):
+    """
+    Cut a frame down to its non-transparent pixels.
+
+    Returns:
+        (trimmed image, (x, y) offset of the trimmed image in the frame)
+    """
+    box = frame.getchannel("A").getbbox()
+    if box is None:
+        # Fully transparent: keep one pixel so the frame still exists
+        return frame.crop((0, 0, 1, 1)), (0, 0)
+    return frame.crop(box), box[:2]
+
+
+def next_power_of_two(value):
+    return 1 << max(0, int(value) - 1).bit_length()
+
+
+def shelf_pack(sizes, width, padding):
+    """
+    Place rectangles tallest first on shelves of a fixed width.
+
+    Same shelf layout as ``rpg_modules.core.asset_loader.pack_shelves``.
+
+    Returns:
+        (positions in input order, used height)
+    """
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    positions = [(0, 0)] * len(sizes)
+    shelf_x = shelf_y = shelf_height = 0
+    for index in order:
+        w, h = sizes[index][0] + padding, sizes[index][1] + padding
+        if shelf_x + w > width:
+            shelf_y += shelf_height
+            shelf_x = shelf_height = 0
+        positions[index] = (shelf_x, shelf_y)
+        shelf_x += w
+        shelf_height = max(shelf_height, h)
+    return positions, shelf_y + shelf_height
+
+
+def pack(sizes, padding=1, max_size=DEFAULT_MAX_SIZE):
+    """
+    Pack rectangles into the smallest power-of-two atlas that holds them.
+
+    Every power-of-two width from the widest rectangle up to ``max_size`` is
+    tried; the one giving the smallest (then squarest) atlas wins.
+
+    Returns:
+        (positions in input order, (atlas_width, atlas_height))
+
+    Raises:
+        ValueError: If the rectangles do not fit in ``max_size`` x ``max_size``
+    """
+    if not sizes:
+        return [], (1, 1)
+    best = None
+    width = next_power_of_two(max(w for w, _ in sizes) + padding)
+    while width <= max_size:
+        positions, used_height = shelf_pack(sizes, width, padding)
+        height = next_power_of_two(used_height)
+        if height <= max_size:
+            score = (width * height, abs(width - height))
+            if best is None or score < best[0]:
+                best = (score, positions, (width, height))
+        width *= 2
+    if best is None:
+        raise ValueError(f"Frames do not fit in a {max_size}x{max_size} atlas; split them into more atlases")
+    return best[1], best[2]
+
+
+def build_atlas(name, frame_sets, out_dir, padding=1, max_size=DEFAULT_MAX_SIZE, trim_frames=True):
+    """
+    Pack frame sets into ``<out_dir>/<name>.png`` and ``<out_dir>/<name>.json``.
+
+    Returns:
+        The frame map that was written
+    """
+    unique = []        # (image, offset, source size) per distinct packed frame
+    by_hash = {}
+    placements = {}    # frame name -> index into unique
+    animations = {}
+    for frame_set in frame_sets:
+        animations[frame_set.name] = []
+        for index, frame in enumerate(frame_set.frames):
+            frame_name = f"{frame_set.name}/{index}"
+            image, offset = trim(frame) if trim_frames else (frame, (0, 0))
+            key = (hashlib.sha1(image.tobytes()).hexdigest(), image.size, offset, frame.size)
+            if key not in by_hash:
+                by_hash[key] = len(unique)
+                unique.append((image, offset, frame.size))
+            placements[frame_name] = by_hash[key]
+            animations[frame_set.name].append(frame_name)
+
+    positions, atlas_size = pack([image.size for image, _, _ in unique], padding, max_size)
+    atlas = Image.new("RGBA", atlas_size, (0, 0, 0, 0))
+    for (image, _, _), position in zip(unique, positions):
+        atlas.paste(image, position)
+
+    frames = {}
+    for frame_name, index in placements.items():
+        image, (ox, oy), (source_w, source_h) = unique[index]
+        x, y = positions[index]
+        w, h = image.size
+        frames[frame_name] = {
+            "frame": {"x": x, "y": y, "w": w, "h": h},
+            "rotated": False,
+            "trimmed": (w, h) != (source_w, source_h),
+            "spriteSourceSize": {"x": ox, "y": oy, "w": w, "h": h},
+            "sourceSize": {"w": source_w, "h": source_h}
+        }
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    atlas.save(out_dir / f"{name}.png", "PNG", optimize=True)
+    frame_map = {
+        "frames": frames,
+        "animations": animations,
+        "meta": {
+            "app": "phaser_starter/sprite_packer.py",
+            "version": "1",
+            "image": f"{name}.png",
+            "format": "RGBA8888",
+            "size": {"w": atlas_size[0], "h": atlas_size[1]},
+            "scale": "1"
+        }
+    }
+    with open(out_dir / f"{name}.json", "w", encoding="utf-8") as f:
+        json.dump(frame_map, f, indent=1)
+    return frame_map
+
+
+def register_atlas(assets_json, key, out_dir):
+    """Add or update the atlas under ``atlases`` in assets.json."""
+    assets_json = Path(assets_json)
+    with open(assets_json, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    relative = Path(os.path.relpath(Path(out_dir).resolve(), assets_json.resolve().parent)).as_posix()
+    data.setdefault("atlases", {})[key] = {
+        "textureURL": f"{relative}/{key}.png",
+        "atlasURL": f"{relative}/{key}.json"
+    }
+    with open(assets_json, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=4)
+        f.write("\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pack sprite sheets into a texture atlas")
+    parser.add_argument("name", help="Atlas name (output file stem and texture key)")
+    parser.add_argument("sheets", nargs="*", help="Sprite sheet paths or glob patterns")
+    parser.add_argument("--npc-json", help="Also pack the NPC sprite sheets listed in this npc.json")
+    parser.add_argument("--directional", action="append", default=[], metavar="NAME=SOURCE",
+                        help="Generate south/north/east/west variants of a south-facing image")
+    parser.add_argument("--directional-size", type=int, default=32)
+    parser.add_argument("--out", default=str(HERE / "assets" / "atlases"))
+    parser.add_argument("--max-size", type=int, default=DEFAULT_MAX_SIZE)
+    parser.add_argument("--padding", type=int, default=1)
+    parser.add_argument("--no-trim", action="store_true", help="Keep transparent borders")
+    parser.add_argument("--register", metavar="ASSETS_JSON", help="Add the atlas to this assets.json")
+    args = parser.parse_args(argv)
+
+    frame_sets = collect_sheets(args.sheets)
+    if args.npc_json:
+        frame_sets += collect_npcs(args.npc_json)
+    frame_sets += collect_directional(args.directional, args.directional_size)
+    if not frame_sets:
+        print("No frame sets to pack")
+        return 1
+
+    names = [frame_set.name for frame_set in frame_sets]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        print(f"❌ Frame set names used twice: {', '.join(duplicates)}")
+        return 1
+
+    try:
+        frame_map = build_atlas(args.name, frame_sets, args.out, args.padding, args.max_size,
+                                trim_frames=not args.no_trim)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+
+    size = frame_map["meta"]["size"]
+    source_area = sum(f["sourceSize"]["w"] * f["sourceSize"]["h"] for f in frame_map["frames"].values())
+    print(f"✅ Packed {len(frame_sets)} sets ({len(frame_map['frames'])} frames) into "
+          f"{args.name}.png {size['w']}x{size['h']} "
+          f"({size['w'] * size['h'] / max(1, source_area):.0%} of the untrimmed frame area)")
+    if args.register:
+        register_atlas(args.register, args.name, args.out)
+        print(f"✅ Registered '{args.name}' in {args.register}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -24,6 +24,7 @@ class AnimationState(Enum):
     HURT = auto()
 
 from .base import MonsterIcon, PlayerIcon, AnimatedIcon
+from .particles import ParticleEngine, ParticleEmitter
 
 class Animation:
     """Base class for handling sprite animations."""
@@ -1,10 +1,34 @@
 import pygame
 import math
 import random
-from dataclasses import dataclass
-from typing import Tuple, List, Optional
+from typing import Dict, Tuple, List, Optional
 from enum import Enum
 import time
+from .particles import ParticleEmitter
+
+# Shadow and highlight overlays are the same every frame for an icon, so
+# they are drawn once per (kind, shape, colour, size, offset, alpha)
+MAX_CACHED_EFFECTS = 512
+_effect_cache: Dict[tuple, pygame.Surface] = {}
+
+
+def _get_effect_surface(kind: str, shape: str, color: Tuple[int, int, int], size: int,
+                        offset: Tuple[int, int], alpha: int) -> pygame.Surface:
+    """Get the cached shadow or highlight overlay for an icon of the given size."""
+    key = (kind, shape, tuple(color[:3]), size, tuple(offset), alpha)
+    effect = _effect_cache.get(key)
+    if effect is None:
+        if len(_effect_cache) >= MAX_CACHED_EFFECTS:
+            _effect_cache.clear()
+        effect = pygame.Surface((size, size), pygame.SRCALPHA)
+        rgba = (*color[:3], alpha)
+        extent = size//2 if kind == "shadow" else size//4
+        if shape == "circle":
+            pygame.draw.circle(effect, rgba, (size//2 + offset[0], size//2 + offset[1]), extent)
+        elif shape == "rect":
+            pygame.draw.rect(effect, rgba, (size//4 + offset[0], size//4 + offset[1], extent, extent))
+        _effect_cache[key] = effect
+    return effect
 
 class Direction(Enum):
     UP = "up"
@@ -12,20 +36,11 @@ class Direction(Enum):
     LEFT = "left"
     RIGHT = "right"
 
-@dataclass
-class Particle:
-    x: float
-    y: float
-    dx: float
-    dy: float
-    color: Tuple[int, int, int]
-    life: float
-    size: float
-
 class AnimatedIcon:
     """Base class for animated icons in the game."""
     def __init__(self):
-        self._particles: List[Particle] = []
+        # Particles live in the shared pool; the emitter tracks this icon's ones
+        self._particles = ParticleEmitter()
         self._time = 0
 
     def update(self, dt: float):
@@ -33,12 +48,7 @@ class AnimatedIcon:
         self._time += dt
         
         # Update particles
-        for particle in self._particles[:]:
-            particle.x += particle.dx
-            particle.y += particle.dy
-            particle.life -= dt
-            if particle.life <= 0:
-                self._particles.remove(particle)
+        self._particles.update(dt)
 
     def _get_animation_values(self) -> dict:
         """Get common animation values used across different icons."""
@@ -52,26 +62,12 @@ class AnimatedIcon:
     def _draw_shadow(self, surface: pygame.Surface, shape: str, color: Tuple[int, int, int], 
                     size: int, offset=(1, 1), alpha=64):
         """Draw a shadow effect."""
-        shadow_surface = pygame.Surface((size, size), pygame.SRCALPHA)
-        if shape == "circle":
-            pygame.draw.circle(shadow_surface, (*color[:3], alpha), 
-                             (size//2 + offset[0], size//2 + offset[1]), size//2)
-        elif shape == "rect":
-            pygame.draw.rect(shadow_surface, (*color[:3], alpha),
-                           (size//4 + offset[0], size//4 + offset[1], size//2, size//2))
-        surface.blit(shadow_surface, (0, 0))
+        surface.blit(_get_effect_surface("shadow", shape, color, size, offset, alpha), (0, 0))
 
     def _draw_highlight(self, surface: pygame.Surface, shape: str, color: Tuple[int, int, int], 
                        size: int, offset=(-1, -1), alpha=128):
         """Draw a highlight effect."""
-        highlight_surface = pygame.Surface((size, size), pygame.SRCALPHA)
-        if shape == "circle":
-            pygame.draw.circle(highlight_surface, (*color[:3], alpha),
-                             (size//2 + offset[0], size//2 + offset[1]), size//4)
-        elif shape == "rect":
-            pygame.draw.rect(highlight_surface, (*color[:3], alpha),
-                           (size//4 + offset[0], size//4 + offset[1], size//4, size//4))
-        surface.blit(highlight_surface, (0, 0))
+        surface.blit(_get_effect_surface("highlight", shape, color, size, offset, alpha), (0, 0))
 
     def _draw_animated_eyes(self, surface: pygame.Surface, x: int, y: int, size: int,
                           eye_color: Tuple[int, int, int], 
@@ -94,28 +90,10 @@ class AnimatedIcon:
             if position and color:
                 # Single particle mode
                 if isinstance(color, (tuple, list)) and len(color) >= 3:
-                    particle_surface = pygame.Surface((int(size*2), int(size*2)), pygame.SRCALPHA)
-                    pygame.draw.circle(particle_surface, color, (size, size), size)
-                    surface.blit(particle_surface, (int(position[0]-size), int(position[1]-size)))
+                    self._particles.engine.draw_single(surface, position, color, size)
             else:
-                # Draw all particles in the list
-                for particle in self._particles:
-                    if not isinstance(particle, Particle):
-                        continue
-                        
-                    alpha = int(255 * (particle.life / 1.0))
-                    if isinstance(particle.color, (tuple, list)):
-                        # Handle both RGB and RGBA colors
-                        if len(particle.color) == 3:
-                            color = (*particle.color, alpha)
-                        else:
-                            color = (*particle.color[:3], min(particle.color[3], alpha))
-                            
-                        particle_surface = pygame.Surface((int(particle.size*2), int(particle.size*2)), pygame.SRCALPHA)
-                        pygame.draw.circle(particle_surface, color, 
-                                        (particle.size, particle.size), particle.size)
-                        surface.blit(particle_surface, 
-                                   (int(particle.x-particle.size), int(particle.y-particle.size)))
+                # Draw all particles of this icon with the cached sprites
+                self._particles.draw(surface)
         except Exception as e:
             print(f"Error drawing particles: {str(e)}")
 
@@ -182,7 +160,7 @@ class PlayerIcon(AnimatedIcon):
         if random.random() < 0.2:
             angle = random.uniform(0, math.pi * 2)
             dist = random.uniform(size//3, size//2)
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2 + math.cos(angle) * dist,
                 y=size//2 + math.sin(angle) * dist,
                 dx=math.cos(angle) * -0.5,
@@ -190,7 +168,7 @@ class PlayerIcon(AnimatedIcon):
                 color=(100, 150, 255),
                 life=random.uniform(0.5, 1.0),
                 size=random.uniform(1, 2)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -207,7 +185,6 @@ class MonsterIcon(AnimatedIcon):
             self.monster_type = monster_type.value
         else:
             self.monster_type = str(monster_type).lower()
-        self._particles = []
         self._animation_state = {
             'time': 0,
             'direction': Direction.DOWN,
@@ -217,16 +194,8 @@ class MonsterIcon(AnimatedIcon):
     def _update_particles(self, size: int):
         """Update particle positions and lifetimes."""
         try:
-            for particle in self._particles[:]:
-                particle.x += particle.dx
-                particle.y += particle.dy
-                particle.life -= 0.016  # Assuming 60 FPS
-                
-                # Remove particles that are out of bounds or have expired
-                if (particle.life <= 0 or 
-                    particle.x < 0 or particle.x > size or 
-                    particle.y < 0 or particle.y > size):
-                    self._particles.remove(particle)
+            # Expired particles and ones that left the icon go back to the pool
+            self._particles.update(0.016, bounds=size)  # Assuming 60 FPS
         except Exception as e:
             print(f"Error updating particles: {e}")
 
@@ -493,7 +462,7 @@ class MonsterIcon(AnimatedIcon):
                         random.randint(center[0] - size//3, center[0] + size//3),
                         random.randint(center[1] - size//3, center[1] + size//3)
                     )
-                    self._particles.append(Particle(
+                    self._particles.emit(
                         x=sparkle_pos[0],
                         y=sparkle_pos[1],
                         dx=random.uniform(-1, 1),
@@ -501,7 +470,7 @@ class MonsterIcon(AnimatedIcon):
                         color=self._sanitize_color((255, 255, 255)),
                         life=random.uniform(0.2, 0.4),
                         size=random.uniform(2, 4)
-                    ))
+                    )
             
             self._draw_particles(surface)
             return True
@@ -608,7 +577,7 @@ class MonsterIcon(AnimatedIcon):
                 for _ in range(2):
                     angle = random.uniform(0, math.pi * 2)
                     distance = random.uniform(size//4, size//2)
-                    self._particles.append(Particle(
+                    self._particles.emit(
                         x=center[0] + math.cos(angle) * distance,
                         y=center[1] + math.sin(angle) * distance,
                         dx=random.uniform(-1, 1),
@@ -616,7 +585,7 @@ class MonsterIcon(AnimatedIcon):
                         color=(255, 100, 0, 150),
                         life=random.uniform(0.3, 0.6),
                         size=random.uniform(2, 4)
-                    ))
+                    )
             
             self._draw_particles(surface)
             return True
@@ -661,7 +630,7 @@ class MonsterIcon(AnimatedIcon):
             if random.random() < 0.3:
                 angle = random.uniform(0, math.pi * 2)
                 distance = random.uniform(size//6, size//3)
-                self._particles.append(Particle(
+                self._particles.emit(
                     x=center[0] + math.cos(angle) * distance,
                     y=center[1] + math.sin(angle) * distance,
                     dx=random.uniform(-1, 1),
@@ -669,7 +638,7 @@ class MonsterIcon(AnimatedIcon):
                     color=(255, 255, 255),
                     life=random.uniform(0.3, 0.6),
                     size=random.uniform(2, 3)
-                ))
+                )
             
             self._draw_particles(surface)
             return True
@@ -725,7 +694,7 @@ class MonsterIcon(AnimatedIcon):
             # Add drip particles
             if random.random() < 0.1:
                 drip_x = center[0] + random.uniform(-radius, radius)
-                self._particles.append(Particle(
+                self._particles.emit(
                     x=drip_x,
                     y=center[1],
                     dx=0,
@@ -733,7 +702,7 @@ class MonsterIcon(AnimatedIcon):
                     color=slime_color,
                     life=random.uniform(0.5, 1.0),
                     size=random.uniform(2, 4)
-                ))
+                )
             
             self._draw_particles(surface)
             return True
@@ -795,7 +764,7 @@ class MonsterIcon(AnimatedIcon):
             # Add steam particle effects
             if random.random() < 0.3:
                 for vent in vent_positions:
-                    self._particles.append(Particle(
+                    self._particles.emit(
                         x=vent[0] + size//12,
                         y=vent[1],
                         dx=random.uniform(-0.5, 0.5),
@@ -803,7 +772,7 @@ class MonsterIcon(AnimatedIcon):
                         color=(200, 200, 200, 128),
                         life=random.uniform(0.5, 1.0),
                         size=random.uniform(4, 8)
-                    ))
+                    )
             
             # Draw glowing power core
             core_pulse = (math.sin(self._time * 4) + 1) / 2
@@ -863,7 +832,7 @@ class MonsterIcon(AnimatedIcon):
             if random.random() < 0.2:
                 angle = random.uniform(0, math.pi * 2)
                 distance = random.uniform(size//6, size//3)
-                self._particles.append(Particle(
+                self._particles.emit(
                     x=center[0] + math.cos(angle) * distance,
                     y=center[1] + math.sin(angle) * distance + float_y,
                     dx=random.uniform(-0.5, 0.5),
@@ -871,7 +840,7 @@ class MonsterIcon(AnimatedIcon):
                     color=(*spirit_color[:3], 128),
                     life=random.uniform(0.5, 1.0),
                     size=random.uniform(3, 6)
-                ))
+                )
             
             self._draw_particles(surface)
             return True
@@ -928,7 +897,7 @@ class MonsterIcon(AnimatedIcon):
             
             # Add mist effect
             if random.random() < 0.2:
-                self._particles.append(Particle(
+                self._particles.emit(
                     x=center[0] + random.uniform(-size//3, size//3),
                     y=center[1] + random.uniform(-size//3, size//3),
                     dx=random.uniform(-0.5, 0.5),
@@ -936,7 +905,7 @@ class MonsterIcon(AnimatedIcon):
                     color=(200, 200, 200, 100),
                     life=random.uniform(0.5, 1.0),
                     size=random.uniform(3, 5)
-                ))
+                )
             
             self._draw_particles(surface)
             return True
@@ -969,7 +938,7 @@ class MonsterIcon(AnimatedIcon):
                 for _ in range(5):
                     angle = random.uniform(0, math.pi * 2)
                     distance = random.uniform(size//4, size//2)
-                    self._particles.append(Particle(
+                    self._particles.emit(
                         x=size//2 + math.cos(angle) * distance,
                         y=size//2 + math.sin(angle) * distance,
                         dx=random.uniform(-2, 2),
@@ -977,7 +946,7 @@ class MonsterIcon(AnimatedIcon):
                         color=self._sanitize_color((255, 165, 0)),
                         life=random.uniform(0.3, 0.6),
                         size=random.uniform(3, 6)
-                    ))
+                    )
             
             eye_color = (255, 255, 0)
             eye_positions = [
@@ -1034,7 +1003,7 @@ class MonsterIcon(AnimatedIcon):
                 for _ in range(3):
                     angle = random.uniform(0, math.pi * 2)
                     distance = random.uniform(size//4, size//2)
-                    self._particles.append(Particle(
+                    self._particles.emit(
                         x=center[0] + math.cos(angle) * distance,
                         y=center[1] + math.sin(angle) * distance,
                         dx=random.uniform(-1, 1),
@@ -1042,7 +1011,7 @@ class MonsterIcon(AnimatedIcon):
                         color=self._sanitize_color((200, 200, 200)),
                         life=random.uniform(0.3, 0.6),
                         size=random.uniform(2, 4)
-                    ))
+                    )
             
             self._draw_particles(surface)
             return True
@@ -1072,7 +1041,7 @@ class MonsterIcon(AnimatedIcon):
             
             # Add simple animation effect
             if random.random() < 0.1:
-                self._particles.append(Particle(
+                self._particles.emit(
                     x=center[0],
                     y=center[1],
                     dx=random.uniform(-1, 1),
@@ -1080,7 +1049,7 @@ class MonsterIcon(AnimatedIcon):
                     color=self._sanitize_color(monster_color),
                     life=random.uniform(0.2, 0.4),
                     size=random.uniform(2, 4)
-                ))
+                )
             
             self._draw_particles(surface)
             return True
@@ -1155,7 +1124,7 @@ class MonsterIcon(AnimatedIcon):
                     spawn_y = center[1] + spawn_radius * math.sin(angle)
                     
                     # Particle movement tends upward
-                    self._particles.append(Particle(
+                    self._particles.emit(
                         x=spawn_x,
                         y=spawn_y,
                         dx=random.uniform(-1, 1),
@@ -1163,7 +1132,7 @@ class MonsterIcon(AnimatedIcon):
                         color=particle_color,
                         life=random.uniform(0.3, 0.8),
                         size=random.uniform(2, 4)
-                    ))
+                    )
             
             self._draw_particles(surface)
             return True
@@ -1224,7 +1193,7 @@ class MonsterIcon(AnimatedIcon):
                 # Add lightning particles
                 for point in bolt_points:
                     for _ in range(2):
-                        self._particles.append(Particle(
+                        self._particles.emit(
                             x=point[0],
                             y=point[1],
                             dx=random.uniform(-2, 2),
@@ -1232,7 +1201,7 @@ class MonsterIcon(AnimatedIcon):
                             color=(255, 255, 200, random.randint(128, 255)),
                             life=random.uniform(0.1, 0.3),
                             size=random.uniform(2, 4)
-                        ))
+                        )
             
             # Draw glowing eyes
             eye_color = (255, 255, 200)
@@ -1253,7 +1222,7 @@ class MonsterIcon(AnimatedIcon):
             if random.random() < 0.3:
                 for _ in range(2):
                     start_x = random.uniform(center[0] - size//3, center[0] + size//3)
-                    self._particles.append(Particle(
+                    self._particles.emit(
                         x=start_x,
                         y=center[1],
                         dx=random.uniform(-0.5, 0.5),
@@ -1261,7 +1230,7 @@ class MonsterIcon(AnimatedIcon):
                         color=(100, 100, 255, 128),
                         life=random.uniform(0.3, 0.6),
                         size=random.uniform(2, 4)
-                    ))
+                    )
             
             self._draw_particles(surface)
             return True
@@ -1330,7 +1299,7 @@ class MonsterIcon(AnimatedIcon):
                 leaf_start_x = center[0] + random.uniform(-crown_radius, crown_radius)
                 leaf_start_y = center[1] - crown_radius
                 
-                self._particles.append(Particle(
+                self._particles.emit(
                     x=leaf_start_x,
                     y=leaf_start_y,
                     dx=random.uniform(-1, 1),
@@ -1338,7 +1307,7 @@ class MonsterIcon(AnimatedIcon):
                     color=(0, 255, 0, 128),
                     life=random.uniform(1.0, 2.0),
                     size=random.uniform(2, 4)
-                ))
+                )
             
             # Add occasional nature sparkle
             if random.random() < 0.1:
@@ -1347,7 +1316,7 @@ class MonsterIcon(AnimatedIcon):
                 sparkle_x = center[0] + math.cos(angle) * distance
                 sparkle_y = center[1] + math.sin(angle) * distance
                 
-                self._particles.append(Particle(
+                self._particles.emit(
                     x=sparkle_x,
                     y=sparkle_y,
                     dx=random.uniform(-0.5, 0.5),
@@ -1355,7 +1324,7 @@ class MonsterIcon(AnimatedIcon):
                     color=(200, 255, 200, 192),
                     life=random.uniform(0.3, 0.6),
                     size=random.uniform(2, 4)
-                ))
+                )
             
             self._draw_particles(surface)
             return True
@@ -1426,7 +1395,7 @@ class MonsterIcon(AnimatedIcon):
                     particle_x = center[0] + math.cos(angle) * distance
                     particle_y = center[1] + math.sin(angle) * distance
                     
-                    self._particles.append(Particle(
+                    self._particles.emit(
                         x=particle_x,
                         y=particle_y,
                         dx=random.uniform(-0.5, 0.5),
@@ -1434,7 +1403,7 @@ class MonsterIcon(AnimatedIcon):
                         color=(*ice_colors[0], 150),  # Semi-transparent ice particles
                         life=random.uniform(0.3, 0.6),
                         size=random.uniform(2, 4)
-                    ))
+                    )
             
             self._draw_particles(surface)
             return True
@@ -1514,7 +1483,7 @@ class MonsterIcon(AnimatedIcon):
                     random.randint(0, size),
                     random.randint(0, size)
                 )
-                self._particles.append(Particle(
+                self._particles.emit(
                     x=web_pos[0],
                     y=web_pos[1],
                     dx=random.uniform(-0.2, 0.2),
@@ -1522,7 +1491,7 @@ class MonsterIcon(AnimatedIcon):
                     color=(255, 255, 255, 128),
                     life=random.uniform(0.5, 1.0),
                     size=random.uniform(1, 2)
-                ))
+                )
             
             self._draw_particles(surface)
             return True
@@ -1674,7 +1643,7 @@ class MonsterIcon(AnimatedIcon):
                         center[0] + math.cos(angle) * distance,
                         center[1] + math.sin(angle) * distance
                     )
-                    self._particles.append(Particle(
+                    self._particles.emit(
                         x=sparkle_pos[0],
                         y=sparkle_pos[1],
                         dx=random.uniform(-0.5, 0.5),
@@ -1682,7 +1651,7 @@ class MonsterIcon(AnimatedIcon):
                         color=(255, 255, 255, 180),
                         life=random.uniform(0.3, 0.6),
                         size=random.uniform(2, 3)
-                    ))
+                    )
             
             self._draw_particles(surface)
             return True
@@ -1748,7 +1717,7 @@ class MonsterIcon(AnimatedIcon):
                         center[1] + math.sin(angle) * distance
                     )
                     
-                    self._particles.append(Particle(
+                    self._particles.emit(
                         x=particle_pos[0],
                         y=particle_pos[1],
                         dx=random.uniform(-1, 1),
@@ -1756,7 +1725,7 @@ class MonsterIcon(AnimatedIcon):
                         color=(*shadow_color, 100),
                         life=random.uniform(0.5, 1.0),
                         size=random.uniform(3, 6)
-                    ))
+                    )
             
             # Add occasional dark tendrils
             if random.random() < 0.1:
@@ -1846,7 +1815,7 @@ class MonsterIcon(AnimatedIcon):
                     center[0] + random.uniform(-size//3, size//3),
                     center[1] + random.uniform(-size//3, size//3)
                 )
-                self._particles.append(Particle(
+                self._particles.emit(
                     x=particle_pos[0],
                     y=particle_pos[1],
                     dx=random.uniform(-0.5, 0.5),
@@ -1854,7 +1823,7 @@ class MonsterIcon(AnimatedIcon):
                     color=(100, 150, 100, 128),
                     life=random.uniform(0.5, 1.0),
                     size=random.uniform(2, 4)
-                ))
+                )
             
             self._draw_particles(surface)
             return True
@@ -1921,7 +1890,7 @@ class MonsterIcon(AnimatedIcon):
                     particle_x = center[0] + math.cos(angle) * distance
                     particle_y = center[1] + math.sin(angle) * distance
                     
-                    self._particles.append(Particle(
+                    self._particles.emit(
                         x=particle_x,
                         y=particle_y,
                         dx=random.uniform(-0.5, 0.5),
@@ -1929,7 +1898,7 @@ class MonsterIcon(AnimatedIcon):
                         color=random.choice(particle_colors),
                         life=random.uniform(0.5, 1.0),
                         size=random.uniform(3, 5)
-                    ))
+                    )
             
             self._draw_particles(surface)
             return True
@@ -2020,7 +1989,7 @@ class MonsterIcon(AnimatedIcon):
                         center[0] + random.uniform(-size//3, size//3),
                         center[1] + random.uniform(-size//3, size//3)
                     )
-                    self._particles.append(Particle(
+                    self._particles.emit(
                         x=trail_pos[0],
                         y=trail_pos[1],
                         dx=random.uniform(-1, 1),
@@ -2028,7 +1997,7 @@ class MonsterIcon(AnimatedIcon):
                         color=(*shadow_color, 100),
                         life=random.uniform(0.5, 1.0),
                         size=random.uniform(3, 6)
-                    ))
+                    )
             
             # Add occasional flame particles from hooves
             if random.random() < 0.2:
@@ -2037,7 +2006,7 @@ class MonsterIcon(AnimatedIcon):
                     (center[0] + size//3, center[1] + size//4)
                 ]
                 for hoof_pos in hoof_positions:
-                    self._particles.append(Particle(
+                    self._particles.emit(
                         x=hoof_pos[0],
                         y=hoof_pos[1],
                         dx=random.uniform(-0.5, 0.5),
@@ -2045,7 +2014,7 @@ class MonsterIcon(AnimatedIcon):
                         color=(255, 0, 0, 150),
                         life=random.uniform(0.3, 0.6),
                         size=random.uniform(2, 4)
-                    ))
+                    )
             
             self._draw_particles(surface)
             return True
@@ -2095,7 +2064,7 @@ class MonsterIcon(AnimatedIcon):
             if random.random() < 0.2:
                 for point in body_points:
                     if random.random() < 0.3:
-                        self._particles.append(Particle(
+                        self._particles.emit(
                             x=point[0],
                             y=point[1],
                             dx=random.uniform(-0.5, 0.5),
@@ -2103,7 +2072,7 @@ class MonsterIcon(AnimatedIcon):
                             color=(0, 255, 0, 128),
                             life=random.uniform(0.3, 0.6),
                             size=random.uniform(2, 4)
-                        ))
+                        )
             
             self._draw_particles(surface)
             return True
@@ -2240,7 +2209,7 @@ class MonsterIcon(AnimatedIcon):
                     random.randint(center[0] - size//4, center[0] + size//4),
                     random.randint(center[1] - size//6, center[1] + size//6)
                 )
-                self._particles.append(Particle(
+                self._particles.emit(
                     x=splash_pos[0],
                     y=splash_pos[1],
                     dx=random.uniform(-1, 1),
@@ -2248,7 +2217,7 @@ class MonsterIcon(AnimatedIcon):
                     color=(100, 150, 200, 128),
                     life=random.uniform(0.5, 1.0),
                     size=random.uniform(2, 4)
-                ))
+                )
             
             self._draw_particles(surface)
             return True
@@ -2303,7 +2272,7 @@ class MonsterIcon(AnimatedIcon):
                     random.randint(center[0] - size//4, center[0] + size//4),
                     random.randint(center[1] - size//6, center[1] + size//6)
                 )
-                self._particles.append(Particle(
+                self._particles.emit(
                     x=splash_pos[0],
                     y=splash_pos[1],
                     dx=random.uniform(-1, 1),
@@ -2311,7 +2280,7 @@ class MonsterIcon(AnimatedIcon):
                     color=(100, 150, 200, 128),
                     life=random.uniform(0.5, 1.0),
                     size=random.uniform(2, 4)
-                ))
+                )
             
             self._draw_particles(surface)
             return True
@@ -2366,7 +2335,7 @@ class MonsterIcon(AnimatedIcon):
                     random.randint(center[0] - size//4, center[0] + size//4),
                     random.randint(center[1] - size//6, center[1] + size//6)
                 )
-                self._particles.append(Particle(
+                self._particles.emit(
                     x=splash_pos[0],
                     y=splash_pos[1],
                     dx=random.uniform(-1, 1),
@@ -2374,7 +2343,7 @@ class MonsterIcon(AnimatedIcon):
                     color=(100, 150, 200, 128),
                     life=random.uniform(0.5, 1.0),
                     size=random.uniform(2, 4)
-                ))
+                )
             
             self._draw_particles(surface)
             return True
@@ -2429,7 +2398,7 @@ class MonsterIcon(AnimatedIcon):
                     random.randint(center[0] - size//4, center[0] + size//4),
                     random.randint(center[1] - size//6, center[1] + size//6)
                 )
-                self._particles.append(Particle(
+                self._particles.emit(
                     x=splash_pos[0],
                     y=splash_pos[1],
                     dx=random.uniform(-1, 1),
@@ -2437,7 +2406,7 @@ class MonsterIcon(AnimatedIcon):
                     color=(100, 150, 200, 128),
                     life=random.uniform(0.5, 1.0),
                     size=random.uniform(2, 4)
-                ))
+                )
             
             self._draw_particles(surface)
             return True
@@ -2491,7 +2460,7 @@ class MonsterIcon(AnimatedIcon):
             if random.random() < 0.2:
                 angle = random.uniform(0, math.pi * 2)
                 distance = random.uniform(size//6, size//3)
-                self._particles.append(Particle(
+                self._particles.emit(
                     x=center[0] + math.cos(angle) * distance,
                     y=center[1] + math.sin(angle) * distance + float_y,
                     dx=random.uniform(-0.5, 0.5),
@@ -2499,7 +2468,7 @@ class MonsterIcon(AnimatedIcon):
                     color=(*water_spirit_color[:3], 128),
                     life=random.uniform(0.5, 1.0),
                     size=random.uniform(3, 6)
-                ))
+                )
             
             self._draw_particles(surface)
             return True
@@ -0,0 +1,229 @@
+"""
+Pooled particle engine shared by all animated icons.
+
+Particles live in one fixed-capacity pool stored as parallel arrays
+(structure of arrays), so spawning and killing particles never allocates.
+Each icon owns a ``ParticleEmitter`` that only keeps the pool slots of its
+own particles. Particles are drawn with pre-rendered circle sprites cached
+per colour, radius and opacity level, in one ``Surface.blits`` call per
+emitter.
+"""
+
+import random
+import pygame
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+Color = Tuple[int, ...]
+
+
+class ParticleEngine:
+    """
+    Fixed-capacity particle pool.
+
+    ``capacity`` is the hard limit on live particles. Above ``budget`` new
+    particles are culled with a probability that rises towards 1 as the pool
+    fills up, so heavy fights thin out their effects gradually instead of
+    cutting them off all at once.
+    """
+
+    _instance = None
+
+    # Upper bound on cached sprites before the cache is rebuilt
+    MAX_SPRITES = 2048
+
+    # Opacity is baked into the sprites in steps of this many alpha values
+    ALPHA_STEP = 16
+
+    @classmethod
+    def instance(cls) -> 'ParticleEngine':
+        """Get the process-wide particle engine."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, capacity: int = 4096, budget: int = 2048):
+        """
+        Initialize the pool.
+
+        Args:
+            capacity: Maximum number of live particles
+            budget: Live particle count above which spawns start being culled
+        """
+        self.capacity = capacity
+        self.budget = min(budget, capacity)
+
+        zeros = [0.0] * capacity
+        self.x = array('f', zeros)
+        self.y = array('f', zeros)
+        self.dx = array('f', zeros)
+        self.dy = array('f', zeros)
+        self.life = array('f', zeros)
+        self.size = array('f', zeros)
+        self.color = array('L', [0] * capacity)  # Packed 0xRRGGBBAA
+
+        self._free: List[int] = list(range(capacity - 1, -1, -1))
+        self._sprites: Dict[Tuple[int, int, int], pygame.Surface] = {}
+        self.culled_count = 0
+
+    @property
+    def active_count(self) -> int:
+        """Number of live particles."""
+        return self.capacity - len(self._free)
+
+    def spawn(self, x: float, y: float, dx: float, dy: float, color: Color,
+              life: float, size: float) -> Optional[int]:
+        """
+        Allocate and initialize a particle.
+
+        Returns:
+            The pool slot, or None if the particle was culled
+        """
+        active = self.active_count
+        if not self._free or (active >= self.budget and
+                              random.random() >= (self.capacity - active) / (self.capacity - self.budget)):
+            self.culled_count += 1
+            return None
+
+        slot = self._free.pop()
+        self.x[slot] = x
+        self.y[slot] = y
+        self.dx[slot] = dx
+        self.dy[slot] = dy
+        self.life[slot] = life
+        self.size[slot] = size
+        alpha = color[3] if len(color) > 3 else 255
+        self.color[slot] = ((int(color[0]) & 0xFF) << 24 | (int(color[1]) & 0xFF) << 16 |
+                            (int(color[2]) & 0xFF) << 8 | (int(alpha) & 0xFF))
+        return slot
+
+    def update_slots(self, slots: List[int], dt: float, bounds: Optional[int] = None):
+        """
+        Advance a group of particles and release the expired ones.
+
+        Compacts ``slots`` in place. Particles move by their velocity once
+        per call and lose ``dt`` of life.
+
+        Args:
+            slots: Pool slots to update
+            dt: Life to subtract
+            bounds: If given, particles leaving the square [0, bounds] die
+        """
+        x, y, dx, dy, life = self.x, self.y, self.dx, self.dy, self.life
+        free = self._free
+        keep = 0
+        for slot in slots:
+            px = x[slot] + dx[slot]
+            py = y[slot] + dy[slot]
+            remaining = life[slot] - dt
+            if remaining <= 0 or (bounds is not None and
+                                  (px < 0 or px > bounds or py < 0 or py > bounds)):
+                free.append(slot)
+                continue
+            x[slot] = px
+            y[slot] = py
+            life[slot] = remaining
+            slots[keep] = slot
+            keep += 1
+        del slots[keep:]
+
+    def draw_slots(self, surface: pygame.Surface, slots: List[int]):
+        """Draw a group of particles, fading them out with their remaining life."""
+        x, y, life, size, color = self.x, self.y, self.life, self.size, self.color
+        sprites = self._sprites
+        step = self.ALPHA_STEP
+        blits = []
+        for slot in slots:
+            packed = color[slot]
+            alpha = packed & 0xFF
+            remaining = life[slot]
+            if remaining < 1.0 and int(255 * remaining) < alpha:
+                alpha = int(255 * remaining)
+            if alpha <= 0:
+                continue
+            radius = size[slot]
+            # Same key as get_sprite, looked up inline on this hot path
+            sprite = sprites.get((packed >> 8, int(radius) or 1, alpha // step))
+            if sprite is None:
+                sprite = self.get_sprite(packed >> 8, radius, alpha)
+            blits.append((sprite, (int(x[slot] - radius), int(y[slot] - radius))))
+        if blits:
+            surface.blits(blits, doreturn=False)
+
+    def draw_single(self, surface: pygame.Surface, position: Tuple[float, float],
+                    color: Color, size: float):
+        """Draw one short-lived particle without adding it to the pool."""
+        rgb = (int(color[0]) & 0xFF) << 16 | (int(color[1]) & 0xFF) << 8 | (int(color[2]) & 0xFF)
+        sprite = self.get_sprite(rgb, size, color[3] if len(color) > 3 else 255)
+        surface.blit(sprite, (int(position[0] - size), int(position[1] - size)))
+
+    def release_slots(self, slots: List[int]):
+        """Return particles to the pool without drawing them again."""
+        self._free.extend(slots)
+        slots.clear()
+
+    def get_sprite(self, rgb: int, radius: float, alpha: int = 255) -> pygame.Surface:
+        """
+        Get the pre-rendered circle sprite for a colour, radius and opacity.
+
+        Args:
+            rgb: Colour packed as 0xRRGGBB
+            radius: Circle radius in pixels (rounded to whole pixels)
+            alpha: Opacity, rounded up to the next ``ALPHA_STEP``
+        """
+        key = (rgb, int(radius) or 1, int(alpha) // self.ALPHA_STEP)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            if len(self._sprites) >= self.MAX_SPRITES:
+                self._sprites.clear()
+            r = key[1]
+            opacity = min(255, (key[2] + 1) * self.ALPHA_STEP)
+            sprite = pygame.Surface((r * 2, r * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, ((rgb >> 16) & 0xFF, (rgb >> 8) & 0xFF, rgb & 0xFF, opacity), (r, r), r)
+            self._sprites[key] = sprite
+        return sprite
+
+
+class ParticleEmitter:
+    """The particles of one icon, stored in the shared ``ParticleEngine``."""
+
+    def __init__(self, engine: Optional[ParticleEngine] = None):
+        """
+        Initialize the emitter.
+
+        Args:
+            engine: Pool to allocate from (defaults to the shared engine)
+        """
+        self.engine = engine or ParticleEngine.instance()
+        self.slots: List[int] = []
+
+    def emit(self, x: float, y: float, dx: float, dy: float, color: Color,
+             life: float, size: float):
+        """Spawn a particle unless the engine culls it."""
+        slot = self.engine.spawn(x, y, dx, dy, color, life, size)
+        if slot is not None:
+            self.slots.append(slot)
+
+    def update(self, dt: float, bounds: Optional[int] = None):
+        """Advance this emitter's particles."""
+        if self.slots:
+            self.engine.update_slots(self.slots, dt, bounds)
+
+    def draw(self, surface: pygame.Surface):
+        """Draw this emitter's particles."""
+        if self.slots:
+            self.engine.draw_slots(surface, self.slots)
+
+    def clear(self):
+        """Remove all of this emitter's particles."""
+        self.engine.release_slots(self.slots)
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def __del__(self):
+        # Give the slots back when the owning icon goes away
+        try:
+            self.clear()
+        except Exception:
+            pass
@@ -0,0 +1,341 @@
+"""
+Manifest-driven asset loading with texture atlas packing and an on-disk cache.
+
+The manifest (``data/assets/manifest.json``) declares every image the game
+needs, grouped into atlases. For each asset it lists candidate source files
+(the first one that exists wins), the size to scale it to and the name of a
+procedural fallback generator used when no source file is present.
+
+On the first run every atlas is built from its sources and fallbacks, packed
+into a single surface and written to the cache directory together with a
+frame map. The cache is keyed by a hash of the manifest entries and of the
+source file contents, so later runs load each atlas with one image read and
+slice the frames out as subsurfaces.
+
+Atlases made ahead of time by ``phaser_starter/sprite_packer.py`` (JSON Hash
+frame maps, as used by Phaser) are read with ``load_packed_atlas`` and can be
+listed under ``packed_atlases`` in the manifest.
+"""
+
+import hashlib
+import json
+import math
+import os
+import time
+import pygame
+from typing import Callable, Dict, List, Optional, Tuple
+
+DEFAULT_MANIFEST_PATH = os.path.join('data', 'assets', 'manifest.json')
+DEFAULT_CACHE_DIR = os.path.join('cache', 'assets')
+
+# Bump when the packing or cache layout changes to invalidate old caches
+CACHE_FORMAT_VERSION = 1
+
+FallbackGenerator = Callable[[Tuple[int, int]], pygame.Surface]
+
+
+def next_power_of_two(value: int) -> int:
+    """Return the smallest power of two greater than or equal to value."""
+    return 1 << max(0, int(value) - 1).bit_length()
+
+
+def pack_shelves(sizes: List[Tuple[int, int]], padding: int = 1,
+                 power_of_two: bool = True) -> Tuple[List[Tuple[int, int]], Tuple[int, int]]:
+    """
+    Pack rectangles into an atlas using a simple shelf algorithm.
+
+    Rectangles are placed tallest first on horizontal shelves. The atlas
+    width is chosen from the total area so that the result is roughly square.
+
+    Args:
+        sizes: (width, height) of each rectangle
+        padding: Empty pixels kept between rectangles
+        power_of_two: Round the atlas dimensions up to powers of two
+
+    Returns:
+        The top-left position of each rectangle (in input order) and the
+        (width, height) of the atlas.
+    """
+    if not sizes:
+        return [], (0, 0)
+
+    padded = [(w + padding, h + padding) for w, h in sizes]
+    total_area = sum(w * h for w, h in padded)
+    widest = max(w for w, _ in padded)
+    atlas_width = max(widest, int(math.ceil(math.sqrt(total_area))))
+    if power_of_two:
+        atlas_width = next_power_of_two(atlas_width)
+
+    order = sorted(range(len(sizes)), key=lambda i: (-padded[i][1], -padded[i][0]))
+    positions: List[Tuple[int, int]] = [(0, 0)] * len(sizes)
+    shelf_x = shelf_y = shelf_height = 0
+
+    for index in order:
+        width, height = padded[index]
+        if shelf_x + width > atlas_width:
+            shelf_y += shelf_height
+            shelf_x = shelf_height = 0
+        positions[index] = (shelf_x, shelf_y)
+        shelf_x += width
+        shelf_height = max(shelf_height, height)
+
+    atlas_height = shelf_y + shelf_height
+    if power_of_two:
+        atlas_height = next_power_of_two(atlas_height)
+
+    return positions, (atlas_width, atlas_height)
+
+
+def load_packed_atlas(frame_map_path: str) -> Tuple[Dict[str, pygame.Surface], Dict[str, List[str]]]:
+    """
+    Load an atlas written by ``phaser_starter/sprite_packer.py``.
+
+    Trimmed frames are placed back at their offset on a surface of their
+    original size, so every frame of a set has the same size.
+
+    Args:
+        frame_map_path: Path to the atlas JSON; the image named in its
+            ``meta.image`` is read from the same directory
+
+    Returns:
+        Frames by name (``<set>/<index>``) and the frame names of each set in order
+    """
+    with open(frame_map_path, 'r') as f:
+        frame_map = json.load(f)
+    image_path = os.path.join(os.path.dirname(frame_map_path), frame_map['meta']['image'])
+    atlas = pygame.image.load(image_path)
+    try:
+        atlas = atlas.convert_alpha()
+    except pygame.error:
+        pass  # No display yet, keep the decoded surface
+
+    frames = {}
+    for name, entry in frame_map['frames'].items():
+        rect = entry['frame']
+        frame = atlas.subsurface(pygame.Rect(rect['x'], rect['y'], rect['w'], rect['h']))
+        if entry.get('trimmed'):
+            source = entry['sourceSize']
+            offset = entry['spriteSourceSize']
+            full = pygame.Surface((source['w'], source['h']), pygame.SRCALPHA)
+            full.blit(frame, (offset['x'], offset['y']))
+            frame = full
+        frames[name] = frame
+    return frames, frame_map.get('animations', {})
+
+
+class AssetLoader:
+    """
+    Loads the assets declared in a manifest into a name -> Surface dict.
+
+    Attributes:
+        load_times: Seconds spent on each asset (and each atlas file) in the
+            last call to ``load``
+        cache_hits: Names of the atlases served from the on-disk cache
+        animations: Frame names per set of each packed atlas, by atlas name
+    """
+
+    def __init__(self, manifest_path: str = DEFAULT_MANIFEST_PATH,
+                 fallbacks: Optional[Dict[str, FallbackGenerator]] = None,
+                 cache_dir: Optional[str] = None):
+        """
+        Initialize the loader.
+
+        Args:
+            manifest_path: Path to the JSON asset manifest
+            fallbacks: Procedural generators by name, used for assets whose
+                source files are missing
+            cache_dir: Where packed atlases are stored (defaults to the
+                manifest's ``cache_dir``)
+        """
+        self.manifest_path = manifest_path
+        self.fallbacks = fallbacks or {}
+        with open(manifest_path, 'r') as f:
+            self.manifest = json.load(f)
+        self.cache_dir = cache_dir or self.manifest.get('cache_dir', DEFAULT_CACHE_DIR)
+        self.load_times: Dict[str, float] = {}
+        self.cache_hits: List[str] = []
+        self.animations: Dict[str, Dict[str, List[str]]] = {}
+        self._hash_index_path = os.path.join(self.cache_dir, 'source_hashes.json')
+        self._hash_index: Dict[str, list] = {}
+        self._hash_index_changed = False
+
+    def load(self) -> Dict[str, pygame.Surface]:
+        """Load every atlas in the manifest and return the assets by name."""
+        self.load_times = {}
+        self.cache_hits = []
+        self._load_hash_index()
+
+        assets: Dict[str, pygame.Surface] = {}
+        for atlas_name, atlas_def in self.manifest.get('atlases', {}).items():
+            assets.update(self._load_atlas(atlas_name, atlas_def))
+
+        for atlas_name, frame_map_path in self.manifest.get('packed_atlases', {}).items():
+            start = time.perf_counter()
+            try:
+                frames, self.animations[atlas_name] = load_packed_atlas(frame_map_path)
+            except (OSError, ValueError, KeyError, pygame.error) as e:
+                print(f"Error loading packed atlas '{atlas_name}' from {frame_map_path}: {e}")
+                continue
+            assets.update(frames)
+            self.load_times[f"atlas:{atlas_name}"] = time.perf_counter() - start
+
+        if self._hash_index_changed:
+            self._save_hash_index()
+        return assets
+
+    def report(self, limit: int = 10) -> None:
+        """Print the total load time and the slowest assets of the last load."""
+        total = sum(self.load_times.values())
+        print(f"Assets loaded in {total * 1000:.1f} ms "
+              f"({len(self.cache_hits)} atlas(es) from cache: {', '.join(self.cache_hits) or 'none'})")
+        slowest = sorted(self.load_times.items(), key=lambda item: item[1], reverse=True)
+        for name, seconds in slowest[:limit]:
+            print(f"  {name:<24} {seconds * 1000:8.2f} ms")
+
+    def _load_atlas(self, atlas_name: str, atlas_def: Dict) -> Dict[str, pygame.Surface]:
+        """Load one atlas from the cache, building and caching it if needed."""
+        entries = self._resolve_entries(atlas_def)
+        cache_key = self._atlas_cache_key(atlas_name, atlas_def, entries)
+        alpha = atlas_def.get('alpha', True)
+        image_path = os.path.join(self.cache_dir, f"{atlas_name}.png")
+        frames_path = os.path.join(self.cache_dir, f"{atlas_name}.json")
+
+        cached = self._load_cached_atlas(image_path, frames_path, cache_key, alpha)
+        if cached is not None:
+            self.cache_hits.append(atlas_name)
+            return cached
+
+        return self._build_atlas(atlas_name, entries, cache_key, alpha, image_path, frames_path)
+
+    def _resolve_entries(self, atlas_def: Dict) -> List[Dict]:
+        """Work out the size and chosen source file of each asset in an atlas."""
+        default_size = atlas_def.get('size')
+        entries = []
+        for name, asset_def in atlas_def.get('assets', {}).items():
+            source = next((path for path in asset_def.get('sources', [])
+                           if os.path.exists(path)), None)
+            size = asset_def.get('size', default_size)
+            entries.append({
+                'name': name,
+                'source': source,
+                'size': tuple(size) if size else None,
+                'fallback': asset_def.get('fallback')
+            })
+        return entries
+
+    def _atlas_cache_key(self, atlas_name: str, atlas_def: Dict, entries: List[Dict]) -> str:
+        """Hash everything that affects the packed atlas."""
+        digest = hashlib.sha1()
+        digest.update(f"{CACHE_FORMAT_VERSION}:{self.manifest.get('version', 0)}:{atlas_name}".encode())
+        digest.update(json.dumps(atlas_def, sort_keys=True).encode())
+        for entry in entries:
+            source_hash = self._source_hash(entry['source']) if entry['source'] else ''
+            digest.update(f"{entry['name']}:{entry['source']}:{source_hash}".encode())
+        return digest.hexdigest()
+
+    def _source_hash(self, path: str) -> str:
+        """Content hash of a source file, memoized by size and modification time."""
+        stat = os.stat(path)
+        known = self._hash_index.get(path)
+        if known and known[0] == stat.st_size and known[1] == stat.st_mtime_ns:
+            return known[2]
+
+        with open(path, 'rb') as f:
+            content_hash = hashlib.sha1(f.read()).hexdigest()
+        self._hash_index[path] = [stat.st_size, stat.st_mtime_ns, content_hash]
+        self._hash_index_changed = True
+        return content_hash
+
+    def _load_cached_atlas(self, image_path: str, frames_path: str, cache_key: str,
+                           alpha: bool) -> Optional[Dict[str, pygame.Surface]]:
+        """Load a packed atlas from disk if it matches the cache key."""
+        if not (os.path.exists(image_path) and os.path.exists(frames_path)):
+            return None
+
+        start = time.perf_counter()
+        try:
+            with open(frames_path, 'r') as f:
+                frame_map = json.load(f)
+            if frame_map.get('key') != cache_key:
+                return None
+            atlas = pygame.image.load(image_path)
+            atlas = atlas.convert_alpha() if alpha else atlas.convert()
+        except (OSError, ValueError, pygame.error) as e:
+            print(f"Ignoring unreadable asset cache {image_path}: {e}")
+            return None
+        self.load_times[f"atlas:{os.path.basename(image_path)}"] = time.perf_counter() - start
+
+        assets = {}
+        for name, rect in frame_map['frames'].items():
+            assets[name] = atlas.subsurface(pygame.Rect(rect))
+        return assets
+
+    def _build_atlas(self, atlas_name: str, entries: List[Dict], cache_key: str, alpha: bool,
+                     image_path: str, frames_path: str) -> Dict[str, pygame.Surface]:
+        """Load or generate every asset of an atlas, pack it and write it to the cache."""
+        surfaces = []
+        for entry in entries:
+            start = time.perf_counter()
+            surface = self._load_entry(entry)
+            self.load_times[entry['name']] = time.perf_counter() - start
+            if surface is not None:
+                surfaces.append((entry['name'], surface))
+
+        positions, atlas_size = pack_shelves([surface.get_size() for _, surface in surfaces])
+        atlas = pygame.Surface(atlas_size, pygame.SRCALPHA) if alpha else pygame.Surface(atlas_size)
+
+        frames = {}
+        for (name, surface), position in zip(surfaces, positions):
+            atlas.blit(surface, position)
+            frames[name] = [position[0], position[1], surface.get_width(), surface.get_height()]
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            pygame.image.save(atlas, image_path)
+            with open(frames_path, 'w') as f:
+                json.dump({'key': cache_key, 'frames': frames}, f, indent=2)
+        except (OSError, pygame.error) as e:
+            print(f"Could not write asset cache for '{atlas_name}': {e}")
+
+        atlas = atlas.convert_alpha() if alpha else atlas.convert()
+        return {name: atlas.subsurface(pygame.Rect(rect)) for name, rect in frames.items()}
+
+    def _load_entry(self, entry: Dict) -> Optional[pygame.Surface]:
+        """Load one asset from its source file, falling back to its generator."""
+        surface = None
+        if entry['source']:
+            try:
+                surface = pygame.image.load(entry['source']).convert_alpha()
+            except pygame.error as e:
+                print(f"Error loading asset '{entry['name']}' from {entry['source']}: {e}")
+
+        if surface is None:
+            generator = self.fallbacks.get(entry['fallback'])
+            if generator is None:
+                print(f"No source or fallback for asset '{entry['name']}'")
+                return None
+            surface = generator(entry['size'])
+
+        if entry['size'] and surface.get_size() != entry['size']:
+            surface = pygame.transform.scale(surface, entry['size'])
+        return surface
+
+    def _load_hash_index(self) -> None:
+        """Read the memoized source file hashes."""
+        self._hash_index = {}
+        self._hash_index_changed = False
+        if os.path.exists(self._hash_index_path):
+            try:
+                with open(self._hash_index_path, 'r') as f:
+                    self._hash_index = json.load(f)
+            except (OSError, ValueError):
+                self._hash_index = {}
+
+    def _save_hash_index(self) -> None:
+        """Write the memoized source file hashes."""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self._hash_index_path, 'w') as f:
+                json.dump(self._hash_index, f, indent=2)
+        except OSError as e:
+            print(f"Could not write asset hash index: {e}")
@@ -5,18 +5,113 @@ Audio system module for handling music and sound effects in the game.
 import pygame
 import os
 from typing import Dict, Optional
+from .sound_streamer import SoundStreamer, StreamPriority
+from .sound_synth import SOUND_PRESETS, create_synth_sound, get_silent_sound
+
+
+class VoicePool:
+    """
+    Assigns mixer channels to sound effects.
+    
+    Free channels are used first. When every channel is busy, the voice with
+    the lowest priority (the oldest among equals) is stopped and reused, as
+    long as it is not more important than the new sound.
+    """
+    
+    def __init__(self, num_channels: int = 16):
+        """
+        Initialize the pool.
+        
+        Args:
+            num_channels: Number of mixer channels to manage
+        """
+        pygame.mixer.set_num_channels(num_channels)
+        self.channels = [pygame.mixer.Channel(i) for i in range(num_channels)]
+        self._priorities = [0] * num_channels
+        self._started = [0] * num_channels
+        self._sequence = 0
+        self.stolen_count = 0
+        self.dropped_count = 0
+    
+    def play(self, sound: pygame.mixer.Sound, priority: int = 0) -> Optional[pygame.mixer.Channel]:
+        """
+        Play a sound on a free or stolen channel.
+        
+        Args:
+            sound: Sound to play
+            priority: Importance of the sound, higher wins
+            
+        Returns:
+            The channel used, or None if every voice is more important
+        """
+        index = self._find_channel(priority)
+        if index is None:
+            self.dropped_count += 1
+            return None
+        
+        channel = self.channels[index]
+        channel.play(sound)
+        self._sequence += 1
+        self._priorities[index] = priority
+        self._started[index] = self._sequence
+        return channel
+    
+    def stop_all(self):
+        """Stop every managed channel."""
+        for channel in self.channels:
+            channel.stop()
+    
+    def _find_channel(self, priority: int) -> Optional[int]:
+        """Pick a free channel, or the cheapest busy one to steal."""
+        victim = None
+        for index, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                return index
+            if victim is None or (self._priorities[index], self._started[index]) < \
+                    (self._priorities[victim], self._started[victim]):
+                victim = index
+        
+        if victim is not None and self._priorities[victim] <= priority:
+            self.channels[victim].stop()
+            self.stolen_count += 1
+            return victim
+        return None
+
 
 class AudioSystem:
     """
     Handles playing and managing game audio including music and sound effects.
     """
     
-    def __init__(self, sound_path: str = "assets/audio"):
+    # Voice priorities for the pool; unlisted sounds use DEFAULT_SOUND_PRIORITY
+    SOUND_PRIORITIES = {
+        "player_death": 3,
+        "level_up": 3,
+        "quest_complete": 2,
+        "quest_accept": 2,
+        "objective_complete": 2,
+        "player_hit": 2,
+        "item_pickup": 1,
+        "enemy_death": 1,
+        "enemy_hit": 0
+    }
+    DEFAULT_SOUND_PRIORITY = 1
+    
+    # Sound effects each area plays, loaded first when the area is entered
+    AREA_SOUNDS = {
+        "town": ("button_click", "quest_accept", "quest_complete", "objective_complete",
+                 "item_pickup"),
+        "dungeon": ("player_hit", "enemy_hit", "enemy_death", "player_death", "item_pickup",
+                    "level_up")
+    }
+    
+    def __init__(self, sound_path: str = "assets/audio", streamer: Optional[SoundStreamer] = None):
         """
         Initialize the audio system.
         
         Args:
             sound_path: Base path to audio assets
+            streamer: Background loader for sound effects, a new one by default
         """
         # Initialize pygame mixer if not already initialized
         if not pygame.mixer.get_init():
@@ -24,6 +119,7 @@ class AudioSystem:
         
         self.sound_path = sound_path
         self.sounds: Dict[str, pygame.mixer.Sound] = {}
+        self.streamer = streamer or SoundStreamer()
         self.music_tracks: Dict[str, str] = {}
         
         # Audio settings
@@ -35,6 +131,9 @@ class AudioSystem:
         # Current music track
         self.current_music = None
         
+        # Mixer channels shared by all sound effects
+        self.voice_pool = VoicePool()
+        
         # Create sound directory if it doesn't exist
         os.makedirs(sound_path, exist_ok=True)
         os.makedirs(os.path.join(sound_path, "music"), exist_ok=True)
@@ -77,34 +176,63 @@ class AudioSystem:
         for sound_id, filename in default_sounds.items():
             self.register_sound(sound_id, filename)
     
-    def register_sound(self, sound_id: str, filename: str) -> bool:
+    def register_sound(self, sound_id: str, filename: str,
+                       priority: StreamPriority = StreamPriority.IDLE) -> bool:
         """
         Register a sound effect.
         
+        The sound is loaded in the background; until it is ready the silent
+        placeholder is used. Missing files fall back to the procedural sound
+        of the same name, if there is one.
+        
         Args:
             sound_id: Identifier for the sound
             filename: Sound file name
+            priority: How soon the sound is needed
             
         Returns:
-            Success of registration
+            Whether a sound will be loaded
         """
         sound_path = os.path.join(self.sound_path, "sfx", filename)
+        self.sounds.setdefault(sound_id, get_silent_sound())
+        
+        if not os.path.exists(sound_path) and sound_id not in SOUND_PRESETS:
+            # For development, keep the shared silent placeholder
+            print(f"Sound file not found: {sound_path}, using placeholder")
+            return False
+        
+        self.streamer.request(sound_id, lambda: self._load_sound(sound_id, sound_path),
+                              priority, self._on_sound_ready)
+        return True
+    
+    def prefetch_area(self, area: str, priority: StreamPriority = StreamPriority.NEXT_AREA):
+        """
+        Load the sound effects of an area ahead of the others.
         
-        # Only try to load the sound if the file exists
+        Args:
+            area: Key in AREA_SOUNDS
+            priority: NOW when entering the area, NEXT_AREA when approaching it
+        """
+        self.streamer.prefetch(self.AREA_SOUNDS.get(area, ()), priority)
+    
+    def _load_sound(self, sound_id: str, sound_path: str) -> Optional[pygame.mixer.Sound]:
+        """Load a sound file, or synthesize the preset of the same name (worker thread)."""
         if os.path.exists(sound_path):
             try:
-                self.sounds[sound_id] = pygame.mixer.Sound(sound_path)
-                self.sounds[sound_id].set_volume(self.sound_volume)
-                return True
+                return pygame.mixer.Sound(sound_path)
             except Exception as e:
                 print(f"Error loading sound {sound_id} from {sound_path}: {e}")
-        else:
-            # For development, create a dummy sound
-            print(f"Sound file not found: {sound_path}, using placeholder")
-            self.sounds[sound_id] = pygame.mixer.Sound(pygame.sndarray.array([0] * 44100))
-            self.sounds[sound_id].set_volume(0.0)  # Silent
-            
-        return False
+        
+        if sound_id in SOUND_PRESETS:
+            sound = create_synth_sound(sound_id)
+            if sound is not get_silent_sound():
+                return sound
+        return None
+    
+    def _on_sound_ready(self, sound_id: str, sound: pygame.mixer.Sound):
+        """Swap a loaded sound in for its placeholder."""
+        sound.set_volume(self.sound_volume)
+        self.sounds[sound_id] = sound
     
     def register_music(self, track_id: str, filename: str) -> bool:
         """
@@ -123,12 +251,13 @@ class AudioSystem:
         self.music_tracks[track_id] = music_path
         return True
     
-    def play_sound(self, sound_id: str) -> bool:
+    def play_sound(self, sound_id: str, priority: Optional[int] = None) -> bool:
         """
         Play a sound effect.
         
         Args:
             sound_id: Identifier for the sound to play
+            priority: Voice priority, defaults to SOUND_PRIORITIES
             
         Returns:
             Success of playback
@@ -137,11 +266,18 @@ class AudioSystem:
             return False
             
         if sound_id in self.sounds:
-            self.sounds[sound_id].play()
-            return True
+            sound = self.sounds[sound_id]
         else:
             print(f"Sound {sound_id} not registered")
             return False
+        
+        # Placeholders would only take up a voice
+        if sound is get_silent_sound():
+            return False
+        
+        if priority is None:
+            priority = self.SOUND_PRIORITIES.get(sound_id, self.DEFAULT_SOUND_PRIORITY)
+        return self.voice_pool.play(sound, priority) is not None
     
     def play_music(self, track_id: str, loop: bool = True) -> bool:
         """
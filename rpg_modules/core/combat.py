@@ -0,0 +1,218 @@
+"""
+Combat hit resolution.
+
+Combatants (anything with ``x``, ``y`` and ``health``) are kept in a spatial
+hash of square cells, so an attack only looks at the combatants in the cells
+its reach overlaps instead of at every monster. All range checks use squared
+distances. Killed or despawned combatants are queued and removed from the
+caller's list in one pass with ``flush_removals``.
+
+Attack types match ``Player.attack_type`` (see ``Player.switch_attack_type``):
+regular and quick attacks hit the nearest target in front of the attacker,
+heavy attacks hit every target around it, and magic attacks are ranged and
+hit the first target along the attack direction.
+"""
+
+import math
+from enum import IntEnum
+from typing import Dict, Iterable, List, Tuple
+from .constants import TILE_SIZE
+from .spatial_hash import SpatialHash
+
+
+class AttackType(IntEnum):
+    """Player attack types, numbered like ``Player.attack_type``."""
+    REGULAR = 1
+    HEAVY = 2
+    MAGIC = 3
+    QUICK = 4
+
+
+class AttackShape(IntEnum):
+    """How an attack picks its targets."""
+    MELEE = 0   # Nearest target in a cone in front of the attacker
+    AREA = 1    # Every target within range
+    RANGED = 2  # First target along the attack direction
+
+
+ATTACK_SHAPES = {
+    AttackType.REGULAR: AttackShape.MELEE,
+    AttackType.HEAVY: AttackShape.AREA,
+    AttackType.MAGIC: AttackShape.RANGED,
+    AttackType.QUICK: AttackShape.MELEE
+}
+
+# Cosine of the half-angle of the melee cone (about 60 degrees to each side)
+MELEE_CONE_COS = 0.5
+
+
+class Hit:
+    """One resolved hit."""
+
+    __slots__ = ('target', 'damage', 'killed')
+
+    def __init__(self, target, damage: int, killed: bool):
+        self.target = target
+        self.damage = damage
+        self.killed = killed
+
+
+class CombatResolver:
+    """Resolves attacks against the combatants in a spatial hash."""
+
+    def __init__(self, cell_size: float = TILE_SIZE * 2):
+        """
+        Initialize the resolver.
+
+        Args:
+            cell_size: Spatial hash cell side in pixels; about the longest
+                common attack range works well
+        """
+        self.index = SpatialHash(cell_size)
+        self._removals: Dict[int, object] = {}
+        self.hits_resolved = 0
+
+    def rebuild(self, combatants: Iterable):
+        """Re-index a list of combatants from scratch."""
+        self.index.clear()
+        for combatant in combatants:
+            self.index.insert(combatant)
+
+    def add(self, combatant):
+        """Start tracking a combatant."""
+        self.index.insert(combatant)
+
+    def moved(self, combatant):
+        """Tell the resolver that a combatant changed position."""
+        self.index.update(combatant)
+
+    def within(self, x: float, y: float, radius: float) -> List:
+        """Live combatants within ``radius`` pixels of a point."""
+        return [c for c in self.index.query_radius(x, y, radius) if id(c) not in self._removals]
+
+    def resolve_attack(self, attack_type: int, origin: Tuple[float, float],
+                       direction: Tuple[float, float], attack_range: float, damage: int) -> List[Hit]:
+        """
+        Resolve an attack of one of the player's attack types.
+
+        Args:
+            attack_type: ``Player.attack_type`` value (1-4)
+            origin: Attacker position in pixels
+            direction: Facing direction (any length; (0, 0) means no facing)
+            attack_range: Reach in pixels, e.g. ``Player.get_attack_range()``
+            damage: Damage dealt to each target hit
+
+        Returns:
+            The hits, in the order they were applied
+        """
+        shape = ATTACK_SHAPES.get(AttackType(attack_type), AttackShape.MELEE)
+        if shape == AttackShape.AREA:
+            return self.resolve_area(origin, attack_range, damage)
+        if shape == AttackShape.RANGED:
+            return self.resolve_ranged(origin, direction, attack_range, damage)
+        return self.resolve_melee(origin, direction, attack_range, damage)
+
+    def resolve_player_attack(self, player, origin: Tuple[float, float],
+                              direction: Tuple[float, float]) -> List[Hit]:
+        """
+        Resolve an attack by a ``Player`` using its current attack type.
+
+        Call after ``Player.try_attack`` succeeded; the damage (and its
+        stamina or mana cost) comes from ``Player.get_attack_damage``.
+        """
+        return self.resolve_attack(player.attack_type, origin, direction,
+                                   player.get_attack_range(), player.get_attack_damage())
+
+    def resolve_melee(self, origin: Tuple[float, float], direction: Tuple[float, float],
+                      attack_range: float, damage: int) -> List[Hit]:
+        """Hit the nearest combatant within range and in front of the attacker."""
+        ox, oy = origin
+        fx, fy = _normalize(direction)
+        best, best_sq = None, None
+        for target in self.within(ox, oy, attack_range):
+            dx, dy = target.x - ox, target.y - oy
+            dist_sq = dx * dx + dy * dy
+            # Inside the cone: dot >= cos * |d|, compared squared to avoid sqrt
+            if fx or fy:
+                dot = dx * fx + dy * fy
+                if dot < 0 or dot * dot < MELEE_CONE_COS * MELEE_CONE_COS * dist_sq:
+                    continue
+            if best is None or dist_sq < best_sq:
+                best, best_sq = target, dist_sq
+        return [self._apply(best, damage)] if best is not None else []
+
+    def resolve_area(self, origin: Tuple[float, float], radius: float, damage: int) -> List[Hit]:
+        """Hit every combatant within ``radius`` pixels."""
+        return [self._apply(target, damage) for target in self.within(origin[0], origin[1], radius)]
+
+    def resolve_ranged(self, origin: Tuple[float, float], direction: Tuple[float, float],
+                       attack_range: float, damage: int, width: float = TILE_SIZE / 2) -> List[Hit]:
+        """
+        Hit the first combatant along a ray.
+
+        Args:
+            width: Half-width of the projectile's path in pixels
+        """
+        fx, fy = _normalize(direction)
+        if not (fx or fy):
+            return self.resolve_melee(origin, direction, attack_range, damage)
+
+        ox, oy = origin
+        ex, ey = ox + fx * attack_range, oy + fy * attack_range
+        candidates = self.index.query_rect(min(ox, ex) - width, min(oy, ey) - width,
+                                           max(ox, ex) + width, max(oy, ey) + width)
+        best, best_along = None, None
+        for target in candidates:
+            if id(target) in self._removals:
+                continue
+            dx, dy = target.x - ox, target.y - oy
+            along = dx * fx + dy * fy
+            if along < 0 or along > attack_range:
+                continue
+            across = dx * fy - dy * fx
+            if across * across > width * width:
+                continue
+            if best is None or along < best_along:
+                best, best_along = target, along
+        return [self._apply(best, damage)] if best is not None else []
+
+    def _apply(self, target, damage: int) -> Hit:
+        """Deal damage and queue the target for removal if it died."""
+        target.health -= damage
+        killed = target.health <= 0
+        if killed:
+            self.queue_removal(target)
+        self.hits_resolved += 1
+        return Hit(target, damage, killed)
+
+    def queue_removal(self, combatant):
+        """Mark a combatant for removal at the next ``flush_removals``."""
+        self._removals[id(combatant)] = combatant
+
+    def flush_removals(self, combatants: List) -> List:
+        """
+        Remove every queued combatant from the index and from a list.
+
+        The list is filtered in place in one pass.
+
+        Returns:
+            The removed combatants
+        """
+        if not self._removals:
+            return []
+        removed = list(self._removals.values())
+        for combatant in removed:
+            self.index.remove(combatant)
+        removals = self._removals
+        combatants[:] = [c for c in combatants if id(c) not in removals]
+        self._removals = {}
+        return removed
+
+
+def _normalize(direction: Tuple[float, float]) -> Tuple[float, float]:
+    """Unit vector of a direction, or (0, 0)."""
+    dx, dy = direction
+    length = math.hypot(dx, dy)
+    if length == 0:
+        return 0.0, 0.0
+    return dx / length, dy / length
@@ -6,11 +6,13 @@ Implementation of the Veilmaster's Fortress dungeon from dungeonlayout.MD.
 import pygame
 import random
 import math
+import time
 from enum import Enum
 from typing import List, Dict, Tuple, Optional, Set
 from .map import Map, BiomeType
 from .enums import TileType
 from .constants import TILE_SIZE
+from .room_graph import RoomGraph
 
 class RoomType(Enum):
     """Types of rooms in the Veilmaster's Fortress dungeon."""
@@ -112,24 +114,71 @@ class Dungeon(Map):
     Inherits from the base Map class and overrides generation methods.
     """
     
-    def __init__(self, width: int, height: int, seed: Optional[int] = None):
-        """Initialize the dungeon map."""
-        super().__init__(width, height, seed)
+    # Bump whenever generation changes so cached layouts are regenerated
+    GENERATOR_VERSION = 1
+    
+    def __init__(self, width: int, height: int, seed: Optional[int] = None,
+                 layout: Optional[Dict] = None):
+        """
+        Initialize the dungeon map.
         
-        # Dungeon-specific properties
+        Args:
+            width: Map width in tiles
+            height: Map height in tiles
+            seed: Seed for generation; the same seed always gives the same dungeon
+            layout: Previously generated layout (see ``to_layout``) to restore
+                instead of generating
+        """
+        # Dungeon-specific properties, set up before Map.__init__ generates the map
         self.rooms: List[Room] = []
         self.entrance_room = None
         self.ritual_chamber = None
-        self.entrance_type = random.choice(list(EntranceType))
+        self.entrance_type = None
         self.corridors = []  # List of corridor coordinates
         self.puzzle_states = {}  # Dictionary of puzzle states
         
         # Special room coordinates for each type
         self.room_positions = {room_type: None for room_type in RoomType}
         
-        # Override the map generation
+        # Seconds spent in each generation phase
+        self.generation_times: Dict[str, float] = {}
+        self._layout = layout
+        self._room_graph = None
+        
+        # Map.__init__ calls _generate_map and _update_wall_rects, which build
+        # the dungeon instead of overworld terrain
+        super().__init__(width, height, seed)
+        self._layout = None
+    
+    def _generate_map(self):
+        """Build the dungeon, from a cached layout when one was given."""
+        if self._layout is not None:
+            self._run_phase("restore_layout", self._restore_layout, self._layout)
+            return
+        
+        self.rng = random.Random(self.seed)
+        self.entrance_type = self.rng.choice(list(EntranceType))
         self._generate_dungeon()
     
+    def _update_wall_rects(self):
+        """Update the wall rectangles, recording the time spent."""
+        self._run_phase("update_wall_rects", super()._update_wall_rects)
+    
+    def _run_phase(self, phase: str, method, *args):
+        """Run a generation phase and add its duration to generation_times."""
+        start = time.perf_counter()
+        result = method(*args)
+        self.generation_times[phase] = self.generation_times.get(phase, 0.0) + time.perf_counter() - start
+        return result
+    
+    def get_generation_report(self) -> str:
+        """Describe how long each generation phase took."""
+        phases = ", ".join(f"{phase} {seconds * 1000:.1f} ms"
+                           for phase, seconds in self.generation_times.items())
+        # Room carving runs inside create_rooms, so leave it out of the total
+        total = sum(seconds for phase, seconds in self.generation_times.items() if phase != "carve_room")
+        return f"Dungeon (seed {self.seed}) built in {total * 1000:.1f} ms: {phases}"
+    
     def _generate_dungeon(self):
         """Generate the Veilmaster's Fortress dungeon layout."""
         # Clear any existing map data
@@ -140,17 +189,86 @@ class Dungeon(Map):
         # Set ambient biome for the dungeon
         self.biome_grid = [[BiomeType.MOUNTAIN for _ in range(self.width)] for _ in range(self.height)]
         
-        # Generate the basic structure
-        self._create_rooms()
-        self._create_corridors()
-        self._place_doors()
-        self._add_special_features()
-        
-        # Update collision grid
-        self._update_wall_rects()
+        # Generate the basic structure (room carving is timed separately
+        # and is included in create_rooms)
+        self._run_phase("create_rooms", self._create_rooms)
+        self._run_phase("create_corridors", self._create_corridors)
+        self._run_phase("place_doors", self._place_doors)
+        self._run_phase("add_special_features", self._add_special_features)
         
+        # The collision rects are updated by Map.__init__ right after this
         print(f"Dungeon generation complete with {len(self.rooms)} rooms")
     
+    def to_layout(self) -> Dict:
+        """
+        Export the generated dungeon in a compact form.
+        
+        Grids are stored as bytes with one tile palette index per tile, row
+        by row; everything else (rooms as their bounds, doors and
+        connections) is JSON-serializable.
+        """
+        tile_palette = list(TileType)
+        tile_index = {tile: i for i, tile in enumerate(tile_palette)}
+        
+        base = bytes(tile_index[tile] for row in self.base_grid for tile in row)
+        decoration = bytes(0 if tile is None else tile_index[tile] + 1
+                           for row in self.decoration_grid for tile in row)
+        collision = bytes(1 if blocked else 0 for row in self.collision_grid for blocked in row)
+        
+        return {
+            "generator_version": self.GENERATOR_VERSION,
+            "seed": self.seed,
+            "width": self.width,
+            "height": self.height,
+            "entrance_type": self.entrance_type.value,
+            "tile_palette": [tile.value for tile in tile_palette],
+            "base_grid": base,
+            "decoration_grid": decoration,
+            "collision_grid": collision,
+            "corridors": [coord for point in self.corridors for coord in point],
+            "rooms": [
+                {
+                    "type": room.room_type.value,
+                    "bounds": [room.x, room.y, room.width, room.height],
+                    "doors": [list(door) for door in room.doors],
+                    "connected": [self.rooms.index(other) for other in room.connected_rooms]
+                }
+                for room in self.rooms
+            ]
+        }
+    
+    def _restore_layout(self, layout: Dict):
+        """Rebuild the grids and rooms from ``to_layout`` output."""
+        tile_palette = [TileType(value) for value in layout["tile_palette"]]
+        width, height = self.width, self.height
+        
+        base = layout["base_grid"]
+        decoration = layout["decoration_grid"]
+        collision = layout["collision_grid"]
+        
+        self.base_grid = _unpack_grid(base, width, height, tile_palette)
+        self.decoration_grid = _unpack_grid(decoration, width, height, [None] + tile_palette)
+        self.collision_grid = _unpack_grid(collision, width, height, [False, True])
+        self.biome_grid = [[BiomeType.MOUNTAIN] * width for _ in range(height)]
+        
+        self.entrance_type = EntranceType(layout["entrance_type"])
+        corridors = layout["corridors"]
+        self.corridors = list(zip(corridors[0::2], corridors[1::2]))
+        
+        self.rooms = []
+        for room_data in layout["rooms"]:
+            room = Room(RoomType(room_data["type"]), *room_data["bounds"])
+            room.doors = [tuple(door) for door in room_data["doors"]]
+            self.rooms.append(room)
+            self.room_positions[room.room_type] = tuple(room_data["bounds"])
+            if room.room_type == RoomType.ENTRANCE:
+                self.entrance_room = room
+            elif room.room_type == RoomType.RITUAL_CHAMBER:
+                self.ritual_chamber = room
+        
+        for room, room_data in zip(self.rooms, layout["rooms"]):
+            room.connected_rooms = [self.rooms[i] for i in room_data["connected"]]
+    
     def _create_rooms(self):
         """Create the main rooms of the dungeon."""
         # Define the room layout - these values could be adjusted
@@ -188,13 +306,13 @@ class Dungeon(Map):
             max_width, max_height = config["max_size"]
             
             # Randomize room size within constraints
-            width = random.randint(min_width, max_width)
-            height = random.randint(min_height, max_height)
+            width = self.rng.randint(min_width, max_width)
+            height = self.rng.randint(min_height, max_height)
             
             # Calculate position (centered horizontally, staggered vertically)
             x = (self.width - width) // 2
             # Add some horizontal variation
-            x += random.randint(-10, 10)
+            x += self.rng.randint(-10, 10)
             x = max(1, min(x, self.width - width - 1))
             
             # Position rooms from bottom to top with spacing
@@ -215,7 +333,7 @@ class Dungeon(Map):
             self.room_positions[room_type] = (x, y, width, height)
             
             # Carve out the room in the map
-            self._carve_room(room)
+            self._run_phase("carve_room", self._carve_room, room)
             
             print(f"Created {room_type.value} room at ({x}, {y}) with size {width}x{height}")
     
@@ -250,7 +368,7 @@ class Dungeon(Map):
             next_room.add_connection(current_room)
         
         # Add a few more connections for non-linearity (shortcuts)
-        num_extra_connections = random.randint(2, 4)
+        num_extra_connections = self.rng.randint(2, 4)
         available_rooms = self.rooms.copy()
         
         for _ in range(num_extra_connections):
@@ -258,14 +376,14 @@ class Dungeon(Map):
                 break
                 
             # Pick two random rooms that aren't already directly connected
-            room1 = random.choice(available_rooms)
+            room1 = self.rng.choice(available_rooms)
             available_rooms.remove(room1)
             
             candidates = [r for r in available_rooms if r not in room1.connected_rooms]
             if not candidates:
                 continue
                 
-            room2 = random.choice(candidates)
+            room2 = self.rng.choice(candidates)
             
             # Connect the rooms with a corridor
             self._connect_rooms(room1, room2)
@@ -375,8 +493,8 @@ class Dungeon(Map):
         
         # Add some decorative elements that hint at sound-based mechanics
         for _ in range(5):
-            x = random.randint(room.x + 1, room.x + room.width - 2)
-            y = random.randint(room.y + 1, room.y + room.height - 2)
+            x = self.rng.randint(room.x + 1, room.x + room.width - 2)
+            y = self.rng.randint(room.y + 1, room.y + room.height - 2)
             
             # Place soundwave-like markings (represented as special decoration)
             self.decoration_grid[y][x] = TileType.ROCK
@@ -420,7 +538,7 @@ class Dungeon(Map):
         
         # Path with some curves
         current_x = bridge_start_x
-        current_y = center_y + random.randint(-2, 2)
+        current_y = center_y + self.rng.randint(-2, 2)
         
         while current_x <= bridge_end_x:
             if (room.x < current_x < room.x + room.width - 1 and 
@@ -429,28 +547,28 @@ class Dungeon(Map):
                 self.collision_grid[current_y][current_x] = False
                 
             current_x += 1
-            if random.random() < 0.3:  # 30% chance to move vertically
-                current_y += random.choice([-1, 1])
+            if self.rng.random() < 0.3:  # 30% chance to move vertically
+                current_y += self.rng.choice([-1, 1])
     
     def _add_gallery_features(self, room: Room):
         """Add portal painting puzzle to Gallery of Shadows."""
         # Add paintings along the walls
         for i in range(4):  # 4 paintings
             # Choose a wall
-            wall = random.choice(["top", "bottom", "left", "right"])
+            wall = self.rng.choice(["top", "bottom", "left", "right"])
             
             if wall == "top":
-                x = random.randint(room.x + 2, room.x + room.width - 3)
+                x = self.rng.randint(room.x + 2, room.x + room.width - 3)
                 y = room.y + 1
             elif wall == "bottom":
-                x = random.randint(room.x + 2, room.x + room.width - 3)
+                x = self.rng.randint(room.x + 2, room.x + room.width - 3)
                 y = room.y + room.height - 2
             elif wall == "left":
                 x = room.x + 1
-                y = random.randint(room.y + 2, room.y + room.height - 3)
+                y = self.rng.randint(room.y + 2, room.y + room.height - 3)
             else:  # right
                 x = room.x + room.width - 2
-                y = random.randint(room.y + 2, room.y + room.height - 3)
+                y = self.rng.randint(room.y + 2, room.y + room.height - 3)
                 
             # Place the painting
             if 0 <= x < self.width and 0 <= y < self.height:
@@ -478,8 +596,8 @@ class Dungeon(Map):
                 self.collision_grid[y][x] = True
                 
                 # Place the element symbol nearby
-                element_x = x + random.randint(-2, 2)
-                element_y = y + random.randint(-2, 2)
+                element_x = x + self.rng.randint(-2, 2)
+                element_y = y + self.rng.randint(-2, 2)
                 
                 if (room.x < element_x < room.x + room.width - 1 and 
                     room.y < element_y < room.y + room.height - 1):
@@ -510,6 +628,12 @@ class Dungeon(Map):
         # Place the boss in the center
         self.decoration_grid[center_y][center_x] = TileType.ROCK
     
+    def get_room_graph(self) -> RoomGraph:
+        """Get the room and corridor graph for long paths, building it on first use."""
+        if self._room_graph is None:
+            self._room_graph = RoomGraph(self)
+        return self._room_graph
+    
     def get_spawn_position(self) -> Tuple[int, int]:
         """Get the spawn position for the player in the dungeon."""
         if self.entrance_room:
@@ -527,4 +651,23 @@ class Dungeon(Map):
             return center_x, center_y
         
         # Fallback
-        return self.width // 2, self.height // 2 
\ No newline at end of file
+        return self.width // 2, self.height // 2 
+
+
+def _unpack_grid(data: bytes, width: int, height: int, values: List) -> List[List]:
+    """
+    Turn a grid of palette indices back into rows of values.
+    
+    Most dungeon rows repeat (solid stone, rows through the same rooms), so
+    each distinct row is decoded once and copied after that.
+    """
+    decoded = {}
+    grid = []
+    lookup = values.__getitem__
+    for start in range(0, width * height, width):
+        key = data[start:start + width]
+        row = decoded.get(key)
+        if row is None:
+            row = decoded[key] = list(map(lookup, key))
+        grid.append(row[:])
+    return grid
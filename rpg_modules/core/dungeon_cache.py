@@ -0,0 +1,165 @@
+"""
+On-disk cache of generated dungeons.
+
+Dungeon generation is deterministic for a given seed, size and generator
+version, so the generated layout is stored once and later restored instead
+of regenerated. Only the most recently used layouts are kept; older files
+are pruned.
+
+A layout file is binary: a fixed header, the JSON metadata from
+``Dungeon.to_layout`` (rooms, corridors, tile palette) and the zlib-compressed
+tile grids, one byte per tile. Decoding it has to stay cheaper than running
+the generator, which rules out per-tile JSON.
+"""
+
+import json
+import os
+import struct
+import zlib
+from typing import Optional
+from .dungeon import Dungeon
+
+DEFAULT_DUNGEON_CACHE_DIR = os.path.join('cache', 'dungeons')
+
+LAYOUT_FILE_MAGIC = b"DDLY"
+LAYOUT_FILE_EXTENSION = ".bin"
+
+# magic, generator version, width, height, length of the JSON metadata
+_HEADER = struct.Struct("<4sHHHI")
+
+# Layout keys holding a grid of width * height bytes, in file order
+_GRID_KEYS = ("base_grid", "decoration_grid", "collision_grid")
+
+# Layout files kept on disk before the least recently used ones are deleted
+DEFAULT_MAX_CACHED_DUNGEONS = 8
+
+
+class DungeonCache:
+    """Stores and restores generated dungeon layouts by seed."""
+
+    def __init__(self, cache_dir: str = DEFAULT_DUNGEON_CACHE_DIR,
+                 max_entries: int = DEFAULT_MAX_CACHED_DUNGEONS):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for the layout files
+            max_entries: Number of layout files to keep
+        """
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+
+    def get_path(self, width: int, height: int, seed: int) -> str:
+        """Path of the layout file for a dungeon."""
+        filename = f"dungeon_v{Dungeon.GENERATOR_VERSION}_{width}x{height}_{seed}{LAYOUT_FILE_EXTENSION}"
+        return os.path.join(self.cache_dir, filename)
+
+    def load(self, width: int, height: int, seed: int) -> Optional[Dungeon]:
+        """
+        Restore a cached dungeon.
+
+        Returns:
+            The dungeon, or None if it is not cached or the file is unusable
+        """
+        path = self.get_path(width, height, seed)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            layout = _decode_layout(data, width, height)
+            if layout is None:
+                return None
+            dungeon = Dungeon(width, height, seed, layout=layout)
+            # Mark as recently used so pruning keeps it
+            os.utime(path)
+            return dungeon
+        except (OSError, ValueError, KeyError, IndexError, struct.error, zlib.error) as e:
+            print(f"Ignoring unusable dungeon cache {path}: {e}")
+            return None
+
+    def save(self, dungeon: Dungeon) -> bool:
+        """Store the layout of a freshly generated dungeon."""
+        path = self.get_path(dungeon.width, dungeon.height, dungeon.seed)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(_encode_layout(dungeon.to_layout()))
+        except OSError as e:
+            print(f"Could not write dungeon cache {path}: {e}")
+            return False
+        self.prune()
+        return True
+
+    def prune(self) -> int:
+        """
+        Delete the least recently used layout files beyond ``max_entries``.
+
+        Files of other generator versions or file formats are never read
+        again and go first.
+
+        Returns:
+            Number of files deleted
+        """
+        try:
+            names = [name for name in os.listdir(self.cache_dir) if name.startswith("dungeon_v")]
+        except OSError:
+            return 0
+
+        current = f"dungeon_v{Dungeon.GENERATOR_VERSION}_"
+        entries = []
+        for name in names:
+            path = os.path.join(self.cache_dir, name)
+            is_current = name.startswith(current) and name.endswith(LAYOUT_FILE_EXTENSION)
+            try:
+                entries.append((is_current, os.path.getmtime(path), path))
+            except OSError:
+                continue
+        entries.sort(reverse=True)
+
+        deleted = 0
+        for index, (is_current, _, path) in enumerate(entries):
+            if is_current and index < self.max_entries:
+                continue
+            try:
+                os.remove(path)
+                deleted += 1
+            except OSError as e:
+                print(f"Could not delete dungeon cache {path}: {e}")
+        return deleted
+
+
+def _encode_layout(layout: dict) -> bytes:
+    """Serialize ``Dungeon.to_layout`` output into a layout file."""
+    metadata = json.dumps({key: value for key, value in layout.items() if key not in _GRID_KEYS},
+                          separators=(',', ':')).encode('utf-8')
+    header = _HEADER.pack(LAYOUT_FILE_MAGIC, layout["generator_version"],
+                          layout["width"], layout["height"], len(metadata))
+    grids = zlib.compress(b"".join(layout[key] for key in _GRID_KEYS), 6)
+    return header + metadata + grids
+
+
+def _decode_layout(data: bytes, width: int, height: int) -> Optional[dict]:
+    """
+    Parse a layout file.
+
+    Returns:
+        The layout, or None if the file is from another generator version
+        or for another size
+    """
+    magic, version, file_width, file_height, metadata_length = _HEADER.unpack_from(data)
+    if magic != LAYOUT_FILE_MAGIC:
+        raise ValueError("not a dungeon layout file")
+    if version != Dungeon.GENERATOR_VERSION or (file_width, file_height) != (width, height):
+        return None
+
+    metadata_end = _HEADER.size + metadata_length
+    layout = json.loads(data[_HEADER.size:metadata_end])
+    grids = zlib.decompress(data[metadata_end:])
+    size = width * height
+    if len(grids) != size * len(_GRID_KEYS):
+        raise ValueError("truncated tile grids")
+    for index, key in enumerate(_GRID_KEYS):
+        layout[key] = grids[index * size:(index + 1) * size]
+    return layout
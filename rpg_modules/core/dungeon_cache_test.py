@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Test module for the dungeon cache.
+This file tests that saved dungeons are restored from the cache and that the cache stays bounded.
+"""
+
+import os
+import random
+import sys
+import tempfile
+import unittest
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from rpg_modules.core.dungeon import Dungeon
+from rpg_modules.core.dungeon_cache import DungeonCache
+from rpg_modules.core.dungeon_handler import DungeonHandler
+from rpg_modules.core.events import EventSystem
+
+
+class Game:
+    """Just enough of a game for the dungeon handler."""
+
+    def __init__(self):
+        self.event_system = EventSystem()
+
+
+class TestDungeonCache(unittest.TestCase):
+    """Test cases for DungeonCache and DungeonHandler's use of it."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.temp_dir.name, "dungeons")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def make_handler(self):
+        handler = DungeonHandler(Game())
+        handler.dungeon_cache = DungeonCache(self.cache_dir)
+        return handler
+
+    def test_loading_a_save_restores_the_cached_dungeon(self):
+        first = self.make_handler()
+        dungeon = first.create_dungeon(40, 40)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+        second = self.make_handler()
+        second.load_state(first.save_state())
+        restored = second.current_dungeon
+        self.assertEqual(restored.seed, dungeon.seed)
+        self.assertIn("restore_layout", restored.generation_times)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+    def test_new_games_get_new_dungeons(self):
+        random.seed(5)
+        first = self.make_handler().create_dungeon(40, 40)
+        second = self.make_handler().create_dungeon(40, 40)
+        self.assertNotEqual(first.seed, second.seed)
+
+    def test_restored_layout_matches_generated(self):
+        cache = DungeonCache(self.cache_dir)
+        generated = Dungeon(60, 60, 7)
+        cache.save(generated)
+        restored = cache.load(60, 60, 7)
+
+        self.assertEqual(restored.base_grid, generated.base_grid)
+        self.assertEqual(restored.decoration_grid, generated.decoration_grid)
+        self.assertEqual(restored.collision_grid, generated.collision_grid)
+        self.assertEqual(restored.corridors, generated.corridors)
+        self.assertEqual([(room.room_type, room.x, room.y, room.width, room.height, room.doors)
+                          for room in restored.rooms],
+                         [(room.room_type, room.x, room.y, room.width, room.height, room.doors)
+                          for room in generated.rooms])
+        # Rows are copies, so editing one tile leaves identical rows alone
+        restored.collision_grid[0][0] = not restored.collision_grid[0][0]
+        self.assertEqual(restored.collision_grid[1][0], generated.collision_grid[1][0])
+
+    def test_unusable_file_is_ignored(self):
+        cache = DungeonCache(self.cache_dir)
+        cache.save(Dungeon(40, 40, 1))
+        path = cache.get_path(40, 40, 1)
+        with open(path, 'r+b') as f:
+            f.truncate(os.path.getsize(path) - 8)
+        self.assertIsNone(cache.load(40, 40, 1))
+
+    def test_cache_is_pruned_to_most_recently_used(self):
+        cache = DungeonCache(self.cache_dir, max_entries=2)
+        for seed in range(3):
+            cache.save(Dungeon(40, 40, seed))
+            # Distinct modification times regardless of filesystem resolution
+            os.utime(cache.get_path(40, 40, seed), (seed, seed))
+        cache.save(Dungeon(40, 40, 3))
+
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+        self.assertIsNone(cache.load(40, 40, 0))
+        self.assertIsNotNone(cache.load(40, 40, 3))
+
+    def test_prune_removes_other_generator_versions_and_formats(self):
+        cache = DungeonCache(self.cache_dir)
+        os.makedirs(self.cache_dir)
+        stale = [os.path.join(self.cache_dir, f"dungeon_v{Dungeon.GENERATOR_VERSION + 1}_40x40_1.bin"),
+                 os.path.join(self.cache_dir, f"dungeon_v{Dungeon.GENERATOR_VERSION}_40x40_1.json")]
+        for path in stale:
+            with open(path, 'w') as f:
+                f.write("{}")
+        cache.save(Dungeon(40, 40, 1))
+        self.assertEqual(os.listdir(self.cache_dir), [os.path.basename(cache.get_path(40, 40, 1))])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,11 +5,14 @@ Dungeon handler module for managing dungeon instances and integrating them with
 from typing import Dict, List, Tuple, Optional, Any
 import json
 import os
+import random
 import pygame
 
 from .dungeon import Dungeon, RoomType, PuzzleState, Room
+from .dungeon_cache import DungeonCache
 from .enums import TileType
 from .events import EventType, GameEvent
+from .settings import GameSettings
 
 class DungeonHandler:
     """
@@ -18,7 +21,12 @@ class DungeonHandler:
     """
     
     def __init__(self, game):
-        """Initialize the dungeon handler."""
+        """
+        Initialize the dungeon handler.
+        
+        Args:
+            game: Game object providing the event and audio systems
+        """
         self.game = game
         self.current_dungeon = None
         self.active_puzzles = {}  # roomtype -> puzzle state
@@ -26,13 +34,37 @@ class DungeonHandler:
         self.puzzle_progress = {}  # Tracks progress of each puzzle
         self.player_position = None  # Last known player position in dungeon
         
+        # Generated layouts are cached on disk by seed; puzzle changes to the
+        # layout are tracked separately so saves can replay them on top
+        self.dungeon_cache = DungeonCache()
+        self.tile_changes = {}  # "x,y" -> changed grid values
+        
         # Register event handlers
         self.game.event_system.register_handler(EventType.PLAYER_MOVE, self._on_player_move)
         self.game.event_system.register_handler(EventType.INTERACT, self._on_player_interact)
         
     def create_dungeon(self, width: int, height: int, seed: Optional[int] = None) -> Dungeon:
-        """Create a new Veilmaster's Fortress dungeon instance."""
-        self.current_dungeon = Dungeon(width, height, seed)
+        """
+        Create a Veilmaster's Fortress dungeon instance.
+        
+        Without a seed a new dungeon is rolled; the seed is part of
+        ``save_state``, so a saved game gets its own dungeon back through
+        ``load_state``. A dungeon generated before with the same seed and
+        size is loaded from the dungeon cache instead of being generated
+        again.
+        """
+        if seed is None:
+            seed = random.randint(0, 1000000)
+            
+        dungeon = self.dungeon_cache.load(width, height, seed)
+        if dungeon is None:
+            dungeon = Dungeon(width, height, seed)
+            self.dungeon_cache.save(dungeon)
+        if GameSettings.instance().debug_generation_reports:
+            print(dungeon.get_generation_report())
+        
+        self.current_dungeon = dungeon
+        self.tile_changes = {}
         self.active_puzzles = {
             RoomType.HALL_OF_ECHOES: PuzzleState.UNSOLVED,
             RoomType.GOLEM_FORGE: PuzzleState.UNSOLVED,
@@ -52,6 +84,41 @@ class DungeonHandler:
         # Return the dungeon instance for integration with game map
         return self.current_dungeon
         
+    def _set_tile(self, x: int, y: int, **changes):
+        """
+        Change the dungeon grids at a tile and remember the change for saving.
+        
+        Args:
+            x, y: Tile coordinates
+            changes: Any of base (TileType), decoration (TileType or None)
+                and collision (bool)
+        """
+        dungeon = self.current_dungeon
+        if "base" in changes:
+            dungeon.base_grid[y][x] = changes["base"]
+        if "decoration" in changes:
+            dungeon.decoration_grid[y][x] = changes["decoration"]
+        if "collision" in changes:
+            dungeon.collision_grid[y][x] = changes["collision"]
+            dungeon.collision_changed()
+            
+        self.tile_changes.setdefault(f"{x},{y}", {}).update(changes)
+    
+    def _apply_tile_changes(self, tile_changes: Dict):
+        """Replay saved tile changes on a freshly loaded dungeon."""
+        for key, changes in tile_changes.items():
+            x, y = (int(value) for value in key.split(","))
+            if not (0 <= x < self.current_dungeon.width and 0 <= y < self.current_dungeon.height):
+                continue
+            restored = {}
+            if "base" in changes:
+                restored["base"] = TileType(changes["base"])
+            if "decoration" in changes:
+                restored["decoration"] = TileType(changes["decoration"]) if changes["decoration"] else None
+            if "collision" in changes:
+                restored["collision"] = bool(changes["collision"])
+            self._set_tile(x, y, **restored)
+    
     def get_current_room(self, player_x: int, player_y: int) -> Optional[Room]:
         """Get the room the player is currently in."""
         if not self.current_dungeon:
@@ -132,8 +199,7 @@ class DungeonHandler:
             # Change from locked door to normal door
             if 0 <= door_x < self.current_dungeon.width and 0 <= door_y < self.current_dungeon.height:
                 if self.current_dungeon.base_grid[door_y][door_x] == TileType.STONE_WALL:
-                    self.current_dungeon.base_grid[door_y][door_x] = TileType.DOOR
-                    self.current_dungeon.collision_grid[door_y][door_x] = False
+                    self._set_tile(door_x, door_y, base=TileType.DOOR, collision=False)
         
         # Trigger an event for this milestone
         self.game.event_system.trigger_event(
@@ -220,7 +286,7 @@ class DungeonHandler:
         # Check if interacting with a titan fragment
         if self.current_dungeon.decoration_grid[y][x] == TileType.ROCK:
             # Remove the fragment (collect it)
-            self.current_dungeon.decoration_grid[y][x] = None
+            self._set_tile(x, y, decoration=None)
             
             # Advance puzzle progress
             self.increase_puzzle_progress(RoomType.GOLEM_FORGE)
@@ -233,8 +299,7 @@ class DungeonHandler:
             # This would need a more sophisticated check in a real implementation
             
             # For demonstration, reveal a bridge segment
-            self.current_dungeon.base_grid[y][x] = TileType.STONE
-            self.current_dungeon.collision_grid[y][x] = False
+            self._set_tile(x, y, base=TileType.STONE, collision=False)
             
             # Advance puzzle progress
             self.increase_puzzle_progress(RoomType.CHASM_OF_WHISPERS)
@@ -253,7 +318,7 @@ class DungeonHandler:
         # Check if interacting with an elemental seal
         if self.current_dungeon.decoration_grid[y][x] in [TileType.ROCK, TileType.WATER, TileType.STONE, TileType.BUSH]:
             # Remove the seal
-            self.current_dungeon.decoration_grid[y][x] = None
+            self._set_tile(x, y, decoration=None)
             
             # Advance puzzle progress
             self.increase_puzzle_progress(RoomType.SANCTUM_OF_SEALS)
@@ -263,18 +328,42 @@ class DungeonHandler:
         if not self.current_dungeon:
             return {}
             
+        # The layout itself is rebuilt from the seed (via the dungeon cache);
+        # only the puzzle state and the tiles it changed are saved
+        tile_changes = {
+            key: {
+                name: (value.value if hasattr(value, "value") else value)
+                for name, value in changes.items()
+            }
+            for key, changes in self.tile_changes.items()
+        }
+            
         return {
+            "seed": self.current_dungeon.seed,
+            "width": self.current_dungeon.width,
+            "height": self.current_dungeon.height,
             "active_puzzles": {k.value: v.value for k, v in self.active_puzzles.items()},
             "puzzle_progress": {k.value: v for k, v in self.puzzle_progress.items()},
             "discovered_rooms": [room.value for room in self.discovered_rooms],
-            "player_position": self.player_position
+            "player_position": self.player_position,
+            "tile_changes": tile_changes
         }
     
     def load_state(self, state: Dict):
         """Load a previously saved dungeon state."""
-        if not state or not self.current_dungeon:
+        if not state:
+            return
+            
+        # Restore the saved dungeon from its seed unless it is already loaded
+        seed = state.get("seed")
+        if seed is not None and (not self.current_dungeon or self.current_dungeon.seed != seed):
+            self.create_dungeon(state.get("width", 100), state.get("height", 100), seed)
+            
+        if not self.current_dungeon:
             return
             
+        self._apply_tile_changes(state.get("tile_changes", {}))
+            
         # Convert string keys back to enum types
         self.active_puzzles = {
             RoomType(k): PuzzleState(v) 
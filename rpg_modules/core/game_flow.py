@@ -9,9 +9,11 @@ from .town_map import TownMap
 from .dungeon import Dungeon, RoomType
 from .dungeon_handler import DungeonHandler
 from .events import EventSystem, EventType, GameEvent
+from .sound_streamer import StreamPriority
 from ..quests import QuestManager, initialize_main_quest_system, register_quest_event_handlers
 from ..entities import player as player_module
 from ..ui.quest import QuestUI
+from ..ui.retained import DirtyRectTracker
 import os
 import json
 
@@ -32,6 +34,31 @@ class GameFlow:
     and coordinating systems like maps, quests, and NPCs.
     """
     
+    # States that show a UI panel over a frozen town or dungeon view
+    STATIC_WORLD_STATES = (
+        GameState.DIALOG,
+        GameState.QUEST_LOG,
+        GameState.INVENTORY,
+        GameState.GAME_MENU
+    )
+    
+    # UI component shown by each static-world state
+    STATE_UI_COMPONENTS = {
+        GameState.DIALOG: "dialog",
+        GameState.QUEST_LOG: "quest",
+        GameState.INVENTORY: "inventory",
+        GameState.GAME_MENU: "game_menu"
+    }
+    
+    # Sound effect area (AudioSystem.AREA_SOUNDS) of each world state
+    STATE_SOUND_AREAS = {
+        GameState.TOWN: "town",
+        GameState.DUNGEON: "dungeon"
+    }
+    
+    # Distance in tiles from the dungeon entrance at which its sounds are prefetched
+    DUNGEON_PREFETCH_DISTANCE = 8
+    
     def __init__(self, screen, audio_system=None):
         """Initialize the game flow controller."""
         self.screen = screen
@@ -60,6 +87,12 @@ class GameFlow:
         # UI components
         self.ui_components = {}
         
+        # Frame presentation: while a panel is open over a static world view the
+        # world is rendered once into a backdrop and only changed rects are pushed
+        self.dirty_rects = DirtyRectTracker()
+        self._world_backdrop = None
+        self._menu_overlay = None
+        
         # Key bindings
         self.key_bindings = {
             pygame.K_q: self._toggle_quest_ui,
@@ -131,6 +164,11 @@ class GameFlow:
         # Store previous state for back functionality
         self.previous_state = self.current_state
         
+        # Load the new area's sound effects ahead of everything else
+        if self.audio_system and new_state in self.STATE_SOUND_AREAS:
+            self.audio_system.prefetch_area(self.STATE_SOUND_AREAS[new_state],
+                                            StreamPriority.NOW)
+        
         # Perform state-specific setup
         if new_state == GameState.TOWN:
             if self.current_state == GameState.CHARACTER_SELECT:
@@ -196,7 +234,12 @@ class GameFlow:
     
     def draw(self):
         """Draw the current game state."""
-        self.screen.fill((0, 0, 0))  # Clear screen
+        if self._is_world_static():
+            self._draw_static_backdrop()
+        else:
+            self._world_backdrop = None
+            self.dirty_rects.request_full_redraw()
+            self.screen.fill((0, 0, 0))  # Clear screen
         
         # Draw based on current state
         if self.current_state == GameState.CHARACTER_SELECT:
@@ -219,15 +262,63 @@ class GameFlow:
             overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
             overlay.fill((0, 0, 0, int(self.screen_transition_alpha)))
             self.screen.blit(overlay, (0, 0))
+            self.dirty_rects.request_full_redraw()
             
         # Draw quest notification if needed
-        self._draw_notifications()
+        if self.notifications:
+            self._draw_notifications()
+            self.dirty_rects.request_full_redraw()
+            
+        # Collect the areas the active panel changed this frame
+        ui_name = self.STATE_UI_COMPONENTS.get(self.current_state)
+        ui = self.ui_components.get(ui_name)
+        if ui is not None and hasattr(ui, 'consume_dirty_rects'):
+            self.dirty_rects.extend(ui.consume_dirty_rects())
+    
+    def present(self):
+        """
+        Push the drawn frame to the display.
+        
+        Call this instead of ``pygame.display.flip()`` after ``draw``. While the
+        world view is static only the rects changed by UI panels are updated.
+        Only loops driven by ``GameFlow`` present this way; working_game.py
+        redraws its scrolling world every frame and keeps its full flip.
+        """
+        self.dirty_rects.present()
+    
+    def _is_world_static(self) -> bool:
+        """Check whether the world behind the current UI is frozen."""
+        return (self.current_state in self.STATIC_WORLD_STATES and
+                self.previous_state in (GameState.TOWN, GameState.DUNGEON))
+    
+    def _draw_static_backdrop(self):
+        """Draw the frozen world view, rendering it only on the first frame."""
+        if self._world_backdrop is None:
+            self.screen.fill((0, 0, 0))
+            self._draw_world(self.previous_state)
+            self._world_backdrop = self.screen.copy()
+            self.dirty_rects.request_full_redraw()
+        else:
+            self.screen.blit(self._world_backdrop, (0, 0))
+    
+    def _draw_world(self, state: GameState):
+        """Draw the map, NPCs and player for the town or dungeon."""
+        if self.current_map:
+            self.current_map.draw(self.screen, self.player)
+            
+        if state == GameState.TOWN and self.npc_manager:
+            self.npc_manager.draw(self.screen)
+            
+        if self.player:
+            self.player.draw(self.screen)
     
     def _setup_town_first_time(self):
         """Set up the town map and NPCs when first entering the town."""
         # Initialize NPCs in town
         if self.npc_manager:
+            self.npc_manager.set_walkable_index(self.town_map.get_walkable_index())
             self.npc_manager.populate_town(self.town_map)
+            self.npc_manager.prepare_patrol_routes(self.town_map)
             
         # Make quest givers available
         self._setup_quest_givers()
@@ -260,9 +351,10 @@ class GameFlow:
     
     def _enter_dungeon(self):
         """Handle entering the dungeon from town."""
-        # Create the dungeon if it doesn't exist
+        # Create the dungeon if it doesn't exist (or use one restored from a save)
         if not self.dungeon:
-            self.dungeon = self.dungeon_handler.create_dungeon(100, 100)
+            self.dungeon = (self.dungeon_handler.current_dungeon or
+                            self.dungeon_handler.create_dungeon(100, 100))
         
         # Set current map to dungeon
         self.current_map = self.dungeon
@@ -390,6 +482,12 @@ class GameFlow:
                 entrance_x, entrance_y = dungeon_entrance
                 player_x, player_y = self.player.get_position()
                 
+                # On the approach, start loading the dungeon's sounds
+                if self.audio_system and \
+                        max(abs(player_x - entrance_x), abs(player_y - entrance_y)) <= \
+                        self.DUNGEON_PREFETCH_DISTANCE:
+                    self.audio_system.prefetch_area("dungeon")
+                
                 # If player is close to entrance, allow entering
                 if abs(player_x - entrance_x) <= 1 and abs(player_y - entrance_y) <= 1:
                     # Show dungeon entrance prompt
@@ -453,17 +551,8 @@ class GameFlow:
     
     def _draw_town(self):
         """Draw town state."""
-        # Draw map
-        if self.current_map:
-            self.current_map.draw(self.screen, self.player)
-            
-        # Draw NPCs
-        if self.npc_manager:
-            self.npc_manager.draw(self.screen)
-            
-        # Draw player
-        if self.player:
-            self.player.draw(self.screen)
+        # Draw map, NPCs and player
+        self._draw_world(GameState.TOWN)
             
         # Draw UI components
         for ui in self.ui_components.values():
@@ -472,13 +561,8 @@ class GameFlow:
     
     def _draw_dungeon(self):
         """Draw dungeon state."""
-        # Draw map
-        if self.current_map:
-            self.current_map.draw(self.screen, self.player)
-            
-        # Draw player
-        if self.player:
-            self.player.draw(self.screen)
+        # Draw map and player
+        self._draw_world(GameState.DUNGEON)
             
         # Draw UI components
         for ui in self.ui_components.values():
@@ -487,12 +571,8 @@ class GameFlow:
     
     def _draw_dialog(self):
         """Draw dialog state."""
-        # Draw background (town or dungeon)
-        if self.previous_state == GameState.TOWN:
-            self._draw_town()
-        elif self.previous_state == GameState.DUNGEON:
-            self._draw_dungeon()
-            
+        # Background (town or dungeon) is the cached static backdrop
+
         # Draw dialog UI on top
         dialog_ui = self.ui_components.get("dialog")
         if dialog_ui:
@@ -613,7 +693,7 @@ class GameFlow:
         """Update inventory state."""
         inventory_ui = self.ui_components.get("inventory")
         if inventory_ui:
-            inventory_ui.update()
+            inventory_ui.update(dt)
             
             # Handle events
             if events:
@@ -641,12 +721,8 @@ class GameFlow:
     
     def _draw_quest_log(self):
         """Draw quest log UI."""
-        # Draw background (town or dungeon)
-        if self.previous_state == GameState.TOWN:
-            self._draw_town()
-        elif self.previous_state == GameState.DUNGEON:
-            self._draw_dungeon()
-            
+        # Background (town or dungeon) is the cached static backdrop
+
         # Draw quest UI on top
         quest_ui = self.ui_components.get("quest")
         if quest_ui:
@@ -655,12 +731,8 @@ class GameFlow:
     
     def _draw_inventory(self):
         """Draw inventory UI."""
-        # Draw background (town or dungeon)
-        if self.previous_state == GameState.TOWN:
-            self._draw_town()
-        elif self.previous_state == GameState.DUNGEON:
-            self._draw_dungeon()
-            
+        # Background (town or dungeon) is the cached static backdrop
+
         # Draw inventory UI on top
         inventory_ui = self.ui_components.get("inventory")
         if inventory_ui:
@@ -670,9 +742,10 @@ class GameFlow:
     def _draw_game_menu(self):
         """Draw game menu UI."""
         # Dim background
-        overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))  # Semi-transparent black
-        self.screen.blit(overlay, (0, 0))
+        if self._menu_overlay is None or self._menu_overlay.get_size() != self.screen.get_size():
+            self._menu_overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
+            self._menu_overlay.fill((0, 0, 0, 128))  # Semi-transparent black
+        self.screen.blit(self._menu_overlay, (0, 0))
         
         # Draw game menu UI on top
         game_menu_ui = self.ui_components.get("game_menu")
@@ -686,6 +759,7 @@ class GameFlow:
             quest = self.quest_manager.quest_log.get_quest(quest_id)
             if quest:
                 print(f"Quest started: {quest.title}")
+                self._invalidate_quest_ui()
                 # Play quest accept sound
                 if self.audio_system:
                     self.audio_system.play_sound("quest_accept")
@@ -702,6 +776,7 @@ class GameFlow:
             if quest and 0 <= objective_index < len(quest.objectives):
                 objective = quest.objectives[objective_index]
                 print(f"Quest objective updated: {objective.description}")
+                self._invalidate_quest_ui()
                 
                 # Play objective updated sound
                 if self.audio_system:
@@ -717,6 +792,7 @@ class GameFlow:
             quest = self.quest_manager.quest_log.get_quest(quest_id)
             if quest:
                 print(f"Quest completed: {quest.title}")
+                self._invalidate_quest_ui()
                 
                 # Play quest complete sound
                 if self.audio_system:
@@ -725,6 +801,12 @@ class GameFlow:
                 # Add notification
                 self.add_notification(f"Quest Completed: {quest.title}", (255, 215, 0), self.notification_duration * 1.5)
     
+    def _invalidate_quest_ui(self):
+        """Re-render the cached quest panel after quest progress changed."""
+        quest_ui = self.ui_components.get("quest")
+        if quest_ui is not None and hasattr(quest_ui, 'invalidate'):
+            quest_ui.invalidate()
+    
     def add_notification(self, text: str, color: Tuple[int, int, int], duration: float):
         """Add a notification to be displayed."""
         self.notifications.append({
@@ -5,12 +5,14 @@ Map management for the RPG game.
 import pygame
 import random
 import math
+import itertools
 from opensimplex import OpenSimplex
 from typing import List, Tuple, Dict, Optional, Set
 from enum import Enum
 from .constants import TILE_SIZE, SCREEN_WIDTH, SCREEN_HEIGHT
 from .camera import Camera
 from .settings import GameSettings
+from .walkable_index import WalkableIndex
 
 class BiomeType(Enum):
     """Enum for different biome types."""
@@ -38,6 +40,9 @@ class TileType(Enum):
     # Structure tiles
     STONE_WALL = "stone_wall"
 
+# Unique map ids; unlike id(), never reused after a map is freed
+_map_uids = itertools.count(1)
+
 class Map:
     """Class for managing the game world map with biomes and varied terrain."""
     
@@ -108,6 +113,17 @@ class Map:
         # List of wall rectangles for collision detection
         self.walls = []
         
+        # Walkable tile index, built on first use
+        self._walkable_index = None
+        
+        # Bumped whenever the collision grid changes, so cached paths expire
+        self.version = 0
+        # Identifies this map in path caches
+        self.uid = next(_map_uids)
+        
+        # Default find_path engine: "astar", or "jps" for paths without wall penalty
+        self.path_engine = "astar"
+        
         # Add a variety of biomes and terrain features
         self._generate_map()
         self._update_wall_rects()
@@ -323,6 +339,21 @@ class Map:
             return not self.collision_grid[y][x]
         return False  # Out of bounds is not walkable
         
+    def get_walkable_index(self) -> WalkableIndex:
+        """Get the walkable tile index of the map, building it on first use."""
+        if self._walkable_index is None:
+            self._walkable_index = WalkableIndex(self)
+        return self._walkable_index
+    
+    def invalidate_walkable_index(self):
+        """Drop the walkable tile index after the collision grid changed."""
+        self._walkable_index = None
+    
+    def collision_changed(self):
+        """Record a change of the collision grid (expires cached paths and the walkable index)."""
+        self.version += 1
+        self.invalidate_walkable_index()
+        
     def get_walls(self) -> List[pygame.Rect]:
         """Get the list of wall rectangles for collision detection."""
         return self.walls
@@ -0,0 +1,76 @@
+"""
+Occupancy bitmap for placing rectangles on a tile grid.
+
+The whole grid is stored as one Python integer with one bit per tile, row by
+row. A rectangle test is a single AND against a precomputed rectangle mask
+shifted to the rectangle's position, so checking whether an area is free
+costs the same no matter how many rectangles were placed before.
+"""
+
+from typing import Dict, Tuple
+
+
+class OccupancyGrid:
+    """One layer of occupied tiles (buildings, roads, water, ...)."""
+
+    def __init__(self, width: int, height: int):
+        """
+        Initialize an empty grid.
+
+        Args:
+            width: Grid width in tiles
+            height: Grid height in tiles
+        """
+        self.width = width
+        self.height = height
+        self.bits = 0
+        self._masks: Dict[Tuple[int, int], int] = {}
+
+    def _clip(self, x: int, y: int, w: int, h: int) -> Tuple[int, int, int, int]:
+        """Clip a rectangle to the grid."""
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(self.width, x + w), min(self.height, y + h)
+        return x0, y0, x1 - x0, y1 - y0
+
+    def _mask(self, x: int, y: int, w: int, h: int) -> int:
+        """Bit mask of a rectangle that lies inside the grid."""
+        mask = self._masks.get((w, h))
+        if mask is None:
+            row = (1 << w) - 1
+            mask = 0
+            for r in range(h):
+                mask |= row << (r * self.width)
+            self._masks[(w, h)] = mask
+        return mask << (y * self.width + x)
+
+    def in_bounds(self, x: int, y: int, w: int = 1, h: int = 1) -> bool:
+        """Check whether a rectangle lies entirely inside the grid."""
+        return 0 <= x and 0 <= y and x + w <= self.width and y + h <= self.height
+
+    def mark(self, x: int, y: int, w: int = 1, h: int = 1):
+        """Mark a rectangle as occupied (the part outside the grid is ignored)."""
+        x, y, w, h = self._clip(x, y, w, h)
+        if w > 0 and h > 0:
+            self.bits |= self._mask(x, y, w, h)
+
+    def clear(self, x: int, y: int, w: int = 1, h: int = 1):
+        """Mark a rectangle as free (the part outside the grid is ignored)."""
+        x, y, w, h = self._clip(x, y, w, h)
+        if w > 0 and h > 0:
+            self.bits &= ~self._mask(x, y, w, h)
+
+    def any_set(self, x: int, y: int, w: int = 1, h: int = 1) -> bool:
+        """Check whether any tile of a rectangle is occupied (clipped to the grid)."""
+        x, y, w, h = self._clip(x, y, w, h)
+        if w <= 0 or h <= 0:
+            return False
+        return bool(self.bits & self._mask(x, y, w, h))
+
+    def is_set(self, x: int, y: int) -> bool:
+        """Check a single tile."""
+        return 0 <= x < self.width and 0 <= y < self.height and \
+            bool(self.bits >> (y * self.width + x) & 1)
+
+    def count(self) -> int:
+        """Number of occupied tiles."""
+        return bin(self.bits).count("1")
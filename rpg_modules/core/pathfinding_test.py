@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Test module for the path cache.
+This file tests that cached paths are never served for a different map or agent.
+"""
+
+import os
+import sys
+import unittest
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from rpg_modules.core.constants import TILE_SIZE
+from rpg_modules.core.dungeon import Dungeon
+from rpg_modules.core.pathfinding import PathCache, path_cache
+from rpg_modules.entities.monster import MonsterType
+from rpg_modules.entities.monster_spawner import MonsterSpawner
+
+
+def tile_center(tile):
+    """Pixel position of a tile's center."""
+    return (tile[0] * TILE_SIZE + TILE_SIZE // 2, tile[1] * TILE_SIZE + TILE_SIZE // 2)
+
+
+class OpenMap:
+    """Minimal map without walls."""
+    width = height = 30
+    version = 0
+
+    def is_walkable(self, x, y):
+        return 0 <= x < self.width and 0 <= y < self.height
+
+
+class Agent:
+    """Anything that follows a path."""
+
+
+class TestPathCache(unittest.TestCase):
+    """Test cases for PathCache."""
+
+    def test_new_maps_never_get_old_paths(self):
+        """Freed maps' ids are reused by new ones; their paths must not be."""
+        shared = PathCache()
+        start, goal = tile_center((12, 12)), tile_center((20, 18))
+        for seed in range(80):
+            dungeon = Dungeon(40, 40, seed=seed)
+            expected = PathCache().get_path(dungeon, start, goal)
+            self.assertEqual(shared.get_path(dungeon, start, goal), expected, f"seed {seed}")
+            del dungeon
+        self.assertEqual(shared.hits, 0)
+
+    def test_map_uids_are_unique(self):
+        first = Dungeon(40, 40, seed=1)
+        second = Dungeon(40, 40, seed=1)
+        self.assertNotEqual(first.uid, second.uid)
+
+    def test_agent_path_is_repaired_when_goal_moves(self):
+        cache = PathCache()
+        game_map, agent = OpenMap(), Agent()
+        cache.get_path(game_map, tile_center((5, 5)), tile_center((10, 5)), agent=agent)
+        path = cache.get_path(game_map, tile_center((5, 5)), tile_center((11, 5)), agent=agent)
+        self.assertEqual(cache.repairs, 1)
+        self.assertEqual(path[-1], tile_center((11, 5)))
+
+    def test_reused_agent_id_does_not_repair(self):
+        """A new agent that got a dead agent's id must not inherit its path."""
+        cache = PathCache()
+        game_map, old_agent, new_agent = OpenMap(), Agent(), Agent()
+        cache.get_path(game_map, tile_center((5, 5)), tile_center((10, 5)), agent=old_agent)
+        # Same situation as the new agent being allocated at the old one's address
+        cache._agent_paths[id(new_agent)] = cache._agent_paths.pop(id(old_agent))
+        cache.get_path(game_map, tile_center((5, 5)), tile_center((11, 5)), agent=new_agent)
+        self.assertEqual(cache.repairs, 0)
+
+    def test_spawner_forgets_removed_monsters(self):
+        spawner = MonsterSpawner()
+        spawner.register_spawn_template("test", {"monster_type": MonsterType.SKELETON, "level": 1})
+        spawner.add_spawn_point(100, 100)
+        self.assertTrue(spawner._spawn_in_region(spawner.get_region(100, 100), (10000, 10000)))
+        monster = spawner.get_active_monsters()[0]
+        path_cache.get_path(OpenMap(), (monster.x, monster.y), tile_center((1, 1)), agent=monster)
+        self.assertIn(id(monster), path_cache._agent_paths)
+
+        spawner._remove(monster)
+        self.assertNotIn(id(monster), path_cache._agent_paths)
+
+    def test_clear_monsters_forgets_paths(self):
+        spawner = MonsterSpawner()
+        spawner.register_spawn_template("test", {"monster_type": MonsterType.SKELETON, "level": 1})
+        spawner.add_spawn_point(100, 100)
+        spawner._spawn_in_region(spawner.get_region(100, 100), (10000, 10000))
+        monster = spawner.get_active_monsters()[0]
+        path_cache.get_path(OpenMap(), (monster.x, monster.y), tile_center((1, 1)), agent=monster)
+
+        spawner.clear_monsters()
+        self.assertNotIn(id(monster), path_cache._agent_paths)
+
+
+if __name__ == "__main__":
+    unittest.main()
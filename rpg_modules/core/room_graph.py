@@ -0,0 +1,357 @@
+"""
+Hierarchical pathfinding over the rooms and corridors of a Dungeon.
+
+The walkable tiles of a dungeon are split into regions: one per room and
+one per connected stretch of corridor. Regions meet at portals: runs of
+adjacent tiles where one region touches another. In generated dungeons these
+are the doors placed by ``_place_doors`` and the seams where rooms overlap.
+The planner first searches the
+small graph of portals, whose edge costs are precomputed once per map
+version, and then runs a local A* inside each region along the route. Search
+cost is therefore bounded by the size of the regions on the route instead of
+by the distance between start and goal, and the portal-to-portal legs are
+cached and shared by every path that crosses the same region.
+"""
+
+import heapq
+import math
+from array import array
+from typing import Dict, List, Optional, Set, Tuple
+from .constants import TILE_SIZE
+from .pathfinding import optimize_path
+
+DIAGONAL_COST = 1.414
+
+# (dx, dy, cost), orthogonal moves first
+MOVES = [(0, -1, 1.0), (1, 0, 1.0), (0, 1, 1.0), (-1, 0, 1.0),
+         (1, -1, DIAGONAL_COST), (1, 1, DIAGONAL_COST), (-1, 1, DIAGONAL_COST), (-1, -1, DIAGONAL_COST)]
+
+
+class Portal:
+    """A run of adjacent tiles of one region that border other regions."""
+
+    __slots__ = ('index', 'region', 'tiles', 'tile', 'regions')
+
+    def __init__(self, index: int, region: int, tiles: List[int], regions: Set[int]):
+        self.index = index
+        self.region = region
+        self.tiles = tiles
+        self.tile = tiles[len(tiles) // 2]  # Tile index all routes pass through
+        self.regions = regions
+
+
+class RoomGraph:
+    """
+    Region and portal graph of a dungeon for long-distance paths.
+
+    The dungeon needs ``width``, ``height``, ``rooms`` (with ``x``, ``y``,
+    ``width`` and ``height``) and ``is_walkable``. The graph rebuilds itself when
+    ``dungeon.version`` changes (see ``Map.collision_changed``).
+    """
+
+    def __init__(self, dungeon):
+        """
+        Build the graph.
+
+        Args:
+            dungeon: Dungeon to plan paths on
+        """
+        self.dungeon = dungeon
+        self.version = None
+        self.rebuild()
+
+    def rebuild(self):
+        """Recompute regions, portals and portal-to-portal costs."""
+        dungeon = self.dungeon
+        self.width, self.height = dungeon.width, dungeon.height
+        self.version = getattr(dungeon, "version", 0)
+        self._label_regions()
+        self._find_portals()
+        self._link_portals()
+        self._legs: Dict[Tuple[int, int, int], List[Tuple[int, int]]] = {}
+        self.nodes_expanded = 0
+
+    def _label_regions(self):
+        """Label every walkable tile with its room index or corridor region."""
+        width, height = self.width, self.height
+        is_walkable = self.dungeon.is_walkable
+        labels = array('i', [-1]) * (width * height)
+        walkable = array('b', [0]) * (width * height)
+        for y in range(height):
+            for x in range(width):
+                if is_walkable(x, y):
+                    walkable[y * width + x] = 1
+
+        rooms = self.dungeon.rooms
+        for room_index, room in enumerate(rooms):
+            for y in range(max(0, room.y), min(height, room.y + room.height)):
+                for x in range(max(0, room.x), min(width, room.x + room.width)):
+                    i = y * width + x
+                    if walkable[i] and labels[i] < 0:
+                        labels[i] = room_index
+
+        # Corridors: flood fill what is left; 4-connectivity matches movement
+        # because diagonal steps may not cut corners
+        region = len(rooms)
+        for start in range(width * height):
+            if not walkable[start] or labels[start] >= 0:
+                continue
+            labels[start] = region
+            stack = [start]
+            while stack:
+                i = stack.pop()
+                x, y = i % width, i // width
+                for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+                    if 0 <= nx < width and 0 <= ny < height:
+                        n = ny * width + nx
+                        if walkable[n] and labels[n] < 0:
+                            labels[n] = region
+                            stack.append(n)
+            region += 1
+
+        self.labels = labels
+        self.region_count = region
+
+    def _find_portals(self):
+        """Group the tiles where regions touch into portals."""
+        width, height = self.width, self.height
+        labels = self.labels
+        self.portals: List[Portal] = []
+        self._region_portals: Dict[int, List[Portal]] = {}
+        self._region_portal_tiles: Dict[int, Set[int]] = {}
+
+        # Each seam is taken from its lower-labelled side, so rooms (labelled
+        # before corridors) contribute their door tiles
+        borders: Dict[int, frozenset] = {}
+        for i, own in enumerate(labels):
+            if own < 0:
+                continue
+            x, y = i % width, i // width
+            outside = set()
+            for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+                if 0 <= nx < width and 0 <= ny < height:
+                    label = labels[ny * width + nx]
+                    if label > own:
+                        outside.add(label)
+            if outside:
+                borders[i] = frozenset(outside)
+
+        # Adjacent border tiles of a region leading to the same regions form one portal
+        seen = set()
+        for tile in sorted(borders):
+            if tile in seen:
+                continue
+            group, stack = [], [tile]
+            seen.add(tile)
+            while stack:
+                i = stack.pop()
+                group.append(i)
+                for n in (i + 1, i - 1, i + width, i - width):
+                    if n in borders and n not in seen and labels[n] == labels[tile] and \
+                            borders[n] == borders[tile] and abs(n % width - i % width) <= 1:
+                        seen.add(n)
+                        stack.append(n)
+            group.sort()
+            portal = Portal(len(self.portals), labels[tile], group, {labels[tile]} | borders[tile])
+            self.portals.append(portal)
+            for region in portal.regions:
+                self._region_portals.setdefault(region, []).append(portal)
+                self._region_portal_tiles.setdefault(region, set()).add(portal.tile)
+
+    def _link_portals(self):
+        """Precompute the travel cost between the portals of each region."""
+        self._edges: Dict[int, List[Tuple[int, float, int]]] = {p.index: [] for p in self.portals}
+        for region, portals in self._region_portals.items():
+            for portal in portals:
+                dist = self._distances(portal.tile, region)
+                for other in portals:
+                    if other is not portal and other.tile in dist:
+                        self._edges[portal.index].append((other.index, dist[other.tile], region))
+
+    def _allowed(self, i: int, region: int) -> bool:
+        """Check whether a tile may be used by a path through a region."""
+        label = self.labels[i]
+        if label == region:
+            return True
+        return label >= 0 and i in self._region_portal_tiles.get(region, ())
+
+    def _neighbours(self, i: int, region: int):
+        """Yield (tile, cost) moves from a tile that stay inside a region."""
+        width, height = self.width, self.height
+        x, y = i % width, i // width
+        for dx, dy, cost in MOVES:
+            nx, ny = x + dx, y + dy
+            if not (0 <= nx < width and 0 <= ny < height):
+                continue
+            n = ny * width + nx
+            if not self._allowed(n, region):
+                continue
+            # Diagonal steps must not cut a wall corner
+            if dx and dy and (not self._allowed(y * width + nx, region) or
+                              not self._allowed(ny * width + x, region)):
+                continue
+            yield n, cost
+
+    def _distances(self, source: int, region: int) -> Dict[int, float]:
+        """Travel cost from a tile to every tile reachable inside a region (Dijkstra)."""
+        dist = {source: 0.0}
+        heap = [(0.0, source)]
+        while heap:
+            d, i = heapq.heappop(heap)
+            if d > dist[i]:
+                continue
+            for n, cost in self._neighbours(i, region):
+                nd = d + cost
+                if nd < dist.get(n, math.inf):
+                    dist[n] = nd
+                    heapq.heappush(heap, (nd, n))
+        return dist
+
+    def _octile(self, a: int, b: int) -> float:
+        """Admissible distance estimate between two tiles."""
+        dx = abs(a % self.width - b % self.width)
+        dy = abs(a // self.width - b // self.width)
+        return max(dx, dy) + (DIAGONAL_COST - 1) * min(dx, dy)
+
+    def _local_path(self, start: int, goal: int, region: int) -> Optional[List[int]]:
+        """A* between two tiles that stays inside a region."""
+        g = {start: 0.0}
+        parents = {start: None}
+        heap = [(self._octile(start, goal), 0.0, start)]
+        while heap:
+            _, d, i = heapq.heappop(heap)
+            if i == goal:
+                path = []
+                while i is not None:
+                    path.append(i)
+                    i = parents[i]
+                path.reverse()
+                return path
+            if d > g[i]:
+                continue
+            self.nodes_expanded += 1
+            for n, cost in self._neighbours(i, region):
+                nd = d + cost
+                if nd < g.get(n, math.inf):
+                    g[n] = nd
+                    parents[n] = i
+                    heapq.heappush(heap, (nd + self._octile(n, goal), nd, n))
+        return None
+
+    def region_at(self, x: int, y: int) -> int:
+        """Region of a tile (-1 for blocked or out-of-bounds tiles)."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.labels[y * self.width + x]
+        return -1
+
+    def _to_pixels(self, tiles: List[int]) -> List[Tuple[int, int]]:
+        """Convert tile indices to pixel tile centers."""
+        half = TILE_SIZE // 2
+        return [((i % self.width) * TILE_SIZE + half, (i // self.width) * TILE_SIZE + half) for i in tiles]
+
+    def _leg(self, start: int, goal: int, region: int, wall_clearance: float,
+             cache: bool = False) -> Optional[List[Tuple[int, int]]]:
+        """Smoothed pixel path between two tiles of a region."""
+        key = (region, start, goal)
+        if cache and key in self._legs:
+            return self._legs[key]
+        tiles = self._local_path(start, goal, region)
+        leg = optimize_path(self.dungeon, self._to_pixels(tiles), wall_clearance) if tiles else None
+        if cache:
+            self._legs[key] = leg
+        return leg
+
+    def find_path(self, start_pos: Tuple[float, float], target_pos: Tuple[float, float],
+                  wall_clearance: float = 1.5) -> Optional[List[Tuple[int, int]]]:
+        """
+        Find a path across the dungeon through its rooms and corridors.
+
+        Args:
+            start_pos: Starting position in pixels (x, y)
+            target_pos: Target position in pixels (x, y)
+            wall_clearance: How far to stay from walls when smoothing (in tiles)
+
+        Returns:
+            Waypoints in pixels (tile centers) from start to target, or None
+            if the target is blocked or unreachable
+        """
+        if getattr(self.dungeon, "version", 0) != self.version:
+            self.rebuild()
+
+        width = self.width
+        sx, sy = int(start_pos[0] // TILE_SIZE), int(start_pos[1] // TILE_SIZE)
+        gx, gy = int(target_pos[0] // TILE_SIZE), int(target_pos[1] // TILE_SIZE)
+        start_region, goal_region = self.region_at(sx, sy), self.region_at(gx, gy)
+        if start_region < 0 or goal_region < 0:
+            return None
+        start, goal = sy * width + sx, gy * width + gx
+        if start == goal:
+            return self._to_pixels([start])
+
+        if start_region == goal_region:
+            leg = self._leg(start, goal, start_region, wall_clearance)
+            if leg:
+                return leg
+
+        # Search the portal graph; the start and goal join it through the
+        # portals of their regions
+        start_dist = self._distances(start, start_region)
+        goal_dist = self._distances(goal, goal_region)
+        goal_costs = {p.index: goal_dist[p.tile] for p in self._region_portals.get(goal_region, ())
+                      if p.tile in goal_dist}
+        if not goal_costs:
+            return None
+
+        g: Dict[int, float] = {}
+        parents: Dict[int, Tuple[int, int]] = {}  # portal -> (previous portal or -1, region)
+        heap = []
+        for portal in self._region_portals.get(start_region, ()):
+            if portal.tile in start_dist:
+                cost = start_dist[portal.tile]
+                if cost < g.get(portal.index, math.inf):
+                    g[portal.index] = cost
+                    parents[portal.index] = (-1, start_region)
+                    heapq.heappush(heap, (cost + self._octile(portal.tile, goal), cost, portal.index))
+
+        best, best_cost = None, math.inf
+        while heap:
+            f, d, index = heapq.heappop(heap)
+            if f >= best_cost:
+                break
+            if d > g[index]:
+                continue
+            if index in goal_costs and d + goal_costs[index] < best_cost:
+                best, best_cost = index, d + goal_costs[index]
+            for other, cost, region in self._edges[index]:
+                nd = d + cost
+                if nd < g.get(other, math.inf):
+                    g[other] = nd
+                    parents[other] = (index, region)
+                    heapq.heappush(heap, (nd + self._octile(self.portals[other].tile, goal), nd, other))
+        if best is None:
+            return None
+
+        # Walk back through the portals, then refine each hop with a local A*
+        hops = []
+        index = best
+        while index != -1:
+            previous, region = parents[index]
+            hops.append((previous, index, region))
+            index = previous
+        hops.reverse()
+
+        path = []
+        for previous, index, region in hops:
+            tile = self.portals[index].tile
+            if previous == -1:
+                leg = self._leg(start, tile, region, wall_clearance)
+            else:
+                leg = self._leg(self.portals[previous].tile, tile, region, wall_clearance, cache=True)
+            if not leg:
+                return None
+            path.extend(leg[1:] if path else leg)
+        leg = self._leg(self.portals[best].tile, goal, goal_region, wall_clearance)
+        if not leg:
+            return None
+        path.extend(leg[1:])
+        return path
@@ -42,6 +42,7 @@ class GameSettings:
         
         # Debug settings
         self.debug_visualization = False  # Toggle for debug visualization like bounding boxes
+        self.debug_generation_reports = False  # Print map generation timings
         
     def reset_to_defaults(self):
         """Reset all settings to their default values."""
@@ -50,6 +51,7 @@ class GameSettings:
         self.difficulty_level = 1
         self.day_night_cycle_enabled = True
         self.debug_visualization = False
+        self.debug_generation_reports = False
     
     def adjust_difficulty(self, level):
         """
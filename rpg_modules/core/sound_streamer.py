@@ -0,0 +1,144 @@
+"""
+Background sound loading.
+
+Sound effects are requested from a ``SoundStreamer`` instead of being decoded
+before the first frame. A worker thread runs the loaders in priority order and
+hands each finished sound to a callback; until then callers keep playing the
+silent placeholder. Sounds for an area the player is about to enter can be
+moved ahead of the queue with ``prefetch``.
+"""
+
+import queue
+import threading
+import pygame
+from enum import IntEnum
+from typing import Callable, Dict, Iterable, Optional
+
+
+class StreamPriority(IntEnum):
+    """Loading priorities, lower values are loaded first."""
+    NOW = 0         # Needed by the current area
+    NEXT_AREA = 1   # Prefetch for an area the player is about to enter
+    IDLE = 2        # Load whenever nothing else is pending
+
+
+SoundLoader = Callable[[], Optional[pygame.mixer.Sound]]
+ReadyCallback = Callable[[str, pygame.mixer.Sound], None]
+
+
+class SoundStreamer:
+    """
+    Loads sounds on a daemon worker thread.
+
+    Attributes:
+        sounds: Finished sounds by key
+    """
+
+    def __init__(self):
+        """Initialize the streamer; the worker starts with the first request."""
+        self.sounds: Dict[str, pygame.mixer.Sound] = {}
+
+        # key -> (priority, sequence, loader, callback) of the live queue entry
+        self._requests: Dict[str, tuple] = {}
+        self._pending = queue.PriorityQueue()
+        self._lock = threading.Condition()
+        self._sequence = 0
+        self._loading = 0
+        self._worker: Optional[threading.Thread] = None
+
+    def request(self, key: str, loader: SoundLoader,
+                priority: StreamPriority = StreamPriority.IDLE,
+                on_ready: Optional[ReadyCallback] = None):
+        """
+        Queue a sound for loading.
+
+        Requesting a key that is already loaded or queued at the same or a
+        more urgent priority does nothing.
+
+        Args:
+            key: Identifier of the sound
+            loader: Called on the worker thread, returns the sound or None
+            priority: How soon the sound is needed
+            on_ready: Called on the worker thread with (key, sound) once loaded
+        """
+        with self._lock:
+            if key in self.sounds:
+                return
+            current = self._requests.get(key)
+            if current is not None and current[0] <= priority:
+                return
+            self._queue(key, priority, loader, on_ready)
+
+    def prefetch(self, keys: Iterable[str],
+                 priority: StreamPriority = StreamPriority.NEXT_AREA):
+        """
+        Move already requested sounds ahead in the queue.
+
+        Args:
+            keys: Sounds to promote; unknown or loaded keys are ignored
+            priority: New priority for the sounds
+        """
+        with self._lock:
+            for key in keys:
+                current = self._requests.get(key)
+                if current is not None and current[0] > priority:
+                    self._queue(key, priority, current[2], current[3])
+
+    def is_ready(self, key: str) -> bool:
+        """Whether the sound for a key has finished loading."""
+        return key in self.sounds
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every queued sound has been loaded.
+
+        Args:
+            timeout: Seconds to wait at most, None waits forever
+
+        Returns:
+            True if the queue is empty
+        """
+        with self._lock:
+            return self._lock.wait_for(lambda: not self._requests and not self._loading,
+                                       timeout)
+
+    @property
+    def pending_count(self) -> int:
+        """Number of sounds waiting to be loaded."""
+        return len(self._requests)
+
+    def _queue(self, key, priority, loader, on_ready):
+        """Add a queue entry for a key; the caller holds the lock."""
+        self._sequence += 1
+        self._requests[key] = (priority, self._sequence, loader, on_ready)
+        self._pending.put((priority, self._sequence, key))
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._run, name="SoundStreamer",
+                                            daemon=True)
+            self._worker.start()
+
+    def _run(self):
+        """Worker loop: load the most urgent sound, skipping superseded entries."""
+        while True:
+            priority, sequence, key = self._pending.get()
+            with self._lock:
+                entry = self._requests.get(key)
+                if entry is None or entry[1] != sequence:
+                    continue
+                del self._requests[key]
+                self._loading += 1
+            _, _, loader, on_ready = entry
+
+            try:
+                sound = loader()
+            except Exception as e:
+                print(f"Error streaming sound {key}: {e}")
+                sound = None
+
+            if sound is not None and on_ready:
+                on_ready(key, sound)
+            with self._lock:
+                if sound is not None:
+                    self.sounds[key] = sound
+                self._loading -= 1
+                self._lock.notify_all()
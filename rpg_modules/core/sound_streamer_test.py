@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Test module for the sound streamer.
+This file tests load order, prefetching and the AudioSystem's streamed sound effects.
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import unittest
+import wave
+
+import pygame
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from rpg_modules.core.audio_system import AudioSystem
+from rpg_modules.core.sound_streamer import SoundStreamer, StreamPriority
+from rpg_modules.core.sound_synth import get_silent_sound
+
+
+class TestSoundStreamer(unittest.TestCase):
+    """Test cases for SoundStreamer."""
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.mixer.init()
+
+    def setUp(self):
+        self.streamer = SoundStreamer()
+        self.loaded = []
+        self.release = threading.Event()
+        started = threading.Event()
+
+        def blocker():
+            started.set()
+            self.release.wait(5)
+            return self.loader("blocker")()
+
+        # Hold the worker so the following requests queue up behind it
+        self.streamer.request("blocker", blocker, StreamPriority.NOW)
+        started.wait(5)
+
+    def loader(self, key):
+        def load():
+            self.loaded.append(key)
+            return get_silent_sound()
+        return load
+
+    def finish(self):
+        self.release.set()
+        self.assertTrue(self.streamer.wait(5))
+
+    def test_loads_in_priority_order(self):
+        self.streamer.request("idle", self.loader("idle"), StreamPriority.IDLE)
+        self.streamer.request("next", self.loader("next"), StreamPriority.NEXT_AREA)
+        self.streamer.request("now", self.loader("now"), StreamPriority.NOW)
+        self.finish()
+
+        self.assertEqual(self.loaded, ["blocker", "now", "next", "idle"])
+        self.assertTrue(self.streamer.is_ready("idle"))
+
+    def test_prefetch_moves_sound_ahead_once(self):
+        self.streamer.request("town", self.loader("town"), StreamPriority.IDLE)
+        self.streamer.request("dungeon", self.loader("dungeon"), StreamPriority.IDLE)
+        self.streamer.prefetch(["dungeon", "unknown"], StreamPriority.NEXT_AREA)
+        self.assertEqual(self.streamer.pending_count, 2)
+        self.finish()
+
+        self.assertEqual(self.loaded, ["blocker", "dungeon", "town"])
+
+    def test_failed_load_is_not_ready(self):
+        def broken():
+            raise pygame.error("bad file")
+
+        ready = []
+        self.streamer.request("broken", broken, on_ready=lambda key, sound: ready.append(key))
+        self.finish()
+
+        self.assertFalse(self.streamer.is_ready("broken"))
+        self.assertEqual(ready, [])
+
+
+class TestAudioSystemStreaming(unittest.TestCase):
+    """Test cases for AudioSystem sound effects loaded by the streamer."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        # Procedural fallbacks are cached relative to the working directory
+        cwd = os.getcwd()
+        os.chdir(self.directory.name)
+        self.addCleanup(os.chdir, cwd)
+
+        os.makedirs(os.path.join("audio", "sfx"))
+        with wave.open(os.path.join("audio", "sfx", "quest_accept.wav"), 'wb') as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(22050)
+            wav_file.writeframes(b"\x10\x00" * 2205)
+
+    def test_sounds_replace_placeholders_when_ready(self):
+        audio = AudioSystem(sound_path="audio")
+        audio.prefetch_area("town", StreamPriority.NOW)
+        self.assertTrue(audio.streamer.wait(5))
+
+        self.assertIsNot(audio.sounds["quest_accept"], get_silent_sound())
+        self.assertAlmostEqual(audio.sounds["quest_accept"].get_volume(), audio.sound_volume,
+                               places=2)
+        # No file and no procedural preset: the placeholder stays
+        self.assertIs(audio.sounds["quest_complete"], get_silent_sound())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,173 @@
+"""
+Procedural placeholder sound effects.
+
+Each sound is described by a preset: the name of a waveform generator and its
+parameters. Generated sounds are written to the cache directory as 16-bit
+mono WAV files named after a hash of the preset, so a sound is synthesized
+once and later runs only load the file.
+"""
+
+import hashlib
+import json
+import os
+import wave
+import pygame
+from typing import Dict, Optional
+
+try:
+    import numpy as np
+except ImportError:  # Synthesis needs numpy; cached WAVs still load without it
+    np = None
+
+SAMPLE_RATE = 22050  # Hz
+SOUND_CACHE_DIR = os.path.join('cache', 'sounds')
+
+# Bump when a generator changes so cached WAVs are rebuilt
+SYNTH_VERSION = 1
+
+SOUND_PRESETS: Dict[str, Dict] = {
+    # Quick sword swing - descending pitch
+    'player_attack': {'generator': 'sweep', 'duration': 0.2, 'freq': 800, 'freq_slope': -2.0},
+    # Low growl with vibrato and noise
+    'monster_attack': {'generator': 'growl', 'duration': 0.3, 'freq': 200, 'vibrato': 20,
+                       'vibrato_rate': 30, 'level': 0.8, 'noise': 0.08, 'seed': 1},
+    # Impact thud - sharp attack, quick decay
+    'player_hit': {'generator': 'impact', 'duration': 0.2, 'freq': 300, 'freq_slope': 0.0,
+                   'pitch_drop': 50, 'pitch_decay': 30, 'decay': 20, 'noise': 0.0, 'seed': 0},
+    # Monster getting hit - higher pitched metallic impact
+    'monster_hit': {'generator': 'impact', 'duration': 0.15, 'freq': 500, 'freq_slope': -0.5,
+                    'pitch_drop': 0, 'pitch_decay': 0, 'decay': 25, 'noise': 0.12, 'seed': 2},
+    # Level up - 3 ascending notes (A major triad)
+    'level_up': {'generator': 'arpeggio', 'duration': 0.5, 'notes': [440, 550, 660]},
+    # Default beep
+    'beep': {'generator': 'tone', 'duration': 0.2, 'freq': 440}
+}
+
+
+def _time_axis(duration: float, sample_rate: int):
+    """Sample times for a sound of the given duration."""
+    return np.arange(int(duration * sample_rate)) / sample_rate
+
+
+def _sweep(t, freq, freq_slope, **_):
+    """Tone whose pitch slides linearly, fading out."""
+    return (1 - t) * np.sin(2 * np.pi * freq * (1 + freq_slope * t) * t)
+
+
+def _growl(t, duration, freq, vibrato, vibrato_rate, level, noise, seed, **_):
+    """Low tone with vibrato and noise under a rise-and-fall envelope."""
+    rng = np.random.default_rng(seed)
+    wave_ = level * np.sin(2 * np.pi * (freq + vibrato * np.sin(vibrato_rate * t)) * t)
+    wave_ += noise * (2 * rng.random(t.size) - 1)
+    return wave_ * (1 - np.abs(2 * t / duration - 1))
+
+
+def _impact(t, freq, freq_slope, pitch_drop, pitch_decay, decay, noise, seed, **_):
+    """Exponentially decaying hit with optional pitch drop and noise."""
+    rng = np.random.default_rng(seed)
+    envelope = np.exp(-t * decay)
+    pitch = freq * (1 + freq_slope * t) + pitch_drop * np.exp(-t * pitch_decay)
+    return envelope * (np.sin(2 * np.pi * pitch * t) + noise * rng.random(t.size))
+
+
+def _arpeggio(t, duration, notes, **_):
+    """Consecutive notes, the last one with a longer release."""
+    note_duration = duration / len(notes)
+    index = np.minimum((t // note_duration).astype(int), len(notes) - 1)
+    local_t = t - index * note_duration
+    release = np.where(index == len(notes) - 1, 0.5, 1.0)
+    envelope = np.sin(np.pi * local_t / note_duration * release)
+    return envelope * np.sin(2 * np.pi * np.asarray(notes)[index] * local_t)
+
+
+def _tone(t, freq, **_):
+    """Plain sine tone."""
+    return np.sin(2 * np.pi * freq * t)
+
+
+GENERATORS = {
+    'sweep': _sweep,
+    'growl': _growl,
+    'impact': _impact,
+    'arpeggio': _arpeggio,
+    'tone': _tone
+}
+
+
+def preset_key(preset: Dict, sample_rate: int = SAMPLE_RATE) -> str:
+    """Cache key of a preset: a hash of its parameters and the synth version."""
+    data = json.dumps({'preset': preset, 'rate': sample_rate, 'version': SYNTH_VERSION},
+                      sort_keys=True)
+    return hashlib.sha1(data.encode()).hexdigest()[:16]
+
+
+def synthesize(preset: Dict, sample_rate: int = SAMPLE_RATE):
+    """
+    Generate the samples of a preset.
+
+    Returns:
+        Mono int16 numpy array
+    """
+    t = _time_axis(preset['duration'], sample_rate)
+    samples = GENERATORS[preset['generator']](t, **preset)
+    return (np.clip(samples, -1.0, 1.0) * 32767).astype(np.int16)
+
+
+def write_wav(path: str, samples, sample_rate: int = SAMPLE_RATE):
+    """Write mono int16 samples to a WAV file."""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with wave.open(path, 'wb') as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(samples.astype('<i2').tobytes())
+
+
+def get_synth_sound_path(name: str, cache_dir: str = SOUND_CACHE_DIR) -> Optional[str]:
+    """
+    Get the cached WAV for a preset, synthesizing it on first use.
+
+    Args:
+        name: Preset name in SOUND_PRESETS (unknown names use 'beep')
+        cache_dir: Directory for the generated WAV files
+
+    Returns:
+        Path of the WAV file, or None if it is not cached and numpy is missing
+    """
+    preset = SOUND_PRESETS.get(name, SOUND_PRESETS['beep'])
+    path = os.path.join(cache_dir, f"{name}_{preset_key(preset)}.wav")
+    if os.path.exists(path):
+        return path
+    if np is None:
+        return None
+
+    write_wav(path, synthesize(preset))
+    return path
+
+
+def create_synth_sound(name: str, cache_dir: str = SOUND_CACHE_DIR) -> pygame.mixer.Sound:
+    """
+    Create a procedural sound effect, reusing the cached WAV when available.
+
+    Falls back to a silent sound if the sound cannot be generated.
+    """
+    try:
+        path = get_synth_sound_path(name, cache_dir)
+        if path:
+            return pygame.mixer.Sound(path)
+    except (OSError, pygame.error) as e:
+        print(f"Error creating sound '{name}': {e}")
+    return get_silent_sound()
+
+
+_silent_sound: Optional[pygame.mixer.Sound] = None
+
+
+def get_silent_sound() -> pygame.mixer.Sound:
+    """Shared short silent sound used as a placeholder for missing files."""
+    global _silent_sound
+    if _silent_sound is None:
+        # Zero bytes are silence in the mixer's signed sample formats
+        _silent_sound = pygame.mixer.Sound(buffer=bytes(1024))
+        _silent_sound.set_volume(0.0)
+    return _silent_sound
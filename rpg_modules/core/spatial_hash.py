@@ -0,0 +1,93 @@
+"""
+Spatial hash for fast neighbourhood queries.
+
+Objects with ``x`` and ``y`` attributes are bucketed in square cells, so
+radius and rectangle queries only look at the objects in the overlapping
+cells. Coordinates can be in any unit (pixels for combat, tiles for NPCs)
+as long as ``cell_size`` uses the same one.
+"""
+
+from typing import Dict, Iterable, List, Tuple
+from .constants import TILE_SIZE
+
+Cell = Tuple[int, int]
+
+
+class SpatialHash:
+    """Objects with ``x`` and ``y`` attributes bucketed in square cells."""
+
+    def __init__(self, cell_size: float = TILE_SIZE * 2):
+        """
+        Initialize the hash.
+
+        Args:
+            cell_size: Side of a cell in pixels
+        """
+        self.cell_size = cell_size
+        self._cells: Dict[Cell, List] = {}
+        self._object_cells: Dict[int, Cell] = {}
+
+    def __len__(self) -> int:
+        return len(self._object_cells)
+
+    def _cell(self, x: float, y: float) -> Cell:
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def insert(self, obj):
+        """Add an object at its current position."""
+        cell = self._cell(obj.x, obj.y)
+        self._cells.setdefault(cell, []).append(obj)
+        self._object_cells[id(obj)] = cell
+
+    def remove(self, obj):
+        """Remove an object (no-op if it is not in the hash)."""
+        cell = self._object_cells.pop(id(obj), None)
+        if cell is None:
+            return
+        bucket = self._cells[cell]
+        bucket.remove(obj)
+        if not bucket:
+            del self._cells[cell]
+
+    def update(self, obj):
+        """Move an object to the cell of its current position."""
+        old = self._object_cells.get(id(obj))
+        new = self._cell(obj.x, obj.y)
+        if old == new:
+            return
+        if old is not None:
+            self.remove(obj)
+        self._cells.setdefault(new, []).append(obj)
+        self._object_cells[id(obj)] = new
+
+    def clear(self):
+        """Remove every object."""
+        self._cells.clear()
+        self._object_cells.clear()
+
+    def query_radius(self, x: float, y: float, radius: float) -> List:
+        """Objects within ``radius`` pixels of a point."""
+        radius_sq = radius * radius
+        found = []
+        for bucket in self._buckets(x - radius, y - radius, x + radius, y + radius):
+            for obj in bucket:
+                dx, dy = obj.x - x, obj.y - y
+                if dx * dx + dy * dy <= radius_sq:
+                    found.append(obj)
+        return found
+
+    def query_rect(self, left: float, top: float, right: float, bottom: float) -> List:
+        """Objects inside a rectangle."""
+        return [obj for bucket in self._buckets(left, top, right, bottom) for obj in bucket
+                if left <= obj.x <= right and top <= obj.y <= bottom]
+
+    def _buckets(self, left: float, top: float, right: float, bottom: float) -> Iterable[List]:
+        """Non-empty cells overlapping a rectangle."""
+        x0, y0 = self._cell(left, top)
+        x1, y1 = self._cell(right, bottom)
+        cells = self._cells
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    yield bucket
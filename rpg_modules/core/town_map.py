@@ -5,10 +5,13 @@ This serves as the starting hub area where players can interact with NPCs, acqui
 
 import pygame
 import random
+import time
 from enum import Enum
 from typing import List, Dict, Tuple, Optional, Set
 from .map import Map, BiomeType
 from .enums import TileType
+from .occupancy_grid import OccupancyGrid
+from .settings import GameSettings
 
 class TownMapTile(Enum):
     """Special town map tile types."""
@@ -27,92 +30,138 @@ class TownMap(Map):
     """
     Town map implementation serving as the hub area.
     Players start here and can interact with NPCs to acquire quests.
+    
+    Placement tests use occupancy bitmaps (see ``OccupancyGrid``) for
+    buildings, roads and other blocking features, so checking whether a
+    rectangle is free does not depend on how many buildings exist.
     """
     
-    def __init__(self, width: int, height: int, seed: Optional[int] = None):
-        """Initialize the town map."""
-        super().__init__(width, height, seed)
+    # Buildings per 100x100 tiles when no explicit limit is given
+    BUILDINGS_PER_10K_TILES = 15
+    
+    def __init__(self, width: int, height: int, seed: Optional[int] = None,
+                 max_buildings: Optional[int] = None):
+        """
+        Initialize the town map.
         
-        # Town-specific properties
+        Args:
+            width: Map width in tiles
+            height: Map height in tiles
+            seed: Optional seed for the town layout
+            max_buildings: Number of buildings to aim for (defaults to a
+                count that scales with the map area)
+        """
+        # Town-specific properties, set up before Map.__init__ generates the map
         self.buildings = []  # [(x, y, width, height, type), ...]
         self.npcs = []  # List of NPC positions for spawning
         self.quest_givers = []  # List of quest giver positions
         self.dungeon_entrance = None  # Position of the entrance to the Veilmaster's Fortress
         self.special_locations = {}  # Dictionary of special locations like Elder Malik's home
+        self.max_buildings = max_buildings if max_buildings is not None else \
+            max(self.BUILDINGS_PER_10K_TILES, self.BUILDINGS_PER_10K_TILES * width * height // 10000)
         
-        # Override the map generation
+        # Occupancy layers used while placing things
+        self.building_mask = OccupancyGrid(width, height)
+        self.road_mask = OccupancyGrid(width, height)
+        self.feature_mask = OccupancyGrid(width, height)  # Water, trees, other blockers
+        
+        # Seconds spent in each generation phase
+        self.generation_times: Dict[str, float] = {}
+        
+        # Map.__init__ calls _generate_map and _update_wall_rects, which build
+        # the town instead of overworld terrain
+        super().__init__(width, height, seed)
+        if GameSettings.instance().debug_generation_reports:
+            print(self.get_generation_report())
+    
+    def _generate_map(self):
+        """Build the town layout."""
+        self.rng = random.Random(self.seed)
         self._generate_town()
     
+    def _update_wall_rects(self):
+        """Update the wall rectangles, recording the time spent."""
+        self._run_phase("update_wall_rects", super()._update_wall_rects)
+    
+    def _run_phase(self, phase: str, method, *args):
+        """Run a generation phase and add its duration to generation_times."""
+        start = time.perf_counter()
+        result = method(*args)
+        self.generation_times[phase] = self.generation_times.get(phase, 0.0) + time.perf_counter() - start
+        return result
+    
+    def get_generation_report(self) -> str:
+        """Describe how long each generation phase took."""
+        phases = ", ".join(f"{phase} {seconds * 1000:.1f} ms"
+                           for phase, seconds in self.generation_times.items())
+        total = sum(self.generation_times.values())
+        return f"Town (seed {self.seed}) built in {total * 1000:.1f} ms: {phases}"
+    
     def _generate_town(self):
         """Generate the town layout."""
-        # Clear any existing map data
-        self.base_grid = [[TileType.GRASS for _ in range(self.width)] for _ in range(self.height)]
-        self.decoration_grid = [[None for _ in range(self.width)] for _ in range(self.height)]
-        self.collision_grid = [[False for _ in range(self.width)] for _ in range(self.height)]
-        
-        # Set ambient biome for the town
+        # Ambient biome for the town (the other layers start out as plain grass)
         self.biome_grid = [[BiomeType.PLAINS for _ in range(self.width)] for _ in range(self.height)]
         
-        # Create streets/paths
-        self._create_streets()
-        
-        # Place buildings
-        self._place_buildings()
-        
-        # Place decorations
-        self._place_decorations()
-        
-        # Place special buildings
-        self._place_special_buildings()
-        
-        # Place NPCs and quest givers
-        self._place_npcs()
-        
-        # Place dungeon entrance
-        self._place_dungeon_entrance()
-        
-        # Update collision grid for buildings
-        self._update_collision_grid()
+        self._run_phase("create_streets", self._create_streets)
+        self._run_phase("place_buildings", self._place_buildings)
+        self._run_phase("place_decorations", self._place_decorations)
+        self._run_phase("place_special_buildings", self._place_special_buildings)
+        self._run_phase("place_npcs", self._place_npcs)
+        self._run_phase("place_dungeon_entrance", self._place_dungeon_entrance)
+        self._run_phase("update_collision_grid", self._update_collision_grid)
         
         print(f"Town generation complete with {len(self.buildings)} buildings")
     
+    def _pave(self, x: int, y: int, w: int, h: int):
+        """Turn a rectangle (clipped to the map) into road."""
+        for ty in range(max(0, y), min(self.height, y + h)):
+            row = self.base_grid[ty]
+            for tx in range(max(0, x), min(self.width, x + w)):
+                row[tx] = TileType.DIRT
+        self.road_mask.mark(x, y, w, h)
+    
     def _create_streets(self):
         """Create a street layout for the town."""
-        # Create main road east-west through center of town
-        center_y = self.height // 2
-        for x in range(0, self.width):
-            for y in range(center_y - 2, center_y + 3):  # 5 tiles wide
-                if 0 <= y < self.height:
-                    self.base_grid[y][x] = TileType.DIRT
-                    
-        # Create north-south road through center of town
-        center_x = self.width // 2
-        for y in range(0, self.height):
-            for x in range(center_x - 2, center_x + 3):  # 5 tiles wide
-                if 0 <= x < self.width:
-                    self.base_grid[y][x] = TileType.DIRT
+        # Create main roads through the center of town, 5 tiles wide
+        center_x, center_y = self.width // 2, self.height // 2
+        self._pave(0, center_y - 2, self.width, 5)
+        self._pave(center_x - 2, 0, 5, self.height)
         
-        # Create some side streets
-        num_side_streets = random.randint(3, 5)
+        # Create some side streets, 3 tiles wide
+        num_side_streets = self.rng.randint(3, 5)
         for _ in range(num_side_streets):
-            if random.choice([True, False]):  # Horizontal street
-                y = random.randint(10, self.height - 10)
+            if self.rng.choice([True, False]):  # Horizontal street
+                y = self.rng.randint(10, self.height - 10)
                 if abs(y - center_y) < 15:  # Not too close to main street
                     continue
-                    
-                for x in range(0, self.width):
-                    for dy in range(-1, 2):  # 3 tiles wide
-                        if 0 <= y + dy < self.height:
-                            self.base_grid[y + dy][x] = TileType.DIRT
+                self._pave(0, y - 1, self.width, 3)
             else:  # Vertical street
-                x = random.randint(10, self.width - 10)
+                x = self.rng.randint(10, self.width - 10)
                 if abs(x - center_x) < 15:  # Not too close to main street
                     continue
-                    
-                for y in range(0, self.height):
-                    for dx in range(-1, 2):  # 3 tiles wide
-                        if 0 <= x + dx < self.width:
-                            self.base_grid[y][x + dx] = TileType.DIRT
+                self._pave(x - 1, 0, 3, self.height)
+    
+    def is_area_clear(self, x: int, y: int, w: int, h: int, margin: int = 0,
+                      road_margin: Optional[int] = None) -> bool:
+        """
+        Check whether a building fits at a position.
+        
+        Args:
+            x, y: Top-left tile of the building
+            w, h: Building size in tiles
+            margin: Free tiles required between the building and other buildings
+            road_margin: Free tiles required between the building and roads,
+                or None to allow building on roads
+            
+        Returns:
+            True if the building is inside the map and the area is free
+        """
+        if not self.building_mask.in_bounds(x, y, w, h):
+            return False
+        if self.building_mask.any_set(x - margin, y - margin, w + 2 * margin, h + 2 * margin):
+            return False
+        return road_margin is None or not self.road_mask.any_set(
+            x - road_margin, y - road_margin, w + 2 * road_margin, h + 2 * road_margin)
     
     def _place_buildings(self):
         """Place buildings in the town."""
@@ -138,15 +187,15 @@ class TownMap(Map):
         for i, (building_type, size, _) in enumerate(important_buildings):
             if i < len(directions):
                 dir_x, dir_y = directions[i]
-                offset_x = random.randint(10, 20) * dir_x
-                offset_y = random.randint(10, 20) * dir_y
+                offset_x = self.rng.randint(10, 20) * dir_x
+                offset_y = self.rng.randint(10, 20) * dir_y
                 
                 # Position building near street but not on it
                 building_x = center_x + offset_x
                 building_y = center_y + offset_y
                 
                 # Adjust to not overlap with streets
-                if self.base_grid[building_y][building_x] == TileType.DIRT:
+                if self.road_mask.is_set(building_x, building_y):
                     if dir_x > 0:
                         building_x += size[0] // 2 + 2
                     else:
@@ -157,44 +206,32 @@ class TownMap(Map):
                     else:
                         building_y -= size[1] // 2 + 2
                 
-                # Check if area is clear
-                area_clear = True
-                for y in range(building_y, building_y + size[1]):
-                    for x in range(building_x, building_x + size[0]):
-                        if not (0 <= x < self.width and 0 <= y < self.height):
-                            area_clear = False
-                            break
-                        if any(self._is_point_in_building(x, y, b) for b in self.buildings):
-                            area_clear = False
-                            break
-                    if not area_clear:
-                        break
-                
-                if area_clear:
-                    self.buildings.append((building_x, building_y, size[0], size[1], building_type))
+                # Keep one free tile to the other buildings
+                if self.is_area_clear(building_x, building_y, size[0], size[1], margin=1):
                     self._place_building(building_x, building_y, size[0], size[1], building_type)
         
         # Fill in with regular buildings
         regular_buildings = [b for b in building_types if not b[2]]
-        attempts = 100  # Limit attempts to prevent infinite loop
+        attempts = self.max_buildings * 7  # Limit attempts to prevent infinite loop
+        offsets = [(5, 0), (-5, 0), (0, 5), (0, -5)]
         
-        while attempts > 0 and len(self.buildings) < 15:
+        while attempts > 0 and len(self.buildings) < self.max_buildings:
             attempts -= 1
             
             # Pick a random building type
-            building_type, size, _ = random.choice(regular_buildings)
+            building_type, size, _ = self.rng.choice(regular_buildings)
             
             # Find a spot near a street
             for _ in range(20):  # Try 20 times to find a spot
                 # Find a road tile
-                road_x, road_y = random.randint(5, self.width - 6), random.randint(5, self.height - 6)
-                if self.base_grid[road_y][road_x] != TileType.DIRT:
+                road_x, road_y = self.rng.randint(5, self.width - 6), self.rng.randint(5, self.height - 6)
+                if not self.road_mask.is_set(road_x, road_y):
                     continue
                 
                 # Find a place nearby but not on the road
-                offsets = [(5, 0), (-5, 0), (0, 5), (0, -5)]
-                random.shuffle(offsets)
+                self.rng.shuffle(offsets)
                 
+                placed = False
                 for offset_x, offset_y in offsets:
                     building_x = road_x + offset_x
                     building_y = road_y + offset_y
@@ -204,45 +241,27 @@ class TownMap(Map):
                             5 <= building_y < self.height - size[1] - 5):
                         continue
                     
-                    # Check if area is clear
-                    area_clear = True
-                    for y in range(building_y - 1, building_y + size[1] + 1):
-                        for x in range(building_x - 1, building_x + size[0] + 1):
-                            if not (0 <= x < self.width and 0 <= y < self.height):
-                                area_clear = False
-                                break
-                            # Check if this point is part of any existing building
-                            if any(self._is_point_in_building(x, y, b) for b in self.buildings):
-                                area_clear = False
-                                break
-                            # Check if this is a road tile
-                            if self.base_grid[y][x] == TileType.DIRT:
-                                area_clear = False
-                                break
-                        if not area_clear:
-                            break
-                    
-                    if area_clear:
-                        self.buildings.append((building_x, building_y, size[0], size[1], building_type))
+                    # Two free tiles to other buildings and one to the road
+                    if self.is_area_clear(building_x, building_y, size[0], size[1],
+                                          margin=2, road_margin=1):
                         self._place_building(building_x, building_y, size[0], size[1], building_type)
+                        placed = True
                         break
-    
-    def _is_point_in_building(self, x, y, building):
-        """Check if a point is inside or bordering a building."""
-        bx, by, bw, bh, _ = building
-        return bx - 1 <= x <= bx + bw and by - 1 <= y <= by + bh
+                
+                if placed:
+                    break
     
     def _place_building(self, x, y, w, h, building_type):
         """Place a building at the specified location."""
         # Add building to the list
         self.buildings.append((x, y, w, h, building_type))
+        self.building_mask.mark(x, y, w, h)
         
         # Update the tiles
-        for by in range(y, y + h):
-            for bx in range(x, x + w):
-                if 0 <= bx < self.width and 0 <= by < self.height:
-                    self.base_grid[by][bx] = TileType.STONE_WALL
-                    self.collision_grid[by][bx] = True
+        for by in range(max(0, y), min(self.height, y + h)):
+            for bx in range(max(0, x), min(self.width, x + w)):
+                self.base_grid[by][bx] = TileType.STONE_WALL
+                self.collision_grid[by][bx] = True
     
     def _place_decorations(self):
         """Place decorations around the town."""
@@ -257,25 +276,32 @@ class TownMap(Map):
                     distance = ((x - center_x) ** 2 + (y - center_y) ** 2) ** 0.5
                     if distance <= fountain_size:
                         self.base_grid[y][x] = TileType.WATER
-                        
-        # Add trees and bushes at the edges of town
-        for _ in range(50):
-            x = random.randint(5, self.width - 6)
-            y = random.randint(5, self.height - 6)
+                        self.feature_mask.mark(x, y)
+        
+        # Add trees and bushes at the edges of town, scaled with the map area
+        for _ in range(max(50, 50 * self.width * self.height // 10000)):
+            x = self.rng.randint(5, self.width - 6)
+            y = self.rng.randint(5, self.height - 6)
             
             # Only place on grass and away from buildings/roads
             if (self.base_grid[y][x] == TileType.GRASS and 
-                not any(self._is_point_in_building(x, y, b) for b in self.buildings) and
-                not any(self.base_grid[y+dy][x+dx] == TileType.DIRT 
-                       for dx in range(-1, 2) for dy in range(-1, 2)
-                       if 0 <= x+dx < self.width and 0 <= y+dy < self.height)):
+                not self.building_mask.any_set(x - 1, y - 1, 3, 3) and
+                not self.road_mask.any_set(x - 1, y - 1, 3, 3)):
                 
-                decoration = random.choice([TileType.TREE, TileType.BUSH, TileType.ROCK])
+                decoration = self.rng.choice([TileType.TREE, TileType.BUSH, TileType.ROCK])
                 self.decoration_grid[y][x] = decoration
                 
                 # Trees block movement
                 if decoration == TileType.TREE:
                     self.collision_grid[y][x] = True
+                    self.feature_mask.mark(x, y)
+    
+    def _is_grass_area_clear(self, x: int, y: int, w: int, h: int) -> bool:
+        """Check that a rectangle is inside the map and only covers open grass."""
+        return (self.building_mask.in_bounds(x, y, w, h) and
+                not self.building_mask.any_set(x, y, w, h) and
+                not self.road_mask.any_set(x, y, w, h) and
+                not self.feature_mask.any_set(x, y, w, h))
     
     def _place_special_buildings(self):
         """Place special buildings like Elder Malik's home."""
@@ -290,19 +316,7 @@ class TownMap(Map):
         if not elder_home_placed:
             elder_x, elder_y = center_x - elder_width // 2, center_y - 20
             
-            # Check if the space is clear
-            clear = True
-            for y in range(elder_y, elder_y + elder_height):
-                for x in range(elder_x, elder_x + elder_width):
-                    if (not self._is_in_bounds(x, y) or 
-                        self.collision_grid[y][x] or 
-                        self.base_grid[y][x] != TileType.GRASS):
-                        clear = False
-                        break
-                if not clear:
-                    break
-            
-            if clear:
+            if self._is_grass_area_clear(elder_x, elder_y, elder_width, elder_height):
                 # Place the Elder's home
                 self._place_building(elder_x, elder_y, elder_width, elder_height, TownMapTile.ELDER_HOME)
                 elder_home_placed = True
@@ -312,22 +326,10 @@ class TownMap(Map):
         # If we couldn't place it in the ideal spot, try somewhere else
         if not elder_home_placed:
             for attempt in range(10):  # Try 10 times
-                elder_x = random.randint(10, self.width - elder_width - 10)
-                elder_y = random.randint(10, self.height - elder_height - 10)
-                
-                # Check if the space is clear
-                clear = True
-                for y in range(elder_y, elder_y + elder_height):
-                    for x in range(elder_x, elder_x + elder_width):
-                        if (not self._is_in_bounds(x, y) or 
-                            self.collision_grid[y][x] or 
-                            self.base_grid[y][x] != TileType.GRASS):
-                            clear = False
-                            break
-                    if not clear:
-                        break
+                elder_x = self.rng.randint(10, self.width - elder_width - 10)
+                elder_y = self.rng.randint(10, self.height - elder_height - 10)
                 
-                if clear:
+                if self._is_grass_area_clear(elder_x, elder_y, elder_width, elder_height):
                     # Place the Elder's home
                     self._place_building(elder_x, elder_y, elder_width, elder_height, TownMapTile.ELDER_HOME)
                     elder_home_placed = True
@@ -366,10 +368,10 @@ class TownMap(Map):
                             break
             
             # Place regular NPCs around buildings
-            for _ in range(random.randint(1, 3)):
+            for _ in range(self.rng.randint(1, 3)):
                 # Find a position near the building
-                offset_x = random.randint(-2, bw + 1)
-                offset_y = random.randint(-2, bh + 1)
+                offset_x = self.rng.randint(-2, bw + 1)
+                offset_y = self.rng.randint(-2, bh + 1)
                 
                 nx, ny = bx + offset_x, by + offset_y
                 
@@ -0,0 +1,192 @@
+"""
+Index of the walkable tiles of a map for picking spawn and objective spots.
+
+The index keeps every walkable tile together with its clearance: the
+Chebyshev distance to the nearest blocked or out-of-bounds tile, computed
+once with a two-pass distance transform. A tile with clearance ``c`` has
+every tile within ``c - 1`` steps walkable.
+
+Tiles are stored sorted by clearance, globally and per square cell, so the
+tiles that satisfy a clearance requirement are always a prefix of a list and
+can be sampled directly instead of by trying random tiles.
+"""
+
+import random
+from array import array
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
+
+
+class WalkableIndex:
+    """
+    Walkable tiles of a map with clearance distances.
+
+    The map needs ``width``, ``height`` and ``is_walkable(x, y)``. Call
+    ``rebuild`` (or ``Map.invalidate_walkable_index``) after tiles change.
+    """
+
+    # Side of the square cells used for sampling near a point, in tiles
+    CELL_SIZE = 8
+
+    def __init__(self, game_map, cell_size: int = CELL_SIZE):
+        """
+        Build the index.
+
+        Args:
+            game_map: Map to index
+            cell_size: Side of the sampling cells in tiles
+        """
+        self.game_map = game_map
+        self.cell_size = cell_size
+        self.rebuild()
+
+    def rebuild(self):
+        """Recompute walkable tiles and clearances from the map."""
+        width, height = self.game_map.width, self.game_map.height
+        self.width, self.height = width, height
+        self.clearance = self._distance_transform(width, height)
+        clearance = self.clearance
+
+        walkable = [i for i in range(width * height) if clearance[i]]
+        walkable.sort(key=lambda i: -clearance[i])
+        self.tiles: List[int] = walkable
+        self._sorted_keys = [-clearance[i] for i in walkable]
+
+        # Per-cell tile lists, also sorted by clearance (descending)
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+        for i in walkable:
+            cell = ((i % width) // self.cell_size, (i // width) // self.cell_size)
+            self._cells.setdefault(cell, []).append(i)
+        self._cell_keys = {cell: [-clearance[i] for i in tiles]
+                           for cell, tiles in self._cells.items()}
+
+    def _distance_transform(self, width: int, height: int) -> array:
+        """Chebyshev distance of every tile to the nearest blocked tile (0 if blocked)."""
+        is_walkable = self.game_map.is_walkable
+        dist = array('H', [0]) * (width * height)
+
+        # Forward pass: neighbours above and to the left. Tiles on the map
+        # edge border the (blocked) outside, so their clearance is 1.
+        for y in range(height):
+            row = y * width
+            edge_row = y == 0 or y == height - 1
+            for x in range(width):
+                if not is_walkable(x, y):
+                    continue
+                if edge_row or x == 0 or x == width - 1:
+                    dist[row + x] = 1
+                    continue
+                above = row - width + x
+                dist[row + x] = min(dist[row + x - 1], dist[above - 1], dist[above], dist[above + 1]) + 1
+
+        # Backward pass: neighbours below and to the right
+        for y in range(height - 2, 0, -1):
+            row = y * width
+            for x in range(width - 2, 0, -1):
+                value = dist[row + x]
+                if value <= 1:
+                    continue
+                below = row + width + x
+                best = min(dist[row + x + 1], dist[below - 1], dist[below], dist[below + 1]) + 1
+                if best < value:
+                    dist[row + x] = best
+
+        return dist
+
+    @property
+    def walkable_count(self) -> int:
+        """Number of walkable tiles."""
+        return len(self.tiles)
+
+    def clearance_at(self, x: int, y: int) -> int:
+        """Clearance of a tile (0 for blocked or out-of-bounds tiles)."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.clearance[y * self.width + x]
+        return 0
+
+    def count_with_clearance(self, min_clearance: int) -> int:
+        """Number of walkable tiles with at least the given clearance."""
+        return bisect_right(self._sorted_keys, -max(1, min_clearance))
+
+    def sample(self, rng: Optional[random.Random] = None, min_clearance: int = 0,
+               near: Optional[Tuple[float, float]] = None, min_distance: float = 0.0,
+               max_distance: Optional[float] = None, attempts: int = 16) -> Optional[Tuple[int, int]]:
+        """
+        Pick a random walkable tile.
+
+        Candidates are drawn only from tiles with enough clearance, and when
+        ``max_distance`` is given only from the cells around ``near``, so a
+        few draws are normally enough. If they all fail the distance check,
+        the remaining candidates are filtered exhaustively.
+
+        Args:
+            rng: Random generator (defaults to the ``random`` module)
+            min_clearance: Required clearance; ``r + 1`` means every tile
+                within ``r`` steps is walkable
+            near: Reference point in tiles for the distance limits
+            min_distance: Minimum distance in tiles from ``near``
+            max_distance: Maximum distance in tiles from ``near``
+            attempts: Random draws before falling back to filtering
+
+        Returns:
+            Tile coordinates, or None if no tile satisfies the constraints
+        """
+        rng = rng or random
+        if near is None:
+            min_distance, max_distance = 0.0, None
+
+        if max_distance is not None:
+            pools = self._cell_pools(near, max_distance, min_clearance)
+        else:
+            count = self.count_with_clearance(min_clearance)
+            pools = [(self.tiles, count)] if count else []
+        total = sum(count for _, count in pools)
+        if not total:
+            return None
+
+        width = self.width
+        min_sq = min_distance * min_distance
+        max_sq = max_distance * max_distance if max_distance is not None else None
+
+        def accept(index: int) -> bool:
+            if near is None:
+                return True
+            dx, dy = index % width - near[0], index // width - near[1]
+            dist_sq = dx * dx + dy * dy
+            return dist_sq >= min_sq and (max_sq is None or dist_sq <= max_sq)
+
+        for _ in range(attempts):
+            pick = rng.randrange(total)
+            for tiles, count in pools:
+                if pick < count:
+                    index = tiles[pick]
+                    break
+                pick -= count
+            if accept(index):
+                return index % width, index // width
+
+        candidates = [index for tiles, count in pools for index in tiles[:count] if accept(index)]
+        if not candidates:
+            return None
+        index = rng.choice(candidates)
+        return index % width, index // width
+
+    def _cell_pools(self, near: Tuple[float, float], radius: float,
+                    min_clearance: int) -> List[Tuple[List[int], int]]:
+        """Tile lists and candidate counts of the cells overlapping a circle."""
+        size = self.cell_size
+        x0 = max(0, int((near[0] - radius) // size))
+        y0 = max(0, int((near[1] - radius) // size))
+        x1 = min((self.width - 1) // size, int((near[0] + radius) // size))
+        y1 = min((self.height - 1) // size, int((near[1] + radius) // size))
+        key = -max(1, min_clearance)
+
+        pools = []
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                tiles = self._cells.get((cx, cy))
+                if tiles:
+                    count = bisect_right(self._cell_keys[(cx, cy)], key)
+                    if count:
+                        pools.append((tiles, count))
+        return pools
@@ -6,11 +6,13 @@ from .monster import Monster, MonsterType
 from .player import Player
 from .npc import NPC
 from .npc_manager import NPCManager
+from .stats import StatEngine
 
 __all__ = [
     'Monster',
     'MonsterType',
     'Player',
     'NPC',
-    'NPCManager'
+    'NPCManager',
+    'StatEngine'
 ] 
\ No newline at end of file
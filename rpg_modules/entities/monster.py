@@ -7,7 +7,8 @@ import math
 from ..core.constants import SCREEN_WIDTH, SCREEN_HEIGHT, TILE_SIZE
 from ..utils.logging import logger
 from ..core.settings import GameSettings
-from rpg_modules.core.pathfinding import find_path
+from ..utils.overhead import get_nameplate, get_health_bar
+from rpg_modules.core.pathfinding import path_cache
 
 class MonsterType(Enum):
     # Format: (name, base_health, base_damage, base_speed, attack_range, attack_cooldown)
@@ -217,6 +218,8 @@ class Monster:
         self.move_timer = 0
         self.chasing = False
         self.chase_range = 6
+        self.path = None  # Waypoints (pixels) towards the player, kept between updates
+        self.path_timer = 0
         
         # Scale monster level based on player level
         # For high-level players, ensure monsters are at least level 10
@@ -258,21 +261,20 @@ class Monster:
         dy = player_pos[1] - self.y
         distance = math.sqrt(dx * dx + dy * dy)
         
-        # Path to follow
-        self.path = None
-        
         # If player is within chase range, use pathfinding to move towards them
         if distance < self.chase_range * TILE_SIZE:  # Convert chase range to pixels
             # Use A* pathfinding to find a path to the player
             if hasattr(self, 'game_map') and self.game_map:
-                # Only calculate a new path every so often to save performance
-                if not hasattr(self, 'path_timer') or self.path_timer <= 0:
-                    self.path = find_path(
+                # Only calculate a new path every so often to save performance;
+                # the current path is followed in between
+                if self.path_timer <= 0 or not self.path:
+                    self.path = path_cache.get_path(
                         self.game_map,
                         (self.x, self.y),
                         player_pos,
                         max_distance=20,
-                        wall_clearance=1.0  # Lower clearance for monsters
+                        wall_clearance=1.0,  # Lower clearance for monsters
+                        agent=self
                     )
                     # Set a timer for recalculating the path (every 1 second)
                     self.path_timer = 1.0
@@ -370,6 +372,8 @@ class Monster:
                 
                 self.moving = True
         else:
+            self.path = None
+            
             # Random movement when not chasing
             if random.random() < 0.02:  # 2% chance to change direction each frame
                 self.direction = random.choice(list(Direction))
@@ -449,26 +453,16 @@ class Monster:
             bar_x = screen_x
             bar_y = screen_y - int(28 * zoom)
             
-            # Draw health bar background (dark red)
-            pygame.draw.rect(screen, (100, 0, 0), 
-                            (bar_x, bar_y, bar_width, bar_height))
-            
-            # Draw health bar fill (bright red/green based on health)
-            if health_percent > 0:
-                # Change color from green to red as health decreases
-                green = int(200 * health_percent)
-                red = int(200 * (1 - health_percent) + 55)
-                fill_color = (red, green, 0)
-                
-                fill_width = int(bar_width * health_percent)
-                pygame.draw.rect(screen, fill_color, 
-                               (bar_x, bar_y, fill_width, bar_height))
+            # Bar fill goes from green to red as health decreases; the bar
+            # is cached per filled width, so the colour follows that width
+            fill_width = max(0, min(bar_width, int(bar_width * health_percent)))
+            fill_percent = fill_width / bar_width if bar_width else 0
+            fill_color = (int(200 * (1 - fill_percent) + 55), int(200 * fill_percent), 0)
+            screen.blit(get_health_bar(bar_width, bar_height, fill_width, fill_color), (bar_x, bar_y))
             
             # Draw monster type text above health bar
             font_size = max(10, int(20 * zoom))
-            font = pygame.font.Font(None, font_size)
-            text = f"{self.monster_type.name} lvl {self.level}"
-            text_surface = font.render(text, True, (255, 255, 255))
+            text_surface = get_nameplate(f"{self.monster_type.name} lvl {self.level}", font_size)
             text_x = screen_x + (scaled_size - text_surface.get_width()) // 2
             text_y = screen_y - int(45 * zoom)
             screen.blit(text_surface, (text_x, text_y))
@@ -2,88 +2,8 @@ import pygame
 import math
 import random
 from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
 from rpg_modules.entities.monster import MonsterType
-
-@dataclass
-class Particle:
-    x: float
-    y: float
-    dx: float
-    dy: float
-    color: Tuple[int, int, int]
-    life: float
-    size: float
-
-class AnimatedIcon:
-    """Base class for animated icons in the game."""
-    def __init__(self):
-        self._particles: List[Particle] = []
-        self._time = 0
-
-    def update(self, dt: float):
-        """Update animation state."""
-        self._time += dt
-        
-        # Update particles
-        for particle in self._particles[:]:
-            particle.x += particle.dx
-            particle.y += particle.dy
-            particle.life -= dt
-            if particle.life <= 0:
-                self._particles.remove(particle)
-
-    def _get_animation_values(self) -> dict:
-        """Get common animation values used across different icons."""
-        return {
-            'pulse': (math.sin(self._time * 2) + 1) / 2,  # 0 to 1
-            'rotation': self._time * 45,  # 45 degrees per second
-            'breath': math.sin(self._time * 2) * 0.1 + 1,  # Subtle breathing
-        }
-
-    def _draw_shadow(self, surface: pygame.Surface, shape: str, color: Tuple[int, int, int], 
-                    size: int, offset=(1, 1), alpha=64):
-        """Draw a shadow effect."""
-        shadow_surface = pygame.Surface((size, size), pygame.SRCALPHA)
-        if shape == "circle":
-            pygame.draw.circle(shadow_surface, (*color[:3], alpha), 
-                             (size//2 + offset[0], size//2 + offset[1]), size//2)
-        elif shape == "rect":
-            pygame.draw.rect(shadow_surface, (*color[:3], alpha),
-                           (size//4 + offset[0], size//4 + offset[1], size//2, size//2))
-        surface.blit(shadow_surface, (0, 0))
-
-    def _draw_highlight(self, surface: pygame.Surface, shape: str, color: Tuple[int, int, int], 
-                       size: int, offset=(-1, -1), alpha=128):
-        """Draw a highlight effect."""
-        highlight_surface = pygame.Surface((size, size), pygame.SRCALPHA)
-        if shape == "circle":
-            pygame.draw.circle(highlight_surface, (*color[:3], alpha),
-                             (size//2 + offset[0], size//2 + offset[1]), size//4)
-        elif shape == "rect":
-            pygame.draw.rect(highlight_surface, (*color[:3], alpha),
-                           (size//4 + offset[0], size//4 + offset[1], size//4, size//4))
-        surface.blit(highlight_surface, (0, 0))
-
-    def _draw_animated_eyes(self, surface: pygame.Surface, x: int, y: int, size: int,
-                          eye_color: Tuple[int, int, int], 
-                          pupil_color: Tuple[int, int, int] = (0, 0, 0)):
-        """Draw animated eyes with movement."""
-        # Eye white
-        pygame.draw.ellipse(surface, eye_color, 
-                          (x - size//8, y - size//8, 
-                           size//4, size//4))
-        # Pupil movement
-        pupil_x = x + int(size//16 * math.sin(self._time * 2))
-        pupil_y = y + int(size//16 * math.sin(self._time * 1.5))
-        pygame.draw.circle(surface, pupil_color, (pupil_x, pupil_y), size//12)
-
-    def _draw_particles(self, surface: pygame.Surface):
-        """Draw all active particles."""
-        for particle in self._particles:
-            pygame.draw.circle(surface, particle.color,
-                             (int(particle.x), int(particle.y)), 
-                             int(particle.size))
+from rpg_modules.animations.base import AnimatedIcon
 
 class MonsterIcon(AnimatedIcon):
     def __init__(self, monster_type: MonsterType):
@@ -116,14 +36,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Default particles
         if random.random() < 0.1:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(150, 150, 150),
                 life=random.uniform(0.5, 1.0),
                 size=random.uniform(1, 2)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -152,14 +72,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Fire particles
         if random.random() < 0.2:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-2, -1),
                 color=(255, 100, 0),
                 life=random.uniform(0.5, 1.0),
                 size=random.uniform(2, 4)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -197,14 +117,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Web particles
         if random.random() < 0.1:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-0.5, 0.5),
                 dy=random.uniform(-0.5, 0.5),
                 color=(200, 200, 200),
                 life=random.uniform(1.0, 2.0),
                 size=random.uniform(1, 2)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -235,14 +155,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Ectoplasm particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(200, 200, 200, 128),
                 life=random.uniform(1.0, 2.0),
                 size=random.uniform(2, 4)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -290,14 +210,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Bone particles
         if random.random() < 0.1:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(200, 200, 200, 128),
                 life=random.uniform(1.0, 2.0),
                 size=random.uniform(2, 4)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -328,14 +248,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Slime particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(0, 200, 0, 128),
                 life=random.uniform(1.0, 2.0),
                 size=random.uniform(2, 4)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -366,14 +286,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Thought particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(100, 0, 100, 128),
                 life=random.uniform(1.0, 2.0),
                 size=random.uniform(2, 4)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -404,14 +324,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Memory particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(100, 0, 100, 128),
                 life=random.uniform(1.0, 2.0),
                 size=random.uniform(2, 4)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -445,14 +365,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Psychic particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(100, 0, 100, 128),
                 life=random.uniform(1.0, 2.0),
                 size=random.uniform(2, 4)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -483,14 +403,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Mind particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(100, 0, 100, 128),
                 life=random.uniform(1.0, 2.0),
                 size=random.uniform(2, 4)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -521,14 +441,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Fire particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(255, 100, 0, 128),
                 life=random.uniform(1.0, 2.0),
                 size=random.uniform(2, 4)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -559,14 +479,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Ice particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(150, 200, 255, 128),
                 life=random.uniform(1.0, 2.0),
                 size=random.uniform(2, 4)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -597,14 +517,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Storm particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(100, 100, 255, 128),
                 life=random.uniform(1.0, 2.0),
                 size=random.uniform(2, 4)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -635,14 +555,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Earth particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(150, 75, 0, 128),
                 life=random.uniform(1.0, 2.0),
                 size=random.uniform(2, 4)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -673,14 +593,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Rot particles
         if random.random() < 0.1:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(100, 100, 0, 128),
                 life=random.uniform(1.0, 2.0),
                 size=random.uniform(2, 4)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -711,14 +631,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Ethereal particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(100, 100, 100, 128),
                 life=random.uniform(1.0, 2.0),
                 size=random.uniform(2, 4)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -749,14 +669,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Blood particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(200, 0, 0, 128),
                 life=random.uniform(1.0, 2.0),
                 size=random.uniform(2, 4)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -787,14 +707,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Arcane particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(100, 0, 100, 128),
                 life=random.uniform(1.0, 2.0),
                 size=random.uniform(2, 4)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -825,14 +745,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Nature particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(0, 200, 0, 128),
                 life=random.uniform(1.0, 2.0),
                 size=random.uniform(2, 4)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -863,14 +783,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Vine particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(0, 150, 0, 128),
                 life=random.uniform(1.0, 2.0),
                 size=random.uniform(2, 4)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -901,14 +821,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Moss particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(100, 150, 100, 128),
                 life=random.uniform(1.0, 2.0),
                 size=random.uniform(2, 4)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -939,14 +859,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Bloom particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(255, 100, 255, 128),
                 life=random.uniform(1.0, 2.0),
                 size=random.uniform(2, 4)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -977,14 +897,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Magic particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(255, 100, 255, 128),
                 life=random.uniform(1.0, 2.0),
                 size=random.uniform(2, 4)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -1015,14 +935,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Fire particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(255, 100, 0, 128),
                 life=random.uniform(1.0, 2.0),
                 size=random.uniform(2, 4)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -1051,14 +971,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Magic particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(100, 100, 255, 128),
                 life=random.uniform(1.0, 2.0),
                 size=random.uniform(2, 4)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -1089,14 +1009,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Feather particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(255, 200, 0, 128),
                 life=random.uniform(1.0, 2.0),
                 size=random.uniform(2, 4)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -1130,14 +1050,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Golden particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(255, 200, 0, 128),
                 life=random.uniform(1.0, 2.0),
                 size=random.uniform(2, 4)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -1168,14 +1088,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Cosmic particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(100, 100, 100, 128),
                 life=random.uniform(1.0, 2.0),
                 size=random.uniform(2, 4)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -1206,14 +1126,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Divine particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(255, 200, 0, 128),
                 life=random.uniform(1.0, 2.0),
                 size=random.uniform(2, 4)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -1244,14 +1164,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Destiny particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(255, 255, 255, 128),
                 life=random.uniform(1.0, 2.0),
                 size=random.uniform(2, 4)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -1282,14 +1202,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Air particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(200, 200, 255, 128),
                 life=random.uniform(1.0, 2.0),
                 size=random.uniform(2, 4)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -1320,14 +1240,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Water particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(100, 100, 255, 128),
                 life=random.uniform(1.0, 2.0),
                 size=random.uniform(2, 4)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -1358,14 +1278,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Earth particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(150, 75, 0, 128),
                 life=random.uniform(1.0, 2.0),
                 size=random.uniform(2, 4)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -1396,14 +1316,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Fire particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(255, 100, 0, 128),
                 life=random.uniform(1.0, 2.0),
                 size=random.uniform(2, 4)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -1434,14 +1354,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Shadow particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(50, 50, 50, 128),
                 life=random.uniform(1.0, 2.0),
                 size=random.uniform(2, 4)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -1472,14 +1392,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Void particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(0, 0, 0, 128),
                 life=random.uniform(1.0, 2.0),
                 size=random.uniform(2, 4)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -1512,14 +1432,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Nightmare particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(100, 0, 100, 64),
                 life=random.uniform(0.5, 1.0),
                 size=random.uniform(1, 2)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -1552,14 +1472,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Dream particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(100, 100, 255, 64),
                 life=random.uniform(0.5, 1.0),
                 size=random.uniform(1, 2)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -1592,14 +1512,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Time particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(100, 100, 0, 64),
                 life=random.uniform(0.5, 1.0),
                 size=random.uniform(1, 2)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -1632,14 +1552,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Space particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(0, 0, 100, 64),
                 life=random.uniform(0.5, 1.0),
                 size=random.uniform(1, 2)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -1672,14 +1592,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Reality particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(100, 0, 0, 64),
                 life=random.uniform(0.5, 1.0),
                 size=random.uniform(1, 2)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -1712,14 +1632,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Dimension particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(100, 0, 100, 64),
                 life=random.uniform(0.5, 1.0),
                 size=random.uniform(1, 2)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -1752,14 +1672,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Chaos particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(100, 0, 0, 64),
                 life=random.uniform(0.5, 1.0),
                 size=random.uniform(1, 2)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -1792,14 +1712,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Order particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(0, 100, 0, 64),
                 life=random.uniform(0.5, 1.0),
                 size=random.uniform(1, 2)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -1832,14 +1752,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Entropy particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(100, 0, 0, 64),
                 life=random.uniform(0.5, 1.0),
                 size=random.uniform(1, 2)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -1872,14 +1792,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Balance particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(100, 100, 100, 64),
                 life=random.uniform(0.5, 1.0),
                 size=random.uniform(1, 2)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -1912,14 +1832,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Light particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(255, 255, 0, 64),
                 life=random.uniform(0.5, 1.0),
                 size=random.uniform(1, 2)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -1952,14 +1872,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Dark particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(0, 0, 0, 64),
                 life=random.uniform(0.5, 1.0),
                 size=random.uniform(1, 2)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -1992,14 +1912,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Life particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(0, 100, 0, 64),
                 life=random.uniform(0.5, 1.0),
                 size=random.uniform(1, 2)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -2032,14 +1952,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Death particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(0, 0, 0, 64),
                 life=random.uniform(0.5, 1.0),
                 size=random.uniform(1, 2)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -2072,14 +1992,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Void particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(0, 0, 0, 64),
                 life=random.uniform(0.5, 1.0),
                 size=random.uniform(1, 2)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -2114,14 +2034,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Shadow particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(20, 20, 20, 128),
                 life=random.uniform(1.0, 2.0),
                 size=random.uniform(2, 4)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -2160,14 +2080,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Magic particles
         if random.random() < 0.2:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size*3//4, y=size//3,  # From staff tip
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(128, 0, 128, 128),  # Purple
                 life=random.uniform(0.5, 1.0),
                 size=random.uniform(2, 4)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -2214,7 +2134,7 @@ class MonsterIcon(AnimatedIcon):
         
         # Water particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=random.randint(0, size),
                 y=random.randint(0, size),
                 dx=random.uniform(-0.5, 0.5),
@@ -2222,7 +2142,7 @@ class MonsterIcon(AnimatedIcon):
                 color=(0, 150, 255, 64),
                 life=random.uniform(1.0, 2.0),
                 size=random.uniform(2, 4)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -2267,7 +2187,7 @@ class MonsterIcon(AnimatedIcon):
         
         # Water particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=random.randint(size//4, size*3//4),
                 y=random.randint(size//2, size*3//4),
                 dx=random.uniform(-0.5, 0.5),
@@ -2275,7 +2195,7 @@ class MonsterIcon(AnimatedIcon):
                 color=(0, 150, 255, 64),
                 life=random.uniform(1.0, 2.0),
                 size=random.uniform(2, 4)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -2322,7 +2242,7 @@ class MonsterIcon(AnimatedIcon):
         
         # Water particles
         if random.random() < 0.2:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=random.randint(0, size),
                 y=random.randint(0, size),
                 dx=random.uniform(-1, 1),
@@ -2330,7 +2250,7 @@ class MonsterIcon(AnimatedIcon):
                 color=(0, 100, 255, 64),
                 life=random.uniform(1.0, 2.0),
                 size=random.uniform(3, 6)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -2377,14 +2297,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Magic particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(200, 100, 255, 128),
                 life=random.uniform(1.0, 2.0),
                 size=random.uniform(2, 4)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -2426,14 +2346,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Particles
         if random.random() < 0.1:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-0.5, 0.5),
                 dy=random.uniform(-0.5, 0.5),
                 color=(0, 255, 0, 64),
                 life=random.uniform(0.5, 1.0),
                 size=random.uniform(1, 2)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -2480,7 +2400,7 @@ class MonsterIcon(AnimatedIcon):
         
         # Shell shine particles
         if random.random() < 0.1:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=random.randint(size//3, size*2//3),
                 y=random.randint(size//3, size*5//6),
                 dx=random.uniform(-0.5, 0.5),
@@ -2488,7 +2408,7 @@ class MonsterIcon(AnimatedIcon):
                 color=(255, 255, 255, 32),
                 life=random.uniform(0.5, 1.0),
                 size=random.uniform(1, 2)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -2550,7 +2470,7 @@ class MonsterIcon(AnimatedIcon):
         
         # Sand particles
         if random.random() < 0.1:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=random.randint(0, size),
                 y=size*3//4,
                 dx=random.uniform(-0.5, 0.5),
@@ -2558,7 +2478,7 @@ class MonsterIcon(AnimatedIcon):
                 color=(210, 180, 140, 64),
                 life=random.uniform(0.5, 1.0),
                 size=random.uniform(1, 2)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -2609,14 +2529,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Particles
         if random.random() < 0.1:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-0.5, 0.5),
                 color=(255, 255, 0, 64),
                 life=random.uniform(0.5, 1.0),
                 size=random.uniform(1, 2)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -2659,14 +2579,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Steam particles
         if random.random() < 0.2:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//3,
                 dx=random.uniform(-0.5, 0.5),
                 dy=random.uniform(-2, -1),
                 color=(200, 200, 200, 64),
                 life=random.uniform(1.0, 2.0),
                 size=random.uniform(2, 4)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -2707,14 +2627,14 @@ class MonsterIcon(AnimatedIcon):
         
         # Energy particles
         if random.random() < 0.15:
-            self._particles.append(Particle(
+            self._particles.emit(
                 x=size//2, y=size//2,
                 dx=random.uniform(-1, 1),
                 dy=random.uniform(-1, 1),
                 color=(0, 255, 255, 64),
                 life=random.uniform(0.5, 1.0),
                 size=random.uniform(1, 2)
-            ))
+            )
         
         self._draw_particles(surface)
 
@@ -2759,13 +2679,13 @@ class MonsterIcon(AnimatedIcon):
         # Steam particles
         for x, y in pipe_positions:
             if random.random() < 0.2:
-                self._particles.append(Particle(
+                self._particles.emit(
                     x=x, y=y + size//4,
                     dx=random.uniform(-0.5, 0.5),
                     dy=random.uniform(-2, -1),
                     color=(200, 200, 200, 64),
                     life=random.uniform(1.0, 2.0),
                     size=random.uniform(2, 4)
-                ))
+                )
         
         self._draw_particles(surface)
\ No newline at end of file
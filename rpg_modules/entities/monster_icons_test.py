@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Test module for the monster icons.
+This file tests that monster icons keep their particles in the shared particle pool.
+"""
+
+import os
+import random
+import sys
+import unittest
+
+import pygame
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from rpg_modules.animations.particles import ParticleEngine, ParticleEmitter
+from rpg_modules.entities.monster import MonsterType
+from rpg_modules.entities.monster_icons import MonsterIcon
+
+
+class TestMonsterIcons(unittest.TestCase):
+    """Test cases for MonsterIcon particles."""
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+
+    def test_every_type_renders_with_pooled_particles(self):
+        random.seed(3)
+        engine = ParticleEngine.instance()
+        surface = pygame.Surface((64, 64), pygame.SRCALPHA)
+        icons = [MonsterIcon(monster_type) for monster_type in MonsterType]
+        for _ in range(60):
+            for icon in icons:
+                surface.fill((0, 0, 0, 0))
+                icon.update(1 / 60)
+                icon.render(surface, 64)
+
+        self.assertTrue(all(isinstance(icon._particles, ParticleEmitter) for icon in icons))
+        live = sum(len(icon._particles) for icon in icons)
+        self.assertGreater(live, 0)
+        self.assertGreaterEqual(engine.active_count, live)
+
+    def test_expired_particles_return_to_pool(self):
+        engine = ParticleEngine.instance()
+        icon = MonsterIcon(MonsterType.DRAGON)
+        icon._particles.emit(x=10, y=10, dx=0, dy=0, color=(255, 0, 0), life=0.1, size=2)
+        before = engine.active_count
+        icon.update(0.2)
+        self.assertEqual(len(icon._particles), 0)
+        self.assertEqual(engine.active_count, before - 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,78 +1,329 @@
-from typing import List, Dict, Tuple, Optional
+"""
+Monster spawning and population management.
+
+The spawner works as a spawn director: the map is split into square regions,
+each with a target number of monsters. Only regions near the player are
+populated, a few regions are serviced per frame so spawning never causes a
+spike, and monsters that leave the active radius are suspended (kept but not
+updated) or despawned when they are far away. Places where monsters recently
+died are kept in a heap ordered by expiry time so no monster spawns on top of
+a fresh kill.
+"""
+
+import heapq
+import math
 import random
-from .monster import Monster
-from .monster_factory import monster_factory
+from collections import deque
+from typing import List, Dict, Tuple, Optional
+from .monster import Monster, MonsterType
+from ..core.constants import TILE_SIZE
+from ..core.pathfinding import path_cache
+
+Region = Tuple[int, int]
+
 
 class MonsterSpawner:
-    """Handles monster spawning in the game world."""
-    
-    def __init__(self):
+    """Keeps the monster population near the player within a budget."""
+
+    def __init__(self, game_map=None, region_size: int = 16, density: int = 2,
+                 active_radius: float = 24 * TILE_SIZE, despawn_radius: float = 40 * TILE_SIZE,
+                 max_active: int = 60, regions_per_frame: int = 2, spawns_per_frame: int = 1,
+                 death_cooldown: float = 30.0, death_radius: float = 4 * TILE_SIZE):
+        """
+        Initialize the spawner.
+
+        Args:
+            game_map: Map to spawn on (monsters are placed on its walkable tiles)
+            region_size: Side of a spawn region in tiles
+            density: Default number of monsters per region
+            active_radius: Monsters within this distance (pixels) of the player
+                are updated; regions overlapping it are populated
+            despawn_radius: Suspended monsters further away than this are removed
+            max_active: Maximum number of updated monsters (the CPU budget)
+            regions_per_frame: Regions checked for missing monsters per frame
+            spawns_per_frame: Monsters created per frame at most
+            death_cooldown: Seconds a death location blocks spawning
+            death_radius: Distance (pixels) around a death location where
+                nothing spawns
+        """
+        self.game_map = game_map
+        self.region_size = region_size
+        self.density = density
+        self.active_radius = active_radius
+        self.despawn_radius = despawn_radius
+        self.max_active = max_active
+        self.regions_per_frame = regions_per_frame
+        self.spawns_per_frame = spawns_per_frame
+        self.death_cooldown = death_cooldown
+        self.death_radius = death_radius
+
         self._spawn_points: List[Tuple[int, int]] = []
         self._spawn_templates: Dict[str, Dict] = {}
+        self._region_targets: Dict[Region, int] = {}
+
         self._active_monsters: List[Monster] = []
-        self._spawn_timer: float = 0
-        self._spawn_interval: float = 10.0  # seconds
-        
+        self._suspended: Dict[Region, List[Monster]] = {}
+        self._region_counts: Dict[Region, int] = {}
+        self.monster_counts: Dict[MonsterType, int] = {monster_type: 0 for monster_type in MonsterType}
+
+        # Recent deaths: (expiry time, x, y) in a heap, and by region for lookups
+        self._death_heap: List[Tuple[float, float, float]] = []
+        self._deaths_by_region: Dict[Region, List[Tuple[float, float, float]]] = {}
+
+        self._region_queue = deque()
+        self._time = 0.0
+        self._player_region: Optional[Region] = None
+        self._rng = random.Random()
+
+    def set_map(self, game_map) -> None:
+        """Switch to another map, removing all monsters."""
+        self.game_map = game_map
+        self.clear_monsters()
+
     def add_spawn_point(self, x: int, y: int) -> None:
-        """Add a new spawn point."""
+        """Add a new spawn point (in pixels). Regions with spawn points only spawn there."""
         self._spawn_points.append((x, y))
-        
+
     def remove_spawn_point(self, x: int, y: int) -> None:
         """Remove a spawn point."""
         if (x, y) in self._spawn_points:
             self._spawn_points.remove((x, y))
-            
+
     def register_spawn_template(self, template_name: str, template: Dict) -> None:
-        """Register a new spawn template."""
+        """
+        Register a new spawn template.
+
+        Templates have a ``monster_type`` (MonsterType or its name) and
+        optionally ``weight`` (relative spawn frequency, defaults to
+        ``spawn_chance`` or 1), ``min_distance`` from the player in pixels and
+        ``level`` (the player level monsters are scaled to).
+        """
         self._spawn_templates[template_name] = template
-        
-    def update(self, dt: float) -> None:
-        """Update the spawner state."""
-        self._spawn_timer += dt
-        
-        # Check if it's time to spawn new monsters
-        if self._spawn_timer >= self._spawn_interval:
-            self._spawn_timer = 0
-            self._try_spawn_monsters()
-            
-        # Update active monsters
-        for monster in self._active_monsters[:]:
-            monster.update(dt)
-            if not monster.is_alive():
-                self._active_monsters.remove(monster)
-                
-    def _try_spawn_monsters(self) -> None:
-        """Attempt to spawn new monsters."""
-        if not self._spawn_points or not self._spawn_templates:
+
+    def set_region_target(self, region: Region, count: int) -> None:
+        """Override the number of monsters a region should hold."""
+        self._region_targets[region] = count
+
+    def get_region(self, x: float, y: float) -> Region:
+        """Region of a pixel position."""
+        size = self.region_size * TILE_SIZE
+        return int(x // size), int(y // size)
+
+    def get_region_target(self, region: Region) -> int:
+        """Number of monsters a region should hold."""
+        return self._region_targets.get(region, self.density)
+
+    def record_death(self, x: float, y: float) -> None:
+        """Block spawning around a death location for ``death_cooldown`` seconds."""
+        entry = (self._time + self.death_cooldown, x, y)
+        heapq.heappush(self._death_heap, entry)
+        self._deaths_by_region.setdefault(self.get_region(x, y), []).append(entry)
+
+    def update(self, dt: float, player_pos: Optional[Tuple[float, float]] = None) -> None:
+        """
+        Update the spawner state.
+
+        Args:
+            dt: Seconds since the last update
+            player_pos: Player position in pixels; monsters chase it and the
+                population follows it
+        """
+        self._time += dt
+        self._expire_deaths()
+        if player_pos is None:
             return
-            
-        # Select a random spawn template
-        template_name = random.choice(list(self._spawn_templates.keys()))
-        template = self._spawn_templates[template_name]
-        
-        # Check spawn chance
-        if random.random() > template.get("spawn_chance", 0.5):
+
+        self._update_activity(player_pos)
+
+        # Update active monsters, removing the dead ones in one pass
+        alive = []
+        for monster in self._active_monsters:
+            monster.update(dt, player_pos)
+            if monster.health > 0:
+                alive.append(monster)
+            else:
+                self._remove(monster)
+                self.record_death(monster.x, monster.y)
+        self._active_monsters = alive
+
+        self._service_regions(player_pos)
+
+    def _expire_deaths(self) -> None:
+        """Drop death locations whose cooldown is over."""
+        heap = self._death_heap
+        while heap and heap[0][0] <= self._time:
+            entry = heapq.heappop(heap)
+            region = self.get_region(entry[1], entry[2])
+            deaths = self._deaths_by_region.get(region)
+            if deaths:
+                deaths.remove(entry)
+                if not deaths:
+                    del self._deaths_by_region[region]
+
+    def _near_recent_death(self, x: float, y: float) -> bool:
+        """Check whether a position is within ``death_radius`` of a recent death."""
+        radius_sq = self.death_radius * self.death_radius
+        rx, ry = self.get_region(x, y)
+        for region in ((rx + dx, ry + dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)):
+            for _, dx_, dy_ in self._deaths_by_region.get(region, ()):
+                if (dx_ - x) ** 2 + (dy_ - y) ** 2 <= radius_sq:
+                    return True
+        return False
+
+    def _update_activity(self, player_pos: Tuple[float, float]) -> None:
+        """Suspend, wake or despawn monsters when the player changes region."""
+        region = self.get_region(*player_pos)
+        if region == self._player_region:
+            return
+        self._player_region = region
+
+        px, py = player_pos
+        active_sq = self.active_radius * self.active_radius
+        despawn_sq = self.despawn_radius * self.despawn_radius
+
+        # Suspend active monsters that fell outside the active radius
+        still_active = []
+        for monster in self._active_monsters:
+            if (monster.x - px) ** 2 + (monster.y - py) ** 2 <= active_sq:
+                still_active.append(monster)
+            else:
+                self._suspended.setdefault(self.get_region(monster.x, monster.y), []).append(monster)
+        self._active_monsters = still_active
+
+        # Wake suspended monsters in range and despawn those far away
+        for suspended_region in list(self._suspended):
+            kept = []
+            for monster in self._suspended[suspended_region]:
+                dist_sq = (monster.x - px) ** 2 + (monster.y - py) ** 2
+                if dist_sq <= active_sq and len(self._active_monsters) < self.max_active:
+                    self._active_monsters.append(monster)
+                elif dist_sq > despawn_sq:
+                    self._remove(monster)
+                else:
+                    kept.append(monster)
+            if kept:
+                self._suspended[suspended_region] = kept
+            else:
+                del self._suspended[suspended_region]
+
+        # Queue the regions around the player for population checks
+        reach = int(math.ceil(self.active_radius / (self.region_size * TILE_SIZE)))
+        rx, ry = region
+        self._region_queue = deque(sorted(
+            ((rx + dx, ry + dy) for dx in range(-reach, reach + 1) for dy in range(-reach, reach + 1)),
+            key=lambda r: abs(r[0] - rx) + abs(r[1] - ry)))
+
+    def _service_regions(self, player_pos: Tuple[float, float]) -> None:
+        """Check a few regions for missing monsters and spawn some of them."""
+        if not self._spawn_templates or not self._region_queue:
             return
-            
-        # Select a random spawn point
-        spawn_point = random.choice(self._spawn_points)
-        
-        # Create and spawn the monster
+
+        spawns = 0
+        for _ in range(min(self.regions_per_frame, len(self._region_queue))):
+            region = self._region_queue[0]
+            self._region_queue.rotate(-1)
+            missing = self.get_region_target(region) - self._region_counts.get(region, 0)
+            while missing > 0 and spawns < self.spawns_per_frame:
+                if len(self._active_monsters) >= self.max_active:
+                    return
+                if not self._spawn_in_region(region, player_pos):
+                    break
+                missing -= 1
+                spawns += 1
+
+    def _pick_template(self) -> Dict:
+        """Pick a spawn template by weight."""
+        templates = list(self._spawn_templates.values())
+        weights = [t.get("weight", t.get("spawn_chance", 1.0)) for t in templates]
+        return self._rng.choices(templates, weights=weights)[0]
+
+    def _spawn_in_region(self, region: Region, player_pos: Tuple[float, float]) -> bool:
+        """Spawn one monster in a region. Returns False if there is no valid spot."""
+        template = self._pick_template()
+        min_distance = template.get("min_distance", 0)
+        position = self._find_spawn_position(region, player_pos, min_distance)
+        if position is None:
+            return False
+
         monster_type = template["monster_type"]
-        level = template.get("level", 1)
-        
-        monster = monster_factory.create_monster(monster_type, level)
-        monster.set_position(spawn_point[0], spawn_point[1])
-        
+        if isinstance(monster_type, str):
+            monster_type = MonsterType[monster_type.upper()]
+        monster = Monster(position[0], position[1], monster_type, self.game_map,
+                          template.get("level", 1))
+        self._add(monster)
         self._active_monsters.append(monster)
-        
+        return True
+
+    def _find_spawn_position(self, region: Region, player_pos: Tuple[float, float],
+                             min_distance: float) -> Optional[Tuple[float, float]]:
+        """Pick a spawn position (pixels) in a region away from the player and recent deaths."""
+        px, py = player_pos
+        min_sq = min_distance * min_distance
+
+        points = [p for p in self._spawn_points if self.get_region(*p) == region]
+        if points:
+            self._rng.shuffle(points)
+            for x, y in points:
+                if (x - px) ** 2 + (y - py) ** 2 >= min_sq and not self._near_recent_death(x, y):
+                    return x, y
+            return None
+
+        if not self.game_map:
+            return None
+        walkable_index = self.game_map.get_walkable_index()
+        half = self.region_size / 2
+        center = (region[0] * self.region_size + half, region[1] * self.region_size + half)
+        for _ in range(4):
+            tile = walkable_index.sample(self._rng, near=center, max_distance=half * 1.5)
+            if tile is None:
+                return None
+            x, y = tile[0] * TILE_SIZE + TILE_SIZE // 2, tile[1] * TILE_SIZE + TILE_SIZE // 2
+            if (self.get_region(x, y) == region and (x - px) ** 2 + (y - py) ** 2 >= min_sq and
+                    not self._near_recent_death(x, y)):
+                return x, y
+        return None
+
+    def _add(self, monster: Monster) -> None:
+        """Count a new monster in its region and type."""
+        region = self.get_region(monster.x, monster.y)
+        self._region_counts[region] = self._region_counts.get(region, 0) + 1
+        monster.spawn_region = region
+        self.monster_counts[monster.monster_type] = self.monster_counts.get(monster.monster_type, 0) + 1
+
+    def _remove(self, monster: Monster) -> None:
+        """Stop counting a monster that died or despawned."""
+        path_cache.forget_agent(monster)
+        region = getattr(monster, "spawn_region", None)
+        if region in self._region_counts:
+            self._region_counts[region] -= 1
+            if self._region_counts[region] <= 0:
+                del self._region_counts[region]
+        if self.monster_counts.get(monster.monster_type, 0) > 0:
+            self.monster_counts[monster.monster_type] -= 1
+
     def get_active_monsters(self) -> List[Monster]:
         """Get the list of active monsters."""
         return self._active_monsters
-        
+
+    def get_suspended_count(self) -> int:
+        """Number of monsters kept but not updated."""
+        return sum(len(monsters) for monsters in self._suspended.values())
+
     def clear_monsters(self) -> None:
-        """Clear all active monsters."""
+        """Clear all active and suspended monsters and recent deaths."""
+        for monster in self._active_monsters:
+            path_cache.forget_agent(monster)
+        for monsters in self._suspended.values():
+            for monster in monsters:
+                path_cache.forget_agent(monster)
         self._active_monsters.clear()
+        self._suspended.clear()
+        self._region_counts.clear()
+        self.monster_counts = {monster_type: 0 for monster_type in MonsterType}
+        self._death_heap.clear()
+        self._deaths_by_region.clear()
+        self._region_queue.clear()
+        self._player_region = None
 
 # Create a global instance
-monster_spawner = MonsterSpawner() 
\ No newline at end of file
+monster_spawner = MonsterSpawner()
@@ -5,6 +5,7 @@ NPC entity class for RPG games.
 import pygame
 from typing import Dict, Any, Optional, List, Tuple, Callable
 from ..core.constants import TILE_SIZE
+from ..core.pathfinding import path_cache
 
 class NPC:
     """Class representing a non-player character that can be interacted with."""
@@ -31,7 +32,9 @@ class NPC:
         self.movement_pattern = "stationary"  # Options: stationary, patrol, wander
         self.patrol_points = []
         self.current_patrol_point = 0
+        self.patrol_route = []  # Walkable waypoints through all patrol points, see build_patrol_route
         self.wander_radius = 3  # Tiles
+        self.walkable_index = None  # WalkableIndex used to pick wander targets
         self.movement_timer = 0
         self.movement_delay = 3  # Seconds between movements
         self.is_moving = False
@@ -51,8 +54,18 @@ class NPC:
         self.indicator_bounce_speed = 2
         self.indicator_bounce_height = 5
         
-    def update(self, dt: float, player_x: float, player_y: float):
-        """Update the NPC state."""
+    def update(self, dt: float, player_x: float, player_y: float, step_dt: Optional[float] = None):
+        """
+        Update the NPC state.
+        
+        Args:
+            dt: Seconds since the last update
+            player_x, player_y: Player position in pixels
+            step_dt: For a coarse update standing in for many frames, the
+                frame time each movement step covers; every movement delay
+                that elapsed in ``dt`` then moves the NPC by one such step,
+                exactly as per-frame updates would
+        """
         # Update animation
         self.animation_timer += dt
         if self.animation_timer >= self.animation_speed:
@@ -84,14 +97,19 @@ class NPC:
         if self.movement_pattern != "stationary":
             self.movement_timer += dt
             if self.movement_timer >= self.movement_delay:
-                self.movement_timer = 0
+                # One move per elapsed delay: one per frame normally, several in a coarse update
+                moves = int(self.movement_timer // self.movement_delay)
+                self.movement_timer -= moves * self.movement_delay
+                if step_dt is None:
+                    step_dt = dt
                 
-                if self.movement_pattern == "patrol" and self.patrol_points:
-                    # Move to next patrol point
-                    self._move_to_next_patrol_point(dt)
-                elif self.movement_pattern == "wander":
-                    # Wander randomly within radius
-                    self._wander_randomly(dt)
+                for _ in range(moves):
+                    if self.movement_pattern == "patrol" and self.patrol_points:
+                        # Move to next patrol point
+                        self._move_to_next_patrol_point(step_dt)
+                    elif self.movement_pattern == "wander":
+                        # Wander randomly within radius
+                        self._wander_randomly(step_dt)
     
     def draw(self, screen: pygame.Surface, camera_x: int, camera_y: int, zoom: float = 1.0):
         """Draw the NPC on the screen."""
@@ -203,12 +221,44 @@ class NPC:
         ))
         pygame.draw.circle(screen, (255, 255, 0), (x, y - size//8), max(2, int(size//4)))
     
+    def build_patrol_route(self, game_map):
+        """
+        Precompute the walkable route through the patrol points.
+        
+        Call once after the map is loaded. Legs without a path are walked
+        in a straight line as before.
+        
+        Args:
+            game_map: Map the NPC patrols on
+        """
+        self.patrol_route = []
+        self.current_patrol_point = 0
+        if self.movement_pattern != "patrol" or len(self.patrol_points) < 2:
+            return
+            
+        half = TILE_SIZE // 2
+        for i, (start_x, start_y) in enumerate(self.patrol_points):
+            end_x, end_y = self.patrol_points[(i + 1) % len(self.patrol_points)]
+            path = path_cache.get_path(
+                game_map,
+                (start_x * TILE_SIZE + half, start_y * TILE_SIZE + half),
+                (end_x * TILE_SIZE + half, end_y * TILE_SIZE + half),
+                max_distance=1000
+            )
+            if path:
+                # Waypoints come back as pixel tile centers; the first one is the start
+                self.patrol_route.extend(((px - half) / TILE_SIZE, (py - half) / TILE_SIZE)
+                                         for px, py in path[1:])
+            else:
+                self.patrol_route.append((end_x, end_y))
+    
     def _move_to_next_patrol_point(self, dt: float):
         """Move to the next point in the patrol route."""
-        if not self.patrol_points:
+        points = self.patrol_route if self.movement_pattern == "patrol" and self.patrol_route else self.patrol_points
+        if not points:
             return
             
-        target_x, target_y = self.patrol_points[self.current_patrol_point]
+        target_x, target_y = points[self.current_patrol_point % len(points)]
         
         # Calculate direction to target
         dx = target_x - self.x
@@ -223,15 +273,16 @@ class NPC:
         # Check if close enough to target
         if abs(dx) < 0.1 and abs(dy) < 0.1:
             # Move to next patrol point
-            self.current_patrol_point = (self.current_patrol_point + 1) % len(self.patrol_points)
+            self.current_patrol_point = (self.current_patrol_point + 1) % len(points)
             self.is_moving = False
             return
             
-        # Move towards target
+        # Move towards target, stopping on it rather than overshooting
         dist = (dx**2 + dy**2)**0.5
         if dist > 0:
-            self.x += (dx / dist) * self.movement_speed * dt
-            self.y += (dy / dist) * self.movement_speed * dt
+            step = min(self.movement_speed * dt, dist)
+            self.x += (dx / dist) * step
+            self.y += (dy / dist) * step
             self.is_moving = True
             
         # Update collision rect
@@ -243,11 +294,19 @@ class NPC:
         import random
         
         if not self.is_moving:
-            # Choose a random point within radius
-            angle = random.random() * 6.28  # 0 to 2π
-            distance = random.random() * self.wander_radius
-            target_x = self.x + distance * pygame.math.Vector2(1, 0).rotate_rad(angle).x
-            target_y = self.y + distance * pygame.math.Vector2(1, 0).rotate_rad(angle).y
+            target = None
+            if self.walkable_index:
+                # Pick a walkable tile within the radius
+                target = self.walkable_index.sample(near=(self.x, self.y),
+                                                    max_distance=self.wander_radius)
+            if target:
+                target_x, target_y = target
+            else:
+                # Choose a random point within radius
+                angle = random.random() * 6.28  # 0 to 2π
+                distance = random.random() * self.wander_radius
+                target_x = self.x + distance * pygame.math.Vector2(1, 0).rotate_rad(angle).x
+                target_y = self.y + distance * pygame.math.Vector2(1, 0).rotate_rad(angle).y
             
             # Set as temporary patrol point
             self.patrol_points = [(target_x, target_y)]
@@ -8,15 +8,52 @@ import pygame
 from typing import Dict, List, Optional, Tuple, Any
 from .npc import NPC
 from ..core.constants import TILE_SIZE
+from ..core.spatial_hash import SpatialHash
+from ..utils.timer_wheel import TimerWheel
 
 class NPCManager:
-    """Class for managing NPCs in the game world."""
+    """
+    Class for managing NPCs in the game world.
     
-    def __init__(self, asset_path: str = "assets/npcs"):
-        """Initialize the NPC manager."""
+    NPCs near the player are awake and updated every frame. The others
+    sleep: stationary ones are not updated at all and moving ones get a
+    coarse update every ``sleep_update_interval`` seconds from a timer
+    wheel. Sleeping NPCs wake when a spatial-hash query around the player
+    finds them within ``wake_radius``. Drawing only looks at the NPCs in
+    the camera rectangle.
+    """
+    
+    def __init__(self, asset_path: str = "assets/npcs", wake_radius: float = 12,
+                 sleep_radius: float = 16, sleep_update_interval: float = 2.0):
+        """
+        Initialize the NPC manager.
+        
+        Args:
+            asset_path: Directory of the NPC sprite sheets
+            wake_radius: Distance in tiles at which sleeping NPCs wake up
+            sleep_radius: Distance in tiles beyond which awake NPCs fall
+                asleep (larger than wake_radius to avoid flickering)
+            sleep_update_interval: Seconds between updates of sleeping NPCs
+                that move
+        """
         self.npcs: Dict[str, NPC] = {}
         self.asset_path = asset_path
         self.sprites: Dict[str, pygame.Surface] = {}
+        self.walkable_index = None  # Shared by NPCs to pick wander targets
+        
+        # Simulation tiers
+        self.wake_radius = wake_radius
+        self.sleep_radius = sleep_radius
+        self.sleep_update_interval = sleep_update_interval
+        self._index = SpatialHash(cell_size=8)  # NPC positions, in tiles
+        self._awake: Dict[str, NPC] = {}
+        self._sleep_wheel = TimerWheel()
+        self._last_update: Dict[str, float] = {}
+        self._clock = 0.0
+        self._frame_dt = 1 / 60  # Length of the last frame, used for coarse movement steps
+        
+        # NPCs drawn last frame, in y order
+        self._draw_order: List[NPC] = []
         
     def load_npcs(self, npc_data_path: str = "data/npcs.json") -> bool:
         """Load NPCs from a JSON data file."""
@@ -46,7 +83,8 @@ class NPCManager:
                     if sprite_id and sprite_id in self.sprites:
                         npc.set_sprite(self.sprites[sprite_id])
                         
-                    self.npcs[npc.npc_id] = npc
+                    self.remove_npc(npc.npc_id)
+                    self._register(npc)
                     
             return True
             
@@ -99,31 +137,130 @@ class NPCManager:
             print(f"NPC with ID {npc.npc_id} already exists.")
             return False
             
-        self.npcs[npc.npc_id] = npc
+        self._register(npc)
         return True
     
+    def _register(self, npc: NPC):
+        """Store an NPC, index its position and start it asleep."""
+        if self.walkable_index:
+            npc.walkable_index = self.walkable_index
+        self.npcs[npc.npc_id] = npc
+        self._index.insert(npc)
+        self._last_update[npc.npc_id] = self._clock
+        self._fall_asleep(npc)
+    
+    def set_walkable_index(self, walkable_index):
+        """
+        Set the walkable tile index NPCs use to pick wander targets.
+        
+        Args:
+            walkable_index: WalkableIndex of the map the NPCs are on
+        """
+        self.walkable_index = walkable_index
+        for npc in self.npcs.values():
+            npc.walkable_index = walkable_index
+    
     def get_npc(self, npc_id: str) -> Optional[NPC]:
         """Get an NPC by ID."""
         return self.npcs.get(npc_id)
     
     def remove_npc(self, npc_id: str) -> bool:
         """Remove an NPC by ID."""
-        if npc_id in self.npcs:
-            del self.npcs[npc_id]
-            return True
-        return False
+        npc = self.npcs.pop(npc_id, None)
+        if npc is None:
+            return False
+        self._index.remove(npc)
+        self._awake.pop(npc_id, None)
+        self._sleep_wheel.cancel(npc)
+        self._last_update.pop(npc_id, None)
+        if npc in self._draw_order:
+            self._draw_order.remove(npc)
+        return True
     
-    def update_npcs(self, dt: float, player_x: float, player_y: float):
-        """Update all NPCs."""
+    def prepare_patrol_routes(self, game_map):
+        """Precompute the patrol routes of all patrolling NPCs for a freshly loaded map."""
         for npc in self.npcs.values():
-            npc.update(dt, player_x, player_y)
+            npc.build_patrol_route(game_map)
+    
+    def npc_moved(self, npc: NPC):
+        """Re-index an NPC whose position was changed from outside."""
+        self._index.update(npc)
+    
+    def is_awake(self, npc_id: str) -> bool:
+        """Check whether an NPC is currently updated every frame."""
+        return npc_id in self._awake
+    
+    def update_npcs(self, dt: float, player_x: float, player_y: float):
+        """
+        Update the NPCs near the player and due sleeping NPCs.
+        
+        Args:
+            dt: Seconds since the last update
+            player_x, player_y: Player position in pixels
+        """
+        self._clock += dt
+        self._frame_dt = dt
+        tile_x, tile_y = player_x / TILE_SIZE, player_y / TILE_SIZE
+        
+        # Wake sleeping NPCs that the player came close to
+        for npc in self._index.query_radius(tile_x, tile_y, self.wake_radius):
+            if npc.npc_id not in self._awake:
+                self._sleep_wheel.cancel(npc)
+                self._awake[npc.npc_id] = npc
+        
+        # Full update for awake NPCs; the ones left behind fall asleep
+        sleep_sq = self.sleep_radius * self.sleep_radius
+        for npc in list(self._awake.values()):
+            self._update_npc(npc, dt, player_x, player_y)
+            if (npc.x - tile_x) ** 2 + (npc.y - tile_y) ** 2 > sleep_sq:
+                del self._awake[npc.npc_id]
+                self._fall_asleep(npc)
+        
+        # Coarse update for sleeping NPCs whose timer came up
+        for npc in self._sleep_wheel.advance(dt):
+            if npc.npc_id in self.npcs and npc.npc_id not in self._awake:
+                # Move in frame-sized steps so sleeping NPCs walk as far as awake ones
+                self._update_npc(npc, self._clock - self._last_update[npc.npc_id], player_x, player_y,
+                                 step_dt=self._frame_dt)
+                self._fall_asleep(npc)
+    
+    def _update_npc(self, npc: NPC, dt: float, player_x: float, player_y: float,
+                    step_dt: Optional[float] = None):
+        """Update one NPC and keep its index entry current."""
+        npc.update(dt, player_x, player_y, step_dt)
+        self._last_update[npc.npc_id] = self._clock
+        self._index.update(npc)
+    
+    def _fall_asleep(self, npc: NPC):
+        """Hide an NPC's indicators and schedule its next coarse update."""
+        npc.dialog_indicator_visible = False
+        npc.quest_indicator_visible = False
+        if npc.movement_pattern != "stationary":
+            self._sleep_wheel.schedule(npc, self.sleep_update_interval)
     
     def draw_npcs(self, screen: pygame.Surface, camera_x: int, camera_y: int, zoom: float = 1.0):
-        """Draw all NPCs."""
-        # Sort NPCs by Y position for proper depth
-        sorted_npcs = sorted(self.npcs.values(), key=lambda npc: npc.y)
+        """Draw the NPCs inside the camera view."""
+        screen_width, screen_height = screen.get_size()
+        left = camera_x / TILE_SIZE - 1
+        top = camera_y / TILE_SIZE - 1
+        right = left + screen_width / (TILE_SIZE * zoom) + 2
+        bottom = top + screen_height / (TILE_SIZE * zoom) + 2
+        visible = self._index.query_rect(left, top, right, bottom)
+        
+        # Keep last frame's order and add newly visible NPCs; NPCs barely
+        # move between frames, so re-sorting the nearly sorted list is cheap
+        visible_ids = {id(npc) for npc in visible}
+        shown_ids = set()
+        order = []
+        for npc in self._draw_order:
+            if id(npc) in visible_ids:
+                order.append(npc)
+                shown_ids.add(id(npc))
+        order.extend(npc for npc in visible if id(npc) not in shown_ids)
+        order.sort(key=lambda npc: npc.y)
+        self._draw_order = order
         
-        for npc in sorted_npcs:
+        for npc in order:
             npc.draw(screen, camera_x, camera_y, zoom)
     
     def get_npc_at(self, world_x: float, world_y: float, interaction_radius: float = None) -> Optional[NPC]:
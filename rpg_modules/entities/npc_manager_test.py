@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Test module for the NPC manager.
+This file tests that sleeping NPCs move like awake ones.
+"""
+
+import os
+import sys
+import unittest
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from rpg_modules.core.constants import TILE_SIZE
+from rpg_modules.entities.npc import NPC
+from rpg_modules.entities.npc_manager import NPCManager
+
+FRAME_DT = 1 / 60
+
+
+def make_patrol_npc(npc_id, x, y, speed=1):
+    """A patrolling NPC walking east and back along a 2-tile route."""
+    npc = NPC(x, y, npc_id, npc_id.capitalize())
+    npc.movement_pattern = "patrol"
+    npc.patrol_points = [(x + 2, y), (x, y)]
+    npc.movement_delay = 0.5
+    npc.movement_speed = speed
+    return npc
+
+
+def run_frames(manager, seconds, player_pos):
+    for _ in range(int(round(seconds / FRAME_DT))):
+        manager.update_npcs(FRAME_DT, *player_pos)
+
+
+class TestNPCManager(unittest.TestCase):
+    """Test cases for sleeping NPC updates."""
+
+    def setUp(self):
+        self.manager = NPCManager(sleep_update_interval=2.0)
+        # Same route, one next to the player and one far away
+        self.awake = make_patrol_npc("awake", 100, 100)
+        self.sleeping = make_patrol_npc("sleeping", 500, 100)
+        self.manager.add_npc(self.awake)
+        self.manager.add_npc(self.sleeping)
+        self.player_pos = (100 * TILE_SIZE, 100 * TILE_SIZE)
+
+    def test_sleeping_npc_is_not_updated_every_frame(self):
+        run_frames(self.manager, 1, self.player_pos)
+        self.assertTrue(self.manager.is_awake("awake"))
+        self.assertFalse(self.manager.is_awake("sleeping"))
+
+    def test_sleeping_npc_keeps_pace_with_awake_npc(self):
+        awake_offsets = {}  # clock -> awake NPC offset
+        for _ in range(int(round(20 / FRAME_DT))):
+            self.manager.update_npcs(FRAME_DT, *self.player_pos)
+            awake_offsets[round(self.manager._clock, 6)] = self.awake.x - 100
+
+        # Compare with the awake NPC at the time of the last coarse update
+        last_update = round(self.manager._last_update["sleeping"], 6)
+        self.assertGreater(last_update, 15)
+        self.assertGreater(self.awake.x, 100)
+        self.assertAlmostEqual(self.sleeping.x - 500, awake_offsets[last_update],
+                               delta=self.awake.movement_speed * FRAME_DT + 1e-6)
+
+    def test_coarse_update_does_not_overshoot_waypoint(self):
+        npc = make_patrol_npc("fast", 0, 0, speed=500)
+        npc.update(10, 0, 0, step_dt=FRAME_DT)
+        self.assertLessEqual(npc.x, 2)
+        self.assertGreaterEqual(npc.x, 0)
+
+    def test_coarse_update_moves_once_per_elapsed_delay(self):
+        npc = make_patrol_npc("single", 0, 0)
+        npc.update(2.0, 0, 0, step_dt=FRAME_DT)
+        # Four delays of 0.5 s, each moving one frame's worth
+        self.assertAlmostEqual(npc.x, 4 * FRAME_DT)
+        self.assertAlmostEqual(npc.movement_timer, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,6 +10,9 @@ from ..core.constants import TILE_SIZE, SCREEN_WIDTH, SCREEN_HEIGHT
 from ..animations.base import PlayerIcon
 from ..core.pathfinding import find_path, is_stuck
 from ..core.settings import GameSettings
+from ..utils.fonts import get_font
+from ..utils.overhead import get_nameplate, get_health_bar
+from .stats import StatEngine
 import random
 import math
 
@@ -33,8 +36,9 @@ class Player:
         self.max_mana = 50
         self.stamina = 100
         self.max_stamina = 100
-        self.attack = 10
-        self.defense = 5
+        # Base stats; equipment and buffs are added by the stat engine
+        self._equipment = None
+        self.stats = StatEngine(attack=10, defense=5)
         self.level = 1
         self.experience = 0
         self.gold = 0
@@ -83,6 +87,42 @@ class Player:
         # Basic attributes
         self.name = "Hero"  # Default name
         
+    @property
+    def equipment(self) -> Equipment:
+        return self._equipment
+        
+    @equipment.setter
+    def equipment(self, equipment: Equipment):
+        self._equipment = equipment
+        self.stats.bind_equipment(equipment)
+        
+    @property
+    def attack(self) -> int:
+        """Base attack, before equipment and modifiers (see ``stats.attack``)."""
+        return self.stats.base['attack']
+        
+    @attack.setter
+    def attack(self, value: int):
+        self.stats.set_base('attack', value)
+        
+    @property
+    def defense(self) -> int:
+        """Base defense, before equipment and modifiers (see ``stats.defense``)."""
+        return self.stats.base['defense']
+        
+    @defense.setter
+    def defense(self, value: int):
+        self.stats.set_base('defense', value)
+        
+    @property
+    def dexterity(self) -> int:
+        """Base dexterity, before equipment and modifiers (see ``stats.dexterity``)."""
+        return self.stats.base['dexterity']
+        
+    @dexterity.setter
+    def dexterity(self, value: int):
+        self.stats.set_base('dexterity', value)
+        
     def handle_input(self, keys: pygame.key.ScancodeWrapper, walls: List[pygame.Rect]) -> None:
         """Handle player input with direct movement and wall sliding."""
         self.walls = walls
@@ -192,30 +232,23 @@ class Player:
         bar_x = screen_x
         bar_y = screen_y - int(15 * zoom)
         
-        # Draw health bar background (dark red)
-        pygame.draw.rect(screen, (100, 0, 0), 
-                         (bar_x, bar_y, bar_width, bar_height))
-        
-        # Draw health bar fill (bright green/yellow/red based on health)
-        if health_percent > 0:
-            # Change color from green to red as health decreases
-            if health_percent > 0.7:
-                fill_color = (0, 200, 0)  # Green for high health
-            elif health_percent > 0.3:
-                fill_color = (200, 200, 0)  # Yellow for medium health
-            else:
-                fill_color = (200, 0, 0)  # Red for low health
-            
-            fill_width = int(bar_width * health_percent)
-            pygame.draw.rect(screen, fill_color, 
-                            (bar_x, bar_y, fill_width, bar_height))
+        # Change color from green to red as health decreases
+        if health_percent > 0.7:
+            fill_color = (0, 200, 0)  # Green for high health
+        elif health_percent > 0.3:
+            fill_color = (200, 200, 0)  # Yellow for medium health
+        else:
+            fill_color = (200, 0, 0)  # Red for low health
         
-        # Draw player name and level above health bar
+        # Cached bar with a dark red background
+        fill_width = int(bar_width * max(0, health_percent))
+        screen.blit(get_health_bar(bar_width, bar_height, fill_width, fill_color), (bar_x, bar_y))
+        
+        # Draw player name and level above health bar (cached until name,
+        # level or zoom changes)
         if not hasattr(self, 'DEBUG') or not self.DEBUG:
             font_size = max(10, int(20 * zoom))
-            font = pygame.font.Font(None, font_size)
-            level_text = f"{self.name} lvl {self.level}"
-            level_surface = font.render(level_text, True, (255, 255, 255))
+            level_surface = get_nameplate(f"{self.name} lvl {self.level}", font_size)
             level_x = screen_x + (scaled_size - level_surface.get_width()) // 2
             level_y = screen_y - int(35 * zoom)
             screen.blit(level_surface, (level_x, level_y))
@@ -226,7 +259,7 @@ class Player:
             pygame.draw.rect(screen, (255, 0, 0), 
                             (screen_x, screen_y, scaled_size, scaled_size), 1)
             # Draw coordinates
-            font = pygame.font.Font(None, int(24 * zoom))
+            font = get_font(int(24 * zoom))
             text = font.render(f"({int(self.x)}, {int(self.y)})", True, (255, 255, 255))
             screen.blit(text, (screen_x, screen_y - int(20 * zoom)))
         
@@ -314,29 +347,28 @@ class Player:
             print("WARNING: Attempted to add None item to inventory")
             return False
             
-        # Try to add item to inventory
+        # Try to add item to inventory; UIs bound to it redraw on their own
         success = self.inventory.add_item(item)
         
-        # Print debug information about inventory status
-        filled_slots = sum(1 for i in self.inventory.items if i is not None)
-        total_slots = len(self.inventory.items)
-        print(f"DEBUG: Inventory status after add attempt: {filled_slots}/{total_slots} slots filled")
-        
         if success:
             print(f"Added {item.display_name} to inventory")
-            # Try to refresh inventory UI through game_state
-            try:
-                import game
-                if hasattr(game, 'game_state') and game.game_state:
-                    if hasattr(game.game_state, 'refresh_inventory_ui'):
-                        game.game_state.refresh_inventory_ui()
-            except Exception as e:
-                print(f"Could not refresh inventory UI from player: {e}")
         else:
             print(f"Inventory full, couldn't add {item.display_name}")
             
         return success
         
+    def add_items(self, items: List[Item]) -> List[Item]:
+        """
+        Add a batch of items, such as a loot drop, to the player's inventory.
+        
+        Returns:
+            The items that did not fit
+        """
+        leftovers = self.inventory.add_items(items)
+        if leftovers:
+            print(f"Inventory full, couldn't add {len(leftovers)} item(s)")
+        return leftovers
+        
     def equip_item(self, inventory_index: int) -> bool:
         """
         Equip an item from the inventory.
@@ -355,22 +387,15 @@ class Player:
             return False
             
         # Determine equipment slot based on item type
-        slot = None
-        if isinstance(item, Item):
-            if hasattr(item, 'weapon_type'):
-                slot = 'weapon'
-            elif hasattr(item, 'armor_type'):
-                slot = item.armor_type
+        slot = self.equipment.slot_for(item) if isinstance(item, Item) else None
                 
         if slot and slot in self.equipment:
-            # Unequip current item if any
+            # The currently equipped item (if any) takes the new item's inventory slot
             current_item = self.equipment[slot]
-            if current_item:
-                self.inventory[inventory_index] = current_item
-                
+            
             # Equip new item
             self.equipment[slot] = item
-            self.inventory[inventory_index] = None
+            self.inventory[inventory_index] = current_item if current_item else None
             return True
             
         return False
@@ -402,9 +427,10 @@ class Player:
             self.stamina = self.max_stamina  # Restore stamina on level up
             self.attack += 2
             self.defense += 1
+            self.stats.invalidate()
             
             print(f"LEVEL UP! Player is now level {self.level}!")
-            print(f"Health: {self.max_health}, Mana: {self.max_mana}, Attack: {self.attack}, Defense: {self.defense}")
+            print(f"Health: {self.max_health}, Mana: {self.max_mana}, Attack: {self.stats.attack}, Defense: {self.stats.defense}")
             
             # Signal that a level-up occurred
             self.on_level_up()
@@ -431,8 +457,9 @@ class Player:
         Args:
             damage: Amount of damage to take
         """
-        # Apply defense reduction (simple formula: damage - defense/2)
-        actual_damage = max(1, damage - (self.defense // 2))
+        # Apply defense reduction (simple formula: damage - defense/2),
+        # using the defense from equipped armor as well
+        actual_damage = max(1, damage - (self.stats.defense // 2))
         
         # Apply damage
         self.health -= actual_damage
@@ -489,7 +516,9 @@ class Player:
             "stamina": self.stamina,
             "max_stamina": self.max_stamina,
             "attack": self.attack,
-            "defense": self.defense
+            "defense": self.defense,
+            "dexterity": self.dexterity,
+            "stats": self.stats.to_dict()
         }
         
     @classmethod
@@ -520,6 +549,7 @@ class Player:
         player.max_stamina = data.get("max_stamina", 100)
         player.attack = data.get("attack", 10)
         player.defense = data.get("defense", 5)
+        player.dexterity = data.get("dexterity", 0)
         
         return player 
 
@@ -555,12 +585,8 @@ class Player:
         
     def get_attack_damage(self) -> int:
         """Get the player's attack damage, accounting for equipment and attack type."""
-        base_damage = self.attack
-        
-        # Add weapon damage if equipped
-        weapon = self.equipment.get_equipped_item('weapon') if hasattr(self.equipment, 'get_equipped_item') else None
-        if weapon and hasattr(weapon, 'attack_power'):
-            base_damage += weapon.attack_power
+        # Base attack plus weapon and buffs, compiled by the stat engine
+        base_damage = self.stats.attack
         
         # Apply modifiers based on attack type
         if self.attack_type == 1:
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Test module for the player.
+This file tests equipping items from the player's inventory.
+"""
+
+import os
+import sys
+import unittest
+
+import pygame
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from rpg_modules.entities.player import Player
+from rpg_modules.items.weapon import Weapon
+
+
+class TestPlayerEquip(unittest.TestCase):
+    """Test cases for Player.equip_item."""
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+
+    def setUp(self):
+        self.player = Player(0, 0)
+        self.player.inventory.clear()
+
+    def test_equip_into_empty_slot(self):
+        sword = Weapon("Sword", 10, "Common", "Iron")
+        self.player.inventory.add_item(sword)
+        slot = self.player.inventory.slot_of(sword)
+
+        self.assertTrue(self.player.equip_item(slot))
+        self.assertIs(self.player.equipment['weapon'], sword)
+        self.assertIsNone(self.player.inventory[slot])
+
+    def test_equip_over_occupied_slot_returns_old_item(self):
+        sword = Weapon("Sword", 10, "Common", "Iron")
+        axe = Weapon("Axe", 12, "Common", "Iron")
+        self.player.inventory.add_item(sword)
+        self.player.equip_item(self.player.inventory.slot_of(sword))
+        self.player.inventory.add_item(axe)
+        slot = self.player.inventory.slot_of(axe)
+
+        self.assertTrue(self.player.equip_item(slot))
+        self.assertIs(self.player.equipment['weapon'], axe)
+        self.assertIs(self.player.inventory[slot], sword)
+        self.assertEqual(self.player.inventory.slot_of(sword), slot)
+        self.assertNotIn(axe, self.player.inventory)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+"""
+Cached stat aggregation for the player.
+
+Attack, defense and dexterity are the sum of the base stats, the bonuses of
+the equipped items and temporary modifiers such as buffs. StatEngine keeps
+that sum compiled into a tuple and rebuilds it only after an invalidation:
+an equipment change, a level-up, a base stat being set or a modifier being
+added or removed. Combat, the equipment UI and save code all read their
+numbers from it.
+"""
+
+from typing import Any, Dict, Hashable, Optional, Tuple
+from ..core.events import EventType, GameEvent
+
+# Aggregated stats, in the order of the compiled tuples
+STATS = ('attack', 'defense', 'dexterity')
+
+# Item attribute that contributes to each stat
+ITEM_STAT_ATTRIBUTES = {
+    'attack': 'attack_power',
+    'defense': 'defense',
+    'dexterity': 'dexterity'
+}
+
+# Events after which the stats have to be recompiled
+INVALIDATING_EVENTS = (EventType.EQUIPMENT_CHANGED, EventType.PLAYER_LEVEL_UP)
+
+
+class StatEngine:
+    """
+    Base + equipment + modifier stats, compiled once per change.
+
+    The engine subscribes to the bound ``Equipment`` so equipping anything
+    invalidates it; ``register_events`` also hooks it up to an
+    ``EventSystem``'s EQUIPMENT_CHANGED and PLAYER_LEVEL_UP events.
+    """
+
+    def __init__(self, equipment=None, **base: int):
+        """
+        Initialize the stat engine.
+
+        Args:
+            equipment: The ``Equipment`` whose items add to the stats
+            **base: Base value of each stat (missing stats start at 0)
+        """
+        self.base: Dict[str, int] = {stat: 0 for stat in STATS}
+        self.base.update(base)
+        self._modifiers: Dict[Hashable, Dict[str, int]] = {}
+        self._equipment = None
+        self._compiled: Optional[Tuple[Tuple[int, ...], Tuple[int, ...]]] = None
+        self.compile_count = 0
+        if equipment is not None:
+            self.bind_equipment(equipment)
+
+    def bind_equipment(self, equipment):
+        """Aggregate the items of ``equipment`` and follow its changes."""
+        if self._equipment is not None and hasattr(self._equipment, 'unsubscribe'):
+            self._equipment.unsubscribe(self._on_equipment_changed)
+        self._equipment = equipment
+        if equipment is not None and hasattr(equipment, 'subscribe'):
+            equipment.subscribe(self._on_equipment_changed)
+        self.invalidate()
+
+    def _on_equipment_changed(self, equipment, slot: str):
+        self.invalidate()
+
+    def register_events(self, event_system):
+        """Invalidate on the EQUIPMENT_CHANGED and PLAYER_LEVEL_UP events of an ``EventSystem``."""
+        for event_type in INVALIDATING_EVENTS:
+            event_system.register_handler(event_type, self.handle_event)
+
+    def unregister_events(self, event_system):
+        """Undo ``register_events``."""
+        for event_type in INVALIDATING_EVENTS:
+            event_system.unregister_handler(event_type, self.handle_event)
+
+    def handle_event(self, event: GameEvent):
+        """Event handler: any registered event invalidates the compiled stats."""
+        self.invalidate()
+
+    def invalidate(self):
+        """Drop the compiled stats; they are rebuilt on the next read."""
+        self._compiled = None
+
+    def set_base(self, stat: str, value: int):
+        """Set a base stat."""
+        if self.base.get(stat) != value:
+            self.base[stat] = value
+            self.invalidate()
+
+    def add_modifier(self, source: Hashable, **stats: int):
+        """
+        Add (or replace) a temporary modifier, e.g. a buff or debuff.
+
+        Args:
+            source: Key identifying the modifier, used to remove it again
+            **stats: Amount added to each stat (negative for debuffs)
+        """
+        self._modifiers[source] = stats
+        self.invalidate()
+
+    def remove_modifier(self, source: Hashable) -> bool:
+        """Remove a modifier. Returns True if it existed."""
+        if self._modifiers.pop(source, None) is None:
+            return False
+        self.invalidate()
+        return True
+
+    def _compile(self) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+        """Sum base, equipment and modifiers into (totals, equipment bonuses)."""
+        bonus = dict.fromkeys(STATS, 0)
+        slots = getattr(self._equipment, 'slots', None) or {}
+        for item in slots.values():
+            if item is None:
+                continue
+            for stat, attribute in ITEM_STAT_ATTRIBUTES.items():
+                bonus[stat] += getattr(item, attribute, 0) or 0
+
+        totals = dict(self.base)
+        for stat in STATS:
+            totals[stat] = totals.get(stat, 0) + bonus[stat]
+        for modifier in self._modifiers.values():
+            for stat, amount in modifier.items():
+                totals[stat] = totals.get(stat, 0) + amount
+
+        self._compiled = (tuple(totals[stat] for stat in STATS), tuple(bonus[stat] for stat in STATS))
+        self.compile_count += 1
+        return self._compiled
+
+    @property
+    def totals(self) -> Tuple[int, ...]:
+        """Final value of every stat, in ``STATS`` order."""
+        return (self._compiled or self._compile())[0]
+
+    @property
+    def equipment_bonus(self) -> Tuple[int, ...]:
+        """Bonus from equipped items for every stat, in ``STATS`` order."""
+        return (self._compiled or self._compile())[1]
+
+    @property
+    def attack(self) -> int:
+        return (self._compiled or self._compile())[0][0]
+
+    @property
+    def defense(self) -> int:
+        return (self._compiled or self._compile())[0][1]
+
+    @property
+    def dexterity(self) -> int:
+        return (self._compiled or self._compile())[0][2]
+
+    def get(self, stat: str) -> int:
+        """Final value of a stat."""
+        return self.totals[STATS.index(stat)]
+
+    def bonus(self, stat: str) -> int:
+        """Bonus from equipped items to a stat."""
+        return self.equipment_bonus[STATS.index(stat)]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Base and derived stats for serialization; only ``base`` is read back."""
+        return {
+            "base": dict(self.base),
+            "derived": dict(zip(STATS, self.totals))
+        }
+
+    def load_dict(self, data: Dict[str, Any]):
+        """Restore the base stats saved by ``to_dict``."""
+        for stat, value in data.get("base", {}).items():
+            self.set_base(stat, value)
@@ -1,7 +1,6 @@
 from rpg_modules.entities.monster import Monster, MonsterType
-import random
-import math
 import logging
+from rpg_modules.core.constants import TILE_SIZE
 
 def _spawn_initial_monsters(self):
     """Spawn initial monsters on the map."""
@@ -16,32 +15,23 @@ def _spawn_initial_monsters(self):
         MonsterType.DRAGON: 1
     }
     
+    # Sample spawn tiles from the walkable index instead of trying random
+    # tiles, so every requested monster gets a valid spot
+    walkable_index = self.game_map.get_walkable_index()
+    player_tile = (self.player.x / TILE_SIZE, self.player.y / TILE_SIZE)
+    
     for monster_type, count in initial_monsters.items():
         logging.log(f"\nSpawning {monster_type.name} monsters...")
+        min_distance = MONSTER_SPAWN_CONFIG[monster_type]['min_distance'] / TILE_SIZE
         for _ in range(count):
-            # Get random position
-            tile_x = random.randint(0, self.game_map.width - 1)
-            tile_y = random.randint(0, self.game_map.height - 1)
-            
-            # Convert to pixel coordinates
-            pixel_x = tile_x * TILE_SIZE
-            pixel_y = tile_y * TILE_SIZE
-            
-            # Check distance from player
-            dx = pixel_x - self.player.x
-            dy = pixel_y - self.player.y
-            distance = math.sqrt(dx * dx + dy * dy)
-            
-            if distance < MIN_SPAWN_DISTANCE:
-                logging.log(f"Skip: Too close to player at ({tile_x}, {tile_y})")
-                continue
-                
-            if not self.game_map.is_walkable(tile_x, tile_y):
-                logging.log(f"Skip: Non-walkable tile at ({tile_x}, {tile_y})")
-                continue
+            position = walkable_index.sample(near=player_tile, min_distance=min_distance)
+            if position is None:
+                logging.log(f"Skip: No walkable tile {min_distance:.1f} tiles from the player")
+                break
+            tile_x, tile_y = position
             
             # Create and add monster
-            monster = Monster(pixel_x, pixel_y, monster_type)
+            monster = Monster(tile_x * TILE_SIZE, tile_y * TILE_SIZE, monster_type)
             self.monsters.append(monster)
             logging.log(f"Spawned {monster_type.name} at ({tile_x}, {tile_y})")
 
@@ -6,6 +6,7 @@ from .base import Item, Equipment, Inventory
 from .equipment import Weapon, Armor, Hands
 from .consumable import Consumable
 from .generator import ItemGenerator
+from .templates import ItemTemplate, get_template
 
 __all__ = [
     'Item',
@@ -15,5 +16,7 @@ __all__ = [
     'Armor',
     'Hands',
     'Consumable',
-    'ItemGenerator'
+    'ItemGenerator',
+    'ItemTemplate',
+    'get_template'
 ] 
\ No newline at end of file
@@ -8,6 +8,8 @@ from .base import Item
 class Armor(Item):
     """Class representing armor that can be equipped."""
     
+    __slots__ = ('defense',)
+    
     def __init__(
         self,
         armor_type: str,
@@ -26,10 +28,13 @@ class Armor(Item):
             material: Material the armor is made from
             prefix: Special prefix that adds effects
         """
-        super().__init__(armor_type, quality, prefix)
-        self.armor_type = armor_type
+        super().__init__(armor_type, quality, prefix, item_type=armor_type, material=material)
         self.defense = defense
-        self.material = material
+        
+    @property
+    def armor_type(self) -> str:
+        """The type, shared with every item of the same template."""
+        return self.template.item_type
         
     @property
     def base_name(self) -> str:
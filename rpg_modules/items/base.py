@@ -2,14 +2,29 @@
 Base classes for items in the RPG game.
 """
 
+import copy
 import pygame
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, Callable, Iterable, Iterator, List, Tuple
 from ..core.constants import TILE_SIZE, GRAY, QUALITY_COLORS
+from .templates import get_template, get_item_sprite
 
 class Item:
-    """Base class for all items in the game."""
+    """
+    Base class for all items in the game.
     
-    def __init__(self, name: str, quality: str = "Common", prefix: Optional[str] = None, description: Optional[str] = None):
+    The description shared by every item of the same kind (name, type,
+    material, quality, prefix) lives in an interned ``ItemTemplate``; an item
+    instance only stores its template and the stats rolled for it.
+    """
+    
+    __slots__ = ('template', 'quantity', '_description')
+    
+    # How many of this item fit in one inventory slot
+    max_stack = 1
+    
+    def __init__(self, name: str, quality: str = "Common", prefix: Optional[str] = None,
+                 description: Optional[str] = None, item_type: Optional[str] = None,
+                 material: Optional[str] = None):
         """
         Initialize an item.
         
@@ -18,14 +33,43 @@ class Item:
             quality: The quality level of the item
             prefix: Optional prefix modifier for the item
             description: Optional description of the item
+            item_type: Weapon, armor or consumable type, if any
+            material: The material the item is made from, if any
         """
-        self.name = name
-        self.quality = quality
-        self.prefix = prefix
-        self.description = description or f"A {quality.lower() if quality else ''} {name.lower()}"
+        self.template = get_template(self.__class__.__name__, name, item_type, material, quality, prefix)
+        # Only a custom description is stored per item
+        self._description = description
+        
+        # Stack size when stored in an inventory
+        self.quantity = 1
         
-        # Load sprite based on item type and name
-        self.sprite = None  # Will be loaded by subclasses
+    @property
+    def name(self) -> str:
+        """The base name of the item."""
+        return self.template.name
+        
+    @property
+    def quality(self) -> str:
+        """The quality level of the item."""
+        return self.template.quality
+        
+    @property
+    def prefix(self) -> Optional[str]:
+        """The prefix modifier of the item, if any."""
+        return self.template.prefix
+        
+    @property
+    def material(self) -> Optional[str]:
+        """The material the item is made from, if any."""
+        return self.template.material
+        
+    @property
+    def description(self) -> str:
+        """The custom description, or one built from quality and name."""
+        if self._description:
+            return self._description
+        quality = self.quality
+        return f"A {quality.lower() if quality else ''} {self.name.lower()}"
         
     @property
     def display_name(self) -> str:
@@ -45,21 +89,20 @@ class Item:
         return QUALITY_COLORS.get(self.quality, GRAY)
         
     def get_equipment_sprite(self) -> pygame.Surface:
-        """Get the sprite for this item."""
-        if not self.sprite:
-            # Load sprite based on item type and name
-            sprite_path = f"assets/items/{self.__class__.__name__.lower()}/{self.name.lower()}.png"
-            try:
-                self.sprite = pygame.image.load(sprite_path)
-            except pygame.error:
-                # Create a default colored square if sprite not found
-                self.sprite = pygame.Surface((32, 32))
-                self.sprite.fill(self.quality_color)
-        return self.sprite
+        """Get the sprite for this item, shared by every item with the same template."""
+        return get_item_sprite(self.template, self.quality_color)
+        
+    def stack_key(self) -> Optional[Tuple]:
+        """Items with equal keys share an inventory stack; None if the item does not stack."""
+        if self.max_stack <= 1:
+            return None
+        return (self.template,)
         
     def get_stats_display(self) -> List[str]:
         """Get a list of stat strings to display in tooltips."""
         stats = []
+        if self.quantity > 1:
+            stats.append(f"Quantity: {self.quantity}")
         if self.quality != "Common":
             stats.append(f"Quality: {self.quality}")
         if self.prefix:
@@ -68,11 +111,14 @@ class Item:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert item to dictionary for serialization."""
-        return {
+        data = {
             "type": self.__class__.__name__,
             "quality": self.quality,
             "prefix": self.prefix
         }
+        if self.quantity != 1:
+            data["quantity"] = self.quantity
+        return data
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Item':
@@ -111,9 +157,8 @@ class Equipment(Item):
             prefix: Optional prefix modifier for the equipment
             description: Optional description of the equipment
         """
-        super().__init__(name, quality, prefix, description)
+        super().__init__(name, quality, prefix, description, material=material)
         self.slot = slot
-        self.material = material
         
     def get_stats_display(self) -> List[str]:
         """Get a list of stat strings to display in tooltips."""
@@ -124,93 +169,369 @@ class Equipment(Item):
         ])
         return stats 
 
+class EquipmentSlots(dict):
+    """Slot name -> item dict that reports every write to its ``Equipment``."""
+    
+    def __init__(self, owner: 'Equipment', slots: Dict[str, Optional[Item]]):
+        super().__init__(slots)
+        self._owner = owner
+        
+    def __setitem__(self, slot: str, item: Optional[Item]):
+        super().__setitem__(slot, item)
+        self._owner._notify(slot)
+        
+    def update(self, *args, **kwargs):
+        for slot, item in dict(*args, **kwargs).items():
+            self[slot] = item
+
+
 class Equipment:
-    """Class to manage equipped items."""
+    """
+    Class to manage equipped items.
+    
+    Every change to ``slots`` (through ``equip_item``, ``unequip_item`` or a
+    direct ``slots[name] = item``) increments ``version`` and calls the
+    listeners added with ``subscribe`` with ``(equipment, slot)``, so derived
+    stats can be cached until the equipment actually changes.
+    """
     def __init__(self):
-        self.slots = {
+        self._listeners: List[Callable[['Equipment', str], None]] = []
+        self.version = 0
+        self.slots = EquipmentSlots(self, {
             'head': None,
             'chest': None,
             'legs': None,
             'feet': None,
             'hands': None,
             'weapon': None
-        }
+        })
+        
+    def __contains__(self, slot: str) -> bool:
+        return slot in self.slots
+        
+    def __getitem__(self, slot: str) -> Optional[Item]:
+        return self.slots[slot]
+        
+    def __setitem__(self, slot: str, item: Optional[Item]):
+        self.slots[slot] = item
+        
+    def items(self):
+        """(slot, item) pairs, like ``dict.items``."""
+        return self.slots.items()
+        
+    def subscribe(self, listener: Callable[['Equipment', str], None]):
+        """Call ``listener(equipment, slot)`` after every change."""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+            
+    def unsubscribe(self, listener: Callable[['Equipment', str], None]):
+        """Stop calling a listener added with ``subscribe``."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+            
+    def _notify(self, slot: str):
+        self.version += 1
+        for listener in list(self._listeners):
+            listener(self, slot)
         
     def get_equipped_item(self, slot: str) -> Optional[Item]:
         """Get the item equipped in the given slot."""
         return self.slots.get(slot)
         
+    def slot_for(self, item: Item) -> Optional[str]:
+        """Get the slot an item is equipped in, or None if it is not equipment."""
+        if hasattr(item, 'weapon_type'):
+            return 'weapon'
+        if hasattr(item, 'armor_type'):
+            armor_type = item.armor_type.lower()
+            return armor_type if armor_type in self.slots else None
+        if getattr(item, 'is_hands', False):
+            return 'hands'
+        return None
+        
     def equip_item(self, item: Item) -> bool:
         """
         Equip an item in its appropriate slot.
         Returns True if successful, False if no appropriate slot.
         """
-        # Adding debug prints
-        print(f"DEBUG: Attempting to equip item: {item.display_name}")
-        print(f"DEBUG: Item type: {type(item).__name__}")
-        
-        slot = None
-        
-        # Check for Weapon type
-        if hasattr(item, 'weapon_type'):
-            slot = 'weapon'
-            print(f"DEBUG: Item identified as weapon, using slot '{slot}'")
-        # Check for armor type
-        elif hasattr(item, 'armor_type'):
-            armor_type = item.armor_type.lower()
-            if armor_type in self.slots:
-                slot = armor_type
-                print(f"DEBUG: Item identified as armor with type '{armor_type}', using slot '{slot}'")
-            else:
-                print(f"DEBUG: Armor type '{armor_type}' not found in available slots")
-        # Check for hands item
-        elif hasattr(item, 'is_hands') and getattr(item, 'is_hands'):
-            slot = 'hands'
-            print(f"DEBUG: Item identified as hands equipment, using slot '{slot}'")
-        else:
-            print(f"DEBUG: Could not determine appropriate slot for item {item.display_name}")
-            print(f"DEBUG: Available slots: {list(self.slots.keys())}")
-            print(f"DEBUG: Item attributes: {dir(item)}")
-            
-        if slot and slot in self.slots:
-            self.slots[slot] = item
-            print(f"DEBUG: Successfully equipped {item.display_name} in slot '{slot}'")
-            return True
+        slot = self.slot_for(item)
+        if slot is None:
+            print(f"Cannot equip {item.display_name}: no suitable slot")
+            return False
             
-        print(f"DEBUG: Failed to equip {item.display_name} - no suitable slot found")
-        return False
+        self.slots[slot] = item
+        return True
         
     def unequip_item(self, slot: str) -> Optional[Item]:
         """Unequip and return the item in the given slot."""
         if slot in self.slots:
             item = self.slots[slot]
-            self.slots[slot] = None
+            if item is not None:
+                self.slots[slot] = None
             return item
         return None
 
 class Inventory:
-    """Class to manage the player's inventory."""
+    """
+    Slot-based inventory with free-slot tracking and item stacks.
+
+    Free slots are kept in a bitset, so adding an item finds the lowest free
+    slot without scanning, and every stored item's slot is indexed by
+    identity. Stackable items (``max_stack > 1``) are merged into existing
+    stacks with the same ``stack_key`` first; the stack size is the stored
+    item's ``quantity``.
+
+    Listeners added with ``subscribe`` are called with ``(inventory,
+    changed_slots)`` after every change, and ``version`` counts the changes.
+    Slots can also be read and written by index (``inventory[i]``); writes go
+    through ``set_item_at`` so the indexes stay correct.
+    """
     def __init__(self, capacity: int = 40):  # Changed from 32 to 40 to match 5x8 grid
-        self.items = [None] * capacity
-        
+        self._items: List[Optional[Item]] = [None] * capacity
+        self._free = (1 << capacity) - 1  # Bit i set = slot i is empty
+        self._slot_of: Dict[int, int] = {}  # id(item) -> slot
+        self._stacks: Dict[Tuple, set] = {}  # stack key -> slots holding such a stack
+        self._listeners: List[Callable[['Inventory', List[int]], None]] = []
+        self.version = 0
+
+    @property
+    def items(self) -> List[Optional[Item]]:
+        """The slot list (one entry per slot, None when empty). Do not write to it directly."""
+        return self._items
+
+    @items.setter
+    def items(self, items: List[Optional[Item]]):
+        # Replace the contents in place so views holding the list stay valid
+        self._items[:] = list(items)
+        self._reindex()
+        self._notify(list(range(len(self._items))))
+
+    @property
+    def capacity(self) -> int:
+        return len(self._items)
+
+    @property
+    def free_count(self) -> int:
+        """Number of empty slots."""
+        return bin(self._free).count("1")
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Optional[Item]]:
+        return iter(self._items)
+
+    def __getitem__(self, index: int) -> Optional[Item]:
+        return self._items[index]
+
+    def __setitem__(self, index: int, item: Optional[Item]):
+        self.set_item_at(index, item)
+
+    def __contains__(self, item: Item) -> bool:
+        return id(item) in self._slot_of
+
+    def subscribe(self, listener: Callable[['Inventory', List[int]], None]):
+        """Call ``listener(inventory, changed_slots)`` after every change."""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[['Inventory', List[int]], None]):
+        """Stop calling a listener (no-op if it is not subscribed)."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def first_free_slot(self) -> Optional[int]:
+        """Index of the lowest empty slot, or None when the inventory is full."""
+        if not self._free:
+            return None
+        return (self._free & -self._free).bit_length() - 1
+
+    def slot_of(self, item: Item) -> Optional[int]:
+        """Slot holding this exact item object, or None."""
+        return self._slot_of.get(id(item))
+
     def add_item(self, item: Item) -> bool:
-        """Add an item to the first empty slot. Returns True if successful."""
-        for i in range(len(self.items)):
-            if self.items[i] is None:
-                self.items[i] = item
-                return True
-        return False
-        
-    def remove_item(self, item: Item) -> bool:
-        """Remove the first occurrence of an item. Returns True if successful."""
-        for i in range(len(self.items)):
-            if self.items[i] is item:
-                self.items[i] = None
-                return True
-        return False
-        
+        """
+        Add an item, topping up matching stacks before using the lowest empty slot.
+
+        Nothing is added unless all of the item's quantity fits. An item whose
+        whole quantity was merged into existing stacks is not stored itself
+        and is left with ``quantity == 0``; otherwise it holds the remainder
+        in its new slot.
+
+        Returns:
+            True if successful
+        """
+        changed: List[int] = []
+        if not self._add(item, changed):
+            return False
+        self._notify(changed)
+        return True
+
+    def add_items(self, items: Iterable[Item]) -> List[Item]:
+        """
+        Add several items (such as a loot drop) with a single change notification.
+
+        Returns:
+            The items that did not fit
+        """
+        changed: List[int] = []
+        leftovers = [item for item in items if item is not None and not self._add(item, changed)]
+        self._notify(changed)
+        return leftovers
+
+    def remove_item(self, item: Item, quantity: Optional[int] = None) -> bool:
+        """
+        Remove a stored item, or part of its stack.
+
+        Args:
+            item: The stored item object
+            quantity: How many to take off the stack (defaults to all of it)
+
+        Returns:
+            True if successful
+        """
+        changed: List[int] = []
+        if not self._remove(item, quantity, changed):
+            return False
+        self._notify(changed)
+        return True
+
+    def remove_items(self, items: Iterable[Item]) -> int:
+        """
+        Remove several stored items with a single change notification.
+
+        Returns:
+            How many of them were removed
+        """
+        changed: List[int] = []
+        removed = sum(1 for item in items if self._remove(item, None, changed))
+        self._notify(changed)
+        return removed
+
     def get_item_at(self, index: int) -> Optional[Item]:
         """Get the item at the given index."""
-        if 0 <= index < len(self.items):
-            return self.items[index]
-        return None 
\ No newline at end of file
+        if 0 <= index < len(self._items):
+            return self._items[index]
+        return None
+
+    def set_item_at(self, index: int, item: Optional[Item]) -> Optional[Item]:
+        """
+        Put an item in a specific slot (None empties it).
+
+        Returns:
+            The item previously in the slot
+        """
+        previous = self._items[index]
+        if previous is item:
+            return previous
+        if item is not None and id(item) in self._slot_of:
+            # Moving an item: free its old slot first
+            self._clear_slot(self._slot_of[id(item)])
+        if previous is not None:
+            self._clear_slot(index)
+        if item is not None:
+            self._fill_slot(index, item)
+        self._notify([index])
+        return previous
+
+    def clear(self):
+        """Empty every slot."""
+        self.items = [None] * len(self._items)
+
+    def _add(self, item: Item, changed: List[int]) -> bool:
+        """Add one item without notifying."""
+        if id(item) in self._slot_of:
+            return False
+        key = item.stack_key()
+        quantity = item.quantity
+        if key is None:
+            slot = self.first_free_slot()
+            if slot is None:
+                return False
+            self._fill_slot(slot, item)
+            changed.append(slot)
+            return True
+
+        stack_slots = sorted(self._stacks.get(key, ()))
+        room = sum(item.max_stack - self._items[slot].quantity for slot in stack_slots)
+        if quantity > room + self.free_count * item.max_stack:
+            return False
+
+        for slot in stack_slots:
+            if quantity == 0:
+                break
+            stack = self._items[slot]
+            moved = min(quantity, item.max_stack - stack.quantity)
+            if moved:
+                stack.quantity += moved
+                quantity -= moved
+                changed.append(slot)
+        if quantity:
+            # The item itself becomes the new stack; extra full stacks are split off
+            while quantity > item.max_stack:
+                split = copy.copy(item)
+                split.quantity = item.max_stack
+                slot = self.first_free_slot()
+                self._fill_slot(slot, split)
+                changed.append(slot)
+                quantity -= item.max_stack
+            item.quantity = quantity
+            slot = self.first_free_slot()
+            self._fill_slot(slot, item)
+            changed.append(slot)
+        else:
+            item.quantity = 0  # Fully merged into existing stacks
+        return True
+
+    def _remove(self, item: Item, quantity: Optional[int], changed: List[int]) -> bool:
+        """Remove one item (or part of its stack) without notifying."""
+        slot = self._slot_of.get(id(item))
+        if slot is None:
+            return False
+        if quantity is not None and 0 < quantity < item.quantity:
+            item.quantity -= quantity
+        else:
+            self._clear_slot(slot)
+        changed.append(slot)
+        return True
+
+    def _fill_slot(self, slot: int, item: Item):
+        self._items[slot] = item
+        self._free &= ~(1 << slot)
+        self._slot_of[id(item)] = slot
+        key = item.stack_key()
+        if key is not None:
+            self._stacks.setdefault(key, set()).add(slot)
+
+    def _clear_slot(self, slot: int):
+        item = self._items[slot]
+        self._items[slot] = None
+        self._free |= 1 << slot
+        self._slot_of.pop(id(item), None)
+        key = item.stack_key()
+        if key is not None:
+            slots = self._stacks.get(key)
+            if slots:
+                slots.discard(slot)
+                if not slots:
+                    del self._stacks[key]
+
+    def _reindex(self):
+        """Rebuild the free bitset and lookup tables from the slot list."""
+        self._free = 0
+        self._slot_of = {}
+        self._stacks = {}
+        for slot, item in enumerate(self._items):
+            if item is None:
+                self._free |= 1 << slot
+            else:
+                self._items[slot] = None
+                self._fill_slot(slot, item)
+
+    def _notify(self, changed: List[int]):
+        if not changed:
+            return
+        self.version += 1
+        for listener in list(self._listeners):
+            listener(self, changed)
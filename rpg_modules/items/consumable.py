@@ -2,12 +2,17 @@
 Consumable item class for RPG games.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 from .base import Item
 
 class Consumable(Item):
     """Class representing consumable items like potions."""
     
+    __slots__ = ('effect_value',)
+    
+    # Identical potions share an inventory slot
+    max_stack = 20
+    
     def __init__(
         self,
         consumable_type: str,
@@ -26,15 +31,23 @@ class Consumable(Item):
         """
         # Use the type as part of the name
         name = f"{consumable_type.capitalize()} Potion"
-        super().__init__(name, quality, prefix)  # Consumables don't have materials
-        self.consumable_type = consumable_type
+        super().__init__(name, quality, prefix, item_type=consumable_type)  # Consumables don't have materials
         self.effect_value = effect_value
         
+    @property
+    def consumable_type(self) -> str:
+        """The type, shared with every item of the same template."""
+        return self.template.item_type
+        
     @property
     def base_name(self) -> str:
         """Get the base name of the consumable."""
         return f"{self.consumable_type.capitalize()} Potion"
         
+    def stack_key(self) -> Optional[Tuple]:
+        """Potions stack when type, strength, quality and prefix all match."""
+        return (self.template, self.effect_value)
+        
     def get_stats_display(self) -> List[str]:
         """Get a list of stat strings to display in tooltips."""
         stats = super().get_stats_display()
@@ -56,9 +69,11 @@ class Consumable(Item):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Consumable':
         """Create a consumable from dictionary data."""
-        return cls(
+        consumable = cls(
             consumable_type=data["consumable_type"],
             effect_value=data["effect_value"],
             quality=data["quality"],
             prefix=data.get("prefix")
-        ) 
\ No newline at end of file
+        )
+        consumable.quantity = data.get("quantity", 1)
+        return consumable 
\ No newline at end of file
@@ -8,6 +8,8 @@ from .base import Item
 class Hands(Item):
     """Class representing gauntlets that can be equipped."""
     
+    __slots__ = ('defense', 'dexterity')
+    
     def __init__(
         self,
         defense: int,
@@ -26,10 +28,9 @@ class Hands(Item):
             material: Material the gauntlets are made from
             prefix: Special prefix that adds effects
         """
-        super().__init__("Gauntlets", quality, prefix)
+        super().__init__("Gauntlets", quality, prefix, material=material)
         self.defense = defense
         self.dexterity = dexterity
-        self.material = material
         
     @property
     def is_hands(self) -> bool:
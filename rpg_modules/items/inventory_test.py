@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Test module for the inventory.
+This file tests stacking, slot bookkeeping and change notifications of Inventory.
+"""
+
+import os
+import sys
+import unittest
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from rpg_modules.items.base import Inventory
+from rpg_modules.items.consumable import Consumable
+from rpg_modules.items.weapon import Weapon
+
+
+def potions(quantity, effect_value=25):
+    """A stack of health potions."""
+    potion = Consumable("health", effect_value, "Common")
+    potion.quantity = quantity
+    return potion
+
+
+class TestInventory(unittest.TestCase):
+    """Test cases for Inventory."""
+
+    def setUp(self):
+        self.inventory = Inventory(capacity=4)
+        self.notifications = []
+        self.inventory.subscribe(lambda inventory, slots: self.notifications.append(list(slots)))
+
+    def test_stacks_merge(self):
+        first = potions(5)
+        second = potions(7)
+        self.assertTrue(self.inventory.add_item(first))
+        self.assertTrue(self.inventory.add_item(second))
+
+        self.assertEqual(first.quantity, 12)
+        self.assertEqual(second.quantity, 0)
+        self.assertNotIn(second, self.inventory)
+        self.assertEqual(self.inventory.free_count, 3)
+
+    def test_different_potions_do_not_merge(self):
+        self.inventory.add_item(potions(5, effect_value=25))
+        self.inventory.add_item(potions(5, effect_value=50))
+        self.assertEqual(self.inventory.free_count, 2)
+
+    def test_overfull_stack_is_split(self):
+        big = potions(45)
+        self.assertTrue(self.inventory.add_item(big))
+
+        stacks = [item for item in self.inventory if item is not None]
+        self.assertEqual([stack.quantity for stack in stacks], [20, 20, 5])
+        self.assertIs(self.inventory[2], big)
+        self.assertEqual(self.notifications, [[0, 1, 2]])
+
+    def test_merge_tops_up_then_uses_new_slot(self):
+        first = potions(18)
+        self.inventory.add_item(first)
+        second = potions(5)
+        self.inventory.add_item(second)
+
+        self.assertEqual(first.quantity, 20)
+        self.assertIs(self.inventory[1], second)
+        self.assertEqual(second.quantity, 3)
+        self.assertEqual(self.notifications[-1], [0, 1])
+
+    def test_overflow_adds_nothing(self):
+        self.inventory.add_item(potions(15))
+        for _ in range(3):
+            self.inventory.add_item(Weapon("Sword", 10, "Common", "Iron"))
+        version = self.inventory.version
+
+        too_many = potions(6)
+        self.assertFalse(self.inventory.add_item(too_many))
+        self.assertEqual(self.inventory[0].quantity, 15)
+        self.assertEqual(too_many.quantity, 6)
+        self.assertNotIn(too_many, self.inventory)
+        self.assertEqual(self.inventory.version, version)
+
+        self.assertTrue(self.inventory.add_item(potions(5)))
+        self.assertEqual(self.inventory[0].quantity, 20)
+
+    def test_add_items_returns_leftovers(self):
+        swords = [Weapon("Sword", 10, "Common", "Iron") for _ in range(5)]
+        leftovers = self.inventory.add_items(swords)
+        self.assertEqual(leftovers, swords[4:])
+        self.assertEqual(self.notifications, [[0, 1, 2, 3]])
+
+    def test_partial_remove_keeps_the_stack(self):
+        stack = potions(10)
+        self.inventory.add_item(stack)
+
+        self.assertTrue(self.inventory.remove_item(stack, 4))
+        self.assertEqual(stack.quantity, 6)
+        self.assertIs(self.inventory[0], stack)
+
+        self.assertTrue(self.inventory.remove_item(stack, 6))
+        self.assertIsNone(self.inventory[0])
+        self.assertEqual(self.inventory.free_count, 4)
+        self.assertEqual(self.notifications[-2:], [[0], [0]])
+
+    def test_removed_stack_is_not_merged_into(self):
+        stack = potions(10)
+        self.inventory.add_item(stack)
+        self.inventory.remove_item(stack)
+
+        fresh = potions(3)
+        self.inventory.add_item(fresh)
+        self.assertEqual(stack.quantity, 10)
+        self.assertIs(self.inventory[0], fresh)
+
+    def test_remove_unknown_item_fails(self):
+        self.assertFalse(self.inventory.remove_item(potions(1)))
+        self.assertEqual(self.notifications, [])
+
+    def test_items_setter_reindexes(self):
+        sword = Weapon("Sword", 10, "Common", "Iron")
+        stack = potions(10)
+        self.inventory.add_item(Weapon("Axe", 12, "Common", "Iron"))
+        self.inventory.items = [None, sword, None, stack]
+
+        self.assertEqual(self.inventory.slot_of(sword), 1)
+        self.assertEqual(self.inventory.slot_of(stack), 3)
+        self.assertEqual(self.inventory.first_free_slot(), 0)
+        self.assertEqual(self.inventory.free_count, 2)
+        self.assertEqual(self.notifications[-1], [0, 1, 2, 3])
+
+        # New potions merge into the stack found by the reindex
+        self.inventory.add_item(potions(5))
+        self.assertEqual(stack.quantity, 15)
+        self.assertEqual(self.inventory.free_count, 2)
+
+    def test_set_item_at_moves_items(self):
+        sword = Weapon("Sword", 10, "Common", "Iron")
+        self.inventory.add_item(sword)
+        self.inventory[2] = sword
+
+        self.assertIsNone(self.inventory[0])
+        self.assertEqual(self.inventory.slot_of(sword), 2)
+        self.assertEqual(self.inventory.first_free_slot(), 0)
+
+    def test_unsubscribed_listener_is_not_called(self):
+        calls = []
+        listener = lambda inventory, slots: calls.append(slots)
+        self.inventory.subscribe(listener)
+        self.inventory.unsubscribe(listener)
+        self.inventory.add_item(potions(1))
+        self.assertEqual(calls, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+Flyweight item templates and the shared item sprite cache.
+
+An item is split into its template, the immutable description shared by
+every item of the same kind (class, base type, material, quality, prefix),
+and the stats rolled for that one instance. Templates are interned, so a
+vendor stock or loot table of a thousand swords holds a handful of
+templates, and item sprites are loaded once per template instead of once per
+item.
+"""
+
+import sys
+import pygame
+from typing import Dict, NamedTuple, Optional, Tuple
+
+
+class ItemTemplate(NamedTuple):
+    """The shared, immutable part of an item."""
+    kind: str                  # Item class name, e.g. 'Weapon'
+    name: str                  # Base name, e.g. 'Sword' or 'Health Potion'
+    item_type: Optional[str]   # Weapon, armor or consumable type
+    material: Optional[str]
+    quality: str
+    prefix: Optional[str]
+
+    @property
+    def sprite_path(self) -> str:
+        """Where the item's sprite is looked for."""
+        return f"assets/items/{self.kind.lower()}/{self.name.lower()}.png"
+
+
+# Interned templates by field values
+_templates: Dict[Tuple, ItemTemplate] = {}
+
+# Item sprites by template, and the loaded image files they come from
+_sprite_cache: Dict[ItemTemplate, pygame.Surface] = {}
+_sprite_files: Dict[str, Optional[pygame.Surface]] = {}
+
+
+def get_template(kind: str, name: str, item_type: Optional[str] = None, material: Optional[str] = None,
+                 quality: str = "Common", prefix: Optional[str] = None) -> ItemTemplate:
+    """
+    Get the shared template for an item description, creating it on first use.
+
+    Returns:
+        The same ItemTemplate object for equal arguments
+    """
+    key = (kind, name, item_type, material, quality, prefix)
+    template = _templates.get(key)
+    if template is None:
+        template = ItemTemplate(*(sys.intern(value) if isinstance(value, str) else value for value in key))
+        _templates[key] = template
+    return template
+
+
+def template_count() -> int:
+    """Number of distinct templates created so far."""
+    return len(_templates)
+
+
+def get_item_sprite(template: ItemTemplate, fallback_color: Tuple[int, int, int]) -> pygame.Surface:
+    """
+    Get the sprite shared by every item with this template.
+
+    The image file is loaded once (and converted to the display format when
+    a display exists); items without a sprite file get a square in the
+    fallback color.
+
+    Args:
+        template: The item's template
+        fallback_color: Fill color used when the sprite file is missing
+    """
+    sprite = _sprite_cache.get(template)
+    if sprite is not None:
+        return sprite
+
+    path = template.sprite_path
+    if path not in _sprite_files:
+        try:
+            image = pygame.image.load(path)
+            try:
+                image = image.convert_alpha()
+            except pygame.error:
+                pass  # No display yet, keep the decoded surface
+        except (pygame.error, OSError):
+            image = None
+        _sprite_files[path] = image
+
+    sprite = _sprite_files[path]
+    if sprite is None:
+        # Create a default colored square if sprite not found
+        sprite = pygame.Surface((32, 32))
+        sprite.fill(fallback_color)
+    _sprite_cache[template] = sprite
+    return sprite
+
+
+def clear_sprite_cache():
+    """Forget every cached item sprite (e.g. after the display mode changed)."""
+    _sprite_cache.clear()
+    _sprite_files.clear()
@@ -8,6 +8,8 @@ from .base import Item
 class Weapon(Item):
     """Class representing weapons that can be equipped."""
     
+    __slots__ = ('attack_power',)
+    
     def __init__(
         self,
         weapon_type: str,
@@ -26,10 +28,13 @@ class Weapon(Item):
             material: Material the weapon is made from
             prefix: Special prefix that adds effects
         """
-        super().__init__(weapon_type, quality, prefix)
-        self.weapon_type = weapon_type
+        super().__init__(weapon_type, quality, prefix, item_type=weapon_type, material=material)
         self.attack_power = attack_power
-        self.material = material
+        
+    @property
+    def weapon_type(self) -> str:
+        """The type, shared with every item of the same template."""
+        return self.template.item_type
         
     @property
     def base_name(self) -> str:
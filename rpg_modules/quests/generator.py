@@ -226,38 +226,15 @@ class QuestGenerator:
     
     def _get_valid_location(self, radius: int) -> Tuple[int, int]:
         """Get a valid location for a quest objective."""
-        max_attempts = 1000  # Maximum number of attempts to find a valid location
-        attempts = 0
+        walkable_index = self.game_map.get_walkable_index()
         
-        while attempts < max_attempts:
-            x = random.randint(radius + 1, self.game_map.width - radius - 2)
-            y = random.randint(radius + 1, self.game_map.height - radius - 2)
-            
-            # First check if the center point is walkable
-            if not self.game_map.is_walkable(x, y):
-                attempts += 1
-                continue
-            
-            # Then check the surrounding area
-            valid = True
-            for dx in range(-radius, radius + 1):
-                for dy in range(-radius, radius + 1):
-                    if not self.game_map.is_valid_position(x + dx, y + dy):
-                        valid = False
-                        break
-                if not valid:
-                    break
-                    
-            if valid:
-                return (x, y)
-                
-            attempts += 1
-            
-        # If we couldn't find a perfect spot, try to find any walkable spot
-        for x in range(1, self.game_map.width - 1):
-            for y in range(1, self.game_map.height - 1):
-                if self.game_map.is_walkable(x, y):
-                    return (x, y)
+        # A clearance of radius + 1 means the whole area around the spot is walkable
+        location = walkable_index.sample(min_clearance=radius + 1)
+        if location is None:
+            # If we couldn't find a perfect spot, take any walkable spot
+            location = walkable_index.sample()
+        if location is not None:
+            return location
                     
         # If all else fails, return a position near the center of the map
         return (self.game_map.width // 2, self.game_map.height // 2)
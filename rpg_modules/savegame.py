@@ -180,6 +180,10 @@ def save_game(game_state):
             'attack_type': getattr(game_state.player, 'attack_type', 1),
             'xp': getattr(game_state.player, 'xp', getattr(game_state.player, 'experience', 0)),
             'level': game_state.player.level,
+            'attack': getattr(game_state.player, 'attack', 0),
+            'defense': getattr(game_state.player, 'defense', 0),
+            'dexterity': getattr(game_state.player, 'dexterity', 0),
+            'stats': game_state.player.stats.to_dict() if hasattr(game_state.player, 'stats') else {},
             'inventory': [item.to_dict() if item is not None else None for item in game_state.player.inventory.items],
             'equipment': {slot: item.to_dict() for slot, item in game_state.player.equipment.slots.items() if item is not None}
         },
@@ -189,6 +193,11 @@ def save_game(game_state):
         }
     }
     
+    # The dungeon is rebuilt from the seed in its state, so each save keeps its own dungeon
+    dungeon_handler = getattr(game_state, 'dungeon_handler', None)
+    if dungeon_handler:
+        save_data['dungeon'] = dungeon_handler.save_state()
+    
     # Create save directory if it doesn't exist
     os.makedirs('save', exist_ok=True)
     
@@ -282,6 +291,8 @@ def _process_save_file(game_state, save_filename):
             game_state.player.max_stamina = player_data.get('max_stamina', getattr(game_state.player, 'max_stamina', 0))
         if hasattr(game_state.player, 'attack_type'):
             game_state.player.attack_type = player_data.get('attack_type', getattr(game_state.player, 'attack_type', 1))
+        if hasattr(game_state.player, 'attack'):
+            game_state.player.attack = player_data.get('attack', getattr(game_state.player, 'attack', 0))
         if hasattr(game_state.player, 'base_attack'):
             game_state.player.base_attack = player_data.get('base_attack', getattr(game_state.player, 'base_attack', 0))
         if hasattr(game_state.player, 'defense'):
@@ -290,21 +301,25 @@ def _process_save_file(game_state, save_filename):
             game_state.player.dexterity = player_data.get('dexterity', getattr(game_state.player, 'dexterity', 0))
         print("Player data applied.")
         
-        # Reset inventory with proper capacity
-        inventory_capacity = len(game_state.player.inventory.items)
-        game_state.player.inventory.items = [None] * inventory_capacity
-        print(f"Reset inventory with capacity {inventory_capacity}.")
+        # Restore the saved dungeon and its puzzle state; a save from before
+        # the dungeon was entered must not keep another save's dungeon
+        dungeon_handler = getattr(game_state, 'dungeon_handler', None)
+        if dungeon_handler:
+            if save_data.get('dungeon'):
+                dungeon_handler.load_state(save_data['dungeon'])
+            else:
+                dungeon_handler.current_dungeon = None
         
-        # Load inventory items
-        for i, item_data in enumerate(player_data.get('inventory', [])):
+        # Rebuild the inventory slot by slot, keeping the exact item positions
+        # from the save file; assigning the whole list notifies the UI once
+        inventory = game_state.player.inventory
+        inventory_capacity = len(inventory.items)
+        slots = [None] * inventory_capacity
+        for i, item_data in enumerate(player_data.get('inventory', [])[:inventory_capacity]):
             if item_data:  # Only process non-None items
-                item = create_item_from_data(item_data)
-                if item:
-                    # Add directly to inventory slot instead of using add_item
-                    # This preserves the exact item positions from the save file
-                    if i < inventory_capacity:
-                        game_state.player.inventory.items[i] = item
-        print(f"Loaded {sum(1 for item in game_state.player.inventory.items if item is not None)} items into inventory.")
+                slots[i] = create_item_from_data(item_data)
+        inventory.items = slots
+        print(f"Loaded {inventory_capacity - inventory.free_count} items into inventory.")
         
         # Clear current equipment
         for slot in game_state.player.equipment.slots:
@@ -341,6 +356,8 @@ def _process_save_file(game_state, save_filename):
         # Reset death locations
         if hasattr(game_state, 'recent_death_locations'):
             game_state.recent_death_locations = []
+        if hasattr(game_state, 'monster_spawner'):
+            game_state.monster_spawner.clear_monsters()
         
         # Spawn new monsters appropriate for the player's level
         if hasattr(game_state, '_spawn_initial_monsters'):
@@ -432,9 +449,11 @@ def create_item_from_data(item_data):
                 prefix=item_data.get('prefix', None)
             )
     elif item_data.get('consumable_type'):
-        return Consumable(
+        consumable = Consumable(
             consumable_type=item_data.get('consumable_type', 'health'),
             effect_value=item_data.get('effect_value', 20),
             quality=quality
         )
+        consumable.quantity = item_data.get('quantity', 1)
+        return consumable
     return None 
\ No newline at end of file
@@ -10,8 +10,9 @@ from ..utils.colors import *
 from ..utils.fonts import get_font
 from ..utils.ui import draw_text, draw_rect_with_border
 from ..core.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from .retained import RetainedPanel
 
-class DialogUI:
+class DialogUI(RetainedPanel):
     """UI component for displaying and managing NPC dialog interactions."""
     
     # Constants for UI layout
@@ -60,6 +61,9 @@ class DialogUI:
         # Loaded dialog data
         self.dialogs = {}
         
+        # Cached panel surface, re-rendered only when the dialog node or hover changes
+        self._init_retained_panel(pygame.Rect(self.x, self.y, self.PANEL_WIDTH, self.PANEL_HEIGHT))
+        
     def load_dialog(self, dialog_id: str) -> bool:
         """Load a dialog by ID from data files."""
         dialog_path = os.path.join("data", "quests", "dialogs")
@@ -211,38 +215,55 @@ class DialogUI:
         
         return False
     
-    def draw(self):
+    def get_panel_state(self):
+        """Snapshot of the displayed dialog state, used to invalidate the cached panel."""
+        return (
+            id(self.current_dialog),
+            self.current_node_id,
+            self.npc_name,
+            self.npc_title,
+            id(self.portrait),
+            self.hovered_choice,
+            self.selected_choice
+        )
+    
+    def draw(self, screen: Optional[pygame.Surface] = None):
         """Draw the dialog UI."""
         if not self.visible:
             return
             
+        self.panel_rect.topleft = (self.x, self.y)
+        self.blit_panel(screen or self.screen)
+    
+    def _render_panel(self, surface: pygame.Surface):
+        """Render the dialog panel in panel-local coordinates."""
         # Draw dialog panel background
-        dialog_rect = pygame.Rect(self.x, self.y, self.PANEL_WIDTH, self.PANEL_HEIGHT)
-        draw_rect_with_border(self.screen, dialog_rect, DARK_GRAY, WHITE, 2)
+        dialog_rect = surface.get_rect()
+        draw_rect_with_border(surface, dialog_rect, DARK_GRAY, WHITE, 2)
         
         # Draw NPC portrait area (left side)
         portrait_rect = pygame.Rect(
-            self.x + self.PADDING, 
-            self.y + self.PADDING,
+            self.PADDING, 
+            self.PADDING,
             self.PORTRAIT_SIZE,
             self.PORTRAIT_SIZE
         )
-        draw_rect_with_border(self.screen, portrait_rect, BLACK, WHITE, 1)
+        draw_rect_with_border(surface, portrait_rect, BLACK, WHITE, 1)
         
         # If we have a portrait image, draw it
         if self.portrait:
-            self.screen.blit(self.portrait, portrait_rect)
+            surface.blit(self.portrait, portrait_rect)
         else:
             # Draw placeholder silhouette
             pygame.draw.circle(
-                self.screen, 
+                surface, 
                 GRAY, 
                 (portrait_rect.centerx, portrait_rect.centery - 15),
                 40  # Head radius
             )
             # Body
             pygame.draw.rect(
-                self.screen,
+                surface,
                 GRAY,
                 pygame.Rect(
                     portrait_rect.centerx - 30,
@@ -254,10 +275,10 @@ class DialogUI:
             )
         
         # Draw NPC name and title
-        name_x = self.x + self.PADDING
-        name_y = self.y + self.PADDING + self.PORTRAIT_SIZE + 10
+        name_x = self.PADDING
+        name_y = self.PADDING + self.PORTRAIT_SIZE + 10
         draw_text(
-            self.screen,
+            surface,
             self.npc_name,
             self.title_font,
             WHITE,
@@ -269,7 +290,7 @@ class DialogUI:
         if self.npc_title:
             title_y = name_y + self.title_font.get_height() + 5
             draw_text(
-                self.screen,
+                surface,
                 self.npc_title,
                 self.font,
                 LIGHT_GRAY,
@@ -279,13 +300,13 @@ class DialogUI:
             )
         
         # Draw dialog text
-        text_x = self.x + self.PORTRAIT_SIZE + self.PADDING * 2
-        text_y = self.y + self.PADDING
+        text_x = self.PORTRAIT_SIZE + self.PADDING * 2
+        text_y = self.PADDING
         text_width = self.PANEL_WIDTH - self.PORTRAIT_SIZE - self.PADDING * 3
         
         for i, line in enumerate(self.dialog_text):
             draw_text(
-                self.screen,
+                surface,
                 line,
                 self.font,
                 WHITE,
@@ -297,17 +318,15 @@ class DialogUI:
         
         # Draw choices if available
         if self.choices:
-            self._draw_choices()
+            self._draw_choices(surface)
     
-    def _draw_choices(self):
-        """Draw dialog choices."""
+    def _draw_choices(self, surface: pygame.Surface):
+        """Draw dialog choices (panel-local)."""
         if not self.choices:
             return
-            
-        start_y = self.y + self.PANEL_HEIGHT - self.PADDING - len(self.choices) * (self.CHOICE_HEIGHT + self.CHOICE_SPACING)
         
         for i, choice in enumerate(self.choices):
-            choice_rect = self._get_choice_rect(i)
+            choice_rect = self._get_choice_rect(i).move(-self.x, -self.y)
             
             # Determine background color based on hover/selection state
             bg_color = DARK_GRAY
@@ -317,12 +336,12 @@ class DialogUI:
                 bg_color = GRAY
                 
             # Draw choice background
-            draw_rect_with_border(self.screen, choice_rect, bg_color, WHITE, 1)
+            draw_rect_with_border(surface, choice_rect, bg_color, WHITE, 1)
             
             # Draw choice text
             text = choice.get("text", "")
             draw_text(
-                self.screen,
+                surface,
                 text,
                 self.choice_font,
                 WHITE,
@@ -9,8 +9,11 @@ from ..core.constants import (
     FONT_SIZES, SCREEN_WIDTH, SCREEN_HEIGHT
 )
 from ..items import Item
+from ..entities.stats import STATS
+from .retained import RetainedPanel
+from .grid import SlotMap, HoverTimer
 
-class EquipmentUI:
+class EquipmentUI(RetainedPanel):
     """A reusable equipment UI component for pygame games."""
     
     def __init__(
@@ -46,12 +49,21 @@ class EquipmentUI:
         
         # Initialize tooltip
         self.hovered_item = None
-        self.hover_timer = 0
+        self.hover_timer = HoverTimer()
         self.tooltip_visible = False
         self.tooltip_rect = pygame.Rect(0, 0, UI_DIMENSIONS['tooltip_width'], UI_DIMENSIONS['tooltip_height'])
         
         # Create equipment slots in a cross pattern
-        slot_size = 40
+        self.slot_size = 40
+        self._layout_slots()
+        
+        # Cached panel and tooltip surfaces
+        self._init_retained_panel(self.rect)
+        self._tooltip_cache = None
+        
+    def _layout_slots(self):
+        """Position the equipment slots in a cross pattern for the current UI position."""
+        slot_size = self.slot_size
         center_x = self.x + self.width // 2 - slot_size // 2
         center_y = self.y + 100  # Center position for the cross
 
@@ -69,6 +81,11 @@ class EquipmentUI:
             # Bottom-right position (feet)
             'feet': pygame.Rect(center_x + slot_size//2 + 5, center_y + slot_size + 10, slot_size, slot_size)
         }
+        self.slot_map = SlotMap(self.slots)
+        
+    def get_slot_at_pos(self, pos) -> Optional[str]:
+        """Get the name of the equipment slot at the given position."""
+        return self.slot_map.slot_at(pos)
         
     def set_player(self, player):
         """Set the player reference for stat calculations."""
@@ -79,50 +96,52 @@ class EquipmentUI:
         self.visible = not self.visible
         if not self.visible:
             self.hovered_item = None
+            self.hover_timer.reset()
             self.tooltip_visible = False
             
+    def get_panel_state(self):
+        """Snapshot of equipped items and displayed stats, used to invalidate the cached panel."""
+        equipped = tuple(id(self.equipment.get(slot)) for slot in self.slots)
+        if not self.player:
+            return (equipped, None)
+        return (equipped, id(self.player), self.player.stats.totals)
+        
     def draw(self, screen: pygame.Surface):
         """Draw the equipment UI."""
         if not self.visible:
             return
         
-        # Update rect position based on current x,y
-        self.rect.topleft = (self.x, self.y)
+        # Update rect and slot positions if the UI has been moved
+        if self.rect.topleft != (self.x, self.y):
+            self.rect.topleft = (self.x, self.y)
+            self._layout_slots()
+            
+        self.blit_panel(screen)
         
-        # Recalculate slot positions based on new UI position
-        slot_size = 40
-        center_x = self.x + self.width // 2 - slot_size // 2
-        center_y = self.y + 100  # Center position for the cross
-
-        self.slots = {
-            # Top position (head)
-            'head': pygame.Rect(center_x, center_y - slot_size - 10, slot_size, slot_size),
-            # Left position (weapon)
-            'weapon': pygame.Rect(center_x - slot_size - 10, center_y, slot_size, slot_size),
-            # Center position (chest)
-            'chest': pygame.Rect(center_x, center_y, slot_size, slot_size),
-            # Right position (hands)
-            'hands': pygame.Rect(center_x + slot_size + 10, center_y, slot_size, slot_size),
-            # Bottom-left position (legs)
-            'legs': pygame.Rect(center_x - slot_size//2 - 5, center_y + slot_size + 10, slot_size, slot_size),
-            # Bottom-right position (feet)
-            'feet': pygame.Rect(center_x + slot_size//2 + 5, center_y + slot_size + 10, slot_size, slot_size)
-        }
+        # Draw tooltip if needed
+        if self.tooltip_visible and self.hovered_item:
+            self.draw_tooltip(screen)
             
+    def _render_panel(self, surface: pygame.Surface):
+        """Render the equipment panel in panel-local coordinates."""
+        panel = surface.get_rect()
+        
         # Draw main panel
-        pygame.draw.rect(screen, UI_COLORS['background'], self.rect)
-        pygame.draw.rect(screen, UI_COLORS['border'], self.rect, 2)
+        pygame.draw.rect(surface, UI_COLORS['background'], panel)
+        pygame.draw.rect(surface, UI_COLORS['border'], panel, 2)
         
         # Draw title
         title = self.font.render("Equipment", True, UI_COLORS['text'])
-        title_x = self.x + (self.width - title.get_width()) // 2
-        screen.blit(title, (title_x, self.y + 10))
+        title_x = (self.width - title.get_width()) // 2
+        surface.blit(title, (title_x, 10))
         
         # Draw equipment slots
-        for slot_name, slot_rect in self.slots.items():
+        for slot_name, screen_rect in self.slots.items():
+            slot_rect = screen_rect.move(-self.x, -self.y)
+            
             # Draw slot background
-            pygame.draw.rect(screen, UI_COLORS['cell_background'], slot_rect)
-            pygame.draw.rect(screen, UI_COLORS['border'], slot_rect, 1)
+            pygame.draw.rect(surface, UI_COLORS['cell_background'], slot_rect)
+            pygame.draw.rect(surface, UI_COLORS['border'], slot_rect, 1)
             
             # Draw slot label based on position
             label = self.small_font.render(slot_name.capitalize(), True, UI_COLORS['text'])
@@ -149,7 +168,7 @@ class EquipmentUI:
                 label_x = slot_rect.x + (slot_rect.width - label.get_width()) // 2
                 label_y = slot_rect.y + slot_rect.height + 5
                 
-            screen.blit(label, (label_x, label_y))
+            surface.blit(label, (label_x, label_y))
             
             # Draw equipped item if present
             if slot_name in self.equipment and self.equipment[slot_name]:
@@ -175,96 +194,43 @@ class EquipmentUI:
                         pygame.draw.polygon(sprite, (180, 180, 180), [(32, 10), (54, 32), (32, 54), (10, 32)])
                 
                 # Scale sprite to fit the slot
-                sprite = pygame.transform.scale(sprite, (slot_size, slot_size))
+                sprite = pygame.transform.scale(sprite, (self.slot_size, self.slot_size))
                 
                 # Draw item centered in the slot
                 item_x = slot_rect.x + (slot_rect.width - sprite.get_width()) // 2
                 item_y = slot_rect.y + (slot_rect.height - sprite.get_height()) // 2
-                screen.blit(sprite, (item_x, item_y))
+                surface.blit(sprite, (item_x, item_y))
         
         # Draw character stats section
-        self._draw_character_stats(screen)
-        
-        # Draw tooltip if needed
-        if self.tooltip_visible and self.hovered_item:
-            self.draw_tooltip()
+        self._draw_character_stats(surface)
             
-    def _draw_character_stats(self, screen):
-        """Draw the character stats section showing base stats and equipment bonuses."""
+    def _draw_character_stats(self, surface):
+        """Draw the character stats section showing base stats and equipment bonuses (panel-local)."""
         # Skip if no player is available
         if not self.player:
             return
             
         # Create stats section header
         stats_title = self.font.render("Character Stats", True, UI_COLORS['text'])
-        stats_title_x = self.x + (self.width - stats_title.get_width()) // 2
-        stats_title_y = self.y + 180  # Position below equipment slots
-        screen.blit(stats_title, (stats_title_x, stats_title_y))
+        stats_title_x = (self.width - stats_title.get_width()) // 2
+        stats_title_y = 180  # Position below equipment slots
+        surface.blit(stats_title, (stats_title_x, stats_title_y))
         
-        # Calculate equipment bonuses
-        attack_bonus = self._calculate_attack_bonus()
-        defense_bonus = self._calculate_defense_bonus()
-        dexterity_bonus = self._calculate_dexterity_bonus()
-        
-        # Format stats with base + bonus
-        stats = [
-            f"Attack: {self.player.attack}+{attack_bonus}" if attack_bonus > 0 else f"Attack: {self.player.attack}",
-            f"Defense: {self.player.defense}+{defense_bonus}" if defense_bonus > 0 else f"Defense: {self.player.defense}",
-        ]
-        
-        # Add dexterity if bonus exists
-        if hasattr(self.player, 'dexterity'):
-            base_dex = getattr(self.player, 'dexterity', 0)
-            stats.append(f"Dexterity: {base_dex}+{dexterity_bonus}" if dexterity_bonus > 0 else f"Dexterity: {base_dex}")
+        # Format stats as base + equipment bonus, both from the player's stat engine
+        stats = []
+        player_stats = self.player.stats
+        for name, total, bonus in zip(STATS, player_stats.totals, player_stats.equipment_bonus):
+            base = total - bonus
+            stats.append(f"{name.capitalize()}: {base}+{bonus}" if bonus > 0 else f"{name.capitalize()}: {base}")
         
         # Draw stats list
         y_offset = stats_title_y + 30
         for stat in stats:
             stat_surface = self.small_font.render(stat, True, UI_COLORS['text'])
-            stat_x = self.x + 20
-            screen.blit(stat_surface, (stat_x, y_offset))
+            stat_x = 20
+            surface.blit(stat_surface, (stat_x, y_offset))
             y_offset += 25
             
-    def _calculate_attack_bonus(self) -> int:
-        """Calculate attack bonus from equipped items."""
-        bonus = 0
-        
-        # Check weapon
-        weapon = self.equipment.get('weapon')
-        if weapon and hasattr(weapon, 'attack_power'):
-            bonus += weapon.attack_power
-            
-        return bonus
-        
-    def _calculate_defense_bonus(self) -> int:
-        """Calculate defense bonus from equipped armor."""
-        bonus = 0
-        
-        # Check all armor slots
-        armor_slots = ['head', 'chest', 'legs', 'feet', 'hands']
-        for slot in armor_slots:
-            item = self.equipment.get(slot)
-            if item and hasattr(item, 'defense'):
-                bonus += item.defense
-                
-        return bonus
-        
-    def _calculate_dexterity_bonus(self) -> int:
-        """Calculate dexterity bonus from equipped items."""
-        bonus = 0
-        
-        # Mainly from hands equipment
-        hands = self.equipment.get('hands')
-        if hands and hasattr(hands, 'dexterity'):
-            bonus += hands.dexterity
-            
-        # Other equipment may also provide dexterity
-        for slot, item in self.equipment.items():
-            if item and hasattr(item, 'dexterity') and slot != 'hands':
-                bonus += item.dexterity
-                
-        return bonus
-    
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle UI events."""
         if not self.visible:
@@ -274,33 +240,32 @@ class EquipmentUI:
             mouse_pos = pygame.mouse.get_pos()
             
             # Check if clicking on equipment slots
-            for slot_name, slot_rect in self.slots.items():
-                if slot_rect.collidepoint(mouse_pos):
-                    if slot_name in self.equipment and self.equipment[slot_name]:
-                        # Get the equipped item
-                        item = self.equipment[slot_name]
-                        print(f"Equipment: Clicked on equipped item: {item.display_name} in slot {slot_name}")
+            slot_name = self.get_slot_at_pos(mouse_pos)
+            if slot_name is not None and self.equipment.get(slot_name):
+                # Get the equipped item
+                item = self.equipment[slot_name]
+                print(f"Equipment: Clicked on equipped item: {item.display_name} in slot {slot_name}")
+                
+                # Use the global GameState object to unequip the item
+                import sys
+                if 'game' in sys.modules:
+                    game_module = sys.modules.get('game')
+                    if hasattr(game_module, 'game_state'):
+                        game_state = game_module.game_state
+                        print(f"Found global game_state: {game_state}")
                         
-                        # Use the global GameState object to unequip the item
-                        import sys
-                        if 'game' in sys.modules:
-                            game_module = sys.modules.get('game')
-                            if hasattr(game_module, 'game_state'):
-                                game_state = game_module.game_state
-                                print(f"Found global game_state: {game_state}")
-                                
-                                # Try to unequip the item
-                                success = game_state.unequip_item(slot_name)
-                                if success:
-                                    print(f"Successfully unequipped {item.display_name} from {slot_name}")
-                                else:
-                                    print(f"Failed to unequip {item.display_name} - inventory may be full")
-                            else:
-                                print("Could not find game_state in game module")
+                        # Try to unequip the item
+                        success = game_state.unequip_item(slot_name)
+                        if success:
+                            print(f"Successfully unequipped {item.display_name} from {slot_name}")
                         else:
-                            print("Could not find game module")
-                        
-                        return True
+                            print(f"Failed to unequip {item.display_name} - inventory may be full")
+                    else:
+                        print("Could not find game_state in game module")
+                else:
+                    print("Could not find game module")
+                
+                return True
         
         elif event.type == pygame.MOUSEMOTION:
             mouse_pos = pygame.mouse.get_pos()
@@ -308,38 +273,38 @@ class EquipmentUI:
             new_hovered_item = None
             
             # Check if mouse is over equipment slots
-            for slot_name, slot_rect in self.slots.items():
-                if slot_rect.collidepoint(mouse_pos):
-                    if slot_name in self.equipment:
-                        new_hovered_item = self.equipment[slot_name]
-                    break
+            slot_name = self.get_slot_at_pos(mouse_pos)
+            if slot_name is not None:
+                new_hovered_item = self.equipment.get(slot_name)
             
             # Update tooltip state
-            if new_hovered_item != self.hovered_item:
+            if self.hover_timer.hover(new_hovered_item):
                 self.hovered_item = new_hovered_item
-                self.hover_timer = 0
                 self.tooltip_visible = False
             
         return False
         
-    def update(self):
-        """Update tooltip visibility."""
+    def update(self, dt: Optional[float] = None):
+        """
+        Update tooltip visibility.
+        
+        Args:
+            dt: Seconds since the last frame; measured from the pygame clock if not given
+        """
         if not self.visible:
             return
             
-        if self.hovered_item:
-            self.hover_timer += 1
-            if self.hover_timer > 15:  # Show tooltip after 0.25 seconds (assuming 60 FPS)
-                self.tooltip_visible = True
-        else:
-            self.hover_timer = 0
-            self.tooltip_visible = False
+        # Show the tooltip once the item has been hovered for TOOLTIP_DELAY seconds
+        self.tooltip_visible = self.hover_timer.update(dt)
             
-    def draw_tooltip(self):
+    def draw_tooltip(self, screen: Optional[pygame.Surface] = None):
         """Draw the tooltip for the currently hovered item."""
         if not self.tooltip_visible or not self.hovered_item:
             return
             
+        screen = screen or self.screen
+        tooltip = self._get_tooltip_surface(self.hovered_item)
+            
         # Position tooltip to avoid screen edges
         mouse_pos = pygame.mouse.get_pos()
         tooltip_x = mouse_pos[0] + 20  # Offset from mouse cursor
@@ -353,19 +318,31 @@ class EquipmentUI:
         if tooltip_y < 10:
             tooltip_y = 10
         
-        # Draw tooltip background
         self.tooltip_rect.topleft = (tooltip_x, tooltip_y)
-        pygame.draw.rect(self.screen, UI_COLORS['background'], self.tooltip_rect)
-        pygame.draw.rect(self.screen, UI_COLORS['border'], self.tooltip_rect, 2)
+        self.blit_overlay(screen, tooltip, self.tooltip_rect.topleft)
+        
+    def _get_tooltip_surface(self, item) -> pygame.Surface:
+        """Get the rendered tooltip for an item, rendering it only once per item."""
+        if self._tooltip_cache is not None and self._tooltip_cache[0] is item:
+            return self._tooltip_cache[1]
+            
+        surface = pygame.Surface(self.tooltip_rect.size)
+        
+        # Draw tooltip background
+        pygame.draw.rect(surface, UI_COLORS['background'], surface.get_rect())
+        pygame.draw.rect(surface, UI_COLORS['border'], surface.get_rect(), 2)
         
         # Draw item name
-        name_text = self.font.render(self.hovered_item.display_name, True, UI_COLORS['text'])
-        self.screen.blit(name_text, (tooltip_x + 10, tooltip_y + 10))
+        name_text = self.font.render(item.display_name, True, UI_COLORS['text'])
+        surface.blit(name_text, (10, 10))
         
         # Draw item stats
         y_offset = 40
-        stats = self.hovered_item.get_stats_display()
+        stats = item.get_stats_display()
         for stat in stats:
             stat_text = self.small_font.render(stat, True, UI_COLORS['text'])
-            self.screen.blit(stat_text, (tooltip_x + 10, tooltip_y + y_offset))
-            y_offset += 20 
\ No newline at end of file
+            surface.blit(stat_text, (10, y_offset))
+            y_offset += 20
+            
+        self._tooltip_cache = (item, surface)
+        return surface
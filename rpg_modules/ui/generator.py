@@ -72,14 +72,10 @@ class ItemGeneratorUI:
                     player = game.game_state.player
                     
                     # Force reset inventory
-                    capacity = 40  # 8 rows x 5 cols
-                    player.inventory.items = [None] * capacity
+                    player.inventory.clear()
                     
-                    # Add 5 test items directly to the first slots
-                    for i in range(5):
-                        item = self.item_generator.generate_item()
-                        if item:
-                            player.inventory.items[i] = item
+                    # Add 5 test items to the first slots
+                    player.inventory.add_items(self.item_generator.generate_item() for _ in range(5))
                     
                     # Refresh inventory UI
                     if hasattr(game.game_state, 'refresh_inventory_ui'):
@@ -174,7 +170,7 @@ class ItemGeneratorUI:
                                             else:
                                                 # Fallback: Try to directly update the inventory UI
                                                 if hasattr(game.game_state, 'inventory_ui'):
-                                                    game.game_state.inventory_ui.inventory = player.inventory.items
+                                                    game.game_state.inventory_ui.bind_inventory(player.inventory)
                                     except Exception:
                                         pass
                             except Exception:
@@ -0,0 +1,205 @@
+"""
+Hit-testing and hover timing shared by grid-based UI panels.
+
+Cell lookups are computed from the grid geometry instead of testing every
+cell rect, so a mouse move costs the same on a 4-slot panel as on a
+100-slot one. Tooltip delays are measured in seconds, not frames.
+"""
+
+import pygame
+from typing import Dict, Hashable, Iterator, List, Optional, Tuple
+
+# Seconds the mouse has to rest on an item before its tooltip shows
+TOOLTIP_DELAY = 0.25
+
+
+class GridLayout:
+    """
+    A uniform grid of cells laid out row by row from a top-left origin.
+
+    Cells are numbered left to right, top to bottom. ``gap`` is the empty
+    space between neighbouring cells; a point in a gap hits no cell.
+    """
+
+    def __init__(self, x: int, y: int, cols: int, rows: int,
+                 cell_width: int, cell_height: Optional[int] = None, gap: int = 0):
+        self.x = x
+        self.y = y
+        self.cols = cols
+        self.rows = rows
+        self.cell_width = cell_width
+        self.cell_height = cell_height if cell_height is not None else cell_width
+        self.gap = gap
+
+    def __len__(self) -> int:
+        return self.cols * self.rows
+
+    @property
+    def rect(self) -> pygame.Rect:
+        """The rect covering the whole grid."""
+        return pygame.Rect(self.x, self.y,
+                           self.cols * (self.cell_width + self.gap) - self.gap,
+                           self.rows * (self.cell_height + self.gap) - self.gap)
+
+    def move_to(self, x: int, y: int):
+        """Move the grid's top-left corner."""
+        self.x = x
+        self.y = y
+
+    def cell_at(self, pos: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+        """
+        Get the (col, row) of the cell under a point.
+
+        Returns:
+            The cell coordinates, or None if the point is outside the grid or in a gap
+        """
+        dx = pos[0] - self.x
+        dy = pos[1] - self.y
+        if dx < 0 or dy < 0:
+            return None
+        col, col_offset = divmod(dx, self.cell_width + self.gap)
+        row, row_offset = divmod(dy, self.cell_height + self.gap)
+        if col >= self.cols or row >= self.rows:
+            return None
+        if col_offset >= self.cell_width or row_offset >= self.cell_height:
+            return None
+        return int(col), int(row)
+
+    def index_at(self, pos: Tuple[int, int]) -> Optional[int]:
+        """Get the index of the cell under a point, or None."""
+        cell = self.cell_at(pos)
+        if cell is None:
+            return None
+        return cell[1] * self.cols + cell[0]
+
+    def cell_rect(self, index: int) -> pygame.Rect:
+        """Get the screen rect of a cell."""
+        row, col = divmod(index, self.cols)
+        return pygame.Rect(self.x + col * (self.cell_width + self.gap),
+                           self.y + row * (self.cell_height + self.gap),
+                           self.cell_width, self.cell_height)
+
+    def cell_rects(self) -> Iterator[pygame.Rect]:
+        """Yield the rect of every cell in index order."""
+        for index in range(len(self)):
+            yield self.cell_rect(index)
+
+
+class SlotMap:
+    """
+    Hit-testing for named slots that are not laid out on a regular grid.
+
+    The slots' bounding box is split into buckets the size of the smallest
+    slot, and every slot is registered in the buckets it overlaps. A lookup
+    finds its bucket arithmetically and tests only the few slots in it.
+    """
+
+    def __init__(self, slots: Dict[Hashable, pygame.Rect]):
+        """
+        Args:
+            slots: Screen rect of each slot, by slot name
+        """
+        self.slots = dict(slots)
+        self._buckets: List[List[Hashable]] = []
+        self.grid: Optional[GridLayout] = None
+        self._build()
+
+    def _build(self):
+        rects = [rect for rect in self.slots.values() if rect.width > 0 and rect.height > 0]
+        if not rects:
+            self.grid = None
+            self._buckets = []
+            return
+        bounds = rects[0].unionall(rects[1:])
+        bucket_width = min(rect.width for rect in rects)
+        bucket_height = min(rect.height for rect in rects)
+        cols = -(-bounds.width // bucket_width)
+        rows = -(-bounds.height // bucket_height)
+        self.grid = GridLayout(bounds.x, bounds.y, cols, rows, bucket_width, bucket_height)
+
+        self._buckets = [[] for _ in range(cols * rows)]
+        for name, rect in self.slots.items():
+            if rect.width <= 0 or rect.height <= 0:
+                continue
+            first_col = (rect.left - bounds.x) // bucket_width
+            last_col = (rect.right - 1 - bounds.x) // bucket_width
+            first_row = (rect.top - bounds.y) // bucket_height
+            last_row = (rect.bottom - 1 - bounds.y) // bucket_height
+            for row in range(first_row, last_row + 1):
+                for col in range(first_col, last_col + 1):
+                    self._buckets[row * cols + col].append(name)
+
+    def move(self, dx: int, dy: int):
+        """Shift every slot by an offset."""
+        if not (dx or dy):
+            return
+        for rect in self.slots.values():
+            rect.move_ip(dx, dy)
+        if self.grid is not None:
+            self.grid.move_to(self.grid.x + dx, self.grid.y + dy)
+
+    def slot_at(self, pos: Tuple[int, int]) -> Optional[Hashable]:
+        """Get the name of the slot under a point, or None."""
+        if self.grid is None:
+            return None
+        index = self.grid.index_at(pos)
+        if index is None:
+            return None
+        for name in self._buckets[index]:
+            if self.slots[name].collidepoint(pos):
+                return name
+        return None
+
+
+class HoverTimer:
+    """
+    Tracks how long the mouse has rested on the same target.
+
+    ``update`` takes the frame time in seconds; when it is not given, the time
+    since the previous update is measured with ``pygame.time.get_ticks``, so
+    the delay does not depend on the frame rate either way.
+    """
+
+    def __init__(self, delay: float = TOOLTIP_DELAY):
+        self.delay = delay
+        self.target = None
+        self.elapsed = 0.0
+        self._last_ticks: Optional[int] = None
+
+    def hover(self, target) -> bool:
+        """
+        Set what the mouse is over.
+
+        Returns:
+            True if the target changed (and the timer restarted)
+        """
+        if target is self.target:
+            return False
+        self.target = target
+        self.elapsed = 0.0
+        return True
+
+    def reset(self):
+        """Forget the current target."""
+        self.hover(None)
+
+    def update(self, dt: Optional[float] = None) -> bool:
+        """
+        Advance the timer.
+
+        Args:
+            dt: Seconds since the last update, or None to measure it
+
+        Returns:
+            True once the current target has been hovered for ``delay`` seconds
+        """
+        ticks = pygame.time.get_ticks()
+        if dt is None:
+            dt = 0.0 if self._last_ticks is None else (ticks - self._last_ticks) / 1000.0
+        self._last_ticks = ticks
+
+        if self.target is None:
+            self.elapsed = 0.0
+            return False
+        self.elapsed += dt
+        return self.elapsed >= self.delay
@@ -8,7 +8,9 @@ from ..core.constants import (
     UI_COLORS, UI_DIMENSIONS, QUALITY_COLORS,
     FONT_SIZES, SCREEN_WIDTH, SCREEN_HEIGHT, GRAY
 )
-from ..items import Item, Weapon, Armor, Hands, Consumable
+from ..items import Item, Weapon, Armor, Hands, Consumable, Inventory
+from .retained import RetainedPanel
+from .grid import GridLayout, HoverTimer
 import sys
 import importlib
 import traceback
@@ -54,7 +56,7 @@ def import_game_module():
 # Try to import the game module right away
 import_game_module()
 
-class InventoryUI:
+class InventoryUI(RetainedPanel):
     """A reusable inventory UI component for pygame games."""
     
     def __init__(
@@ -70,13 +72,18 @@ class InventoryUI:
         
         Args:
             screen: The pygame surface to draw on
-            inventory: The player's inventory
+            inventory: The player's ``Inventory`` (subscribed to for changes)
+                or a plain list of slots
             rows: Number of rows in the grid
             cols: Number of columns in the grid
             equip_callback: Function to call when an item is clicked for equipping
         """
         self.screen = screen
-        self.inventory = inventory if inventory is not None else []
+        self.bound_inventory = None
+        if isinstance(inventory, Inventory):
+            self.inventory = inventory.items
+        else:
+            self.inventory = inventory if inventory is not None else []
         print(f"InventoryUI initialized with inventory: {id(self.inventory)}")
         self.visible = False
         self.grid_rows = rows
@@ -102,17 +109,11 @@ class InventoryUI:
         
         # Calculate grid position
         grid_width = cols * self.cell_size
-        grid_height = rows * self.cell_size
         grid_x = self.x + (self.width - grid_width) // 2
         grid_y = self.y + 50  # Leave space for header
         
-        # Create grid cells
-        self.grid_cells = []
-        for row in range(rows):
-            for col in range(cols):
-                cell_x = grid_x + col * self.cell_size
-                cell_y = grid_y + row * self.cell_size
-                self.grid_cells.append(pygame.Rect(cell_x, cell_y, self.cell_size, self.cell_size))
+        # Cell positions are computed from the grid geometry
+        self.grid = GridLayout(grid_x, grid_y, cols, rows, self.cell_size)
         
         # Initialize fonts
         self.font = pygame.font.Font(None, FONT_SIZES['medium'])
@@ -120,13 +121,38 @@ class InventoryUI:
         
         # Initialize tooltip
         self.hovered_item = None
-        self.hover_timer = 0
+        self.hover_timer = HoverTimer()
         self.tooltip_visible = False
         self.tooltip_rect = pygame.Rect(0, 0, UI_DIMENSIONS['tooltip_width'], UI_DIMENSIONS['tooltip_height'])
         
         # Initialize selection
         self.selected_item = None
         
+        # Cached panel and tooltip surfaces
+        self._init_retained_panel(self.rect)
+        self._tooltip_cache = None
+        
+        if isinstance(inventory, Inventory):
+            self.bind_inventory(inventory)
+        
+    def bind_inventory(self, inventory: Inventory):
+        """Show an ``Inventory`` and redraw only when it reports a change."""
+        if self.bound_inventory is not None:
+            self.bound_inventory.unsubscribe(self._on_inventory_changed)
+        self.bound_inventory = inventory
+        self.inventory = inventory.items
+        inventory.subscribe(self._on_inventory_changed)
+        self.invalidate()
+        
+    def _on_inventory_changed(self, inventory: Inventory, changed_slots: List[int]):
+        """Inventory listener: drop stale hover state and re-render the panel."""
+        if self.hovered_item is not None and self.hovered_item not in inventory:
+            self.hovered_item = None
+            self.hover_timer.reset()
+            self.tooltip_visible = False
+        self._tooltip_cache = None
+        self.invalidate()
+        
     def set_equip_callback(self, callback: Callable[[int], bool]):
         """Set the equip callback function."""
         self.equip_callback = callback
@@ -137,14 +163,12 @@ class InventoryUI:
         self.visible = not self.visible
         if not self.visible:
             self.hovered_item = None
+            self.hover_timer.reset()
             self.tooltip_visible = False
         
     def get_cell_at_pos(self, pos: Tuple[int, int]) -> Optional[int]:
         """Get the cell index at the given position."""
-        for i, cell in enumerate(self.grid_cells):
-            if cell.collidepoint(pos):
-                return i
-        return None
+        return self.grid.index_at(pos)
         
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle UI events."""
@@ -190,208 +214,260 @@ class InventoryUI:
                     new_hovered_item = self.inventory[cell_index]
             
             # Update tooltip state
-            if new_hovered_item != self.hovered_item:
+            if self.hover_timer.hover(new_hovered_item):
                 self.hovered_item = new_hovered_item
-                self.hover_timer = 0
                 self.tooltip_visible = False
             
         return False
         
-    def update(self):
-        """Update tooltip visibility."""
+    def update(self, dt: Optional[float] = None):
+        """
+        Update tooltip visibility.
+        
+        Args:
+            dt: Seconds since the last frame; measured from the pygame clock if not given
+        """
         if not self.visible:
             return
             
-        if self.hovered_item:
-            self.hover_timer += 1
-            if self.hover_timer > 15:  # Show tooltip after 0.25 seconds (assuming 60 FPS)
-                self.tooltip_visible = True
-        else:
-            self.hover_timer = 0
-            self.tooltip_visible = False
+        # Show the tooltip once the item has been hovered for TOOLTIP_DELAY seconds
+        self.tooltip_visible = self.hover_timer.update(dt)
         
-    def draw_tooltip(self):
+    def draw_tooltip(self, screen: Optional[pygame.Surface] = None):
         """Draw the tooltip for the currently hovered item."""
-        if self.tooltip_visible and self.hovered_item:
-            # Position tooltip to avoid screen edges
-            mouse_pos = pygame.mouse.get_pos()
+        if not (self.tooltip_visible and self.hovered_item):
+            return
+            
+        screen = screen or self.screen
+        tooltip = self._get_tooltip_surface(self.hovered_item)
+        self.tooltip_rect = tooltip.get_rect()
+        
+        # Position tooltip to avoid screen edges
+        mouse_pos = pygame.mouse.get_pos()
+        tooltip_x = mouse_pos[0] + 20  # Offset from mouse cursor
+        tooltip_y = mouse_pos[1] - 50   # Position above mouse cursor
+        
+        # Adjust if tooltip would go off screen
+        if tooltip_x + self.tooltip_rect.width > SCREEN_WIDTH:
+            tooltip_x = SCREEN_WIDTH - self.tooltip_rect.width - 10
+        if tooltip_y + self.tooltip_rect.height > SCREEN_HEIGHT:
+            tooltip_y = SCREEN_HEIGHT - self.tooltip_rect.height - 10
+        if tooltip_y < 10:
+            tooltip_y = 10
             
-            # Increase tooltip size for more information
-            tooltip_width = UI_DIMENSIONS['tooltip_width'] + 50  # Make it wider
-            tooltip_height = UI_DIMENSIONS['tooltip_height'] + 80  # Make it taller
-            self.tooltip_rect = pygame.Rect(0, 0, tooltip_width, tooltip_height)
+        self.tooltip_rect.topleft = (tooltip_x, tooltip_y)
+        self.blit_overlay(screen, tooltip, self.tooltip_rect.topleft)
+        
+    def _get_tooltip_surface(self, item) -> pygame.Surface:
+        """Get the rendered tooltip for an item, rendering it only once per item."""
+        if self._tooltip_cache is not None and self._tooltip_cache[0] is item:
+            return self._tooltip_cache[1]
+            
+        # Increase tooltip size for more information
+        tooltip_width = UI_DIMENSIONS['tooltip_width'] + 50  # Make it wider
+        tooltip_height = UI_DIMENSIONS['tooltip_height'] + 80  # Make it taller
+        surface = pygame.Surface((tooltip_width, tooltip_height))
+        tooltip_rect = surface.get_rect()
+        
+        # Draw tooltip background
+        pygame.draw.rect(surface, UI_COLORS['background'], tooltip_rect)
+        
+        # Draw quality-colored border
+        border_color = QUALITY_COLORS.get(item.quality, QUALITY_COLORS['Common'])
+        pygame.draw.rect(surface, border_color, tooltip_rect, 3)
+        
+        try:
+            # Try to get the item sprite with fallback for missing sprites
+            try:
+                sprite = item.get_equipment_sprite()
+            except (FileNotFoundError, pygame.error, AttributeError) as e:
+                # Create a fallback sprite based on item type
+                sprite = pygame.Surface((64, 64), pygame.SRCALPHA)
+                
+                # Determine item type and set appropriate color
+                if hasattr(item, 'weapon_type'):
+                    # Weapon placeholder (sword shape)
+                    color = QUALITY_COLORS.get(item.quality, (200, 200, 200))
+                    pygame.draw.polygon(sprite, color, [(20, 10), (44, 10), (44, 54), (32, 54), (20, 40)])
+                    pygame.draw.rect(sprite, (100, 100, 100), (25, 10, 14, 25))  # handle
+                elif hasattr(item, 'armor_type'):
+                    # Armor placeholder (shield/chest shape)
+                    color = QUALITY_COLORS.get(item.quality, (200, 200, 200))
+                    pygame.draw.ellipse(sprite, color, (10, 10, 44, 44))
+                    pygame.draw.ellipse(sprite, (100, 100, 100), (15, 15, 34, 34), 2)
+                else:
+                    # Consumable placeholder (potion shape)
+                    color = (200, 50, 50) if item.consumable_type == 'health' else \
+                           (50, 50, 200) if item.consumable_type == 'mana' else \
+                           (50, 200, 50)  # stamina
+                    pygame.draw.rect(sprite, (200, 200, 200), (25, 15, 14, 35))
+                    pygame.draw.rect(sprite, color, (20, 25, 24, 25))
+                    pygame.draw.ellipse(sprite, (200, 200, 200), (20, 10, 24, 20))
             
-            tooltip_x = mouse_pos[0] + 20  # Offset from mouse cursor
-            tooltip_y = mouse_pos[1] - 50   # Position above mouse cursor
+            # Scale the sprite
+            scaled_sprite = pygame.transform.scale(sprite, (128, 128))
+            surface.blit(scaled_sprite, (10, 10))
             
-            # Adjust if tooltip would go off screen
-            if tooltip_x + self.tooltip_rect.width > SCREEN_WIDTH:
-                tooltip_x = SCREEN_WIDTH - self.tooltip_rect.width - 10
-            if tooltip_y + self.tooltip_rect.height > SCREEN_HEIGHT:
-                tooltip_y = SCREEN_HEIGHT - self.tooltip_rect.height - 10
-            if tooltip_y < 10:
-                tooltip_y = 10
+            # Draw item name with quality-colored text
+            name_font = pygame.font.Font(None, FONT_SIZES['large'])
+            name_text = name_font.render(item.display_name, True, border_color)
+            name_shadow = name_font.render(item.display_name, True, (30, 30, 30))
             
-            # Draw tooltip background
-            self.tooltip_rect.topleft = (tooltip_x, tooltip_y)
-            pygame.draw.rect(self.screen, UI_COLORS['background'], self.tooltip_rect)
+            # Add text shadow for better visibility
+            surface.blit(name_shadow, (151, 16))
+            surface.blit(name_text, (150, 15))
             
-            # Draw quality-colored border
-            border_color = QUALITY_COLORS.get(self.hovered_item.quality, QUALITY_COLORS['Common'])
-            pygame.draw.rect(self.screen, border_color, self.tooltip_rect, 3)
+            # Draw horizontal divider line
+            pygame.draw.line(surface, border_color, 
+                            (10, 45), 
+                            (tooltip_width - 20, 45), 2)
             
-            try:
-                # Try to get the item sprite with fallback for missing sprites
-                try:
-                    sprite = self.hovered_item.get_equipment_sprite()
-                except (FileNotFoundError, pygame.error, AttributeError) as e:
-                    # Create a fallback sprite based on item type
-                    sprite = pygame.Surface((64, 64), pygame.SRCALPHA)
-                    
-                    # Determine item type and set appropriate color
-                    if hasattr(self.hovered_item, 'weapon_type'):
-                        # Weapon placeholder (sword shape)
-                        color = QUALITY_COLORS.get(self.hovered_item.quality, (200, 200, 200))
-                        pygame.draw.polygon(sprite, color, [(20, 10), (44, 10), (44, 54), (32, 54), (20, 40)])
-                        pygame.draw.rect(sprite, (100, 100, 100), (25, 10, 14, 25))  # handle
-                    elif hasattr(self.hovered_item, 'armor_type'):
-                        # Armor placeholder (shield/chest shape)
-                        color = QUALITY_COLORS.get(self.hovered_item.quality, (200, 200, 200))
-                        pygame.draw.ellipse(sprite, color, (10, 10, 44, 44))
-                        pygame.draw.ellipse(sprite, (100, 100, 100), (15, 15, 34, 34), 2)
-                    else:
-                        # Consumable placeholder (potion shape)
-                        color = (200, 50, 50) if self.hovered_item.consumable_type == 'health' else \
-                               (50, 50, 200) if self.hovered_item.consumable_type == 'mana' else \
-                               (50, 200, 50)  # stamina
-                        pygame.draw.rect(sprite, (200, 200, 200), (25, 15, 14, 35))
-                        pygame.draw.rect(sprite, color, (20, 25, 24, 25))
-                        pygame.draw.ellipse(sprite, (200, 200, 200), (20, 10, 24, 20))
-                
-                # Scale the sprite
-                scaled_sprite = pygame.transform.scale(sprite, (128, 128))
-                self.screen.blit(scaled_sprite, (tooltip_x + 10, tooltip_y + 10))
-                
-                # Draw item name with quality-colored text
-                name_font = pygame.font.Font(None, FONT_SIZES['large'])
-                name_text = name_font.render(self.hovered_item.display_name, True, border_color)
-                name_shadow = name_font.render(self.hovered_item.display_name, True, (30, 30, 30))
+            # Get complete item stats using the item's built-in method
+            if hasattr(item, 'get_stats_display'):
+                basic_stats = item.get_stats_display()
+            else:
+                # Fallback for items without get_stats_display
+                basic_stats = []
                 
-                # Add text shadow for better visibility
-                self.screen.blit(name_shadow, (tooltip_x + 151, tooltip_y + 16))
-                self.screen.blit(name_text, (tooltip_x + 150, tooltip_y + 15))
+            # Add additional attributes if available
+            additional_stats = []
+            
+            # Weight if available
+            if hasattr(item, 'weight'):
+                additional_stats.append(f"Weight: {item.weight} kg")
                 
-                # Draw horizontal divider line
-                pygame.draw.line(self.screen, border_color, 
-                                (tooltip_x + 10, tooltip_y + 45), 
-                                (tooltip_x + tooltip_width - 20, tooltip_y + 45), 2)
+            # Durability if available
+            if hasattr(item, 'durability') and hasattr(item, 'max_durability'):
+                durability_percent = int((item.durability / item.max_durability) * 100)
+                additional_stats.append(f"Durability: {durability_percent}%")
                 
-                # Get complete item stats using the item's built-in method
-                if hasattr(self.hovered_item, 'get_stats_display'):
-                    basic_stats = self.hovered_item.get_stats_display()
+            # Level requirement if available
+            if hasattr(item, 'level_req'):
+                additional_stats.append(f"Required Level: {item.level_req}")
+            
+            # Combine all stats
+            all_stats = basic_stats + additional_stats
+            
+            # Draw basic stats on left column
+            y_offset = 60
+            for i, stat in enumerate(all_stats):
+                # Check if we need to start a second column
+                if i == len(all_stats) // 2 + 1:
+                    y_offset = 60  # Reset y position for second column
+                    x_offset = tooltip_width // 2 + 10  # Start x position for second column
                 else:
-                    # Fallback for items without get_stats_display
-                    basic_stats = []
-                    
-                # Add additional attributes if available
-                additional_stats = []
-                
-                # Weight if available
-                if hasattr(self.hovered_item, 'weight'):
-                    additional_stats.append(f"Weight: {self.hovered_item.weight} kg")
+                    x_offset = 20  # Default x position for first column
                     
-                # Durability if available
-                if hasattr(self.hovered_item, 'durability') and hasattr(self.hovered_item, 'max_durability'):
-                    durability_percent = int((self.hovered_item.durability / self.hovered_item.max_durability) * 100)
-                    additional_stats.append(f"Durability: {durability_percent}%")
+                # Determine text color based on stat content
+                if "Quality:" in stat:
+                    text_color = QUALITY_COLORS.get(item.quality, UI_COLORS['text'])
+                elif "Effect:" in stat:
+                    text_color = (220, 190, 100)  # Gold-ish for effects
+                elif "Attack:" in stat or "Damage:" in stat:
+                    text_color = (220, 100, 100)  # Red for attack stats
+                elif "Defense:" in stat:
+                    text_color = (100, 100, 220)  # Blue for defense stats
+                else:
+                    text_color = UI_COLORS['text']
                     
-                # Level requirement if available
-                if hasattr(self.hovered_item, 'level_req'):
-                    additional_stats.append(f"Required Level: {self.hovered_item.level_req}")
-                
-                # Combine all stats
-                all_stats = basic_stats + additional_stats
+                stat_text = self.small_font.render(stat, True, text_color)
+                surface.blit(stat_text, (x_offset, y_offset))
+                y_offset += 22  # Slightly increased line spacing
+            
+            # Draw item description if available
+            if hasattr(item, 'description') and item.description:
+                # Draw another divider
+                description_y = tooltip_height - 60
+                pygame.draw.line(surface, border_color, 
+                                (10, description_y - 10), 
+                                (tooltip_width - 20, description_y - 10), 1)
+                                
+                # Draw description with word wrapping
+                desc_font = pygame.font.Font(None, FONT_SIZES['small'] - 2)
+                lines = []
+                words = item.description.split()
+                current_line = ""
                 
-                # Draw basic stats on left column
-                y_offset = 60
-                for i, stat in enumerate(all_stats):
-                    # Check if we need to start a second column
-                    if i == len(all_stats) // 2 + 1:
-                        y_offset = 60  # Reset y position for second column
-                        x_offset = tooltip_width // 2 + 10  # Start x position for second column
+                for word in words:
+                    test_line = current_line + word + " "
+                    if desc_font.size(test_line)[0] < tooltip_width - 40:
+                        current_line = test_line
                     else:
-                        x_offset = 20  # Default x position for first column
-                        
-                    # Determine text color based on stat content
-                    if "Quality:" in stat:
-                        text_color = QUALITY_COLORS.get(self.hovered_item.quality, UI_COLORS['text'])
-                    elif "Effect:" in stat:
-                        text_color = (220, 190, 100)  # Gold-ish for effects
-                    elif "Attack:" in stat or "Damage:" in stat:
-                        text_color = (220, 100, 100)  # Red for attack stats
-                    elif "Defense:" in stat:
-                        text_color = (100, 100, 220)  # Blue for defense stats
-                    else:
-                        text_color = UI_COLORS['text']
-                        
-                    stat_text = self.small_font.render(stat, True, text_color)
-                    self.screen.blit(stat_text, (tooltip_x + x_offset, tooltip_y + y_offset))
-                    y_offset += 22  # Slightly increased line spacing
-                
-                # Draw item description if available
-                if hasattr(self.hovered_item, 'description') and self.hovered_item.description:
-                    # Draw another divider
-                    description_y = tooltip_y + tooltip_height - 60
-                    pygame.draw.line(self.screen, border_color, 
-                                    (tooltip_x + 10, description_y - 10), 
-                                    (tooltip_x + tooltip_width - 20, description_y - 10), 1)
-                                    
-                    # Draw description with word wrapping
-                    desc_font = pygame.font.Font(None, FONT_SIZES['small'] - 2)
-                    lines = []
-                    words = self.hovered_item.description.split()
-                    current_line = ""
-                    
-                    for word in words:
-                        test_line = current_line + word + " "
-                        if desc_font.size(test_line)[0] < tooltip_width - 40:
-                            current_line = test_line
-                        else:
-                            lines.append(current_line)
-                            current_line = word + " "
-                    lines.append(current_line)  # Add the last line
-                    
-                    # Draw each line
-                    for i, line in enumerate(lines):
-                        if i < 3:  # Limit to 3 lines
-                            desc_text = desc_font.render(line, True, (180, 180, 180))
-                            self.screen.blit(desc_text, (tooltip_x + 20, description_y + i * 18))
+                        lines.append(current_line)
+                        current_line = word + " "
+                lines.append(current_line)  # Add the last line
                 
-            except Exception as e:
-                # Handle errors when drawing tooltip
-                error_text = self.small_font.render(f"Error displaying item: {str(e)}", True, (255, 100, 100))
-                self.screen.blit(error_text, (tooltip_x + 10, tooltip_y + 150))
-                print(f"Error drawing tooltip: {e}")
+                # Draw each line
+                for i, line in enumerate(lines):
+                    if i < 3:  # Limit to 3 lines
+                        desc_text = desc_font.render(line, True, (180, 180, 180))
+                        surface.blit(desc_text, (20, description_y + i * 18))
+            
+        except Exception as e:
+            # Handle errors when drawing tooltip
+            error_text = self.small_font.render(f"Error displaying item: {str(e)}", True, (255, 100, 100))
+            surface.blit(error_text, (10, 150))
+            print(f"Error drawing tooltip: {e}")
+        
+        self._tooltip_cache = (item, surface)
+        return surface
+        
+    def get_panel_state(self):
+        """Snapshot of the slot contents, used to invalidate the cached panel."""
+        if self.bound_inventory is not None and self.inventory is self.bound_inventory.items:
+            # Changes arrive through _on_inventory_changed
+            return (id(self.inventory), None)
+        if not isinstance(self.inventory, list):
+            return (id(self.inventory), None)
+        # Stack sizes change without the slot's item changing
+        return (id(self.inventory), tuple((id(item), getattr(item, 'quantity', 1)) if item is not None else None
+                                          for item in self.inventory))
         
     def draw(self, screen: pygame.Surface):
         """Draw the inventory UI."""
         if not self.visible:
             return
             
+        self.blit_panel(screen)
+        
+        # Draw tooltip if visible
+        if self.tooltip_visible:
+            self.draw_tooltip(screen)
+            
+        # Debug rect to show touch target
+        if hasattr(self, 'DEBUG') and self.DEBUG:
+            pygame.draw.rect(screen, (255, 0, 0), self.rect, 1)
+            
+    def _render_panel(self, surface: pygame.Surface):
+        """Render the inventory panel in panel-local coordinates."""
+        if self.inventory is None:
+            print("ERROR: Inventory is None!")
+            # Initialize with empty list to prevent errors
+            self.inventory = []
+        elif not isinstance(self.inventory, list):
+            print(f"ERROR: Inventory is not a list! Type: {type(self.inventory)}")
+            # Try to convert to list if possible, otherwise use empty list
+            try:
+                self.inventory = list(self.inventory)
+            except:
+                self.inventory = []
+                
+        panel = surface.get_rect()
+        
         # Draw background
-        pygame.draw.rect(screen, UI_COLORS['background'], self.rect)
-        pygame.draw.rect(screen, UI_COLORS['border'], self.rect, 2)
+        pygame.draw.rect(surface, UI_COLORS['background'], panel)
+        pygame.draw.rect(surface, UI_COLORS['border'], panel, 2)
         
         # Draw header
         header_text = self.font.render("Inventory", True, UI_COLORS['text'])
-        header_rect = header_text.get_rect(centerx=self.rect.centerx, top=self.rect.top + 10)
-        screen.blit(header_text, header_rect)
+        header_rect = header_text.get_rect(centerx=panel.centerx, top=panel.top + 10)
+        surface.blit(header_text, header_rect)
         
         # DIAGNOSTIC: Draw a direct visual representation of inventory contents at the top
         filled_slots = sum(1 for item in self.inventory if item is not None)
         diagnostic_text = f"Items: {filled_slots}/{len(self.inventory) if self.inventory else 0} - ID: {id(self.inventory)}"
         diag_text = self.small_font.render(diagnostic_text, True, (255, 255, 0))
-        screen.blit(diag_text, (self.rect.left + 10, self.rect.top + 35))
+        surface.blit(diag_text, (panel.left + 10, panel.top + 35))
         
         # Draw an array visualization showing which slots have items
         if self.inventory:
@@ -399,53 +475,32 @@ class InventoryUI:
             slot_spacing = 2
             slot_total = slot_width + slot_spacing
             slots_per_row = min(len(self.inventory), 20)  # Max 20 slots per row
+            tiny_font = pygame.font.Font(None, 10)
             
             for i, item in enumerate(self.inventory):
                 row = i // slots_per_row
                 col = i % slots_per_row
-                x = self.rect.left + 10 + col * slot_total
-                y = self.rect.top + 60 + row * slot_total
+                x = panel.left + 10 + col * slot_total
+                y = panel.top + 60 + row * slot_total
                 
                 # Draw slot representation
                 color = (0, 200, 0) if item is not None else (100, 100, 100)
-                pygame.draw.rect(screen, color, (x, y, slot_width, slot_width))
+                pygame.draw.rect(surface, color, (x, y, slot_width, slot_width))
                 
                 # Add small number indicator for first few items
                 if item is not None and i < 20:
-                    tiny_font = pygame.font.Font(None, 10)
                     idx_text = tiny_font.render(str(i), True, (0, 0, 0))
-                    screen.blit(idx_text, (x, y))
-        
-        # Draw each inventory slot
-        # Debug print to check number of items
-        print(f"\n===== INVENTORY UI DEBUG ====")
-        print(f"Inventory reference: {id(self.inventory)}")
-        print(f"Inventory type: {type(self.inventory)}")
-        if self.inventory is None:
-            print("ERROR: Inventory is None!")
-            # Initialize with empty list to prevent errors
-            self.inventory = []
-        elif not isinstance(self.inventory, list):
-            print(f"ERROR: Inventory is not a list! Type: {type(self.inventory)}")
-            # Try to convert to list if possible, otherwise use empty list
-            try:
-                self.inventory = list(self.inventory)
-            except:
-                self.inventory = []
-        else:
-            print(f"Inventory length: {len(self.inventory)}")
-            filled_slots = sum(1 for item in self.inventory if item is not None)
-            print(f"Filled slots: {filled_slots}")
-            print(f"First few items: {[str(item) if item else 'None' for item in self.inventory[:5]]}")
-        print(f"===== END INVENTORY DEBUG ====\n")
+                    surface.blit(idx_text, (x, y))
         
         # Draw each cell in the grid
-        for i, cell in enumerate(self.grid_cells):
+        for i, screen_cell in enumerate(self.grid.cell_rects()):
+            cell = screen_cell.move(-self.rect.x, -self.rect.y)
+            
             # Draw cell background
-            pygame.draw.rect(screen, UI_COLORS['cell_background'], cell)
+            pygame.draw.rect(surface, UI_COLORS['cell_background'], cell)
             
             # Draw cell border
-            pygame.draw.rect(screen, UI_COLORS['border'], cell, 1)
+            pygame.draw.rect(surface, UI_COLORS['border'], cell, 1)
             
             # Draw item in cell if it exists
             if self.inventory and i < len(self.inventory) and self.inventory[i] is not None:
@@ -467,11 +522,16 @@ class InventoryUI:
                         sprite_y = cell.y + (cell.height - new_height) // 2
                         
                         # Draw the sprite
-                        screen.blit(scaled_sprite, (sprite_x, sprite_y))
+                        surface.blit(scaled_sprite, (sprite_x, sprite_y))
                         
                         # Draw a colored border based on item quality
                         quality_color = item.quality_color
-                        pygame.draw.rect(screen, quality_color, cell, 2)
+                        pygame.draw.rect(surface, quality_color, cell, 2)
+                        
+                        # Stack size in the bottom-right corner
+                        if getattr(item, 'quantity', 1) > 1:
+                            count_text = self.small_font.render(str(item.quantity), True, UI_COLORS['text'])
+                            surface.blit(count_text, count_text.get_rect(bottomright=(cell.right - 4, cell.bottom - 2)))
                         
                     except (pygame.error, FileNotFoundError, AttributeError) as e:
                         # If sprite loading fails, draw a colored rectangle
@@ -482,7 +542,7 @@ class InventoryUI:
                             cell.x + 5, cell.y + 5, 
                             cell.width - 10, cell.height - 10
                         )
-                        pygame.draw.rect(screen, quality_color, inner_rect)
+                        pygame.draw.rect(surface, quality_color, inner_rect)
                         
                         # Add an icon based on item type
                         if hasattr(item, 'weapon_type'):
@@ -493,37 +553,29 @@ class InventoryUI:
                                 (cell.centerx, cell.bottom - 10),
                                 (cell.centerx - 5, cell.centery)
                             ]
-                            pygame.draw.polygon(screen, (200, 200, 200), points)
+                            pygame.draw.polygon(surface, (200, 200, 200), points)
                         elif hasattr(item, 'armor_type'):
                             # Draw a simple shield icon
                             pygame.draw.ellipse(
-                                screen, (200, 200, 200),
+                                surface, (200, 200, 200),
                                 pygame.Rect(cell.centerx - 10, cell.centery - 10, 20, 20),
                                 3
                             )
                         elif hasattr(item, 'consumable_type'):
                             # Draw a simple potion icon
                             pygame.draw.rect(
-                                screen, (200, 200, 200),
+                                surface, (200, 200, 200),
                                 pygame.Rect(cell.centerx - 4, cell.centery - 8, 8, 16)
                             )
                         
                 except Exception as e:
                     # If rendering fails for any reason, draw an X
-                    pygame.draw.line(screen, (255, 0, 0), 
+                    pygame.draw.line(surface, (255, 0, 0), 
                                    (cell.x + 5, cell.y + 5), 
                                    (cell.x + cell.width - 5, cell.y + cell.height - 5), 2)
-                    pygame.draw.line(screen, (255, 0, 0), 
+                    pygame.draw.line(surface, (255, 0, 0), 
                                    (cell.x + cell.width - 5, cell.y + 5), 
                                    (cell.x + 5, cell.y + cell.height - 5), 2)
                     
                     # Log error
                     print(f"Error rendering item in inventory: {e}")
-        
-        # Draw tooltip if visible
-        if self.tooltip_visible:
-            self.draw_tooltip()
-            
-        # Debug rect to show touch target
-        if hasattr(self, 'DEBUG') and self.DEBUG:
-            pygame.draw.rect(screen, (255, 0, 0), self.rect, 1) 
\ No newline at end of file
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Test module for the inventory UI.
+This file tests that the cached inventory panel is re-rendered when stack sizes change.
+"""
+
+import os
+import sys
+import unittest
+
+import pygame
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from rpg_modules.items.base import Inventory
+from rpg_modules.items.consumable import Consumable
+from rpg_modules.ui.inventory import InventoryUI
+
+
+def potions(quantity):
+    """A stack of health potions."""
+    potion = Consumable("health", 25, "Common")
+    potion.quantity = quantity
+    return potion
+
+
+class TestInventoryUI(unittest.TestCase):
+    """Test cases for InventoryUI's panel cache."""
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+        cls.screen = pygame.Surface((800, 600))
+
+    def make_ui(self, inventory=None):
+        ui = InventoryUI(self.screen, inventory)
+        ui.visible = True
+        ui.draw(self.screen)
+        return ui
+
+    def test_bound_inventory_stacking_rerenders(self):
+        inventory = Inventory()
+        inventory.add_item(potions(5))
+        ui = InventoryUI(self.screen)
+        ui.bind_inventory(inventory)
+        ui.visible = True
+        ui.draw(self.screen)
+
+        ui.draw(self.screen)
+        self.assertFalse(ui._panel_rendered)
+
+        inventory.add_item(potions(3))
+        ui.draw(self.screen)
+        self.assertTrue(ui._panel_rendered)
+
+    def test_plain_list_quantity_change_rerenders(self):
+        stack = potions(5)
+        ui = self.make_ui([stack, None])
+
+        stack.quantity = 8
+        ui.draw(self.screen)
+        self.assertTrue(ui._panel_rendered)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,8 +8,9 @@ from ..quests.base import Quest, QuestType, QuestDifficulty, QuestObjective, Que
 from ..utils.colors import *
 from ..utils.fonts import get_font
 from ..utils.ui import draw_text, draw_rect_with_border
+from .retained import RetainedPanel
 
-class QuestUI:
+class QuestUI(RetainedPanel):
     """UI component for displaying and managing quests."""
     
     # Constants for UI layout
@@ -59,6 +60,9 @@ class QuestUI:
         self.details_y = self.quest_list_y
         self.details_width = self.PANEL_WIDTH - self.QUEST_LIST_WIDTH - self.PADDING * 3
         self.details_height = self.QUEST_LIST_HEIGHT
+        
+        # Cached panel surface, re-rendered only when the quest state changes
+        self._init_retained_panel(pygame.Rect(self.x, self.y, self.PANEL_WIDTH, self.PANEL_HEIGHT))
     
     def toggle(self):
         """Toggle the visibility of the quest UI."""
@@ -129,57 +133,83 @@ class QuestUI:
         self.max_scroll = max(0, content_height - self.QUEST_LIST_HEIGHT)
         self.scroll_offset = min(self.scroll_offset, self.max_scroll)
     
+    def get_panel_state(self):
+        """Snapshot of the displayed quest state, used to invalidate the cached panel."""
+        tab_counts = tuple(len(self.quest_log.get_quests_by_type(quest_type)) for quest_type in QuestType)
+        # Status and objective progress of the listed quests and the one in the details pane
+        shown = list(self.quest_log.get_quests_by_type(self.selected_tab))
+        if self.selected_quest is not None:
+            shown.append(self.selected_quest)
+        progress = tuple(
+            (id(quest), quest.status,
+             tuple((objective.current_progress, objective.completed) for objective in quest.objectives))
+            for quest in shown
+        )
+        return (
+            self.selected_tab,
+            id(self.selected_quest),
+            id(self.hovered_quest),
+            self.scroll_offset,
+            tab_counts,
+            progress
+        )
+    
     def draw(self, screen: pygame.Surface):
         """Draw the quest UI."""
         if not self.visible:
             return
         
+        self.panel_rect.topleft = (self.x, self.y)
+        self.blit_panel(screen)
+    
+    def _render_panel(self, surface: pygame.Surface):
+        """Render the quest panel in panel-local coordinates."""
         # Draw main panel background
         draw_rect_with_border(
-            screen,  # Use the passed screen
-            (self.x, self.y, self.PANEL_WIDTH, self.PANEL_HEIGHT),
+            surface,
+            (0, 0, self.PANEL_WIDTH, self.PANEL_HEIGHT),
             DARK_GRAY,
             WHITE
         )
         
         # Draw tabs
-        self._draw_tabs()
+        self._draw_tabs(surface)
         
         # Draw quest list panel
         draw_rect_with_border(
-            screen,  # Use the passed screen
-            (self.quest_list_x, self.quest_list_y, self.QUEST_LIST_WIDTH, self.QUEST_LIST_HEIGHT),
+            surface,
+            (self.quest_list_x - self.x, self.quest_list_y - self.y, self.QUEST_LIST_WIDTH, self.QUEST_LIST_HEIGHT),
             BLACK,
             WHITE
         )
         
         # Draw quest list
-        self._draw_quest_list()
+        self._draw_quest_list(surface)
         
         # Draw details panel
         draw_rect_with_border(
-            screen,  # Use the passed screen
-            (self.details_x, self.details_y, self.details_width, self.details_height),
+            surface,
+            (self.details_x - self.x, self.details_y - self.y, self.details_width, self.details_height),
             BLACK,
             WHITE
         )
         
         # Draw quest details if a quest is selected
         if self.selected_quest:
-            self._draw_quest_details()
+            self._draw_quest_details(surface)
     
-    def _draw_tabs(self):
-        """Draw quest type tabs."""
+    def _draw_tabs(self, surface: pygame.Surface):
+        """Draw quest type tabs (panel-local)."""
         tab_width = self.QUEST_LIST_WIDTH // 3
-        tab_y = self.y + self.PADDING
+        tab_y = self.PADDING
         
         for i, quest_type in enumerate(QuestType):
-            tab_x = self.quest_list_x + i * tab_width
+            tab_x = self.quest_list_x - self.x + i * tab_width
             tab_color = LIGHT_GRAY if quest_type == self.selected_tab else DARK_GRAY
             
             # Draw tab background
             draw_rect_with_border(
-                self.screen,
+                surface,
                 (tab_x, tab_y, tab_width, self.TAB_HEIGHT),
                 tab_color,
                 WHITE
@@ -189,7 +219,7 @@ class QuestUI:
             quests = self.quest_log.get_quests_by_type(quest_type)
             tab_text = f"{quest_type.name} ({len(quests)})"
             draw_text(
-                self.screen,
+                surface,
                 tab_text,
                 self.small_font,
                 WHITE,
@@ -198,8 +228,8 @@ class QuestUI:
                 center=True
             )
     
-    def _draw_quest_list(self):
-        """Draw the list of quests for the selected type."""
+    def _draw_quest_list(self, surface: pygame.Surface):
+        """Draw the list of quests for the selected type (panel-local)."""
         quests = self.quest_log.get_quests_by_type(self.selected_tab)
         
         # Create a surface for the quest list with clipping
@@ -268,18 +298,18 @@ class QuestUI:
                 align="right"
             )
         
-        # Draw the list surface to the screen
-        self.screen.blit(list_surface, (self.quest_list_x, self.quest_list_y))
+        # Draw the list surface onto the panel
+        surface.blit(list_surface, (self.quest_list_x - self.x, self.quest_list_y - self.y))
     
-    def _draw_quest_details(self):
-        """Draw detailed information about the selected quest."""
-        x = self.details_x + self.PADDING
-        y = self.details_y + self.PADDING
+    def _draw_quest_details(self, surface: pygame.Surface):
+        """Draw detailed information about the selected quest (panel-local)."""
+        x = self.details_x - self.x + self.PADDING
+        y = self.details_y - self.y + self.PADDING
         width = self.details_width - self.PADDING * 2
         
         # Draw quest title
         draw_text(
-            self.screen,
+            surface,
             self.selected_quest.title,
             self.title_font,
             WHITE,
@@ -291,7 +321,7 @@ class QuestUI:
         # Draw difficulty
         difficulty_color = self.DIFFICULTY_COLORS.get(self.selected_quest.difficulty, WHITE)
         draw_text(
-            self.screen,
+            surface,
             f"Difficulty: {self.selected_quest.difficulty.name}",
             self.font,
             difficulty_color,
@@ -304,7 +334,7 @@ class QuestUI:
         if self.selected_quest.chain_id:
             chain_text = f"Quest Chain: {self.selected_quest.chain_position}/3"
             draw_text(
-                self.screen,
+                surface,
                 chain_text,
                 self.font,
                 GOLD,
@@ -323,7 +353,7 @@ class QuestUI:
                 quest.title for quest in prereq_quests if quest
             )
             draw_text(
-                self.screen,
+                surface,
                 prereq_text,
                 self.small_font,
                 LIGHT_GRAY,
@@ -334,6 +364,7 @@ class QuestUI:
         
         # Draw description
         y = self._draw_wrapped_text(
+            surface,
             self.selected_quest.description,
             self.font,
             LIGHT_GRAY,
@@ -344,7 +375,7 @@ class QuestUI:
         
         # Draw objectives header
         draw_text(
-            self.screen,
+            surface,
             "Objectives:",
             self.font,
             WHITE,
@@ -358,7 +389,7 @@ class QuestUI:
             status_color = GREEN if objective.is_complete else LIGHT_GRAY
             progress_text = f"{objective.description} ({objective.progress}/{objective.required_progress})"
             draw_text(
-                self.screen,
+                surface,
                 progress_text,
                 self.font,
                 status_color,
@@ -371,7 +402,7 @@ class QuestUI:
         
         # Draw rewards header
         draw_text(
-            self.screen,
+            surface,
             "Rewards:",
             self.font,
             WHITE,
@@ -383,7 +414,7 @@ class QuestUI:
         # Draw rewards
         for reward in self.selected_quest.rewards:
             draw_text(
-                self.screen,
+                surface,
                 reward.description,
                 self.font,
                 GOLD,
@@ -392,7 +423,7 @@ class QuestUI:
             )
             y += 25
     
-    def _draw_wrapped_text(self, text: str, font: pygame.font.Font, color: Tuple[int, int, int],
+    def _draw_wrapped_text(self, surface: pygame.Surface, text: str, font: pygame.font.Font, color: Tuple[int, int, int],
                           x: int, y: int, max_width: int) -> int:
         """Draw text wrapped to fit within max_width. Returns the new y position."""
         words = text.split()
@@ -414,7 +445,7 @@ class QuestUI:
             lines.append(" ".join(current_line))
         
         for line in lines:
-            draw_text(self.screen, line, font, color, x, y)
+            draw_text(surface, line, font, color, x, y)
             y += font.get_height()
         
         return y 
\ No newline at end of file
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Test module for the quest UI.
+This file tests that the cached quest panel notices progress and status changes.
+"""
+
+import os
+import sys
+import unittest
+
+import pygame
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from rpg_modules.quests import Quest, QuestType, QuestStatus, QuestLog, KillObjective
+from rpg_modules.ui.quest import QuestUI
+
+
+class TestQuestUIPanelState(unittest.TestCase):
+    """Test cases for QuestUI.get_panel_state."""
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+
+    def setUp(self):
+        self.objective = KillObjective(target_type="goblin", description="Kill 3 goblins",
+                                       required_progress=3)
+        self.quest = Quest(id="goblins", title="Goblins", description="Thin the goblins",
+                           quest_type=QuestType.MAIN, objectives=[self.objective])
+        quest_log = QuestLog()
+        quest_log.add_quest(self.quest)
+        self.ui = QuestUI(pygame.Surface((800, 600)), quest_log)
+
+    def test_objective_progress_changes_state(self):
+        state = self.ui.get_panel_state()
+        self.objective.update_progress()
+        self.assertNotEqual(self.ui.get_panel_state(), state)
+
+    def test_status_change_changes_state(self):
+        state = self.ui.get_panel_state()
+        self.quest.status = QuestStatus.IN_PROGRESS
+        self.assertNotEqual(self.ui.get_panel_state(), state)
+
+    def test_unchanged_quests_keep_state(self):
+        self.assertEqual(self.ui.get_panel_state(), self.ui.get_panel_state())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+"""
+Retained-mode rendering helpers for UI panels.
+
+Panels render their static content once to a cached surface and composite it
+with a single blit every frame. The cache is only rebuilt when the panel is
+invalidated, either explicitly or because its state snapshot changed.
+
+Dirty-rect presentation (``DirtyRectTracker``) is used by ``GameFlow``, which
+knows when the world behind a panel is frozen. Game loops that redraw the
+whole world every frame still get the cached panels but present with
+``pygame.display.flip()``.
+"""
+
+import pygame
+from typing import Any, List, Optional, Tuple
+
+
+class RetainedPanel:
+    """
+    Mixin for UI panels that cache their rendering on their own surface.
+
+    Subclasses call ``_init_retained_panel`` with the rect the panel occupies
+    on screen, implement ``_render_panel`` to draw in panel-local coordinates
+    and may override ``get_panel_state`` to return a cheap, comparable snapshot
+    of whatever the panel displays. A change in that snapshot invalidates the
+    cache automatically; anything else can call ``invalidate`` directly.
+    """
+
+    def _init_retained_panel(self, rect: pygame.Rect):
+        """
+        Set up the panel cache.
+
+        Args:
+            rect: The rect the panel occupies on screen. It is kept by
+                reference, so moving it moves the panel.
+        """
+        self.panel_rect = rect
+        self._panel_surface: Optional[pygame.Surface] = None
+        self._panel_state: Any = None
+        self._panel_dirty = True
+        self._panel_rendered = False
+        self._overlay_rect: Optional[pygame.Rect] = None
+        self._presented_overlay_rect: Optional[pygame.Rect] = None
+        self._presented_panel_pos: Optional[Tuple[int, int]] = None
+
+    def invalidate(self):
+        """Mark the cached panel surface as stale."""
+        self._panel_dirty = True
+
+    def get_panel_state(self) -> Any:
+        """Return a snapshot of the displayed state. Override in subclasses."""
+        return None
+
+    def _render_panel(self, surface: pygame.Surface):
+        """Draw the panel contents onto ``surface`` using local coordinates."""
+        raise NotImplementedError
+
+    def blit_panel(self, screen: pygame.Surface):
+        """Composite the cached panel onto the screen, re-rendering if stale."""
+        self._panel_rendered = False
+        self._overlay_rect = None
+
+        state = self.get_panel_state()
+        if state != self._panel_state:
+            self._panel_state = state
+            self._panel_dirty = True
+
+        size = self.panel_rect.size
+        if self._panel_surface is None or self._panel_surface.get_size() != size:
+            self._panel_surface = pygame.Surface(size)
+            self._panel_dirty = True
+
+        if self._panel_dirty:
+            self._render_panel(self._panel_surface)
+            self._panel_dirty = False
+            self._panel_rendered = True
+
+        screen.blit(self._panel_surface, self.panel_rect)
+
+    def blit_overlay(self, screen: pygame.Surface, surface: pygame.Surface,
+                     pos: Tuple[int, int]):
+        """Blit a floating surface (such as a tooltip) above the panel."""
+        screen.blit(surface, pos)
+        self._overlay_rect = pygame.Rect(pos, surface.get_size())
+
+    def consume_dirty_rects(self) -> List[pygame.Rect]:
+        """
+        Return the screen areas this panel changed since the last call.
+
+        Covers the panel itself when it was re-rendered or moved, and the old
+        and new positions of its overlay when that appeared, moved or vanished.
+        """
+        rects = []
+        panel_pos = self.panel_rect.topleft
+        if self._panel_rendered or panel_pos != self._presented_panel_pos:
+            if self._presented_panel_pos is not None and panel_pos != self._presented_panel_pos:
+                rects.append(pygame.Rect(self._presented_panel_pos, self.panel_rect.size))
+            rects.append(self.panel_rect.copy())
+            self._presented_panel_pos = panel_pos
+            self._panel_rendered = False
+
+        if self._overlay_rect != self._presented_overlay_rect:
+            if self._presented_overlay_rect is not None:
+                rects.append(self._presented_overlay_rect)
+            if self._overlay_rect is not None:
+                rects.append(self._overlay_rect)
+            self._presented_overlay_rect = self._overlay_rect
+
+        return rects
+
+
+class DirtyRectTracker:
+    """
+    Collects changed screen areas for a frame and presents them.
+
+    Falls back to a full ``pygame.display.flip()`` whenever a full redraw was
+    requested, otherwise only the collected rects are pushed with
+    ``pygame.display.update``.
+    """
+
+    def __init__(self):
+        """Initialize the tracker, starting with a full redraw."""
+        self._rects: List[pygame.Rect] = []
+        self._full_redraw = True
+
+    def request_full_redraw(self):
+        """Present the whole screen on the next call to ``present``."""
+        self._full_redraw = True
+
+    def add(self, rect: pygame.Rect):
+        """Add a single changed area."""
+        self._rects.append(rect)
+
+    def extend(self, rects: List[pygame.Rect]):
+        """Add several changed areas."""
+        self._rects.extend(rects)
+
+    def present(self):
+        """Push this frame to the display and reset for the next one."""
+        if self._full_redraw:
+            pygame.display.flip()
+        elif self._rects:
+            pygame.display.update(self._rects)
+
+        self._rects = []
+        self._full_redraw = False
@@ -8,8 +8,9 @@ from ..core.constants import (
     UI_COLORS, UI_DIMENSIONS, QUALITY_COLORS,
     FONT_SIZES, SCREEN_WIDTH, SCREEN_HEIGHT
 )
+from .retained import RetainedPanel
 
-class SystemMenuUI:
+class SystemMenuUI(RetainedPanel):
     """A reusable system menu UI component for pygame games."""
     
     def __init__(self, screen: pygame.Surface):
@@ -76,6 +77,11 @@ class SystemMenuUI:
         # Update settings from current game settings
         self._sync_with_game_settings()
         
+        # Cached overlay and panel surfaces
+        self._overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self._overlay.fill((0, 0, 0, 180))  # Dark overlay with alpha
+        self._init_retained_panel(self.rect)
+        
     def _sync_with_game_settings(self):
         """Synchronize UI with current game settings."""
         try:
@@ -240,32 +246,41 @@ class SystemMenuUI:
         """Update the system menu UI."""
         pass  # No animation or state changes needed yet
         
+    def get_panel_state(self):
+        """Snapshot of the displayed menu state, used to invalidate the cached panel."""
+        return (self.hovered_option, self.selected_option, self.current_difficulty)
+        
     def draw(self, screen: pygame.Surface):
         """Draw the system menu UI."""
         if not self.visible:
             return
             
         # Update position if needed
-        self.rect.topleft = (self.x, self.y)
-        self._create_buttons()  # Recreate buttons to match position
+        if self.rect.topleft != (self.x, self.y):
+            self.rect.topleft = (self.x, self.y)
+            self._create_buttons()  # Recreate buttons to match position
         
         # Semi-transparent dark overlay for entire screen
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))  # Dark overlay with alpha
-        screen.blit(overlay, (0, 0))
+        screen.blit(self._overlay, (0, 0))
         
+        self.blit_panel(screen)
+        
+    def _render_panel(self, surface: pygame.Surface):
+        """Render the menu panel in panel-local coordinates."""
         # Draw menu background
-        pygame.draw.rect(screen, UI_COLORS['background'], self.rect)
-        pygame.draw.rect(screen, UI_COLORS['border'], self.rect, 2)
+        panel = surface.get_rect()
+        pygame.draw.rect(surface, UI_COLORS['background'], panel)
+        pygame.draw.rect(surface, UI_COLORS['border'], panel, 2)
         
         # Draw title
         title = self.title_font.render("System Menu", True, UI_COLORS['text'])
-        title_x = self.x + (self.width - title.get_width()) // 2
-        screen.blit(title, (title_x, self.y + 20))
+        title_x = (self.width - title.get_width()) // 2
+        surface.blit(title, (title_x, 20))
         
         # Draw buttons
-        for i, button in enumerate(self.buttons):
+        for i, screen_button in enumerate(self.buttons):
             option = self.options[i]
+            button = screen_button.move(-self.x, -self.y)
             
             # Determine button color
             if option == self.selected_option:
@@ -276,55 +291,60 @@ class SystemMenuUI:
                 button_color = (50, 50, 80)     # Default color
                 
             # Draw button
-            pygame.draw.rect(screen, button_color, button, border_radius=5)
-            pygame.draw.rect(screen, UI_COLORS['border'], button, 2, border_radius=5)
+            pygame.draw.rect(surface, button_color, button, border_radius=5)
+            pygame.draw.rect(surface, UI_COLORS['border'], button, 2, border_radius=5)
             
             # Draw option text
             text = self.font.render(option, True, UI_COLORS['text'])
             text_x = button.x + (button.width - text.get_width()) // 2
             text_y = button.y + (button.height - text.get_height()) // 2
-            screen.blit(text, (text_x, text_y))
+            surface.blit(text, (text_x, text_y))
         
         # Draw settings section header
         settings_header = self.font.render("Game Settings", True, UI_COLORS['text'])
-        settings_x = self.x + 20
-        settings_y = self.settings_section_y - 30
-        screen.blit(settings_header, (settings_x, settings_y))
+        settings_x = 20
+        settings_y = self.settings_section_y - self.y - 30
+        surface.blit(settings_header, (settings_x, settings_y))
         
         # Draw settings divider line
         pygame.draw.line(
-            screen, 
+            surface, 
             UI_COLORS['border'], 
-            (self.x + 20, settings_y + 25), 
-            (self.x + self.width - 20, settings_y + 25),
+            (20, settings_y + 25), 
+            (self.width - 20, settings_y + 25),
             1
         )
         
         # Draw difficulty controls
+        label_rect = self.difficulty_label_rect.move(-self.x, -self.y)
+        decrease_rect = self.difficulty_decrease_rect.move(-self.x, -self.y)
+        value_rect = self.difficulty_value_rect.move(-self.x, -self.y)
+        increase_rect = self.difficulty_increase_rect.move(-self.x, -self.y)
+        
         # Label
         difficulty_label = self.settings_font.render("Difficulty:", True, UI_COLORS['text'])
-        screen.blit(difficulty_label, (self.difficulty_label_rect.x, self.difficulty_label_rect.y + 5))
+        surface.blit(difficulty_label, (label_rect.x, label_rect.y + 5))
         
         # Decrease button (-)
-        pygame.draw.rect(screen, (70, 70, 100), self.difficulty_decrease_rect, border_radius=3)
-        pygame.draw.rect(screen, UI_COLORS['border'], self.difficulty_decrease_rect, 1, border_radius=3)
+        pygame.draw.rect(surface, (70, 70, 100), decrease_rect, border_radius=3)
+        pygame.draw.rect(surface, UI_COLORS['border'], decrease_rect, 1, border_radius=3)
         minus_text = self.font.render("-", True, UI_COLORS['text'])
-        minus_x = self.difficulty_decrease_rect.x + (self.difficulty_decrease_rect.width - minus_text.get_width()) // 2
-        minus_y = self.difficulty_decrease_rect.y + (self.difficulty_decrease_rect.height - minus_text.get_height()) // 2
-        screen.blit(minus_text, (minus_x, minus_y))
+        minus_x = decrease_rect.x + (decrease_rect.width - minus_text.get_width()) // 2
+        minus_y = decrease_rect.y + (decrease_rect.height - minus_text.get_height()) // 2
+        surface.blit(minus_text, (minus_x, minus_y))
         
         # Value
-        pygame.draw.rect(screen, (60, 60, 80), self.difficulty_value_rect, border_radius=3)
-        pygame.draw.rect(screen, UI_COLORS['border'], self.difficulty_value_rect, 1, border_radius=3)
+        pygame.draw.rect(surface, (60, 60, 80), value_rect, border_radius=3)
+        pygame.draw.rect(surface, UI_COLORS['border'], value_rect, 1, border_radius=3)
         difficulty_text = self.settings_font.render(self.difficulty_levels[self.current_difficulty], True, UI_COLORS['text'])
-        value_x = self.difficulty_value_rect.x + (self.difficulty_value_rect.width - difficulty_text.get_width()) // 2
-        value_y = self.difficulty_value_rect.y + (self.difficulty_value_rect.height - difficulty_text.get_height()) // 2
-        screen.blit(difficulty_text, (value_x, value_y))
+        value_x = value_rect.x + (value_rect.width - difficulty_text.get_width()) // 2
+        value_y = value_rect.y + (value_rect.height - difficulty_text.get_height()) // 2
+        surface.blit(difficulty_text, (value_x, value_y))
         
         # Increase button (+)
-        pygame.draw.rect(screen, (70, 70, 100), self.difficulty_increase_rect, border_radius=3)
-        pygame.draw.rect(screen, UI_COLORS['border'], self.difficulty_increase_rect, 1, border_radius=3)
+        pygame.draw.rect(surface, (70, 70, 100), increase_rect, border_radius=3)
+        pygame.draw.rect(surface, UI_COLORS['border'], increase_rect, 1, border_radius=3)
         plus_text = self.font.render("+", True, UI_COLORS['text'])
-        plus_x = self.difficulty_increase_rect.x + (self.difficulty_increase_rect.width - plus_text.get_width()) // 2
-        plus_y = self.difficulty_increase_rect.y + (self.difficulty_increase_rect.height - plus_text.get_height()) // 2
-        screen.blit(plus_text, (plus_x, plus_y)) 
\ No newline at end of file
+        plus_x = increase_rect.x + (increase_rect.width - plus_text.get_width()) // 2
+        plus_y = increase_rect.y + (increase_rect.height - plus_text.get_height()) // 2
+        surface.blit(plus_text, (plus_x, plus_y)) 
\ No newline at end of file
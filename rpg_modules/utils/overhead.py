@@ -0,0 +1,154 @@
+"""
+Cached overhead UI: nameplates, health bars and floating combat numbers.
+
+Everything drawn above characters is rendered once and reused:
+
+- Nameplates are cached per text, font size and colour, so a nameplate is
+  only rasterized again when the name, level or zoom (font size) changes.
+- Health bars are cached per size and filled width and can be collected in
+  a ``HealthBarBatch`` and drawn with a single ``Surface.blits`` call.
+- Combat numbers are assembled from a ``DigitAtlas`` of pre-rendered glyphs
+  instead of calling ``font.render`` for every number on every frame.
+"""
+
+import pygame
+from typing import Dict, List, Optional, Tuple
+from .fonts import get_font
+
+Color = Tuple[int, int, int]
+
+# Cached surfaces are dropped wholesale when a cache grows past this size
+MAX_CACHED_SURFACES = 512
+
+_nameplates: Dict[Tuple[str, int, Color], pygame.Surface] = {}
+_health_bars: Dict[Tuple, pygame.Surface] = {}
+_digit_atlases: Dict[Tuple[int, Color], 'DigitAtlas'] = {}
+
+
+def get_nameplate(text: str, font_size: int, color: Color = (255, 255, 255)) -> pygame.Surface:
+    """
+    Get the rendered nameplate for a text.
+
+    Args:
+        text: Nameplate text (for example "Hero lvl 3")
+        font_size: Font size, usually scaled by the camera zoom
+        color: Text colour
+    """
+    key = (text, font_size, color)
+    surface = _nameplates.get(key)
+    if surface is None:
+        if len(_nameplates) >= MAX_CACHED_SURFACES:
+            _nameplates.clear()
+        surface = get_font(font_size).render(text, True, color)
+        _nameplates[key] = surface
+    return surface
+
+
+def get_health_bar(width: int, height: int, fill_width: int, fill_color: Color,
+                   background: Color = (100, 0, 0),
+                   border: Optional[Color] = None) -> pygame.Surface:
+    """
+    Get a rendered health bar.
+
+    Args:
+        width: Bar width in pixels
+        height: Bar height in pixels
+        fill_width: Width of the filled part in pixels
+        fill_color: Colour of the filled part
+        background: Colour of the empty part
+        border: Optional 1-pixel border colour
+    """
+    fill_width = max(0, min(width, fill_width))
+    key = (width, height, fill_width, fill_color, background, border)
+    surface = _health_bars.get(key)
+    if surface is None:
+        if len(_health_bars) >= MAX_CACHED_SURFACES:
+            _health_bars.clear()
+        surface = pygame.Surface((max(1, width), max(1, height)))
+        surface.fill(background)
+        if fill_width > 0:
+            surface.fill(fill_color, (0, 0, fill_width, height))
+        if border is not None:
+            pygame.draw.rect(surface, border, surface.get_rect(), 1)
+        _health_bars[key] = surface
+    return surface
+
+
+class HealthBarBatch:
+    """Collects health bars during a frame and draws them with one blits call."""
+
+    def __init__(self):
+        """Initialize an empty batch."""
+        self._blits: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+
+    def add(self, x: int, y: int, width: int, height: int, percent: float, fill_color: Color,
+            background: Color = (100, 0, 0), border: Optional[Color] = None):
+        """Queue a health bar at a screen position."""
+        percent = max(0.0, min(1.0, percent))
+        bar = get_health_bar(width, height, int(width * percent), fill_color, background, border)
+        self._blits.append((bar, (int(x), int(y))))
+
+    def flush(self, screen: pygame.Surface):
+        """Draw and clear all queued health bars."""
+        if self._blits:
+            screen.blits(self._blits, doreturn=False)
+            self._blits.clear()
+
+
+class DigitAtlas:
+    """
+    Pre-rendered glyphs for combat numbers.
+
+    Digits and signs are rendered once; numbers are drawn by blitting their
+    glyphs side by side. Characters outside the atlas are rendered on first
+    use and kept as well.
+    """
+
+    GLYPHS = "0123456789+-"
+
+    def __init__(self, font_size: int, color: Color):
+        """
+        Initialize the atlas.
+
+        Args:
+            font_size: Font size of the glyphs
+            color: Glyph colour
+        """
+        self.font = get_font(font_size)
+        self.color = color
+        self.glyphs: Dict[str, pygame.Surface] = {
+            char: self.font.render(char, True, color) for char in self.GLYPHS
+        }
+
+    def _get_glyph(self, char: str) -> pygame.Surface:
+        """Get a glyph, rendering characters outside the atlas on first use."""
+        glyph = self.glyphs.get(char)
+        if glyph is None:
+            glyph = self.font.render(char, True, self.color)
+            self.glyphs[char] = glyph
+        return glyph
+
+    def measure(self, text: str) -> Tuple[int, int]:
+        """Size of a text drawn with this atlas."""
+        glyphs = [self._get_glyph(char) for char in text]
+        return sum(g.get_width() for g in glyphs), max((g.get_height() for g in glyphs), default=0)
+
+    def draw(self, surface: pygame.Surface, text: str, position: Tuple[int, int]):
+        """Draw a text with its top-left corner at position."""
+        x, y = int(position[0]), int(position[1])
+        blits = []
+        for char in text:
+            glyph = self._get_glyph(char)
+            blits.append((glyph, (x, y)))
+            x += glyph.get_width()
+        surface.blits(blits, doreturn=False)
+
+
+def get_digit_atlas(font_size: int, color: Color) -> DigitAtlas:
+    """Get the shared digit atlas for a font size and colour."""
+    key = (font_size, tuple(color))
+    atlas = _digit_atlases.get(key)
+    if atlas is None:
+        atlas = DigitAtlas(font_size, tuple(color))
+        _digit_atlases[key] = atlas
+    return atlas
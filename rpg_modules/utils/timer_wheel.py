@@ -0,0 +1,84 @@
+"""
+Hashed timer wheel for scheduling many low-frequency wake-ups.
+
+Items are dropped into a ring of time slots. Advancing the wheel only looks
+at the slots the clock passes, so thousands of scheduled items cost nothing
+until their slot comes up. Delays longer than one turn of the wheel are
+handled by counting the remaining turns.
+"""
+
+import math
+from typing import Any, Dict, List
+
+
+class TimerWheel:
+    """Schedules items to come due after a delay."""
+
+    def __init__(self, slot_duration: float = 0.25, num_slots: int = 64):
+        """
+        Initialize the wheel.
+
+        Args:
+            slot_duration: Seconds per slot (the timer resolution)
+            num_slots: Slots in the ring
+        """
+        self.slot_duration = slot_duration
+        self.num_slots = num_slots
+        self._slots: List[List[list]] = [[] for _ in range(num_slots)]
+        self._entries: Dict[int, list] = {}
+        self._cursor = 0
+        self._elapsed = 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, item: Any) -> bool:
+        return id(item) in self._entries
+
+    def schedule(self, item: Any, delay: float):
+        """Schedule an item, replacing an earlier schedule of the same item."""
+        self.cancel(item)
+        ticks = max(1, math.ceil(delay / self.slot_duration))
+        entry = [item, (ticks - 1) // self.num_slots, True]  # item, remaining turns, live
+        self._slots[(self._cursor + ticks) % self.num_slots].append(entry)
+        self._entries[id(item)] = entry
+
+    def cancel(self, item: Any):
+        """Unschedule an item (no-op if it is not scheduled)."""
+        entry = self._entries.pop(id(item), None)
+        if entry:
+            entry[2] = False
+
+    def advance(self, dt: float) -> List[Any]:
+        """
+        Move the clock forward.
+
+        Returns:
+            The items that came due, in schedule order
+        """
+        self._elapsed += dt
+        due = []
+        while self._elapsed >= self.slot_duration:
+            self._elapsed -= self.slot_duration
+            self._cursor = (self._cursor + 1) % self.num_slots
+            bucket = self._slots[self._cursor]
+            if not bucket:
+                continue
+            pending = []
+            for entry in bucket:
+                if not entry[2]:
+                    continue
+                if entry[1] > 0:
+                    entry[1] -= 1
+                    pending.append(entry)
+                else:
+                    del self._entries[id(entry[0])]
+                    due.append(entry[0])
+            self._slots[self._cursor] = pending
+        return due
+
+    def clear(self):
+        """Unschedule everything."""
+        for bucket in self._slots:
+            bucket.clear()
+        self._entries.clear()
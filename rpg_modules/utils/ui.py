@@ -7,7 +7,8 @@ from typing import Tuple, Optional
 
 def draw_text(surface: pygame.Surface, text: str, font: pygame.font.Font,
               color: Tuple[int, int, int], x: int, y: int,
-              align: str = "left", center: bool = False) -> None:
+              align: str = "left", center: bool = False,
+              max_width: Optional[int] = None) -> None:
     """
     Draw text on a surface with various alignment options.
     
@@ -20,8 +21,11 @@ def draw_text(surface: pygame.Surface, text: str, font: pygame.font.Font,
         y: The y position
         align: Text alignment ("left", "center", or "right")
         center: Whether to center the text vertically
+        max_width: Optional width to clip the rendered text to
     """
     text_surface = font.render(text, True, color)
+    if max_width is not None and text_surface.get_width() > max_width:
+        text_surface = text_surface.subsurface((0, 0, max_width, text_surface.get_height()))
     text_rect = text_surface.get_rect()
     
     if align == "right":
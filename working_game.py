@@ -17,6 +17,9 @@ try:
 except ImportError:
     MONSTER_ICONS_AVAILABLE = False
 
+from rpg_modules.utils.overhead import HealthBarBatch, get_health_bar, get_digit_atlas
+from rpg_modules.core.combat import CombatResolver
+
 # Constants
 SCREEN_WIDTH = 1024
 SCREEN_HEIGHT = 768
@@ -181,6 +184,23 @@ class Player:
         self.kills = {}
         self.visited_locations = set()
         self.dialog_complete = set()
+        self.attack_type = 1  # 1=Regular, 2=Heavy, 3=Magic, 4=Quick
+        self.attack_range = 1.5 * TILE_SIZE
+
+    def get_attack_range(self):
+        """Attack range in pixels for the current attack type"""
+        if self.attack_type == 3:
+            return self.attack_range * 1.5
+        if self.attack_type == 2:
+            return self.attack_range * 0.8
+        return self.attack_range
+
+    def switch_attack_type(self, new_type):
+        """Switch to another attack type (1-4)"""
+        if not (1 <= new_type <= 4):
+            return False
+        self.attack_type = new_type
+        return True
 
 class GameMap:
     """Simple game map with different terrain types"""
@@ -298,14 +318,16 @@ class Game:
         
         # Monster system
         self.monsters = []
+        self.combat = CombatResolver()  # Spatial index of monsters for hit tests
         self.spawn_monsters()
         self.damage_feedback = []  # List of (x, y, text, timer)
         self.player_last_hit_time = 0
         self.player_damage_feedback = []  # List of (x, y, text, timer)
         self.monster_icon_cache = {}
+        self.health_bars = HealthBarBatch()  # Monster health bars, drawn in one batch
         
     def is_tile_occupied_by_monster(self, tile_x, tile_y, exclude_monster=None):
-        for m in self.monsters:
+        for m in self.combat.within(tile_x * TILE_SIZE, tile_y * TILE_SIZE, TILE_SIZE):
             if m is exclude_monster:
                 continue
             mx = int(round(m.x / TILE_SIZE))
@@ -349,6 +371,7 @@ class Game:
                     monster = SimpleMonster(x * TILE_SIZE, y * TILE_SIZE, monster_type)
                 
                 self.monsters.append(monster)
+                self.combat.add(monster)
                 print(f"Spawned {monster_type} at ({x}, {y})")
     
     def load_quests(self):
@@ -379,6 +402,8 @@ class Game:
                     self.player_attack()
                 elif event.key == pygame.K_h:
                     self.player_heal()
+                elif event.key in (pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4):
+                    self.player.switch_attack_type(event.key - pygame.K_0)
                 elif event.key in [pygame.K_w, pygame.K_UP]:
                     self.keys_pressed.add(event.key)
                     self.last_move_dir = (0, -1)
@@ -498,17 +523,16 @@ class Game:
         bar_width = TILE_SIZE
         bar_height = 6
         health_percent = max(0, min(1, self.player.health / self.player.max_health))
-        pygame.draw.rect(self.screen, RED, (screen_x, screen_y + TILE_SIZE + 2, bar_width, bar_height))
-        pygame.draw.rect(self.screen, GREEN, (screen_x, screen_y + TILE_SIZE + 2, int(bar_width * health_percent), bar_height))
-        pygame.draw.rect(self.screen, BLACK, (screen_x, screen_y + TILE_SIZE + 2, bar_width, bar_height), 1)
+        health_bar = get_health_bar(bar_width, bar_height, int(bar_width * health_percent), GREEN, RED, BLACK)
+        self.screen.blit(health_bar, (screen_x, screen_y + TILE_SIZE + 2))
         # Draw player damage/heal feedback
         for fb in self.player_damage_feedback:
             px, py, text, timer, *color = fb
             fx = (px - self.camera_x) * TILE_SIZE
             fy = (py - self.camera_y) * TILE_SIZE
             col = color[0] if color else RED
-            text_surface = self.font.render(text, True, col)
-            self.screen.blit(text_surface, (fx + TILE_SIZE // 2 - 10, fy - 20 - int((0.7 - timer) * 30)))
+            # Numbers are assembled from cached glyphs instead of rendered each frame
+            get_digit_atlas(24, col).draw(self.screen, text, (fx + TILE_SIZE // 2 - 10, fy - 20 - int((0.7 - timer) * 30)))
     
     def draw_ui(self):
         """Draw UI elements"""
@@ -531,6 +555,7 @@ class Game:
             "Q: Toggle Quest",
             "D: Toggle Dialog", 
             "SPACE: Add Quest Progress",
+            "F: Attack, 1-4: Attack Type",
             "ESC: Exit"
         ]
         
@@ -663,8 +688,10 @@ class Game:
     def update_monsters(self, dt):
         """Update all monsters"""
         player_pos = (self.player.x * TILE_SIZE, self.player.y * TILE_SIZE)
+        attack_range_sq = (TILE_SIZE * 1.1) ** 2
+        despawn_range_sq = (100 * TILE_SIZE) ** 2
         
-        for monster in self.monsters[:]:  # Copy list to avoid modification during iteration
+        for monster in self.monsters:
             # Update monster
             if hasattr(monster, 'update'):
                 # Pass self (game) to update for overlap check
@@ -672,18 +699,20 @@ class Game:
                     monster.update(dt, player_pos, game=self)
                 except TypeError:
                     monster.update(dt, player_pos)
+                self.combat.moved(monster)
             
-            # Check if monster is too far from player and remove it
             dx = monster.x - player_pos[0]
             dy = monster.y - player_pos[1]
-            distance = math.sqrt(dx * dx + dy * dy)
+            distance_sq = dx * dx + dy * dy
             
             # Monster attacks player if adjacent
-            if distance <= TILE_SIZE * 1.1:
+            if distance_sq <= attack_range_sq:
                 self.monster_attack_player(monster)
             # Remove monsters that are too far away (optional for performance)
-            if distance > 100 * TILE_SIZE:
-                self.monsters.remove(monster)
+            if distance_sq > despawn_range_sq:
+                self.combat.queue_removal(monster)
+        
+        self.combat.flush_removals(self.monsters)
     
     def draw_monsters(self):
         """Draw all monsters with sprites if available"""
@@ -727,34 +756,31 @@ class Game:
                 health = getattr(monster, 'health', 1)
                 max_health = getattr(monster, 'max_health', 1)
                 health_percent = max(0, min(1, health / max_health))
-                pygame.draw.rect(self.screen, RED, (screen_x, screen_y - 10, bar_width, bar_height))
-                pygame.draw.rect(self.screen, GREEN, (screen_x, screen_y - 10, int(bar_width * health_percent), bar_height))
-                pygame.draw.rect(self.screen, BLACK, (screen_x, screen_y - 10, bar_width, bar_height), 1)
+                self.health_bars.add(screen_x, screen_y - 10, bar_width, bar_height,
+                                     health_percent, GREEN, RED, BLACK)
             elif hasattr(monster, 'draw'):
                 monster.draw(self.screen, self.camera_x, self.camera_y)
-        # Draw damage feedback
+        # Draw all queued health bars at once
+        self.health_bars.flush(self.screen)
+        # Draw damage feedback from the cached digit glyphs
+        damage_digits = get_digit_atlas(24, YELLOW)
         for fb in self.damage_feedback:
             mx, my, text, timer = fb
             screen_x = (mx - self.camera_x) * TILE_SIZE
             screen_y = (my - self.camera_y) * TILE_SIZE
-            text_surface = self.font.render(text, True, YELLOW)
-            self.screen.blit(text_surface, (screen_x + TILE_SIZE // 2 - 10, screen_y - 20 - int((0.7 - timer) * 30)))
+            damage_digits.draw(self.screen, text, (screen_x + TILE_SIZE // 2 - 10, screen_y - 20 - int((0.7 - timer) * 30)))
 
     def player_attack(self):
-        """Attack in the direction of last movement, damaging a monster in the adjacent tile."""
-        px, py = self.player.x, self.player.y
-        dx, dy = self.last_move_dir
-        target_tile = (int(px + dx), int(py + dy))
-        for monster in self.monsters:
-            mx = int(round(monster.x / TILE_SIZE))
-            my = int(round(monster.y / TILE_SIZE))
-            if (mx, my) == target_tile:
-                monster.health -= 10
-                # Add feedback
-                self.damage_feedback.append([mx, my, "-10", 0.7])  # 0.7 seconds
-                if monster.health <= 0:
-                    self.monsters.remove(monster)
-                break  # Only hit one monster per attack
+        """Attack in the direction of last movement with the current attack type."""
+        origin = (self.player.x * TILE_SIZE, self.player.y * TILE_SIZE)
+        hits = self.combat.resolve_attack(self.player.attack_type, origin, self.last_move_dir,
+                                          self.player.get_attack_range(), 10)
+        for hit in hits:
+            # Add feedback
+            mx = int(round(hit.target.x / TILE_SIZE))
+            my = int(round(hit.target.y / TILE_SIZE))
+            self.damage_feedback.append([mx, my, f"-{hit.damage}", 0.7])  # 0.7 seconds
+        self.combat.flush_removals(self.monsters)
 
     def update(self):
         # Update damage feedback timers